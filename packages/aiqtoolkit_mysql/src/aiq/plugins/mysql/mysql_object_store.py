@@ -15,6 +15,8 @@
 
 import logging
 import pickle
+from collections.abc import AsyncIterable
+from collections.abc import AsyncIterator
 from urllib.parse import urlparse
 
 import aiomysql
@@ -22,8 +24,10 @@ from aiomysql.pool import Pool
 
 from aiq.data_models.object_store import KeyAlreadyExistsError
 from aiq.data_models.object_store import NoSuchKeyError
+from aiq.object_store.interfaces import DEFAULT_CHUNK_SIZE
 from aiq.object_store.interfaces import ObjectStore
 from aiq.object_store.models import ObjectStoreItem
+from aiq.object_store.models import ObjectStoreItemInfo
 from aiq.plugins.mysql.object_store import MySQLObjectStoreClientConfig
 from aiq.utils.type_utils import override
 
@@ -33,6 +37,10 @@ logger = logging.getLogger(__name__)
 class MySQLObjectStore(ObjectStore):
     """
     Implementation of ObjectStore that stores objects in a MySQL database.
+
+    Objects saved with `put_object` and `upsert_object` are stored as a single pickled blob. Streamed uploads store
+    the pickled item without its data and write the data in a sequence of `object_chunk` rows, which can be read back
+    one row at a time.
     """
 
     def __init__(self, config: MySQLObjectStoreClientConfig):
@@ -97,6 +105,18 @@ class MySQLObjectStore(ObjectStore):
                 ) ENGINE=InnoDB ROW_FORMAT=DYNAMIC;
                 """)
 
+                # Create chunked data table for streamed uploads
+                await cur.execute("""
+                CREATE TABLE IF NOT EXISTS object_chunk (
+                    id INT NOT NULL,
+                    seq INT NOT NULL,
+                    start_offset BIGINT NOT NULL,
+                    data LONGBLOB NOT NULL,
+                    PRIMARY KEY (id, seq),
+                    FOREIGN KEY (id) REFERENCES object_meta(id) ON DELETE CASCADE
+                ) ENGINE=InnoDB ROW_FORMAT=DYNAMIC;
+                """)
+
             await conn.commit()
 
         logger.info(f"Created schema and tables for {self._config.bucket_name} at {self._config.endpoint_url}")
@@ -162,6 +182,7 @@ class MySQLObjectStore(ObjectStore):
 
                     blob = pickle.dumps(item)
                     await cur.execute("REPLACE INTO object_data (id, data) VALUES (%s, %s)", (obj_id, blob))
+                    await cur.execute("DELETE FROM object_chunk WHERE id=%s", (obj_id, ))
                     await conn.commit()
                 except Exception:
                     await conn.rollback()
@@ -178,7 +199,7 @@ class MySQLObjectStore(ObjectStore):
                 await cur.execute(f"USE {self._schema};")
                 await cur.execute(
                     """
-                    SELECT d.data
+                    SELECT m.id, d.data
                     FROM object_data d
                     JOIN object_meta m USING(id)
                     WHERE m.path=%s
@@ -186,7 +207,13 @@ class MySQLObjectStore(ObjectStore):
                 row = await cur.fetchone()
                 if not row:
                     raise NoSuchKeyError(key=key)
-                return pickle.loads(row[0])
+                item = pickle.loads(row[1])
+
+                await cur.execute("SELECT data FROM object_chunk WHERE id=%s ORDER BY seq", (row[0], ))
+                chunks = await cur.fetchall()
+                if chunks:
+                    item.data = b"".join(chunk for (chunk, ) in chunks)
+                return item
 
     @override
     async def delete_object(self, key: str):
@@ -213,3 +240,154 @@ class MySQLObjectStore(ObjectStore):
                 except Exception:
                     await conn.rollback()
                     raise
+
+    @override
+    async def put_object_stream(self,
+                                key: str,
+                                chunks: AsyncIterable[bytes],
+                                content_type: str | None = None,
+                                metadata: dict[str, str] | None = None) -> int:
+        return await self._put_stream(key, chunks, content_type, metadata, overwrite=False)
+
+    @override
+    async def upsert_object_stream(self,
+                                   key: str,
+                                   chunks: AsyncIterable[bytes],
+                                   content_type: str | None = None,
+                                   metadata: dict[str, str] | None = None) -> int:
+        return await self._put_stream(key, chunks, content_type, metadata, overwrite=True)
+
+    async def _put_stream(self,
+                          key: str,
+                          chunks: AsyncIterable[bytes],
+                          content_type: str | None,
+                          metadata: dict[str, str] | None,
+                          overwrite: bool) -> int:
+
+        if not self._conn_pool:
+            raise RuntimeError("Connection not established")
+
+        chunk_size = self._config.chunk_size
+
+        async with self._conn_pool.acquire() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(f"USE {self._schema};")
+                try:
+                    await cur.execute("START TRANSACTION;")
+                    if overwrite:
+                        await cur.execute(
+                            """
+                            INSERT INTO object_meta (path, size)
+                            VALUES (%s, 0)
+                            ON DUPLICATE KEY UPDATE size=0, created_at=CURRENT_TIMESTAMP
+                            """, (key, ))
+                    else:
+                        await cur.execute("INSERT IGNORE INTO object_meta (path, size) VALUES (%s, 0)", (key, ))
+                        if cur.rowcount == 0:
+                            raise KeyAlreadyExistsError(key=key)
+                    await cur.execute("SELECT id FROM object_meta WHERE path=%s FOR UPDATE;", (key, ))
+                    (obj_id, ) = await cur.fetchone()
+
+                    # The item is stored without its data, which is written to the chunk table
+                    blob = pickle.dumps(ObjectStoreItem(data=b"", content_type=content_type, metadata=metadata))
+                    await cur.execute("REPLACE INTO object_data (id, data) VALUES (%s, %s)", (obj_id, blob))
+                    await cur.execute("DELETE FROM object_chunk WHERE id=%s", (obj_id, ))
+
+                    buffer = bytearray()
+                    seq = 0
+                    size = 0
+
+                    async def write_chunk(data: bytes):
+                        nonlocal seq, size
+                        await cur.execute(
+                            "INSERT INTO object_chunk (id, seq, start_offset, data) VALUES (%s, %s, %s, %s)",
+                            (obj_id, seq, size, data))
+                        seq += 1
+                        size += len(data)
+
+                    async for chunk in chunks:
+                        buffer += chunk
+                        while len(buffer) >= chunk_size:
+                            await write_chunk(bytes(buffer[:chunk_size]))
+                            del buffer[:chunk_size]
+                    if buffer:
+                        await write_chunk(bytes(buffer))
+
+                    await cur.execute("UPDATE object_meta SET size=%s WHERE id=%s", (size, obj_id))
+                    await conn.commit()
+                    return size
+                except Exception:
+                    await conn.rollback()
+                    raise
+
+    @override
+    async def get_object_info(self, key: str) -> ObjectStoreItemInfo:
+
+        if not self._conn_pool:
+            raise RuntimeError("Connection not established")
+
+        async with self._conn_pool.acquire() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(f"USE {self._schema};")
+                await cur.execute(
+                    """
+                    SELECT m.size, d.data
+                    FROM object_data d
+                    JOIN object_meta m USING(id)
+                    WHERE m.path=%s
+                """, (key, ))
+                row = await cur.fetchone()
+                if not row:
+                    raise NoSuchKeyError(key=key)
+                item = pickle.loads(row[1])
+                return ObjectStoreItemInfo(size=row[0], content_type=item.content_type, metadata=item.metadata)
+
+    @override
+    async def get_object_stream(self,
+                                key: str,
+                                start: int = 0,
+                                end: int | None = None,
+                                chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[bytes]:
+
+        if not self._conn_pool:
+            raise RuntimeError("Connection not established")
+
+        async with self._conn_pool.acquire() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(f"USE {self._schema};")
+                await cur.execute("SELECT id, size FROM object_meta WHERE path=%s", (key, ))
+                row = await cur.fetchone()
+                if not row:
+                    raise NoSuchKeyError(key=key)
+                obj_id, size = row
+                end = size if end is None else min(end, size)
+
+                # Only the layout of the chunks overlapping the range, not their data
+                await cur.execute(
+                    """
+                    SELECT seq, start_offset
+                    FROM object_chunk
+                    WHERE id=%s AND start_offset < %s AND start_offset + LENGTH(data) > %s
+                    ORDER BY seq
+                """, (obj_id, end, start))
+                layout = await cur.fetchall()
+
+        if not layout:
+            # Objects which were not streamed are stored as a single blob, and empty streamed objects have no chunks
+            async for chunk in super().get_object_stream(key, start, end, chunk_size):
+                yield chunk
+            return
+
+        for seq, chunk_offset in layout:
+            # Read one row at a time without holding a connection while the consumer processes the data
+            async with self._conn_pool.acquire() as conn:
+                async with conn.cursor() as cur:
+                    await cur.execute(f"USE {self._schema};")
+                    await cur.execute("SELECT data FROM object_chunk WHERE id=%s AND seq=%s", (obj_id, seq))
+                    row = await cur.fetchone()
+            if not row:
+                raise NoSuchKeyError(key=key, additional_message="Object was modified while being read")
+
+            data = memoryview(row[0])[max(0, start - chunk_offset):end - chunk_offset]
+            for offset in range(0, len(data), chunk_size):
+                yield bytes(data[offset:offset + chunk_size])
@@ -28,6 +28,11 @@ class MySQLObjectStoreClientConfig(ObjectStoreBaseConfig, name="mysql"):
     endpoint_url: str = Field(default="127.0.0.1:3306", description="The URL of the MySQL server to connect to")
     user: str | None = Field(default=None, description="The user to use to connect to the MySQL server")
     password: str | None = Field(default=None, description="The password to use to connect to the MySQL server")
+    chunk_size: int = Field(
+        default=1024 * 1024,
+        gt=0,
+        description=("Size of the rows in which streamed uploads are written. Must be below the `max_allowed_packet` "
+                     "setting of the server."))
 
 
 @register_object_store(config_type=MySQLObjectStoreClientConfig)
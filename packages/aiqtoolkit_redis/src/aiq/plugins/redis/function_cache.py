@@ -0,0 +1,101 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import typing
+
+import redis.asyncio as redis
+from pydantic import TypeAdapter
+from redis.exceptions import RedisError
+
+from aiq.builder.function_cache import CACHE_MISS
+from aiq.builder.function_cache import FunctionCacheBackend
+
+logger = logging.getLogger(__name__)
+
+
+class RedisFunctionCache(FunctionCacheBackend):
+    """
+    Function result cache backend shared between processes through Redis. Results are stored as JSON and validated
+    against the result type of the function when they are read. Results which don't survive the JSON round trip
+    unchanged are not cached, and entries which can't be decoded are deleted and treated as misses.
+
+    Args:
+        redis_client (redis.Redis): The Redis client. Must not decode responses.
+        key_prefix (str): Prefix of the Redis keys.
+        value_type (typing.Any): The result type of the function.
+    """
+
+    def __init__(self,
+                 redis_client: redis.Redis,
+                 key_prefix: str = "aiq:function_cache",
+                 value_type: typing.Any = typing.Any):
+        self._client = redis_client
+        self._key_prefix = key_prefix
+        self._adapter = TypeAdapter(value_type)
+
+    @classmethod
+    def from_url(cls,
+                 url: str,
+                 key_prefix: str = "aiq:function_cache",
+                 value_type: typing.Any = typing.Any) -> "RedisFunctionCache":
+        return cls(redis.Redis.from_url(url, socket_timeout=5.0, socket_connect_timeout=5.0),
+                   key_prefix=key_prefix,
+                   value_type=value_type)
+
+    def _key(self, key: str) -> str:
+        return f"{self._key_prefix}:{key}"
+
+    async def get(self, key: str) -> typing.Any:
+        try:
+            data = await self._client.get(self._key(key))
+        except RedisError as e:
+            # The cache is an optimization, an unavailable server should not fail the function call
+            logger.warning("Unable to read function cache entry %s: %s", key, e)
+            return CACHE_MISS
+
+        if data is None:
+            return CACHE_MISS
+
+        try:
+            return self._adapter.validate_json(data)
+        except ValueError as e:
+            # Written by an older version or for a different result type, drop it so that it is replaced
+            logger.warning("Discarding invalid function cache entry %s: %s", key, e)
+            try:
+                await self._client.delete(self._key(key))
+            except RedisError as delete_error:
+                logger.warning("Unable to delete function cache entry %s: %s", key, delete_error)
+            return CACHE_MISS
+
+    async def set(self, key: str, value: typing.Any, ttl: float | None) -> None:
+        try:
+            data = self._adapter.dump_json(value)
+            cacheable = self._adapter.validate_json(data) == value
+        except Exception as e:
+            logger.debug("Not caching result for %s which can't be encoded as JSON: %s", key, e)
+            return
+
+        if not cacheable:
+            logger.debug("Not caching result for %s which changes when encoded as JSON", key)
+            return
+
+        try:
+            await self._client.set(self._key(key), data, px=int(ttl * 1000) if ttl is not None else None)
+        except RedisError as e:
+            logger.warning("Unable to write function cache entry %s: %s", key, e)
+
+    async def aclose(self) -> None:
+        await self._client.close()
@@ -0,0 +1,251 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import json
+import logging
+from datetime import UTC
+from datetime import datetime
+
+import redis.asyncio as redis
+from pydantic import BaseModel
+
+from aiq.front_ends.fastapi.job_store import JobInfo
+from aiq.front_ends.fastapi.job_store import JobStatus
+from aiq.front_ends.fastapi.job_store import JobStoreBase
+from aiq.object_store.interfaces import ObjectStore
+
+logger = logging.getLogger(__name__)
+
+
+class RedisJobStore(JobStoreBase):
+    """
+    Job store shared by all workers through Redis.
+
+    Every job is a JSON document. Sorted sets index the jobs by creation time, by status (scored by update time) and,
+    for finished jobs, by update and expiry time, so that queries and the expiry cleanup only touch matching jobs.
+
+    Finishing a job publishes its ID on a pub/sub channel, which wakes up the callers of `wait_for_job` in every
+    worker. Pub/sub delivery is not guaranteed across reconnects, so waiters also re-check their job every
+    `poll_interval` seconds.
+
+    Args:
+        redis_client (redis.Redis): The Redis client. Must decode responses.
+        key_prefix (str): Prefix of the Redis keys, which keeps the jobs of different routes apart.
+        object_store (ObjectStore | None): If provided, job outputs are stored in the object store by reference.
+        output_prefix (str): Key prefix of the job outputs in the object store.
+        poll_interval (float): Seconds between checks of a waited for job, in case a notification was missed.
+    """
+
+    def __init__(self,
+                 redis_client: redis.Redis,
+                 key_prefix: str = "aiq:jobs",
+                 object_store: ObjectStore | None = None,
+                 output_prefix: str = "jobs",
+                 poll_interval: float = 5.0):
+        super().__init__(object_store=object_store, output_prefix=output_prefix)
+        self.poll_interval = poll_interval
+        self._client = redis_client
+        self._key_prefix = key_prefix
+        self._listener: asyncio.Task | None = None
+        self._subscribed: asyncio.Future | None = None
+
+    @classmethod
+    def from_url(cls, url: str, key_prefix: str = "aiq:jobs", **kwargs) -> "RedisJobStore":
+        client = redis.Redis.from_url(url, decode_responses=True, socket_timeout=5.0, socket_connect_timeout=5.0)
+        return cls(client, key_prefix=key_prefix, **kwargs)
+
+    def _job_key(self, job_id: str) -> str:
+        return f"{self._key_prefix}:job:{job_id}"
+
+    def _status_key(self, status: str) -> str:
+        return f"{self._key_prefix}:status:{status}"
+
+    @property
+    def _created_key(self) -> str:
+        return f"{self._key_prefix}:created"
+
+    @property
+    def _finished_key(self) -> str:
+        return f"{self._key_prefix}:finished"
+
+    @property
+    def _expires_key(self) -> str:
+        return f"{self._key_prefix}:expires"
+
+    @property
+    def _finished_channel(self) -> str:
+        return f"{self._key_prefix}:finished-events"
+
+    def _to_job(self, data: str) -> JobInfo:
+        record = json.loads(data)
+        return JobInfo(job_id=record["job_id"],
+                       status=record["status"],
+                       config_file=record["config_file"],
+                       error=record["error"],
+                       output_path=record["output_path"],
+                       created_at=datetime.fromtimestamp(record["created_at"], UTC),
+                       updated_at=datetime.fromtimestamp(record["updated_at"], UTC),
+                       expiry_seconds=record["expiry_seconds"])
+
+    async def _get_jobs(self, job_ids: list[str]) -> list[JobInfo]:
+        if not job_ids:
+            return []
+        documents = await self._client.mget([self._job_key(job_id) for job_id in job_ids])
+        # Skip jobs removed between reading the index and the documents
+        return [self._to_job(data) for data in documents if data is not None]
+
+    async def _add_job(self, job: JobInfo):
+        status = JobStatus(job.status).value
+        record = {
+            "job_id": job.job_id,
+            "status": status,
+            "config_file": job.config_file,
+            "error": job.error,
+            "output_path": job.output_path,
+            "created_at": job.created_at.timestamp(),
+            "updated_at": job.updated_at.timestamp(),
+            "expiry_seconds": job.expiry_seconds,
+            "output": None,
+            "output_ref": None,
+        }
+
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.set(self._job_key(job.job_id), json.dumps(record))
+            pipe.zadd(self._created_key, {job.job_id: record["created_at"]})
+            pipe.zadd(self._status_key(status), {job.job_id: record["updated_at"]})
+            await pipe.execute()
+
+    async def _update_job(self,
+                          job_id: str,
+                          status: str,
+                          error: str | None,
+                          output_path: str | None,
+                          output: BaseModel | None):
+        data = await self._client.get(self._job_key(job_id))
+        if data is None:
+            raise ValueError(f"Job {job_id} not found")
+
+        record = json.loads(data)
+        previous_status = record["status"]
+        status = JobStatus(status).value
+        output_data, output_ref = await self._dump_output(job_id, output)
+
+        record.update(status=status,
+                      error=error,
+                      output_path=output_path,
+                      updated_at=datetime.now(UTC).timestamp(),
+                      output=output_data,
+                      output_ref=output_ref)
+
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.set(self._job_key(job_id), json.dumps(record))
+            if previous_status != status:
+                pipe.zrem(self._status_key(previous_status), job_id)
+            pipe.zadd(self._status_key(status), {job_id: record["updated_at"]})
+
+            # Only finished jobs are indexed for expiry, active jobs are exempt
+            if status in self.ACTIVE_STATUS:
+                pipe.zrem(self._finished_key, job_id)
+                pipe.zrem(self._expires_key, job_id)
+            else:
+                pipe.zadd(self._finished_key, {job_id: record["updated_at"]})
+                pipe.zadd(self._expires_key, {job_id: record["updated_at"] + record["expiry_seconds"]})
+                pipe.publish(self._finished_channel, job_id)
+            await pipe.execute()
+
+    async def _listen(self) -> None:
+        if self._listener is None or self._listener.done():
+            self._subscribed = asyncio.get_running_loop().create_future()
+            self._listener = asyncio.create_task(self._dispatch(self._subscribed))
+
+        # Subscribed before the waiter checks its job, so that a job finishing in between is not missed
+        await asyncio.shield(self._subscribed)
+
+    async def _dispatch(self, subscribed: asyncio.Future) -> None:
+        pubsub = self._client.pubsub()
+        try:
+            await pubsub.subscribe(self._finished_channel)
+            subscribed.set_result(None)
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    self._wake_waiters(message["data"])
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:  # pylint: disable=broad-except
+            # The next waiter subscribes again, waiters fall back to polling in the meantime
+            logger.warning("Lost the job notifications of %s: %s", self._key_prefix, e)
+        finally:
+            if not subscribed.done():
+                subscribed.set_result(None)
+            await pubsub.close()
+
+    async def get_job(self, job_id: str) -> JobInfo | None:
+        data = await self._client.get(self._job_key(job_id))
+        if data is None:
+            return None
+
+        record = json.loads(data)
+        job = self._to_job(data)
+        job.output = await self._load_output(record["output"], record["output_ref"])
+        return job
+
+    async def get_last_job(self) -> JobInfo | None:
+        job_ids = await self._client.zrevrange(self._created_key, 0, 0)
+        jobs = await self._get_jobs(job_ids)
+        if not jobs:
+            logger.info("No jobs found in job store")
+            return None
+        return jobs[0]
+
+    async def get_jobs_by_status(self, status: str) -> list[JobInfo]:
+        """Get all jobs with the specified status. The outputs of the jobs are not loaded."""
+        return await self._get_jobs(await self._client.zrange(self._status_key(JobStatus(status).value), 0, -1))
+
+    async def get_all_jobs(self) -> list[JobInfo]:
+        """Get all jobs in the store. The outputs of the jobs are not loaded."""
+        return await self._get_jobs(await self._client.zrange(self._created_key, 0, -1))
+
+    async def _remove_expired_jobs(self, now: datetime) -> list[JobInfo]:
+        expired_ids = await self._client.zrangebyscore(self._expires_key, "-inf", f"({now.timestamp()}")
+
+        # Always keep the most recent finished job
+        most_recent = await self._client.zrevrange(self._finished_key, 0, 0)
+        expired_ids = [job_id for job_id in expired_ids if job_id not in most_recent]
+
+        expired_jobs = await self._get_jobs(expired_ids)
+        if not expired_ids:
+            return expired_jobs
+
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.delete(*[self._job_key(job_id) for job_id in expired_ids])
+            pipe.zrem(self._created_key, *expired_ids)
+            pipe.zrem(self._finished_key, *expired_ids)
+            pipe.zrem(self._expires_key, *expired_ids)
+            for job in expired_jobs:
+                pipe.zrem(self._status_key(JobStatus(job.status).value), job.job_id)
+            await pipe.execute()
+
+        return expired_jobs
+
+    async def aclose(self):
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        await self._client.close()
@@ -0,0 +1,104 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pickle
+from unittest.mock import AsyncMock
+
+import pytest
+from pydantic import BaseModel
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from aiq.builder.function_cache import CACHE_MISS
+from aiq.plugins.redis.function_cache import RedisFunctionCache
+
+
+class _Answer(BaseModel):
+    value: int
+    sources: list[str]
+
+
+@pytest.fixture(name="mock_redis_client")
+def mock_redis_client_fixture() -> AsyncMock:
+    return AsyncMock()
+
+
+@pytest.fixture(name="redis_cache")
+def redis_cache_fixture(mock_redis_client: AsyncMock) -> RedisFunctionCache:
+    return RedisFunctionCache(redis_client=mock_redis_client, key_prefix="pytest")
+
+
+async def test_get_miss(redis_cache: RedisFunctionCache, mock_redis_client: AsyncMock):
+    mock_redis_client.get.return_value = None
+
+    assert await redis_cache.get("fn:abc") is CACHE_MISS
+    mock_redis_client.get.assert_awaited_once_with("pytest:fn:abc")
+
+
+async def test_get_hit(redis_cache: RedisFunctionCache, mock_redis_client: AsyncMock):
+    mock_redis_client.get.return_value = b'{"answer":42}'
+
+    assert await redis_cache.get("fn:abc") == {"answer": 42}
+
+
+async def test_set_with_ttl(redis_cache: RedisFunctionCache, mock_redis_client: AsyncMock):
+    await redis_cache.set("fn:abc", "result", ttl=1.5)
+
+    mock_redis_client.set.assert_awaited_once_with("pytest:fn:abc", b'"result"', px=1500)
+
+
+async def test_set_without_ttl(redis_cache: RedisFunctionCache, mock_redis_client: AsyncMock):
+    await redis_cache.set("fn:abc", "result", ttl=None)
+
+    mock_redis_client.set.assert_awaited_once_with("pytest:fn:abc", b'"result"', px=None)
+
+
+async def test_unavailable_server_is_a_miss(redis_cache: RedisFunctionCache, mock_redis_client: AsyncMock):
+    mock_redis_client.get.side_effect = RedisConnectionError("down")
+    mock_redis_client.set.side_effect = RedisConnectionError("down")
+
+    assert await redis_cache.get("fn:abc") is CACHE_MISS
+    await redis_cache.set("fn:abc", "result", ttl=None)
+
+
+async def test_typed_round_trip(mock_redis_client: AsyncMock):
+    redis_cache = RedisFunctionCache(redis_client=mock_redis_client, key_prefix="pytest", value_type=_Answer)
+    answer = _Answer(value=42, sources=["a", "b"])
+
+    await redis_cache.set("fn:abc", answer, ttl=None)
+    data = mock_redis_client.set.await_args.args[1]
+    assert data == b'{"value":42,"sources":["a","b"]}'
+
+    mock_redis_client.get.return_value = data
+    assert await redis_cache.get("fn:abc") == answer
+
+
+@pytest.mark.parametrize("value", [object(), _Answer(value=42, sources=[]), (1, 2)],
+                         ids=["not_json", "model_without_type", "tuple_without_type"])
+async def test_results_changed_by_json_are_not_cached(redis_cache: RedisFunctionCache,
+                                                      mock_redis_client: AsyncMock,
+                                                      value):
+    await redis_cache.set("fn:abc", value, ttl=None)
+
+    mock_redis_client.set.assert_not_awaited()
+
+
+@pytest.mark.parametrize("data", [pickle.dumps({"answer": 42}), b"{not json", b'{"value":"x"}'],
+                         ids=["pickle", "malformed", "wrong_type"])
+async def test_invalid_entry_is_deleted(mock_redis_client: AsyncMock, data: bytes):
+    redis_cache = RedisFunctionCache(redis_client=mock_redis_client, key_prefix="pytest", value_type=_Answer)
+    mock_redis_client.get.return_value = data
+
+    assert await redis_cache.get("fn:abc") is CACHE_MISS
+    mock_redis_client.delete.assert_awaited_once_with("pytest:fn:abc")
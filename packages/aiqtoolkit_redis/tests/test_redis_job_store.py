@@ -0,0 +1,197 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("redis")
+
+from aiq.front_ends.fastapi.job_store import JobStatus  # noqa: E402  # pylint: disable=wrong-import-position
+from aiq.plugins.redis.job_store import RedisJobStore  # noqa: E402  # pylint: disable=wrong-import-position
+
+
+class _FakePubSub:
+
+    def __init__(self, server: "_FakeRedis"):
+        self._server = server
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._channels: set[str] = set()
+
+    async def subscribe(self, channel: str):
+        self._channels.add(channel)
+        self._server.subscribers.append(self)
+
+    async def listen(self):
+        while True:
+            yield await self._queue.get()
+
+    async def close(self):
+        if self in self._server.subscribers:
+            self._server.subscribers.remove(self)
+
+
+class _FakePipeline:
+
+    def __init__(self, server: "_FakeRedis"):
+        self._server = server
+        self._commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self._commands.append((name, args, kwargs))
+
+    async def execute(self):
+        return [await getattr(self._server, name)(*args, **kwargs) for name, args, kwargs in self._commands]
+
+
+class _FakeRedis:
+    """In-memory subset of the redis.asyncio client used by the job store."""
+
+    def __init__(self):
+        self.values: dict[str, str] = {}
+        self.sorted_sets: dict[str, dict[str, float]] = {}
+        self.subscribers: list[_FakePubSub] = []
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value):
+        self.values[key] = value
+
+    async def mget(self, keys):
+        return [self.values.get(key) for key in keys]
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.values.pop(key, None)
+
+    async def zadd(self, key, mapping):
+        self.sorted_sets.setdefault(key, {}).update(mapping)
+
+    async def zrem(self, key, *members):
+        for member in members:
+            self.sorted_sets.get(key, {}).pop(member, None)
+
+    def _sorted(self, key):
+        return sorted(self.sorted_sets.get(key, {}).items(), key=lambda item: item[1])
+
+    async def zrange(self, key, start, end):
+        members = [member for member, _ in self._sorted(key)]
+        return members[start:None if end == -1 else end + 1]
+
+    async def zrevrange(self, key, start, end):
+        members = [member for member, _ in reversed(self._sorted(key))]
+        return members[start:None if end == -1 else end + 1]
+
+    async def zrangebyscore(self, key, low, high):
+        assert low == "-inf" and high.startswith("(")
+        return [member for member, score in self._sorted(key) if score < float(high[1:])]
+
+    async def publish(self, channel, message):
+        for subscriber in self.subscribers:
+            if channel in subscriber._channels:
+                subscriber._queue.put_nowait({"type": "message", "channel": channel, "data": message})
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+    def pubsub(self):
+        return _FakePubSub(self)
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture(name="redis_server")
+def redis_server_fixture() -> _FakeRedis:
+    return _FakeRedis()
+
+
+@pytest.fixture(name="job_store")
+async def job_store_fixture(redis_server: _FakeRedis):
+    store = RedisJobStore(redis_server, key_prefix="pytest")
+    yield store
+    await store.aclose()
+
+
+async def test_create_update_get(job_store: RedisJobStore):
+    job_id = await job_store.create_job(config_file="config.yml")
+    assert (await job_store.get_status(job_id)).status == JobStatus.SUBMITTED
+
+    await job_store.update_status(job_id, "success", output={"value": "done"})
+
+    job = await job_store.get_job(job_id)
+    assert job.status == JobStatus.SUCCESS
+    assert job.output == {"value": "done"}
+    assert await job_store.get_job("missing") is None
+
+    with pytest.raises(ValueError):
+        await job_store.update_status("missing", "success")
+
+
+async def test_status_indexes(job_store: RedisJobStore, redis_server: _FakeRedis):
+    first = await job_store.create_job()
+    second = await job_store.create_job()
+    await job_store.update_status(first, "running")
+    await job_store.update_status(second, "failure")
+
+    assert [job.job_id for job in await job_store.get_all_jobs()] == [first, second]
+    assert (await job_store.get_last_job()).job_id == second
+    assert [job.job_id for job in await job_store.get_jobs_by_status("running")] == [first]
+    assert await job_store.get_jobs_by_status("submitted") == []
+    assert set(redis_server.sorted_sets["pytest:expires"]) == {second}
+
+
+async def test_remove_expired_jobs_keeps_most_recent(job_store: RedisJobStore, redis_server: _FakeRedis):
+    old = await job_store.create_job()
+    await job_store.update_status(old, "success")
+    recent = await job_store.create_job()
+    await job_store.update_status(recent, "success")
+    active = await job_store.create_job()
+
+    for job_id in (old, recent):
+        redis_server.sorted_sets["pytest:expires"][job_id] = 0.0
+
+    await job_store.cleanup_expired_jobs()
+
+    assert {job.job_id for job in await job_store.get_all_jobs()} == {recent, active}
+    assert await redis_server.get(f"pytest:job:{old}") is None
+    assert old not in redis_server.sorted_sets["pytest:status:success"]
+
+
+async def test_wait_for_job_woken_by_other_worker(redis_server: _FakeRedis):
+    worker = RedisJobStore(redis_server, key_prefix="pytest", poll_interval=60)
+    other_worker = RedisJobStore(redis_server, key_prefix="pytest", poll_interval=60)
+    try:
+        job_id = await worker.create_job()
+
+        waiter = asyncio.create_task(other_worker.wait_for_job(job_id, timeout=5))
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+        # Notified through pub/sub rather than by polling
+        await worker.update_status(job_id, "success")
+        job = await asyncio.wait_for(waiter, timeout=1)
+        assert job.status == JobStatus.SUCCESS
+    finally:
+        await worker.aclose()
+        await other_worker.aclose()
+    assert not redis_server.subscribers
@@ -13,6 +13,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from pydantic import Field
+
 from aiq.builder.builder import Builder
 from aiq.cli.register_workflow import register_object_store
 from aiq.data_models.object_store import ObjectStoreBaseConfig
@@ -24,6 +26,11 @@ class S3ObjectStoreClientConfig(ObjectStoreBaseConfig, name="s3"):
     access_key: str | None = None
     secret_key: str | None = None
     region: str | None = None
+    multipart_part_size: int = Field(
+        default=8 * 1024 * 1024,
+        ge=5 * 1024 * 1024,
+        description=("Size of the parts of streamed uploads. Streams larger than one part are uploaded with a "
+                     "multipart upload, buffering a single part in memory."))
 
 
 @register_object_store(config_type=S3ObjectStoreClientConfig)
@@ -14,6 +14,8 @@
 # limitations under the License.
 
 import os
+from collections.abc import AsyncIterable
+from collections.abc import AsyncIterator
 
 import aioboto3
 from botocore.client import BaseClient
@@ -21,8 +23,10 @@ from botocore.exceptions import ClientError
 
 from aiq.data_models.object_store import KeyAlreadyExistsError
 from aiq.data_models.object_store import NoSuchKeyError
+from aiq.object_store.interfaces import DEFAULT_CHUNK_SIZE
 from aiq.object_store.interfaces import ObjectStore
 from aiq.object_store.models import ObjectStoreItem
+from aiq.object_store.models import ObjectStoreItemInfo
 from aiq.plugins.s3.object_store import S3ObjectStoreClientConfig
 
 
@@ -36,6 +40,7 @@ class S3ObjectStore(ObjectStore):
         super().__init__()
 
         self.bucket_name = config.bucket_name
+        self.multipart_part_size = config.multipart_part_size
         self.session = aioboto3.Session()
         self._client: BaseClient | None = None
         self._client_context = None
@@ -162,3 +167,131 @@ class S3ObjectStore(ObjectStore):
 
         if results.get('DeleteMarker', False):
             raise NoSuchKeyError(key, "Object was a delete marker")
+
+    async def put_object_stream(self,
+                                key: str,
+                                chunks: AsyncIterable[bytes],
+                                content_type: str | None = None,
+                                metadata: dict[str, str] | None = None) -> int:
+        return await self._put_stream(key, chunks, content_type, metadata, overwrite=False)
+
+    async def upsert_object_stream(self,
+                                   key: str,
+                                   chunks: AsyncIterable[bytes],
+                                   content_type: str | None = None,
+                                   metadata: dict[str, str] | None = None) -> int:
+        return await self._put_stream(key, chunks, content_type, metadata, overwrite=True)
+
+    async def _put_stream(self,
+                          key: str,
+                          chunks: AsyncIterable[bytes],
+                          content_type: str | None,
+                          metadata: dict[str, str] | None,
+                          overwrite: bool) -> int:
+
+        if self._client is None:
+            raise RuntimeError("Connection not established")
+
+        object_args = {"Bucket": self.bucket_name, "Key": key}
+        create_args = dict(object_args)
+        if content_type:
+            create_args["ContentType"] = content_type
+        if metadata:
+            create_args["Metadata"] = metadata
+        # Only succeed if the key does not already exist
+        condition = {} if overwrite else {"IfNoneMatch": "*"}
+
+        buffer = bytearray()
+        upload_id: str | None = None
+        parts = []
+        size = 0
+
+        try:
+            async for chunk in chunks:
+                buffer += chunk
+                size += len(chunk)
+                while len(buffer) >= self.multipart_part_size:
+                    if upload_id is None:
+                        response = await self._client.create_multipart_upload(**create_args)
+                        upload_id = response["UploadId"]
+                    part_number = len(parts) + 1
+                    response = await self._client.upload_part(**object_args,
+                                                              UploadId=upload_id,
+                                                              PartNumber=part_number,
+                                                              Body=bytes(buffer[:self.multipart_part_size]))
+                    parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+                    del buffer[:self.multipart_part_size]
+
+            if upload_id is None:
+                # Small enough for a single request
+                await self._client.put_object(**create_args, Body=bytes(buffer), **condition)
+                return size
+
+            if buffer:
+                part_number = len(parts) + 1
+                response = await self._client.upload_part(**object_args,
+                                                          UploadId=upload_id,
+                                                          PartNumber=part_number,
+                                                          Body=bytes(buffer))
+                parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+
+            await self._client.complete_multipart_upload(**object_args,
+                                                         UploadId=upload_id,
+                                                         MultipartUpload={"Parts": parts},
+                                                         **condition)
+            upload_id = None
+            return size
+
+        except ClientError as e:
+            http_status_code = e.response.get("ResponseMetadata", {}).get("HTTPStatusCode", None)
+            if http_status_code == 412:
+                raise KeyAlreadyExistsError(key=key,
+                                            additional_message=f"S3 object {self.bucket_name}/{key} already exists")
+            raise
+        finally:
+            if upload_id is not None:
+                # Don't leave the parts of a failed upload behind
+                await self._client.abort_multipart_upload(**object_args, UploadId=upload_id)
+
+    async def get_object_info(self, key: str) -> ObjectStoreItemInfo:
+        if self._client is None:
+            raise RuntimeError("Connection not established")
+
+        try:
+            response = await self._client.head_object(Bucket=self.bucket_name, Key=key)
+        except ClientError as e:
+            # HEAD responses have no body, so missing keys are only reported by their status code
+            if e.response['Error']['Code'] in ('404', 'NoSuchKey'):
+                raise NoSuchKeyError(key, str(e))
+            raise
+
+        return ObjectStoreItemInfo(size=response["ContentLength"],
+                                   content_type=response.get("ContentType"),
+                                   metadata=response.get("Metadata"))
+
+    async def get_object_stream(self,
+                                key: str,
+                                start: int = 0,
+                                end: int | None = None,
+                                chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[bytes]:
+        if self._client is None:
+            raise RuntimeError("Connection not established")
+
+        get_args = {"Bucket": self.bucket_name, "Key": key}
+        if end is not None:
+            if end <= start:
+                return
+            get_args["Range"] = f"bytes={start}-{end - 1}"
+        elif start:
+            get_args["Range"] = f"bytes={start}-"
+
+        try:
+            response = await self._client.get_object(**get_args)
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'NoSuchKey':
+                raise NoSuchKeyError(key, str(e))
+            raise
+
+        async with response["Body"] as body:
+            async for chunk in body.iter_chunks(chunk_size):
+                yield chunk
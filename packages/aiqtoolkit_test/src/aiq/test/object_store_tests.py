@@ -115,3 +115,67 @@ class ObjectStoreTests:
         # Try to delete the object again
         with pytest.raises(NoSuchKeyError):
             await store.delete_object(key)
+
+    async def test_put_object_stream(self, store: ObjectStore):
+
+        key = f"test_key_{uuid.uuid4()}"
+        chunks = [b"a" * 1000, b"b" * 10, b"", b"c" * 500]
+
+        async def stream():
+            for chunk in chunks:
+                yield chunk
+
+        size = await store.put_object_stream(key, stream(), content_type="text/plain", metadata={"key": "value"})
+        assert size == 1510
+
+        retrieved_item = await store.get_object(key)
+        assert retrieved_item.data == b"".join(chunks)
+        assert retrieved_item.content_type == "text/plain"
+        assert retrieved_item.metadata == {"key": "value"}
+
+        # Try to put the same object again
+        with pytest.raises(KeyAlreadyExistsError):
+            await store.put_object_stream(key, stream())
+
+        # Upsert replaces the object, including objects which were not streamed
+        await store.upsert_object_stream(key, stream(), content_type="application/octet-stream")
+        info = await store.get_object_info(key)
+        assert info.size == 1510
+        assert info.content_type == "application/octet-stream"
+
+        await store.upsert_object(key, ObjectStoreItem(data=b"small"))
+        assert (await store.get_object(key)).data == b"small"
+
+    async def test_get_object_stream(self, store: ObjectStore):
+
+        key = f"test_key_{uuid.uuid4()}"
+        data = bytes(range(256)) * 10
+
+        async def stream():
+            for offset in range(0, len(data), 300):
+                yield data[offset:offset + 300]
+
+        await store.put_object_stream(key, stream())
+
+        async def read(**kwargs) -> bytes:
+            return b"".join([chunk async for chunk in store.get_object_stream(key, **kwargs)])
+
+        assert await read() == data
+        assert await read(chunk_size=7) == data
+        assert await read(start=100, end=1000) == data[100:1000]
+        assert await read(start=2500) == data[2500:]
+        assert await read(start=0, end=1) == data[:1]
+
+        chunks = [chunk async for chunk in store.get_object_stream(key, chunk_size=64)]
+        assert all(len(chunk) <= 64 for chunk in chunks)
+
+        # Ranges of objects which were not streamed
+        await store.upsert_object(key, ObjectStoreItem(data=data))
+        assert await read(start=100, end=1000) == data[100:1000]
+
+        with pytest.raises(NoSuchKeyError):
+            await store.get_object_info(f"test_key_{uuid.uuid4()}")
+
+        with pytest.raises(NoSuchKeyError):
+            async for _ in store.get_object_stream(f"test_key_{uuid.uuid4()}"):
+                pass
@@ -27,10 +27,8 @@ from aiq.data_models.authentication import AuthFlowType
 from aiq.data_models.authentication import AuthProviderBaseConfig
 from aiq.data_models.interactive import HumanResponse
 from aiq.data_models.interactive import InteractionPrompt
-from aiq.data_models.intermediate_step import IntermediateStep
-from aiq.data_models.intermediate_step import IntermediateStepPayload
+from aiq.data_models.intermediate_step import IntermediateStepEvent
 from aiq.data_models.intermediate_step import IntermediateStepType
-from aiq.data_models.intermediate_step import StreamEventData
 from aiq.data_models.invocation_node import InvocationNode
 from aiq.runtime.user_metadata import RequestAttributes
 from aiq.utils.reactive.subject import Subject
@@ -68,7 +66,8 @@ class AIQContextState(metaclass=Singleton):
         self.input_message: ContextVar[typing.Any] = ContextVar("input_message", default=None)
         self.user_manager: ContextVar[typing.Any] = ContextVar("user_manager", default=None)
         self.metadata: ContextVar[RequestAttributes] = ContextVar("request_attributes", default=RequestAttributes())
-        self.event_stream: ContextVar[Subject[IntermediateStep] | None] = ContextVar("event_stream", default=Subject())
+        self.event_stream: ContextVar[Subject[IntermediateStepEvent] | None] = ContextVar("event_stream",
+                                                                                          default=Subject())
         self.active_function: ContextVar[InvocationNode] = ContextVar("active_function",
                                                                       default=InvocationNode(function_id="root",
                                                                                              function_name="root"))
@@ -183,11 +182,10 @@ class AIQContext:
 
         # 2) Optionally record function start as an intermediate step
         step_manager = self.intermediate_step_manager
-        step_manager.push_intermediate_step(
-            IntermediateStepPayload(UUID=current_function_id,
-                                    event_type=IntermediateStepType.FUNCTION_START,
-                                    name=function_name,
-                                    data=StreamEventData(input=input_data)))
+        step_manager.push_event(IntermediateStepType.FUNCTION_START,
+                                UUID=current_function_id,
+                                name=function_name,
+                                data={"input": input_data})
 
         manager = ActiveFunctionContextManager()
 
@@ -196,13 +194,12 @@ class AIQContext:
         finally:
             # 3) Record function end
 
-            data = StreamEventData(input=input_data, output=manager.output)
-
-            step_manager.push_intermediate_step(
-                IntermediateStepPayload(UUID=current_function_id,
-                                        event_type=IntermediateStepType.FUNCTION_END,
-                                        name=function_name,
-                                        data=data))
+            step_manager.push_event(IntermediateStepType.FUNCTION_END,
+                                    UUID=current_function_id,
+                                    name=function_name,
+                                    data={
+                                        "input": input_data, "output": manager.output
+                                    })
 
             # 4) Unset the function contextvar
             self._context_state.active_function.reset(fn_token)
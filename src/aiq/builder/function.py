@@ -28,6 +28,8 @@ from aiq.builder.function_base import FunctionBase
 from aiq.builder.function_base import InputT
 from aiq.builder.function_base import SingleOutputT
 from aiq.builder.function_base import StreamingOutputT
+from aiq.builder.function_cache import FunctionResultCache
+from aiq.builder.function_cache import create_function_cache
 from aiq.builder.function_info import FunctionInfo
 from aiq.data_models.function import FunctionBaseConfig
 
@@ -60,6 +62,19 @@ class Function(FunctionBase[InputT, StreamingOutputT, SingleOutputT], ABC):
         self.description = description
         self.instance_name = instance_name or config.type
         self._context = AIQContext.get()
+        self._result_cache: FunctionResultCache | None = None
+
+        if config.cache is not None:
+            self._result_cache = create_function_cache(config.cache,
+                                                       namespace=self.instance_name,
+                                                       value_type=self.single_output_type)
+
+    @property
+    def result_cache(self) -> FunctionResultCache | None:
+        """
+        The cache of `ainvoke` results, if caching is enabled in the function configuration.
+        """
+        return self._result_cache
 
     def convert(self, value: typing.Any, to_type: type[_T]) -> _T:
         """
@@ -136,7 +151,11 @@ class Function(FunctionBase[InputT, StreamingOutputT, SingleOutputT], ABC):
             try:
                 converted_input: InputT = self._convert_input(value)  # type: ignore
 
-                result = await self._ainvoke(converted_input)
+                if self._result_cache is not None:
+                    result = await self._result_cache.get_or_call(converted_input,
+                                                                  lambda: self._ainvoke(converted_input))
+                else:
+                    result = await self._ainvoke(converted_input)
 
                 if to_type is not None and not isinstance(result, to_type):
                     result = self._converter.try_convert(result, to_type=to_type)
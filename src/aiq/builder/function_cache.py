@@ -0,0 +1,209 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+import time
+import typing
+from abc import ABC
+from abc import abstractmethod
+from collections import OrderedDict
+from collections.abc import Awaitable
+from collections.abc import Callable
+
+from pydantic import BaseModel
+
+from aiq.data_models.function_cache import FunctionCacheConfig
+
+logger = logging.getLogger(__name__)
+
+CACHE_MISS = object()
+
+
+class FunctionCacheBackend(ABC):
+    """
+    Storage for cached function results.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> typing.Any:
+        """
+        Get a cached result, or `CACHE_MISS` if there is no valid entry for the key.
+        """
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: typing.Any, ttl: float | None) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        pass
+
+
+class InMemoryFunctionCache(FunctionCacheBackend):
+    """
+    Process-local LRU cache with per-entry expiry. Results are copied in and out of the cache, so that callers
+    modifying a result do not change the cached entry.
+
+    Args:
+        max_entries (int): Maximum number of cached results. The least recently used result is evicted first.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        # key -> (expires_at, value), ordered from least to most recently used
+        self._entries: OrderedDict[str, tuple[float | None, typing.Any]] = OrderedDict()
+
+    async def get(self, key: str) -> typing.Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return CACHE_MISS
+
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[key]
+            return CACHE_MISS
+
+        self._entries.move_to_end(key)
+        return copy.deepcopy(value)
+
+    async def set(self, key: str, value: typing.Any, ttl: float | None) -> None:
+        self._entries[key] = (time.monotonic() + ttl if ttl is not None else None, copy.deepcopy(value))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+def _to_jsonable(value: typing.Any) -> typing.Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    return value
+
+
+class FunctionResultCache:
+    """
+    Caches the results of a function by its input and de-duplicates identical concurrent calls, so that only one of
+    them runs the function while the others wait for its result (single-flight).
+
+    Args:
+        config (FunctionCacheConfig): The cache configuration of the function.
+        namespace (str): Name which keeps the keys of different functions apart, usually the function instance name.
+        backend (FunctionCacheBackend): Storage for the cached results.
+    """
+
+    def __init__(self, config: FunctionCacheConfig, namespace: str, backend: FunctionCacheBackend):
+        self.config = config
+        self.namespace = namespace
+        self.backend = backend
+        self._in_flight: dict[str, asyncio.Future] = {}
+
+    def make_key(self, value: typing.Any) -> str:
+        """
+        Build the cache key of a function input. When `key_fields` is configured only those fields of the input are
+        used.
+        """
+        data = _to_jsonable(value)
+        if self.config.key_fields is not None and isinstance(data, dict):
+            data = {field: data.get(field) for field in self.config.key_fields}
+
+        canonical = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+        digest = hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+        return f"{self.namespace}:{digest}"
+
+    async def get_or_call(self, value: typing.Any, fn: Callable[[], Awaitable[typing.Any]]) -> typing.Any:
+        """
+        Get the cached result for `value`, or run `fn` to produce and cache it.
+
+        Args:
+            value (typing.Any): The function input, used to build the cache key.
+            fn (Callable): Coroutine function which runs the function on `value`.
+
+        Returns:
+            typing.Any: The cached or freshly computed result.
+        """
+        key = self.make_key(value)
+
+        while True:
+            cached = await self.backend.get(key)
+            if cached is not CACHE_MISS:
+                logger.debug("Function cache hit for %s", key)
+                return cached
+
+            flight = self._in_flight.get(key)
+            if flight is None:
+                break
+
+            try:
+                # Every waiting caller gets its own copy of the result
+                return copy.deepcopy(await asyncio.shield(flight))
+            except asyncio.CancelledError:
+                if not flight.cancelled():
+                    # This caller was cancelled, not the call it was waiting for
+                    raise
+                # The leading call was cancelled, try again and possibly lead the next call
+
+        flight = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = flight
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            flight.cancel()
+            raise
+        except BaseException as e:
+            # Errors are not cached, but are shared with the callers waiting for this call
+            flight.set_exception(e)
+            # Mark the exception as retrieved in case no other caller was waiting
+            flight.exception()
+            raise
+        finally:
+            self._in_flight.pop(key, None)
+
+        await self.backend.set(key, result, self.config.ttl)
+        flight.set_result(result)
+        return result
+
+    async def aclose(self) -> None:
+        await self.backend.aclose()
+
+
+def create_function_cache(config: FunctionCacheConfig,
+                          namespace: str,
+                          value_type: typing.Any = typing.Any) -> FunctionResultCache:
+    """
+    Create the result cache of a function from its cache configuration.
+
+    Args:
+        config (FunctionCacheConfig): The cache configuration of the function.
+        namespace (str): Name which keeps the keys of different functions apart.
+        value_type (typing.Any): The result type of the function, used by backends which serialize the results.
+
+    Returns:
+        FunctionResultCache: The result cache.
+    """
+    if config.backend == "redis":
+        try:
+            from aiq.plugins.redis.function_cache import RedisFunctionCache
+        except ImportError:
+            raise ImportError("The redis function cache backend requires the aiqtoolkit-redis package. "
+                              "Install aiqtoolkit-redis or use the memory backend.")
+
+        backend = RedisFunctionCache.from_url(config.redis_url, key_prefix=config.key_prefix, value_type=value_type)
+    else:
+        backend = InMemoryFunctionCache(max_entries=config.max_entries)
+
+    return FunctionResultCache(config, namespace, backend)
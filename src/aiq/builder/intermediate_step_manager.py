@@ -16,20 +16,56 @@
 import dataclasses
 import logging
 import typing
+import uuid
 
+from aiq.builder.framework_enum import LLMFrameworkEnum
 from aiq.data_models.intermediate_step import IntermediateStep
+from aiq.data_models.intermediate_step import IntermediateStepEvent
 from aiq.data_models.intermediate_step import IntermediateStepPayload
 from aiq.data_models.intermediate_step import IntermediateStepState
+from aiq.data_models.intermediate_step import IntermediateStepType
+from aiq.data_models.intermediate_step import StreamEventData
+from aiq.data_models.intermediate_step import TraceMetadata
+from aiq.data_models.intermediate_step import UsageInfo
+from aiq.data_models.intermediate_step import event_state_of
+from aiq.utils.reactive.buffered_observer import OverflowPolicy
 from aiq.utils.reactive.observable import OnComplete
 from aiq.utils.reactive.observable import OnError
 from aiq.utils.reactive.observable import OnNext
+from aiq.utils.reactive.subject import Subject
 from aiq.utils.reactive.subscription import Subscription
 
 if typing.TYPE_CHECKING:
     from aiq.builder.context import AIQContextState
+    from aiq.data_models.config import EventStreamConfig
 
 logger = logging.getLogger(__name__)
 
+_event_stream_config: "EventStreamConfig | None" = None
+
+
+def set_event_stream_config(config: "EventStreamConfig") -> None:
+    """
+    Set the process-wide configuration of the event streams created for new workflow runs.
+    """
+    global _event_stream_config  # pylint: disable=global-statement
+    _event_stream_config = config
+
+
+def create_event_stream() -> Subject[IntermediateStepEvent]:
+    """
+    Create the event stream of a workflow run, delivering to its subscribers as configured by
+    `set_event_stream_config`.
+    """
+    config = _event_stream_config
+    if config is None or config.delivery == "sync":
+        return Subject()
+
+    return Subject(buffered=True,
+                   max_buffer_size=config.max_buffer_size,
+                   batch_size=config.batch_size,
+                   overflow_policy=OverflowPolicy(config.overflow_policy))
+
 
 @dataclasses.dataclass
 class OpenStep:
@@ -59,40 +95,104 @@ class IntermediateStepManager:
         if not isinstance(payload, IntermediateStepPayload):
             raise TypeError(f"Payload must be of type IntermediateStepPayload, not {type(payload)}")
 
+        parent_step_id = self._track_step(payload.event_state, payload.UUID, payload.name, payload.event_type)
+        if parent_step_id is None:
+            return
+
+        active_function = self._context_state.active_function.get()
+
+        self._context_state.event_stream.get().on_next(
+            IntermediateStepEvent.from_payload(parent_step_id, active_function, payload))
+
+    def push_event(
+            self,
+            event_type: IntermediateStepType,
+            UUID: str | None = None,  # pylint: disable=invalid-name
+            name: str | None = None,
+            framework: LLMFrameworkEnum | None = None,
+            tags: list[str] | None = None,
+            data: StreamEventData | dict[str, typing.Any] | None = None,
+            metadata: TraceMetadata | dict[str, typing.Any] | None = None,
+            usage_info: UsageInfo | dict[str, typing.Any] | None = None,
+            event_timestamp: float | None = None,
+            span_event_timestamp: float | None = None) -> None:
+        """
+        Pushes an intermediate step to the AIQ Toolkit Event Stream without building an `IntermediateStepPayload`.
+
+        This is the fast path for frequent events such as streamed tokens. The arguments are the fields of
+        `IntermediateStepPayload`; `data`, `metadata` and `usage_info` can also be given as dictionaries of the fields
+        of their models, which are only built if a subscriber reads them. See `IntermediateStepEvent`.
+        """
+
+        event_state = event_state_of(event_type)
+        if span_event_timestamp is not None and event_state != IntermediateStepState.END:
+            raise ValueError("span_event_timestamp can only be provided for events with an END state")
+
+        if UUID is None:
+            UUID = str(uuid.uuid4())
+
+        parent_step_id = self._track_step(event_state, UUID, name, event_type)
+        if parent_step_id is None:
+            return
+
+        self._context_state.event_stream.get().on_next(
+            IntermediateStepEvent(parent_id=parent_step_id,
+                                  function_ancestry=self._context_state.active_function.get(),
+                                  event_type=event_type,
+                                  UUID=UUID,
+                                  event_timestamp=event_timestamp,
+                                  span_event_timestamp=span_event_timestamp,
+                                  framework=framework,
+                                  name=name,
+                                  tags=tags,
+                                  data=data,
+                                  metadata=metadata,
+                                  usage_info=usage_info))
+
+    def _track_step(self,
+                    event_state: IntermediateStepState,
+                    step_id: str,
+                    step_name: str | None,
+                    event_type: IntermediateStepType) -> str | None:
+        """
+        Updates the active span stack for a step and returns the id of its parent step, or None if the step does not
+        match an outstanding START step and must be dropped.
+        """
+
         active_span_id_stack = self._context_state.active_span_id_stack.get()
 
-        if (payload.event_state == IntermediateStepState.START):
+        if (event_state == IntermediateStepState.START):
 
             prev_stack = active_span_id_stack
 
             parent_step_id = active_span_id_stack[-1]
 
             # Note, this must not mutate the active_span_id_stack in place
-            active_span_id_stack = active_span_id_stack + [payload.UUID]
+            active_span_id_stack = active_span_id_stack + [step_id]
             self._context_state.active_span_id_stack.set(active_span_id_stack)
 
-            self._outstanding_start_steps[payload.UUID] = OpenStep(step_id=payload.UUID,
-                                                                   step_name=payload.name or payload.UUID,
-                                                                   step_type=payload.event_type,
-                                                                   step_parent_id=parent_step_id,
-                                                                   prev_stack=prev_stack,
-                                                                   active_stack=active_span_id_stack)
+            self._outstanding_start_steps[step_id] = OpenStep(step_id=step_id,
+                                                              step_name=step_name or step_id,
+                                                              step_type=event_type,
+                                                              step_parent_id=parent_step_id,
+                                                              prev_stack=prev_stack,
+                                                              active_stack=active_span_id_stack)
 
             logger.debug("Pushed start step %s, name %s, type %s, parent %s, stack id %s",
-                         payload.UUID,
-                         payload.name,
-                         payload.event_type,
+                         step_id,
+                         step_name,
+                         event_type,
                          parent_step_id,
                          id(active_span_id_stack))
 
-        elif (payload.event_state == IntermediateStepState.END):
+        elif (event_state == IntermediateStepState.END):
 
             # Remove the current step from the outstanding steps
-            open_step = self._outstanding_start_steps.pop(payload.UUID, None)
+            open_step = self._outstanding_start_steps.pop(step_id, None)
 
             if (open_step is None):
-                logger.warning("Step id %s not found in outstanding start steps", payload.UUID)
-                return
+                logger.warning("Step id %s not found in outstanding start steps", step_id)
+                return None
 
             parent_step_id = open_step.step_parent_id
 
@@ -124,7 +224,7 @@ class IntermediateStepManager:
                 logger.warning(
                     "Step id %s not the last step in the stack. "
                     "Removing it from the stack but this is likely an error",
-                    payload.UUID)
+                    step_id)
 
             # Verify that the stack is now equal to the previous stack
             if (curr_stack != prev_stack):
@@ -132,36 +232,30 @@ class IntermediateStepManager:
                                "This is likely an error. Report this to the AIQ team.")
 
             logger.debug("Popped end step %s, name %s, type %s, parent %s, stack id %s",
-                         payload.UUID,
-                         payload.name,
-                         payload.event_type,
+                         step_id,
+                         step_name,
+                         event_type,
                          parent_step_id,
                          id(curr_stack))
 
-        elif (payload.event_state == IntermediateStepState.CHUNK):
+        elif (event_state == IntermediateStepState.CHUNK):
 
             # Get the current step from the outstanding steps
-            open_step = self._outstanding_start_steps.get(payload.UUID, None)
+            open_step = self._outstanding_start_steps.get(step_id, None)
 
             # Generate a warning if the parent step id is not set to the current step id
             if (open_step is None):
                 logger.warning(
                     "Created a chunk for step %s, but no matching start step was found. "
                     "Chunks must be created with the same ID as the start step.",
-                    payload.UUID)
-                return
+                    step_id)
+                return None
 
             parent_step_id = open_step.step_parent_id
         else:
             assert False, "Invalid event state"
 
-        active_function = self._context_state.active_function.get()
-
-        intermediate_step = IntermediateStep(parent_id=parent_step_id,
-                                             function_ancestry=active_function,
-                                             payload=payload)
-
-        self._context_state.event_stream.get().on_next(intermediate_step)
+        return parent_step_id
 
     def subscribe(self,
                   on_next: OnNext[IntermediateStep],
@@ -171,4 +265,19 @@ class IntermediateStepManager:
         Subscribes to the AIQ Toolkit Event Stream for intermediate steps
         """
 
+        def on_next_step(event: IntermediateStepEvent) -> None:
+            on_next(event.to_intermediate_step())
+
+        return self._context_state.event_stream.get().subscribe(on_next_step, on_error, on_complete)
+
+    def subscribe_events(self,
+                         on_next: OnNext[IntermediateStepEvent],
+                         on_error: OnError = None,
+                         on_complete: OnComplete = None) -> Subscription:
+        """
+        Subscribes to the AIQ Toolkit Event Stream, receiving the compact `IntermediateStepEvent` of every step.
+        Subscribers which only look at some of the steps should use this method and call
+        `IntermediateStepEvent.to_intermediate_step` for the steps they need as models.
+        """
+
         return self._context_state.event_stream.get().subscribe(on_next, on_error, on_complete)
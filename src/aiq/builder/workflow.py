@@ -51,6 +51,7 @@ class Workflow(FunctionBase[InputT, StreamingOutputT, SingleOutputT]):
                  telemetry_exporters: dict[str, BaseExporter] | None = None,
                  retrievers: dict[str | None, RetrieverProviderInfo] | None = None,
                  its_strategies: dict[str, StrategyBase] | None = None,
+                 exporter_manager: ExporterManager | None = None,
                  context_state: AIQContextState):
 
         super().__init__(input_schema=entry_fn.input_schema,
@@ -66,13 +67,22 @@ class Workflow(FunctionBase[InputT, StreamingOutputT, SingleOutputT]):
         self.object_stores = object_stores or {}
         self.retrievers = retrievers or {}
 
-        self._exporter_manager = ExporterManager.from_exporters(self.telemetry_exporters)
+        # A shared exporter pipeline is owned by the builder so that every workflow it builds reuses it
+        if exporter_manager is None:
+            exporter_manager = ExporterManager.from_exporters(
+                self.telemetry_exporters, shared_pipeline=config.general.telemetry.shared_exporter_pipeline)
+        self._exporter_manager = exporter_manager
         self.its_strategies = its_strategies or {}
 
         self._entry_fn = entry_fn
 
         self._context_state = context_state
 
+    @property
+    def exporter_manager(self) -> ExporterManager:
+
+        return self._exporter_manager
+
     @property
     def has_streaming_output(self) -> bool:
 
@@ -126,6 +136,7 @@ class Workflow(FunctionBase[InputT, StreamingOutputT, SingleOutputT]):
                       telemetry_exporters: dict[str, BaseExporter] | None = None,
                       retrievers: dict[str | None, RetrieverProviderInfo] | None = None,
                       its_strategies: dict[str, StrategyBase] | None = None,
+                      exporter_manager: ExporterManager | None = None,
                       context_state: AIQContextState) -> 'Workflow[InputT, StreamingOutputT, SingleOutputT]':
 
         input_type: type = entry_fn.input_type
@@ -145,4 +156,5 @@ class Workflow(FunctionBase[InputT, StreamingOutputT, SingleOutputT]):
                             telemetry_exporters=telemetry_exporters,
                             retrievers=retrievers,
                             its_strategies=its_strategies,
+                            exporter_manager=exporter_manager,
                             context_state=context_state)
@@ -33,6 +33,7 @@ from aiq.builder.framework_enum import LLMFrameworkEnum
 from aiq.builder.function import Function
 from aiq.builder.function import LambdaFunction
 from aiq.builder.function_info import FunctionInfo
+from aiq.builder.intermediate_step_manager import set_event_stream_config
 from aiq.builder.llm import LLMProviderInfo
 from aiq.builder.retriever import RetrieverProviderInfo
 from aiq.builder.workflow import Workflow
@@ -66,6 +67,8 @@ from aiq.experimental.inference_time_scaling.models.strategy_base import Strateg
 from aiq.memory.interfaces import MemoryEditor
 from aiq.object_store.interfaces import ObjectStore
 from aiq.observability.exporter.base_exporter import BaseExporter
+from aiq.observability.exporter_manager import ExporterManager
+from aiq.profiler.callbacks.token_stream import set_token_stream_config
 from aiq.profiler.decorators.framework_wrapper import chain_wrapped_build_fn
 from aiq.profiler.utils import detect_llm_frameworks_in_build_fn
 from aiq.utils.type_utils import override
@@ -144,6 +147,7 @@ class WorkflowBuilder(Builder, AbstractAsyncContextManager):
 
         self._logging_handlers: dict[str, logging.Handler] = {}
         self._telemetry_exporters: dict[str, ConfiguredTelemetryExporter] = {}
+        self._shared_exporter_manager: ExporterManager | None = None
 
         self._functions: dict[str, ConfiguredFunction] = {}
         self._workflow: ConfiguredFunction | None = None
@@ -190,6 +194,10 @@ class WorkflowBuilder(Builder, AbstractAsyncContextManager):
         for key, telemetry_exporter_config in telemetry_config.tracing.items():
             await self.add_telemetry_exporter(key, telemetry_exporter_config)
 
+        # Configure how the profiler callbacks report streamed LLM tokens and how steps reach the subscribers
+        set_token_stream_config(telemetry_config.token_stream)
+        set_event_stream_config(telemetry_config.event_stream)
+
         return self
 
     async def __aexit__(self, *exc_details):
@@ -262,6 +270,10 @@ class WorkflowBuilder(Builder, AbstractAsyncContextManager):
         else:
             entry_fn_obj = self.get_function(entry_function)
 
+        exporter_manager = None
+        if config.general.telemetry.shared_exporter_pipeline:
+            exporter_manager = self._get_shared_exporter_manager()
+
         workflow = Workflow.from_entry_fn(config=config,
                                           entry_fn=entry_fn_obj,
                                           functions={
@@ -296,10 +308,31 @@ class WorkflowBuilder(Builder, AbstractAsyncContextManager):
                                               k: v.instance
                                               for k, v in self._its_strategies.items()
                                           },
+                                          exporter_manager=exporter_manager,
                                           context_state=self._context_state)
 
         return workflow
 
+    def _get_shared_exporter_manager(self) -> ExporterManager:
+        """
+        Get the exporter manager of the shared exporter pipeline, creating it on first use.
+
+        The manager is shared by every workflow built by this builder, so its exporters are started once, on the first
+        run of any of these workflows, and stopped once, when the builder exits and before the exporters are torn down.
+        Exporters added after the first build are registered with the manager on the next build.
+        """
+        if self._shared_exporter_manager is None:
+            self._shared_exporter_manager = ExporterManager(shared_pipeline=True)
+            self._get_exit_stack().push_async_callback(self._shared_exporter_manager.stop)
+
+        for name, telemetry_exporter in self._telemetry_exporters.items():
+            try:
+                self._shared_exporter_manager.get_exporter(name)
+            except ValueError:
+                self._shared_exporter_manager.add_exporter(name, telemetry_exporter.instance)
+
+        return self._shared_exporter_manager
+
     def _get_exit_stack(self) -> AsyncExitStack:
 
         if self._exit_stack is None:
@@ -346,6 +379,9 @@ class WorkflowBuilder(Builder, AbstractAsyncContextManager):
             raise ValueError("Expected a function, FunctionInfo object, or FunctionBase object to be "
                              f"returned from the function builder. Got {type(build_result)}")
 
+        if build_result.result_cache is not None:
+            self._get_exit_stack().push_async_callback(build_result.result_cache.aclose)
+
         return ConfiguredFunction(config=config, instance=build_result)
 
     @override
@@ -20,6 +20,7 @@ import typing
 from pydantic import BaseModel
 from pydantic import ConfigDict
 from pydantic import Discriminator
+from pydantic import Field
 from pydantic import ValidationError
 from pydantic import ValidationInfo
 from pydantic import ValidatorFunctionWrapHandler
@@ -133,10 +134,66 @@ def _process_validation_error(err: ValidationError, handler: ValidatorFunctionWr
         raise ValidationError.from_exception_data(title=err.title, line_errors=new_errors)
 
 
+class TokenStreamConfig(BaseModel):
+
+    mode: typing.Literal["full", "delta"] = "full"
+    """
+    How streamed LLM tokens are reported as LLM_NEW_TOKEN intermediate steps. In `full` mode every token step carries
+    one token together with the prompt and the raw chunk from the LLM. In `delta` mode the prompt is only reported by
+    the LLM_START step and token steps only carry the new text, in `chunk`, with its offset in the output in
+    `chunk_offset` and its number of tokens in `chunk_tokens`. Subscribers which read the prompt or the raw chunk from
+    token steps must be updated before enabling `delta` mode; `StreamedText` reassembles the output in both modes.
+    """
+
+    coalesce_tokens: int = Field(default=1, ge=1)
+    """
+    Number of tokens combined into a single LLM_NEW_TOKEN step in `delta` mode.
+    """
+
+    coalesce_interval_ms: float | None = Field(default=None, gt=0)
+    """
+    Maximum age in milliseconds of the oldest token of a combined step in `delta` mode. The age is checked when tokens
+    arrive, and the remaining tokens are always reported before the LLM_END step.
+    """
+
+
+class EventStreamConfig(BaseModel):
+
+    delivery: typing.Literal["sync", "buffered"] = "sync"
+    """
+    How intermediate steps are delivered to the subscribers of the event stream, such as exporters. With `sync` every
+    subscriber runs on the stack of the function, LLM or tool producing the step. With `buffered` every subscriber has
+    its own bounded buffer which is drained from the event loop, so slow subscribers do not add to the workflow latency.
+    """
+
+    max_buffer_size: int = Field(default=10_000, ge=1)
+    """
+    Maximum number of steps buffered per subscriber in `buffered` mode.
+    """
+
+    batch_size: int = Field(default=256, ge=1)
+    """
+    Maximum number of steps delivered to a subscriber at once in `buffered` mode.
+    """
+
+    overflow_policy: typing.Literal["block", "drop_oldest", "drop_newest"] = "block"
+    """
+    What happens to new steps when a subscriber's buffer is full in `buffered` mode. `block` keeps every step by
+    making the producer wait, or deliver steps itself when it runs on the event loop.
+    """
+
+
 class TelemetryConfig(BaseModel):
 
     logging: dict[str, LoggingBaseConfig] = {}
     tracing: dict[str, TelemetryExporterBaseConfig] = {}
+    token_stream: TokenStreamConfig = TokenStreamConfig()
+    event_stream: EventStreamConfig = EventStreamConfig()
+    shared_exporter_pipeline: bool = False
+    """
+    Keep one running pipeline per tracing exporter for all workflow runs, instead of starting an isolated copy of
+    every exporter for each run.
+    """
 
     @field_validator("logging", "tracing", mode="wrap")
     @classmethod
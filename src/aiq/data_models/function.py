@@ -15,12 +15,16 @@
 
 import typing
 
+from pydantic import Field
+
 from .common import BaseModelRegistryTag
 from .common import TypedBaseModel
+from .function_cache import FunctionCacheConfig
 
 
 class FunctionBaseConfig(TypedBaseModel, BaseModelRegistryTag):
-    pass
+    cache: FunctionCacheConfig | None = Field(default=None,
+                                              description="Cache the results of the function. Disabled by default.")
 
 
 class EmptyFunctionConfig(FunctionBaseConfig, name="EmptyFunctionConfig"):
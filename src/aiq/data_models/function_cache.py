@@ -0,0 +1,42 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import typing
+
+from pydantic import BaseModel
+from pydantic import Field
+
+
+class FunctionCacheConfig(BaseModel):
+    """
+    Cache of function results, for functions which are pure functions of their input (searches, retrievals, rendering
+    from a spec). Only `ainvoke` results are cached; streaming calls always run the function.
+    """
+    ttl: float | None = Field(default=300.0,
+                              gt=0,
+                              description="Seconds a cached result stays valid. Set to null to never expire entries.")
+    max_entries: int = Field(default=1024,
+                             ge=1,
+                             description="Maximum number of results kept by the in-memory backend (least recently "
+                             "used results are evicted first).")
+    key_fields: list[str] | None = Field(default=None,
+                                         description="Input fields which identify a call. Other input fields are "
+                                         "ignored when looking up cached results. Defaults to the whole input.")
+    backend: typing.Literal["memory", "redis"] = Field(
+        default="memory",
+        description="Where results are cached. The redis backend is shared between processes and requires the "
+        "aiqtoolkit-redis package.")
+    redis_url: str = Field(default="redis://localhost:6379/0", description="Redis server url for the redis backend.")
+    key_prefix: str = Field(default="aiq:function_cache", description="Key prefix to use for redis keys.")
@@ -64,6 +64,60 @@ class IntermediateStepState(str, Enum):
     END = "END"
 
 
+# Category and state of every event type, looked up on every event
+_EVENT_CATEGORY: dict[IntermediateStepType, IntermediateStepCategory] = {
+    IntermediateStepType.LLM_START: IntermediateStepCategory.LLM,
+    IntermediateStepType.LLM_END: IntermediateStepCategory.LLM,
+    IntermediateStepType.LLM_NEW_TOKEN: IntermediateStepCategory.LLM,
+    IntermediateStepType.TOOL_START: IntermediateStepCategory.TOOL,
+    IntermediateStepType.TOOL_END: IntermediateStepCategory.TOOL,
+    IntermediateStepType.WORKFLOW_START: IntermediateStepCategory.WORKFLOW,
+    IntermediateStepType.WORKFLOW_END: IntermediateStepCategory.WORKFLOW,
+    IntermediateStepType.TASK_START: IntermediateStepCategory.TASK,
+    IntermediateStepType.TASK_END: IntermediateStepCategory.TASK,
+    IntermediateStepType.FUNCTION_START: IntermediateStepCategory.FUNCTION,
+    IntermediateStepType.FUNCTION_END: IntermediateStepCategory.FUNCTION,
+    IntermediateStepType.CUSTOM_START: IntermediateStepCategory.CUSTOM,
+    IntermediateStepType.CUSTOM_END: IntermediateStepCategory.CUSTOM,
+    IntermediateStepType.SPAN_START: IntermediateStepCategory.SPAN,
+    IntermediateStepType.SPAN_CHUNK: IntermediateStepCategory.SPAN,
+    IntermediateStepType.SPAN_END: IntermediateStepCategory.SPAN,
+}
+
+_EVENT_STATE: dict[IntermediateStepType, IntermediateStepState] = {
+    IntermediateStepType.LLM_START: IntermediateStepState.START,
+    IntermediateStepType.LLM_END: IntermediateStepState.END,
+    IntermediateStepType.LLM_NEW_TOKEN: IntermediateStepState.CHUNK,
+    IntermediateStepType.TOOL_START: IntermediateStepState.START,
+    IntermediateStepType.TOOL_END: IntermediateStepState.END,
+    IntermediateStepType.WORKFLOW_START: IntermediateStepState.START,
+    IntermediateStepType.WORKFLOW_END: IntermediateStepState.END,
+    IntermediateStepType.TASK_START: IntermediateStepState.START,
+    IntermediateStepType.TASK_END: IntermediateStepState.END,
+    IntermediateStepType.FUNCTION_START: IntermediateStepState.START,
+    IntermediateStepType.FUNCTION_END: IntermediateStepState.END,
+    IntermediateStepType.CUSTOM_START: IntermediateStepState.START,
+    IntermediateStepType.CUSTOM_END: IntermediateStepState.END,
+    IntermediateStepType.SPAN_START: IntermediateStepState.START,
+    IntermediateStepType.SPAN_CHUNK: IntermediateStepState.CHUNK,
+    IntermediateStepType.SPAN_END: IntermediateStepState.END,
+}
+
+
+def event_category_of(event_type: IntermediateStepType) -> IntermediateStepCategory:
+    try:
+        return _EVENT_CATEGORY[event_type]
+    except KeyError:
+        raise ValueError(f"Unknown event type: {event_type}") from None
+
+
+def event_state_of(event_type: IntermediateStepType) -> IntermediateStepState:
+    try:
+        return _EVENT_STATE[event_type]
+    except KeyError:
+        raise ValueError(f"Unknown event type: {event_type}") from None
+
+
 class StreamEventData(BaseModel):
     """
     AIQStreamEventData is a data model that represents the data field in an streaming event.
@@ -142,80 +196,12 @@ class IntermediateStepPayload(BaseModel):
     UUID: str = Field(default_factory=lambda: str(uuid.uuid4()))
 
     @property
-    def event_category(self) -> IntermediateStepCategory:  # pylint: disable=too-many-return-statements
-        match self.event_type:
-            case IntermediateStepType.LLM_START:
-                return IntermediateStepCategory.LLM
-            case IntermediateStepType.LLM_END:
-                return IntermediateStepCategory.LLM
-            case IntermediateStepType.LLM_NEW_TOKEN:
-                return IntermediateStepCategory.LLM
-            case IntermediateStepType.TOOL_START:
-                return IntermediateStepCategory.TOOL
-            case IntermediateStepType.TOOL_END:
-                return IntermediateStepCategory.TOOL
-            case IntermediateStepType.WORKFLOW_START:
-                return IntermediateStepCategory.WORKFLOW
-            case IntermediateStepType.WORKFLOW_END:
-                return IntermediateStepCategory.WORKFLOW
-            case IntermediateStepType.TASK_START:
-                return IntermediateStepCategory.TASK
-            case IntermediateStepType.TASK_END:
-                return IntermediateStepCategory.TASK
-            case IntermediateStepType.FUNCTION_START:
-                return IntermediateStepCategory.FUNCTION
-            case IntermediateStepType.FUNCTION_END:
-                return IntermediateStepCategory.FUNCTION
-            case IntermediateStepType.CUSTOM_START:
-                return IntermediateStepCategory.CUSTOM
-            case IntermediateStepType.CUSTOM_END:
-                return IntermediateStepCategory.CUSTOM
-            case IntermediateStepType.SPAN_START:
-                return IntermediateStepCategory.SPAN
-            case IntermediateStepType.SPAN_CHUNK:
-                return IntermediateStepCategory.SPAN
-            case IntermediateStepType.SPAN_END:
-                return IntermediateStepCategory.SPAN
-            case _:
-                raise ValueError(f"Unknown event type: {self.event_type}")
+    def event_category(self) -> IntermediateStepCategory:
+        return event_category_of(self.event_type)
 
     @property
-    def event_state(self) -> IntermediateStepState:  # pylint: disable=too-many-return-statements
-        match self.event_type:
-            case IntermediateStepType.LLM_START:
-                return IntermediateStepState.START
-            case IntermediateStepType.LLM_END:
-                return IntermediateStepState.END
-            case IntermediateStepType.LLM_NEW_TOKEN:
-                return IntermediateStepState.CHUNK
-            case IntermediateStepType.TOOL_START:
-                return IntermediateStepState.START
-            case IntermediateStepType.TOOL_END:
-                return IntermediateStepState.END
-            case IntermediateStepType.WORKFLOW_START:
-                return IntermediateStepState.START
-            case IntermediateStepType.WORKFLOW_END:
-                return IntermediateStepState.END
-            case IntermediateStepType.TASK_START:
-                return IntermediateStepState.START
-            case IntermediateStepType.TASK_END:
-                return IntermediateStepState.END
-            case IntermediateStepType.FUNCTION_START:
-                return IntermediateStepState.START
-            case IntermediateStepType.FUNCTION_END:
-                return IntermediateStepState.END
-            case IntermediateStepType.CUSTOM_START:
-                return IntermediateStepState.START
-            case IntermediateStepType.CUSTOM_END:
-                return IntermediateStepState.END
-            case IntermediateStepType.SPAN_START:
-                return IntermediateStepState.START
-            case IntermediateStepType.SPAN_CHUNK:
-                return IntermediateStepState.CHUNK
-            case IntermediateStepType.SPAN_END:
-                return IntermediateStepState.END
-            case _:
-                raise ValueError(f"Unknown event type: {self.event_type}")
+    def event_state(self) -> IntermediateStepState:
+        return event_state_of(self.event_type)
 
     @model_validator(mode="after")
     def check_span_event_timestamp(self) -> "IntermediateStepPayload":
@@ -300,3 +286,133 @@ class IntermediateStep(BaseModel):
     @property
     def event_state(self) -> IntermediateStepState:
         return self.payload.event_state
+
+
+class IntermediateStepEvent:
+    """
+    Compact representation of an intermediate step, published on the event stream.
+
+    Events are plain slotted objects which are created without validation, so that producers emitting many events (such
+    as streamed tokens) don't pay for building and validating the pydantic models. Events expose the same read-only
+    attributes as `IntermediateStep`. The nested models are only built when `data`, `metadata`, `usage_info` or
+    `payload` are accessed, and the full `IntermediateStep` when a subscriber asks for it with `to_intermediate_step`.
+
+    The `data` and `usage_info` arguments can be given either as models or as dictionaries of the model fields, and
+    `metadata` as a `TraceMetadata` or as a dictionary of `TraceMetadata` fields.
+    """
+
+    __slots__ = ("parent_id",
+                 "function_ancestry",
+                 "event_type",
+                 "UUID",
+                 "event_timestamp",
+                 "span_event_timestamp",
+                 "framework",
+                 "name",
+                 "tags",
+                 "_data",
+                 "_metadata",
+                 "_usage_info",
+                 "_payload",
+                 "_step")
+
+    def __init__(
+            self,
+            parent_id: str,
+            function_ancestry: InvocationNode,
+            event_type: IntermediateStepType,
+            UUID: str,  # pylint: disable=invalid-name
+            event_timestamp: float | None = None,
+            span_event_timestamp: float | None = None,
+            framework: LLMFrameworkEnum | None = None,
+            name: str | None = None,
+            tags: list[str] | None = None,
+            data: StreamEventData | dict[str, typing.Any] | None = None,
+            metadata: TraceMetadata | dict[str, typing.Any] | None = None,
+            usage_info: UsageInfo | dict[str, typing.Any] | None = None):
+        self.parent_id = parent_id
+        self.function_ancestry = function_ancestry
+        self.event_type = event_type
+        self.UUID = UUID
+        self.event_timestamp = time.time() if event_timestamp is None else event_timestamp
+        self.span_event_timestamp = span_event_timestamp
+        self.framework = framework
+        self.name = name
+        self.tags = tags
+        self._data = data
+        self._metadata = metadata
+        self._usage_info = usage_info
+        self._payload: IntermediateStepPayload | None = None
+        self._step: IntermediateStep | None = None
+
+    @classmethod
+    def from_payload(cls, parent_id: str, function_ancestry: InvocationNode,
+                     payload: IntermediateStepPayload) -> "IntermediateStepEvent":
+        """
+        Create an event from an already validated payload, which is reused when the event is materialized.
+        """
+        event = cls(parent_id=parent_id,
+                    function_ancestry=function_ancestry,
+                    event_type=payload.event_type,
+                    UUID=payload.UUID,
+                    event_timestamp=payload.event_timestamp,
+                    span_event_timestamp=payload.span_event_timestamp,
+                    framework=payload.framework,
+                    name=payload.name,
+                    tags=payload.tags,
+                    data=payload.data,
+                    metadata=payload.metadata,
+                    usage_info=payload.usage_info)
+        event._payload = payload
+        return event
+
+    @property
+    def event_category(self) -> IntermediateStepCategory:
+        return event_category_of(self.event_type)
+
+    @property
+    def event_state(self) -> IntermediateStepState:
+        return event_state_of(self.event_type)
+
+    @property
+    def data(self) -> StreamEventData | None:
+        if isinstance(self._data, dict):
+            self._data = StreamEventData(**self._data)
+        return self._data
+
+    @property
+    def metadata(self) -> dict[str, typing.Any] | TraceMetadata | None:
+        if type(self._metadata) is dict and self._payload is None:
+            self._metadata = TraceMetadata(**self._metadata)
+        return self._metadata
+
+    @property
+    def usage_info(self) -> UsageInfo | None:
+        if isinstance(self._usage_info, dict):
+            self._usage_info = UsageInfo(**self._usage_info)
+        return self._usage_info
+
+    @property
+    def payload(self) -> IntermediateStepPayload:
+        if self._payload is None:
+            self._payload = IntermediateStepPayload(event_type=self.event_type,
+                                                    event_timestamp=self.event_timestamp,
+                                                    span_event_timestamp=self.span_event_timestamp,
+                                                    framework=self.framework,
+                                                    name=self.name,
+                                                    tags=self.tags,
+                                                    metadata=self.metadata,
+                                                    data=self.data,
+                                                    usage_info=self.usage_info,
+                                                    UUID=self.UUID)
+        return self._payload
+
+    def to_intermediate_step(self) -> IntermediateStep:
+        """
+        Get the event as an `IntermediateStep`. The step is built once and shared by all subscribers.
+        """
+        if self._step is None:
+            self._step = IntermediateStep(parent_id=self.parent_id,
+                                          function_ancestry=self.function_ancestry,
+                                          payload=self.payload)
+        return self._step
@@ -37,6 +37,7 @@ from aiq.eval.usage_stats import UsageStatsLLM
 from aiq.eval.utils.output_uploader import OutputUploader
 from aiq.eval.utils.weave_eval import WeaveEvaluationIntegration
 from aiq.profiler.data_models import ProfilerResults
+from aiq.runtime.admission import RequestPriority
 from aiq.runtime.session import AIQSessionManager
 
 logger = logging.getLogger(__name__)
@@ -146,7 +147,7 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
             if stop_event.is_set():
                 return "", []
 
-            async with session_manager.run(item.input_obj) as runner:
+            async with session_manager.run(item.input_obj, priority=RequestPriority.EVALUATION) as runner:
                 if not session_manager.workflow.has_single_output:
                     # raise an error if the workflow has multiple outputs
                     raise NotImplementedError("Multiple outputs are not supported")
@@ -18,6 +18,8 @@ import logging
 
 from aiq.builder.context import AIQContext
 from aiq.data_models.intermediate_step import IntermediateStep
+from aiq.data_models.intermediate_step import IntermediateStepType
+from aiq.profiler.callbacks.token_stream import StreamedText
 
 logger = logging.getLogger(__name__)
 
@@ -31,10 +33,21 @@ def pull_intermediate() -> asyncio.Future[list[dict]]:
     future = asyncio.Future()
     intermediate_steps = []  # We'll store the dumped steps here.
     context = AIQContext.get()
+    streamed_text = StreamedText()
 
     def on_next_cb(item: IntermediateStep):
         # Append each new intermediate step (dumped to dict) to the list.
-        intermediate_steps.append(item.model_dump())
+        step = item.model_dump()
+
+        # Give LLM end steps without an output the text streamed by the LLM
+        if item.event_type == IntermediateStepType.LLM_NEW_TOKEN:
+            streamed_text.add(item)
+        elif item.event_type == IntermediateStepType.LLM_END:
+            streamed_output = streamed_text.pop(item.UUID)
+            if streamed_output and (item.data is None or item.data.output is None):
+                step["payload"]["data"] = {**(step["payload"]["data"] or {}), "output": streamed_output}
+
+        intermediate_steps.append(step)
 
     def on_error_cb(exc: Exception):
         logger.error("Hit on_error: %s", exc)
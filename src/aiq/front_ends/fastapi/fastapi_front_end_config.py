@@ -176,15 +176,80 @@ class FastApiFrontEndConfig(FrontEndBaseConfig, name="fastapi"):
             description="Sets a maximum time in seconds for browsers to cache CORS responses.",
         )
 
+    class JobStoreConfig(BaseModel):
+        backend: typing.Literal["memory", "sqlite", "redis"] = Field(
+            default="memory",
+            description=("Where async jobs are tracked. The memory backend is local to each worker process and loses "
+                         "jobs on restart. The sqlite and redis backends are durable and shared between workers; the "
+                         "redis backend requires the aiqtoolkit-redis package."))
+        sqlite_path: str | None = Field(
+            default=None, description="Path of the SQLite database. Defaults to `jobs.db` in the user data directory.")
+        redis_url: str = Field(default="redis://localhost:6379/0",
+                               description="Redis server url for the redis backend.")
+        key_prefix: str = Field(default="aiq:jobs", description="Key prefix to use for redis keys.")
+        object_store: ObjectStoreRef | None = Field(
+            default=None,
+            description=("Object store for the outputs of async jobs. If present, durable backends store outputs in "
+                         "the object store and only keep a reference to them."))
+        output_prefix: str = Field(default="jobs", description="Key prefix of the job outputs in the object store.")
+
+    class AdmissionConfig(BaseModel):
+        max_concurrency: int = Field(
+            default=8,
+            description=("Maximum number of workflow runs in flight in each worker process, shared by all endpoints. "
+                         "0 disables admission control."))
+        min_concurrency: int = Field(default=1,
+                                     description="Lower bound of the concurrency limit when it is adaptive.",
+                                     ge=1)
+        max_queue_size: int | None = Field(
+            default=None,
+            description=("Maximum number of runs waiting per priority class. Further requests are rejected with "
+                         "HTTP 429. None is unbounded."),
+            ge=0)
+        queue_timeout: float | None = Field(
+            default=None,
+            description=("Maximum number of seconds a run waits to be admitted before the request is rejected with "
+                         "HTTP 503. None waits forever."),
+            gt=0)
+        adaptive: bool = Field(
+            default=False,
+            description=("Adapt the concurrency limit to the observed run latency, reducing it when the backends "
+                         "(usually the LLM) slow down and raising it back while latency is healthy."))
+        latency_tolerance: float = Field(
+            default=2.0,
+            description="Runs slower than the baseline latency times this factor reduce the adaptive limit.",
+            gt=1.0)
+        backoff_ratio: float = Field(default=0.9,
+                                     description="Factor applied to the adaptive limit when it is reduced.",
+                                     gt=0.0,
+                                     lt=1.0)
+
     root_path: str = Field(default="", description="The root path for the API")
     host: str = Field(default="localhost", description="Host to bind the server to")
     port: int = Field(default=8000, description="Port to bind the server to", ge=0, le=65535)
     reload: bool = Field(default=False, description="Enable auto-reload for development")
-    workers: int = Field(default=1, description="Number of workers to run", ge=1)
+    workers: int = Field(default=1,
+                         description=("Number of worker processes to run. Each worker builds the workflow once. With "
+                                      "more than one worker, async jobs are shared through the job store, so the "
+                                      "memory job store is replaced by a SQLite store shared by the workers. In-memory "
+                                      "object stores cannot be shared by several workers and are rejected."),
+                         ge=1)
     max_running_async_jobs: int = Field(default=10,
                                         description="Maximum number of async jobs to run concurrently",
                                         ge=1)
     step_adaptor: StepAdaptorConfig = StepAdaptorConfig()
+    job_store: JobStoreConfig = Field(default_factory=JobStoreConfig,
+                                      description="Storage of the async evaluation and generation jobs.")
+    admission: AdmissionConfig = Field(
+        default_factory=AdmissionConfig,
+        description=("Admission control of workflow runs. Websocket runs are admitted before synchronous HTTP "
+                     "requests, which are admitted before async jobs and evaluations."))
+    metrics_path: str | None = Field(
+        default=None,
+        description=("Path of the endpoint reporting request and resource metrics of every worker process in the "
+                     "Prometheus text format, e.g. '/metrics'. The endpoint is not authenticated and exposes process "
+                     "ids, resource usage and request rates, so it is disabled by default. If None, no metrics "
+                     "endpoint is created."))
 
     workflow: typing.Annotated[EndpointBase, Field(description="Endpoint for the default workflow.")] = EndpointBase(
         method="POST",
@@ -15,6 +15,7 @@
 
 import logging
 import os
+import shutil
 import tempfile
 import typing
 
@@ -22,6 +23,8 @@ from aiq.builder.front_end import FrontEndBase
 from aiq.front_ends.fastapi.fastapi_front_end_config import FastApiFrontEndConfig
 from aiq.front_ends.fastapi.fastapi_front_end_plugin_worker import FastApiFrontEndPluginWorkerBase
 from aiq.front_ends.fastapi.main import get_app
+from aiq.front_ends.fastapi.worker_metrics import METRICS_DIR_ENV
+from aiq.object_store.in_memory_object_store import InMemoryObjectStoreConfig
 from aiq.utils.io.yaml_tools import yaml_dump
 
 logger = logging.getLogger(__name__)
@@ -44,8 +47,50 @@ class FastApiFrontEndPlugin(FrontEndBase[FastApiFrontEndConfig]):
 
         return f"{worker_class.__module__}.{worker_class.__qualname__}"
 
+    def _prepare_workers(self) -> str:
+        """
+        Prepare the state shared by the worker processes, returning the directory holding it.
+
+        Raises:
+            ValueError: If static files or job outputs are kept in an in-memory object store, which every worker
+                would have a separate copy of.
+        """
+        self._check_shared_object_stores()
+
+        run_dir = tempfile.mkdtemp(prefix="aiq_workers_")
+
+        # Every worker reports its metrics through the shared directory
+        if self.front_end_config.metrics_path:
+            os.environ[METRICS_DIR_ENV] = os.path.join(run_dir, "metrics")
+
+        # Async jobs must be visible to every worker, not only to the one which accepted the job
+        job_store_config = self.front_end_config.job_store
+        if job_store_config.backend == "memory":
+            logger.info("Sharing async jobs between %d workers through a SQLite job store",
+                        self.front_end_config.workers)
+            self.front_end_config.job_store = job_store_config.model_copy(update={
+                "backend": "sqlite", "sqlite_path": os.path.join(run_dir, "jobs.db")
+            })
+
+        return run_dir
+
+    def _check_shared_object_stores(self) -> None:
+        refs = {
+            "object_store": self.front_end_config.object_store,
+            "job_store.object_store": self.front_end_config.job_store.object_store,
+        }
+        for field, ref in refs.items():
+            if ref is None:
+                continue
+            if isinstance(self.full_config.object_stores.get(ref), InMemoryObjectStoreConfig):
+                raise ValueError(f"The front end {field} '{ref}' is an in-memory object store, which is not shared "
+                                 f"between the {self.front_end_config.workers} workers. Use an external object store "
+                                 "or a single worker.")
+
     async def run(self):
 
+        run_dir = self._prepare_workers() if self.front_end_config.workers > 1 else None
+
         # Write the entire config to a temporary file
         with tempfile.NamedTemporaryFile(mode="w", prefix="aiq_config", suffix=".yml", delete=False) as config_file:
 
@@ -101,10 +146,13 @@ class FastApiFrontEndPlugin(FrontEndBase[FastApiFrontEndConfig]):
                     def load(self):
                         return self.app
 
+                # The app, the config and the plugins are loaded once before forking the workers. Every worker
+                # builds its own workflow on startup.
                 options = {
                     "bind": f"{self.front_end_config.host}:{self.front_end_config.port}",
                     "workers": self.front_end_config.workers,
                     "worker_class": "uvicorn.workers.UvicornWorker",
+                    "preload_app": True,
                 }
 
                 StandaloneApplication(app, options=options).run()
@@ -114,3 +162,6 @@ class FastApiFrontEndPlugin(FrontEndBase[FastApiFrontEndConfig]):
                 os.remove(config_file_name)
             except OSError as e:
                 logger.error(f"Warning: Failed to delete temp file {config_file_name}: {e}")
+
+            if run_dir is not None:
+                shutil.rmtree(run_dir, ignore_errors=True)
@@ -15,8 +15,8 @@
 
 import asyncio
 import logging
+import math
 import os
-import time
 import typing
 from abc import ABC
 from abc import abstractmethod
@@ -33,11 +33,13 @@ from fastapi import Response
 from fastapi import UploadFile
 from fastapi.exceptions import HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from pydantic import Field
 from starlette.websockets import WebSocket
 
+from aiq.builder.workflow import Workflow
 from aiq.builder.workflow_builder import WorkflowBuilder
 from aiq.data_models.api_server import AIQChatRequest
 from aiq.data_models.api_server import AIQChatResponse
@@ -60,17 +62,63 @@ from aiq.front_ends.fastapi.fastapi_front_end_config import AIQEvaluateStatusRes
 from aiq.front_ends.fastapi.fastapi_front_end_config import FastApiFrontEndConfig
 from aiq.front_ends.fastapi.job_store import JobInfo
 from aiq.front_ends.fastapi.job_store import JobStore
+from aiq.front_ends.fastapi.job_store import JobStoreBase
+from aiq.front_ends.fastapi.job_store import create_job_store
 from aiq.front_ends.fastapi.message_handler import WebSocketMessageHandler
 from aiq.front_ends.fastapi.response_helpers import generate_single_response
 from aiq.front_ends.fastapi.response_helpers import generate_streaming_response_as_str
 from aiq.front_ends.fastapi.response_helpers import generate_streaming_response_full_as_str
 from aiq.front_ends.fastapi.step_adaptor import StepAdaptor
-from aiq.object_store.models import ObjectStoreItem
+from aiq.front_ends.fastapi.worker_metrics import METRICS_DIR_ENV
+from aiq.front_ends.fastapi.worker_metrics import WorkerMetrics
+from aiq.object_store.interfaces import DEFAULT_CHUNK_SIZE
+from aiq.object_store.interfaces import ObjectStore
+from aiq.runtime.admission import AdmissionController
+from aiq.runtime.admission import AdmissionRejectedError
+from aiq.runtime.admission import RequestPriority
 from aiq.runtime.session import AIQSessionManager
 
 logger = logging.getLogger(__name__)
 
 
+def _parse_byte_range(range_header: str | None, size: int) -> tuple[int, int] | None:
+    """
+    Parse a single `bytes=` HTTP Range header into the `[start, end)` range of an object of the given size. Returns
+    `None` when the whole object should be sent, including for multiple ranges which are not supported.
+    """
+    if not range_header:
+        return None
+
+    unit, _, ranges = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in ranges:
+        return None
+
+    first, sep, last = ranges.strip().partition("-")
+    try:
+        if not sep or (not first and not last):
+            raise ValueError(range_header)
+        if not first:
+            # Suffix range with the number of bytes at the end of the object
+            start, end = max(0, size - int(last)), size
+        else:
+            start = int(first)
+            end = int(last) + 1 if last else size
+        if start < 0 or end < start:
+            raise ValueError(range_header)
+    except ValueError:
+        return None
+
+    # A range extending past the object is served up to its end, a range starting past it is not satisfiable
+    end = min(end, size)
+
+    if start >= size or start == end:
+        raise HTTPException(status_code=416,
+                            detail="Requested range not satisfiable",
+                            headers={"Content-Range": f"bytes */{size}"})
+
+    return start, end
+
+
 class FastApiFrontEndPluginWorkerBase(ABC):
 
     def __init__(self, config: AIQConfig):
@@ -81,8 +129,13 @@ class FastApiFrontEndPluginWorkerBase(ABC):
 
         self._front_end_config = config.general.front_end
 
-        self._cleanup_tasks: list[str] = []
-        self._cleanup_tasks_lock = asyncio.Lock()
+        # Job stores of all routes, expired jobs are removed by a single periodic cleanup task
+        self._job_stores: list[JobStoreBase] = []
+        self._job_output_store: ObjectStore | None = None
+        self._metrics = WorkerMetrics(metrics_dir=os.getenv(METRICS_DIR_ENV))
+        # Workflow runs of all endpoints share a single admission controller
+        self._admission = AdmissionController(**self._front_end_config.admission.model_dump())
+        self._metrics.add_collector(self._admission.stats)
         self._http_flow_handler: HTTPAuthenticationFlowHandler | None = HTTPAuthenticationFlowHandler()
 
     @property
@@ -105,21 +158,20 @@ class FastApiFrontEndPluginWorkerBase(ABC):
 
                 await self.configure(starting_app, builder)
 
-                yield
+                cleanup_task = asyncio.create_task(self._periodic_cleanup())
+                # Metrics are only recorded when the metrics endpoint is enabled
+                metrics_task = asyncio.create_task(self._metrics.run()) if self.front_end_config.metrics_path else None
 
-                # If a cleanup task is running, cancel it
-                async with self._cleanup_tasks_lock:
+                yield
 
-                    # Cancel all cleanup tasks
-                    for task_name in self._cleanup_tasks:
-                        cleanup_task: asyncio.Task | None = getattr(starting_app.state, task_name, None)
-                        if cleanup_task is not None:
-                            logger.info("Cancelling %s cleanup task", task_name)
-                            cleanup_task.cancel()
-                        else:
-                            logger.warning("No cleanup task found for %s", task_name)
+                logger.info("Cancelling job cleanup task")
+                cleanup_task.cancel()
+                if metrics_task is not None:
+                    metrics_task.cancel()
 
-                    self._cleanup_tasks.clear()
+                for job_store in self._job_stores:
+                    await job_store.aclose()
+                self._job_stores.clear()
 
             logger.debug("Closing AIQ Toolkit server from process %s", os.getpid())
 
@@ -132,8 +184,32 @@ class FastApiFrontEndPluginWorkerBase(ABC):
         async def authentication_log_filter(request: Request, call_next: Callable[[Request], Awaitable[Response]]):
             return await self._suppress_authentication_logs(request, call_next)
 
+        aiq_app.add_exception_handler(AdmissionRejectedError, self._admission_rejected_handler)
+
+        if self.front_end_config.metrics_path:
+            aiq_app.middleware("http")(self._metrics.middleware)
+            aiq_app.add_api_route(self.front_end_config.metrics_path,
+                                  self._get_metrics,
+                                  methods=["GET"],
+                                  include_in_schema=False)
+
         return aiq_app
 
+    async def _get_metrics(self) -> Response:
+        return Response(content=self._metrics.render_prometheus(), media_type="text/plain; version=0.0.4")
+
+    async def _admission_rejected_handler(self, request: Request, exc: AdmissionRejectedError) -> Response:
+        # A full queue means the client is sending too much, a timeout means the server is overloaded
+        return JSONResponse(status_code=429 if exc.queue_full else 503,
+                            content={"detail": str(exc)},
+                            headers={"Retry-After": str(math.ceil(exc.retry_after))})
+
+    def create_session_manager(self, workflow: Workflow) -> AIQSessionManager:
+        """
+        Create the session manager of an endpoint, admitting its runs with the admission controller of the worker.
+        """
+        return AIQSessionManager(workflow, admission_controller=self._admission)
+
     def set_cors_config(self, aiq_app: FastAPI) -> None:
         """
         Set the cross origin resource sharing configuration.
@@ -186,6 +262,29 @@ class FastApiFrontEndPluginWorkerBase(ABC):
 
         return response
 
+    def create_job_store(self, namespace: str) -> JobStoreBase:
+        """
+        Create a job store, using the configured backend, whose expired jobs are removed by the periodic cleanup task.
+
+        Args:
+            namespace (str): Name which keeps the jobs of different routes apart in shared backends.
+        """
+        job_store = create_job_store(self.front_end_config.job_store,
+                                     namespace=namespace,
+                                     object_store=self._job_output_store)
+        self._job_stores.append(job_store)
+        return job_store
+
+    async def _periodic_cleanup(self, sleep_time_sec: int = 300):
+        while True:
+            await asyncio.sleep(sleep_time_sec)
+            for job_store in self._job_stores:
+                try:
+                    await job_store.cleanup_expired_jobs()
+                except Exception as e:
+                    logger.error("Error during job cleanup: %s", e)
+            logger.debug("Expired jobs cleaned up")
+
     @abstractmethod
     async def configure(self, app: FastAPI, builder: WorkflowBuilder):
         pass
@@ -208,32 +307,6 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
         self._outstanding_flows: dict[str, FlowState] = {}
         self._outstanding_flows_lock = asyncio.Lock()
 
-    @staticmethod
-    async def _periodic_cleanup(name: str, job_store: JobStore, sleep_time_sec: int = 300):
-        while True:
-            try:
-                job_store.cleanup_expired_jobs()
-                logger.debug("Expired %s jobs cleaned up", name)
-            except Exception as e:
-                logger.error("Error during %s job cleanup: %s", name, e)
-            await asyncio.sleep(sleep_time_sec)
-
-    async def create_cleanup_task(self, app: FastAPI, name: str, job_store: JobStore, sleep_time_sec: int = 300):
-        # Schedule periodic cleanup of expired jobs on first job creation
-        attr_name = f"{name}_cleanup_task"
-
-        # Cheap check, if it doesn't exist, we will need to re-check after we acquire the lock
-        if not hasattr(app.state, attr_name):
-            async with self._cleanup_tasks_lock:
-                if not hasattr(app.state, attr_name):
-                    logger.info("Starting %s periodic cleanup task", name)
-                    setattr(
-                        app.state,
-                        attr_name,
-                        asyncio.create_task(
-                            self._periodic_cleanup(name=name, job_store=job_store, sleep_time_sec=sleep_time_sec)))
-                    self._cleanup_tasks.append(attr_name)
-
     def get_step_adaptor(self) -> StepAdaptor:
 
         return StepAdaptor(self.front_end_config.step_adaptor)
@@ -247,8 +320,11 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
     async def add_routes(self, app: FastAPI, builder: WorkflowBuilder):
 
-        await self.add_default_route(app, AIQSessionManager(builder.build()))
-        await self.add_evaluate_route(app, AIQSessionManager(builder.build()))
+        if self.front_end_config.job_store.object_store:
+            self._job_output_store = await builder.get_object_store_client(self.front_end_config.job_store.object_store)
+
+        await self.add_default_route(app, self.create_session_manager(builder.build()))
+        await self.add_evaluate_route(app, self.create_session_manager(builder.build()))
         await self.add_static_files_route(app, builder)
         await self.add_authorization_route(app)
 
@@ -256,7 +332,7 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
             entry_workflow = builder.build(entry_function=ep.function_name)
 
-            await self.add_route(app, endpoint=ep, session_manager=AIQSessionManager(entry_workflow))
+            await self.add_route(app, endpoint=ep, session_manager=self.create_session_manager(entry_workflow))
 
     async def add_default_route(self, app: FastAPI, session_manager: AIQSessionManager):
 
@@ -277,7 +353,7 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
         }
 
         # Create job store for tracking evaluation jobs
-        job_store = JobStore()
+        job_store = self.create_job_store(namespace="evaluate")
         # Don't run multiple evaluations at the same time
         evaluation_lock = asyncio.Lock()
 
@@ -289,20 +365,20 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
                     eval_config = EvaluationRunConfig(config_file=Path(config_file), dataset=None, reps=reps)
 
                     # Create a new EvaluationRun with the evaluation-specific config
-                    job_store.update_status(job_id, "running")
+                    await job_store.update_status(job_id, "running")
                     eval_runner = EvaluationRun(eval_config)
                     output: EvaluationRunOutput = await eval_runner.run_and_evaluate(session_manager=session_manager,
                                                                                      job_id=job_id)
                     if output.workflow_interrupted:
-                        job_store.update_status(job_id, "interrupted")
+                        await job_store.update_status(job_id, "interrupted")
                     else:
                         parent_dir = os.path.dirname(
                             output.workflow_output_file) if output.workflow_output_file else None
 
-                        job_store.update_status(job_id, "success", output_path=str(parent_dir))
+                        await job_store.update_status(job_id, "success", output_path=str(parent_dir))
                 except Exception as e:
                     logger.error("Error in evaluation job %s: %s", job_id, str(e))
-                    job_store.update_status(job_id, "failure", error=str(e))
+                    await job_store.update_status(job_id, "failure", error=str(e))
 
         async def start_evaluation(request: AIQEvaluateRequest,
                                    background_tasks: BackgroundTasks,
@@ -313,12 +389,11 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
                 # if job_id is present and already exists return the job info
                 if request.job_id:
-                    job = job_store.get_job(request.job_id)
+                    job = await job_store.get_job(request.job_id)
                     if job:
                         return AIQEvaluateResponse(job_id=job.job_id, status=job.status)
 
-                job_id = job_store.create_job(request.config_file, request.job_id, request.expiry_seconds)
-                await self.create_cleanup_task(app=app, name="async_evaluation", job_store=job_store)
+                job_id = await job_store.create_job(request.config_file, request.job_id, request.expiry_seconds)
                 background_tasks.add_task(run_evaluation, job_id, request.config_file, request.reps, session_manager)
 
                 return AIQEvaluateResponse(job_id=job_id, status="submitted")
@@ -340,7 +415,7 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
             async with session_manager.session(request=http_request):
 
-                job = job_store.get_job(job_id)
+                job = await job_store.get_job(job_id)
                 if not job:
                     logger.warning("Job %s not found", job_id)
                     raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
@@ -353,7 +428,7 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
             async with session_manager.session(request=http_request):
 
-                job = job_store.get_last_job()
+                job = await job_store.get_last_job()
                 if not job:
                     logger.warning("No jobs found when requesting last job status")
                     raise HTTPException(status_code=404, detail="No jobs found")
@@ -367,10 +442,10 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
                 if status is None:
                     logger.info("Getting all jobs")
-                    jobs = job_store.get_all_jobs()
+                    jobs = await job_store.get_all_jobs()
                 else:
                     logger.info("Getting jobs with status %s", status)
-                    jobs = job_store.get_jobs_by_status(status)
+                    jobs = await job_store.get_jobs_by_status(status)
                 logger.info("Found %d jobs", len(jobs))
                 return [translate_job_to_response(job) for job in jobs]
 
@@ -440,14 +515,19 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
                 raise HTTPException(status_code=400, detail="Filename cannot be empty.")
             return sanitized_path
 
+        async def read_upload(file: UploadFile):
+            # The upload is spooled by the multipart parser, read it back one chunk at a time
+            while chunk := await file.read(DEFAULT_CHUNK_SIZE):
+                yield chunk
+
         # Upload static files to the object store; if key is present, it will fail with 409 Conflict
         async def add_static_file(file_path: str, file: UploadFile):
             sanitized_file_path = sanitize_path(file_path)
-            file_data = await file.read()
 
             try:
-                await object_store_client.put_object(sanitized_file_path,
-                                                     ObjectStoreItem(data=file_data, content_type=file.content_type))
+                await object_store_client.put_object_stream(sanitized_file_path,
+                                                            read_upload(file),
+                                                            content_type=file.content_type)
             except KeyAlreadyExistsError as e:
                 raise HTTPException(status_code=409, detail=str(e)) from e
 
@@ -456,29 +536,37 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
         # Upsert static files to the object store; if key is present, it will overwrite the file
         async def upsert_static_file(file_path: str, file: UploadFile):
             sanitized_file_path = sanitize_path(file_path)
-            file_data = await file.read()
 
-            await object_store_client.upsert_object(sanitized_file_path,
-                                                    ObjectStoreItem(data=file_data, content_type=file.content_type))
+            await object_store_client.upsert_object_stream(sanitized_file_path,
+                                                           read_upload(file),
+                                                           content_type=file.content_type)
 
             return {"filename": sanitized_file_path}
 
-        # Get static files from the object store
-        async def get_static_file(file_path: str):
+        # Get static files from the object store, streaming the whole file or the byte range requested
+        async def get_static_file(file_path: str, request: Request):
 
             try:
-                file_data = await object_store_client.get_object(file_path)
+                info = await object_store_client.get_object_info(file_path)
             except NoSuchKeyError as e:
                 raise HTTPException(status_code=404, detail=str(e)) from e
 
             filename = file_path.split("/")[-1]
+            headers = {"Content-Disposition": f"attachment; filename={filename}", "Accept-Ranges": "bytes"}
 
-            async def reader():
-                yield file_data.data
+            byte_range = _parse_byte_range(request.headers.get("range"), info.size)
+            if byte_range is None:
+                start, end, status_code = 0, info.size, 200
+            else:
+                start, end = byte_range
+                status_code = 206
+                headers["Content-Range"] = f"bytes {start}-{end - 1}/{info.size}"
+            headers["Content-Length"] = str(end - start)
 
-            return StreamingResponse(reader(),
-                                     media_type=file_data.content_type,
-                                     headers={"Content-Disposition": f"attachment; filename={filename}"})
+            return StreamingResponse(object_store_client.get_object_stream(file_path, start, end),
+                                     status_code=status_code,
+                                     media_type=info.content_type,
+                                     headers=headers)
 
         async def delete_static_file(file_path: str):
             try:
@@ -563,7 +651,7 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
         }
 
         # Create job store for tracking async generation jobs
-        job_store = JobStore()
+        job_store = self.create_job_store(namespace=f"generate:{endpoint.path}")
 
         # Run up to max_running_async_jobs jobs at the same time
         async_job_concurrency = asyncio.Semaphore(self._front_end_config.max_running_async_jobs)
@@ -734,19 +822,19 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
                                  session_manager: AIQSessionManager,
                                  result_type: type):
             """Background task to run the evaluation."""
-            async with async_job_concurrency:
+            async with async_job_concurrency, session_manager.session(priority=RequestPriority.ASYNC):
                 try:
                     result = await generate_single_response(payload=payload,
                                                             session_manager=session_manager,
                                                             result_type=result_type)
-                    job_store.update_status(job_id, "success", output=result)
+                    await job_store.update_status(job_id, "success", output=result)
                 except Exception as e:
                     logger.error("Error in evaluation job %s: %s", job_id, e)
-                    job_store.update_status(job_id, "failure", error=str(e))
+                    await job_store.update_status(job_id, "failure", error=str(e))
 
         def _job_status_to_response(job: JobInfo) -> AIQAsyncGenerationStatusResponse:
             job_output = job.output
-            if job_output is not None:
+            if isinstance(job_output, BaseModel):
                 job_output = job_output.model_dump()
             return AIQAsyncGenerationStatusResponse(job_id=job.job_id,
                                                     status=job.status,
@@ -767,12 +855,11 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
                     # if job_id is present and already exists return the job info
                     if request.job_id:
-                        job = job_store.get_job(request.job_id)
+                        job = await job_store.get_job(request.job_id)
                         if job:
                             return AIQAsyncGenerateResponse(job_id=job.job_id, status=job.status)
 
-                    job_id = job_store.create_job(job_id=request.job_id, expiry_seconds=request.expiry_seconds)
-                    await self.create_cleanup_task(app=app, name="async_generation", job_store=job_store)
+                    job_id = await job_store.create_job(job_id=request.job_id, expiry_seconds=request.expiry_seconds)
 
                     # The fastapi/starlette background tasks won't begin executing until after the response is sent
                     # to the client, so we need to wrap the task in a function, alowing us to start the task now,
@@ -788,17 +875,11 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
                     background_tasks.add_task(wrapped_task, task)
 
-                    now = time.time()
-                    sync_timeout = now + request.sync_timeout
-                    while time.time() < sync_timeout:
-                        job = job_store.get_job(job_id)
-                        if job is not None and job.status not in job_store.ACTIVE_STATUS:
-                            # If the job is done, return the result
-                            response.status_code = 200
-                            return _job_status_to_response(job)
-
-                        # Sleep for a short time before checking again
-                        await asyncio.sleep(0.1)
+                    # Return as soon as the job finishes within the sync timeout
+                    job = await job_store.wait_for_job(job_id, timeout=request.sync_timeout)
+                    if job is not None and job.status not in job_store.ACTIVE_STATUS:
+                        response.status_code = 200
+                        return _job_status_to_response(job)
 
                     response.status_code = 202
                     return AIQAsyncGenerateResponse(job_id=job_id, status="submitted")
@@ -811,7 +892,7 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
             async with session_manager.session(request=http_request):
 
-                job = job_store.get_job(job_id)
+                job = await job_store.get_job(job_id)
                 if not job:
                     logger.warning("Job %s not found", job_id)
                     raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
@@ -18,7 +18,7 @@ import logging
 
 from aiq.builder.context import AIQContext
 from aiq.data_models.api_server import AIQResponseIntermediateStep
-from aiq.data_models.intermediate_step import IntermediateStep
+from aiq.data_models.intermediate_step import IntermediateStepEvent
 
 logger = logging.getLogger(__name__)
 
@@ -36,12 +36,13 @@ async def pull_intermediate(_q, adapter):
     async def set_intermediate_done():
         intermediate_done.set()
 
-    def on_next_cb(item: IntermediateStep):
+    def on_next_cb(item: IntermediateStepEvent):
         """
         Synchronously called whenever the runner publishes an event.
         We process it, then place it into the async queue (via a small async task).
-        If adapter is None, convert the raw IntermediateStep into the complete
-        AIQResponseIntermediateStep and place it into the queue.
+        If adapter is None, convert the raw IntermediateStepEvent into the complete
+        AIQResponseIntermediateStep and place it into the queue. The adapter works on the compact
+        event, so that steps it filters out are never materialized as models.
         """
         if adapter is None:
             adapted = AIQResponseIntermediateStep(id=item.UUID,
@@ -72,9 +73,9 @@ async def pull_intermediate(_q, adapter):
         loop.create_task(set_intermediate_done())
 
     # Subscribe to the runner's "reactive_event_stream" (now a simple Observable)
-    _ = context.intermediate_step_manager.subscribe(on_next=on_next_cb,
-                                                    on_error=on_error_cb,
-                                                    on_complete=on_complete_cb)
+    _ = context.intermediate_step_manager.subscribe_events(on_next=on_next_cb,
+                                                           on_error=on_error_cb,
+                                                           on_complete=on_complete_cb)
 
     # Wait until on_complete or on_error sets intermediate_done
     return intermediate_done
@@ -1,4 +1,4 @@
-# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
@@ -13,10 +13,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+
+import asyncio
+import json
 import logging
 import os
 import shutil
 import threading
+import typing
+from abc import ABC
+from abc import abstractmethod
 from datetime import UTC
 from datetime import datetime
 from datetime import timedelta
@@ -25,6 +31,13 @@ from uuid import uuid4
 
 from pydantic import BaseModel
 
+from aiq.data_models.object_store import NoSuchKeyError
+from aiq.object_store.interfaces import ObjectStore
+from aiq.object_store.models import ObjectStoreItem
+
+if typing.TYPE_CHECKING:
+    from aiq.front_ends.fastapi.fastapi_front_end_config import FastApiFrontEndConfig
+
 logger = logging.getLogger(__name__)
 
 
@@ -47,10 +60,27 @@ class JobInfo(BaseModel):
     created_at: datetime
     updated_at: datetime
     expiry_seconds: int
-    output: BaseModel | None = None
+    # Durable stores return the output as the JSON data it was stored as
+    output: dict[str, typing.Any] | BaseModel | None = None
+
+
+class JobStoreBase(ABC):
+    """
+    Interface of the stores tracking background jobs.
 
+    Callers can wait for a job to finish with `wait_for_job`, which is woken up by the status update that finishes the
+    job rather than polling the store. Updates made through the same store instance wake waiters immediately, which is
+    always the case for jobs run by the process that accepted them. Stores shared between processes either wake the
+    waiters of other instances themselves (see `_listen`) or set `poll_interval`, in which case waiters re-check the
+    job at that interval to notice updates made by other instances.
 
-class JobStore:
+    The query methods are coroutines, since durable stores do I/O. `get_status` is kept as an alias of `get_job`.
+
+    Args:
+        object_store (ObjectStore | None): If provided, durable stores keep job outputs in the object store and only
+            store a reference to them.
+        output_prefix (str): Key prefix of the job outputs in the object store.
+    """
 
     MIN_EXPIRY = 600  # 10 minutes
     MAX_EXPIRY = 86400  # 24 hours
@@ -59,14 +89,20 @@ class JobStore:
     # active jobs are exempt from expiry
     ACTIVE_STATUS = {"running", "submitted"}
 
-    def __init__(self):
-        self._jobs = {}
-        self._lock = threading.Lock()  # Ensure thread safety for job operations
+    # Seconds between checks for updates made by other store instances, `None` when waiters are always woken up
+    poll_interval: float | None = None
 
-    def create_job(self,
-                   config_file: str | None = None,
-                   job_id: str | None = None,
-                   expiry_seconds: int = DEFAULT_EXPIRY) -> str:
+    def __init__(self, object_store: ObjectStore | None = None, output_prefix: str = "jobs"):
+        self.object_store = object_store
+        self.output_prefix = output_prefix
+        self._waiters_lock = threading.Lock()
+        # job_id -> futures of the callers waiting for the job to finish, with the loop each future belongs to
+        self._waiters: dict[str, list[tuple[asyncio.AbstractEventLoop, asyncio.Future]]] = {}
+
+    async def create_job(self,
+                         config_file: str | None = None,
+                         job_id: str | None = None,
+                         expiry_seconds: int = DEFAULT_EXPIRY) -> str:
         if job_id is None:
             job_id = str(uuid4())
 
@@ -74,39 +110,242 @@ class JobStore:
         if expiry_seconds != clamped_expiry:
             logger.info("Clamped expiry_seconds from %d to %d for job %s", expiry_seconds, clamped_expiry, job_id)
 
+        now = datetime.now(UTC)
         job = JobInfo(job_id=job_id,
                       status=JobStatus.SUBMITTED,
                       config_file=config_file,
-                      created_at=datetime.now(UTC),
-                      updated_at=datetime.now(UTC),
+                      created_at=now,
+                      updated_at=now,
                       error=None,
                       output_path=None,
                       expiry_seconds=clamped_expiry)
 
-        with self._lock:
-            self._jobs[job_id] = job
+        await self._add_job(job)
 
         logger.info("Created new job %s with config %s", job_id, config_file)
         return job_id
 
-    def update_status(self,
-                      job_id: str,
-                      status: str,
-                      error: str | None = None,
-                      output_path: str | None = None,
-                      output: BaseModel | None = None):
-        if job_id not in self._jobs:
-            raise ValueError(f"Job {job_id} not found")
+    async def update_status(self,
+                            job_id: str,
+                            status: str,
+                            error: str | None = None,
+                            output_path: str | None = None,
+                            output: BaseModel | None = None):
+        await self._update_job(job_id, status, error, output_path, output)
+
+        if status not in self.ACTIVE_STATUS:
+            self._wake_waiters(job_id)
+
+    def _wake_waiters(self, job_id: str) -> None:
+        """Wake up the callers of this instance waiting for a job to finish."""
+        with self._waiters_lock:
+            waiters = self._waiters.pop(job_id, [])
+
+        # Status updates may come from other threads, so waiters are woken up on their own loop
+        for loop, waiter in waiters:
+            loop.call_soon_threadsafe(_wake_waiter, waiter)
+
+    async def wait_for_job(self, job_id: str, timeout: float | None = None) -> JobInfo | None:
+        """
+        Wait until a job is no longer active.
+
+        Args:
+            job_id (str): The job to wait for.
+            timeout (float | None): Maximum number of seconds to wait. `None` waits until the job finishes.
+
+        Returns:
+            JobInfo | None: The job, which is still active if the timeout expired, or `None` if it does not exist.
+        """
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        entry = (loop, waiter)
+
+        deadline = loop.time() + timeout if timeout is not None else None
+
+        # Register before checking the job so that an update between the check and the wait is not missed
+        with self._waiters_lock:
+            self._waiters.setdefault(job_id, []).append(entry)
+
+        try:
+            await self._listen()
+
+            while True:
+                job = await self.get_job(job_id)
+                if job is None or job.status not in self.ACTIVE_STATUS:
+                    return job
+
+                wait = deadline - loop.time() if deadline is not None else None
+                if wait is not None and wait <= 0:
+                    return job
+                if self.poll_interval is not None:
+                    wait = self.poll_interval if wait is None else min(wait, self.poll_interval)
+
+                await asyncio.wait({waiter}, timeout=wait)
+                if waiter.done():
+                    break
+        finally:
+            with self._waiters_lock:
+                waiters = self._waiters.get(job_id)
+                if waiters is not None and entry in waiters:
+                    waiters.remove(entry)
+                    if not waiters:
+                        del self._waiters[job_id]
+
+        return await self.get_job(job_id)
+
+    def get_expires_at(self, job: JobInfo) -> datetime | None:
+        """Get the time for a job to expire."""
+        if job.status in self.ACTIVE_STATUS:
+            return None
+        return job.updated_at + timedelta(seconds=job.expiry_seconds)
+
+    async def cleanup_expired_jobs(self):
+        """
+        Cleanup expired jobs, keeping the most recent one.
+        Updated_at is used instead of created_at to determine the most recent job.
+        This is because jobs may not be processed in the order they are created.
+        """
+        expired_jobs = await self._remove_expired_jobs(datetime.now(UTC))
+
+        for job in expired_jobs:
+            # cleanup output dir if present
+            if job.output_path:
+                logger.info("Cleaning up output directory for job %s at %s", job.job_id, job.output_path)
+                # If it is a file remove it
+                if os.path.isfile(job.output_path):
+                    os.remove(job.output_path)
+                # If it is a directory remove it
+                elif os.path.isdir(job.output_path):
+                    shutil.rmtree(job.output_path)
+
+            if self.object_store is not None:
+                try:
+                    await self.object_store.delete_object(self._output_key(job.job_id))
+                except NoSuchKeyError:
+                    pass
+
+    async def aclose(self):
+        """Release the resources held by the store."""
+        pass
+
+    async def _listen(self) -> None:
+        """
+        Make sure updates made by other store instances wake up the waiters of this instance, by calling
+        `_wake_waiters`. Called before a waiter checks its job. Stores without notifications rely on `poll_interval`.
+        """
+        pass
+
+    async def get_status(self, job_id: str) -> JobInfo | None:
+        """Get a job by its ID. Alias of `get_job`."""
+        return await self.get_job(job_id)
+
+    @abstractmethod
+    async def get_job(self, job_id: str) -> JobInfo | None:
+        """Get a job by its ID."""
+        pass
+
+    @abstractmethod
+    async def get_last_job(self) -> JobInfo | None:
+        """Get the last created job."""
+        pass
+
+    @abstractmethod
+    async def get_jobs_by_status(self, status: str) -> list[JobInfo]:
+        """Get all jobs with the specified status."""
+        pass
+
+    @abstractmethod
+    async def get_all_jobs(self) -> list[JobInfo]:
+        """Get all jobs in the store."""
+        pass
+
+    @abstractmethod
+    async def _add_job(self, job: JobInfo):
+        pass
+
+    @abstractmethod
+    async def _update_job(self,
+                          job_id: str,
+                          status: str,
+                          error: str | None,
+                          output_path: str | None,
+                          output: BaseModel | None):
+        """Update a job, raising `ValueError` if it does not exist."""
+        pass
+
+    @abstractmethod
+    async def _remove_expired_jobs(self, now: datetime) -> list[JobInfo]:
+        """Remove the expired finished jobs, except the most recently updated finished job, and return them."""
+        pass
+
+    def _output_key(self, job_id: str) -> str:
+        return f"{self.output_prefix}/{job_id}/output.json"
+
+    async def _dump_output(self, job_id: str, output: BaseModel | dict | None) -> tuple[str | None, str | None]:
+        """
+        Serialize a job output for a durable store.
+
+        Returns:
+            tuple[str | None, str | None]: The output JSON to store inline, or the object store key of the output.
+        """
+        if output is None:
+            return None, None
+
+        data = output.model_dump_json() if isinstance(output, BaseModel) else json.dumps(output)
+        if self.object_store is None:
+            return data, None
+
+        key = self._output_key(job_id)
+        await self.object_store.upsert_object(key, ObjectStoreItem(data=data.encode("utf-8"),
+                                                                   content_type="application/json"))
+        return None, key
+
+    async def _load_output(self, data: str | None, output_ref: str | None) -> dict | None:
+        if output_ref is not None and self.object_store is not None:
+            try:
+                data = (await self.object_store.get_object(output_ref)).data.decode("utf-8")
+            except NoSuchKeyError:
+                logger.warning("Output %s of job is missing from the object store", output_ref)
+                return None
+
+        return json.loads(data) if data is not None else None
+
 
+class JobStore(JobStoreBase):
+    """
+    In-process store of background jobs. Jobs are lost on restart and are not shared between workers.
+    """
+
+    def __init__(self):
+        super().__init__()
+        # Ordered by creation
+        self._jobs: dict[str, JobInfo] = {}
+        self._lock = threading.Lock()  # Ensure thread safety for job operations
+
+    async def _add_job(self, job: JobInfo):
+        with self._lock:
+            # Re-insert so that the dict stays ordered by creation
+            self._jobs.pop(job.job_id, None)
+            self._jobs[job.job_id] = job
+
+    async def _update_job(self,
+                          job_id: str,
+                          status: str,
+                          error: str | None,
+                          output_path: str | None,
+                          output: BaseModel | None):
         with self._lock:
-            job = self._jobs[job_id]
+            job = self._jobs.get(job_id)
+            if job is None:
+                raise ValueError(f"Job {job_id} not found")
+
             job.status = status
             job.error = error
             job.output_path = output_path
             job.updated_at = datetime.now(UTC)
             job.output = output
 
-    def get_status(self, job_id: str) -> JobInfo | None:
+    async def get_job(self, job_id: str) -> JobInfo | None:
         with self._lock:
             return self._jobs.get(job_id)
 
@@ -114,70 +353,79 @@ class JobStore:
         with self._lock:
             return self._jobs
 
-    def get_job(self, job_id: str) -> JobInfo | None:
-        """Get a job by its ID."""
-        with self._lock:
-            return self._jobs.get(job_id)
-
-    def get_last_job(self) -> JobInfo | None:
-        """Get the last created job."""
+    async def get_last_job(self) -> JobInfo | None:
         with self._lock:
             if not self._jobs:
                 logger.info("No jobs found in job store")
                 return None
-            last_job = max(self._jobs.values(), key=lambda job: job.created_at)
+            last_job = next(reversed(self._jobs.values()))
             logger.info("Retrieved last job %s created at %s", last_job.job_id, last_job.created_at)
             return last_job
 
-    def get_jobs_by_status(self, status: str) -> list[JobInfo]:
-        """Get all jobs with the specified status."""
+    async def get_jobs_by_status(self, status: str) -> list[JobInfo]:
         with self._lock:
             return [job for job in self._jobs.values() if job.status == status]
 
-    def get_all_jobs(self) -> list[JobInfo]:
-        """Get all jobs in the store."""
+    async def get_all_jobs(self) -> list[JobInfo]:
         with self._lock:
             return list(self._jobs.values())
 
-    def get_expires_at(self, job: JobInfo) -> datetime | None:
-        """Get the time for a job to expire."""
-        if job.status in self.ACTIVE_STATUS:
-            return None
-        return job.updated_at + timedelta(seconds=job.expiry_seconds)
-
-    def cleanup_expired_jobs(self):
-        """
-        Cleanup expired jobs, keeping the most recent one.
-        Updated_at is used instead of created_at to determine the most recent job.
-        This is because jobs may not be processed in the order they are created.
-        """
-        now = datetime.now(UTC)
-
-        # Filter out active jobs
-        with self._lock:
-            finished_jobs = {job_id: job for job_id, job in self._jobs.items() if job.status not in self.ACTIVE_STATUS}
-
-        # Sort finished jobs by updated_at descending
-        sorted_finished = sorted(finished_jobs.items(), key=lambda item: item[1].updated_at, reverse=True)
-
-        # Always keep the most recent finished job
-        jobs_to_check = sorted_finished[1:]
-
-        expired_ids = []
-        for job_id, job in jobs_to_check:
-            expires_at = self.get_expires_at(job)
-            if expires_at and now > expires_at:
-                expired_ids.append(job_id)
-                # cleanup output dir if present
-                if job.output_path:
-                    logger.info("Cleaning up output directory for job %s at %s", job_id, job.output_path)
-                    # If it is a file remove it
-                    if os.path.isfile(job.output_path):
-                        os.remove(job.output_path)
-                    # If it is a directory remove it
-                    elif os.path.isdir(job.output_path):
-                        shutil.rmtree(job.output_path)
-
+    async def _remove_expired_jobs(self, now: datetime) -> list[JobInfo]:
         with self._lock:
-            for job_id in expired_ids:
-                del self._jobs[job_id]
+            finished_jobs = [job for job in self._jobs.values() if job.status not in self.ACTIVE_STATUS]
+            if not finished_jobs:
+                return []
+
+            # Always keep the most recent finished job
+            most_recent = max(finished_jobs, key=lambda job: job.updated_at)
+            expired_jobs = [
+                job for job in finished_jobs if job is not most_recent and now > self.get_expires_at(job)
+            ]
+            for job in expired_jobs:
+                del self._jobs[job.job_id]
+
+        return expired_jobs
+
+
+def create_job_store(config: "FastApiFrontEndConfig.JobStoreConfig",
+                     namespace: str,
+                     object_store: ObjectStore | None = None) -> JobStoreBase:
+    """
+    Create a job store from the front end configuration.
+
+    Args:
+        config (FastApiFrontEndConfig.JobStoreConfig): The job store configuration.
+        namespace (str): Name which keeps the jobs of different routes apart in shared backends.
+        object_store (ObjectStore | None): Object store used for job outputs by durable backends.
+
+    Returns:
+        JobStoreBase: The job store.
+    """
+    output_prefix = f"{config.output_prefix}/{namespace}"
+
+    if config.backend == "sqlite":
+        from aiq.front_ends.fastapi.sqlite_job_store import SQLiteJobStore
+
+        return SQLiteJobStore(config.sqlite_path,
+                              namespace=namespace,
+                              object_store=object_store,
+                              output_prefix=output_prefix)
+
+    if config.backend == "redis":
+        try:
+            from aiq.plugins.redis.job_store import RedisJobStore
+        except ImportError:
+            raise ImportError("The redis job store backend requires the aiqtoolkit-redis package. "
+                              "Install aiqtoolkit-redis or use the memory or sqlite backend.")
+
+        return RedisJobStore.from_url(config.redis_url,
+                                      key_prefix=f"{config.key_prefix}:{namespace}",
+                                      object_store=object_store,
+                                      output_prefix=output_prefix)
+
+    return JobStore()
+
+
+def _wake_waiter(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
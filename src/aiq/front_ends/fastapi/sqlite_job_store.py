@@ -0,0 +1,224 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+from datetime import UTC
+from datetime import datetime
+
+from platformdirs import user_data_dir
+from pydantic import BaseModel
+
+from aiq.front_ends.fastapi.job_store import JobInfo
+from aiq.front_ends.fastapi.job_store import JobStatus
+from aiq.front_ends.fastapi.job_store import JobStoreBase
+from aiq.object_store.interfaces import ObjectStore
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    namespace TEXT NOT NULL,
+    job_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    config_file TEXT,
+    error TEXT,
+    output_path TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    expiry_seconds INTEGER NOT NULL,
+    expires_at REAL,
+    output TEXT,
+    output_ref TEXT,
+    PRIMARY KEY (namespace, job_id)
+);
+CREATE INDEX IF NOT EXISTS jobs_status_idx ON jobs (namespace, status, updated_at);
+CREATE INDEX IF NOT EXISTS jobs_created_idx ON jobs (namespace, created_at);
+CREATE INDEX IF NOT EXISTS jobs_updated_idx ON jobs (namespace, updated_at);
+CREATE INDEX IF NOT EXISTS jobs_expires_idx ON jobs (namespace, expires_at);
+"""
+
+_COLUMNS = ("job_id, status, config_file, error, output_path, created_at, updated_at, expiry_seconds, output, "
+            "output_ref")
+
+
+class SQLiteJobStore(JobStoreBase):
+    """
+    Job store persisted in a local SQLite database, so that jobs survive restarts and are shared by all workers on the
+    host. Jobs are indexed by status, creation and update time, and finished jobs carry their expiry time, so status
+    queries and the expiry cleanup do not scan the whole table.
+
+    SQLite has no change notifications, so `wait_for_job` notices jobs finished by other workers by re-checking the
+    job every `poll_interval` seconds. Jobs finished through this instance wake their waiters immediately.
+
+    Args:
+        path (str | None): Path of the database file. Defaults to `jobs.db` in the user data directory.
+        namespace (str): Name which keeps the jobs of different routes apart in the same database.
+        object_store (ObjectStore | None): If provided, job outputs are stored in the object store by reference.
+        output_prefix (str): Key prefix of the job outputs in the object store.
+        poll_interval (float): Seconds between checks for jobs finished by other workers.
+    """
+
+    def __init__(self,
+                 path: str | None = None,
+                 namespace: str = "default",
+                 object_store: ObjectStore | None = None,
+                 output_prefix: str = "jobs",
+                 poll_interval: float = 1.0):
+        super().__init__(object_store=object_store, output_prefix=output_prefix)
+
+        self.poll_interval = poll_interval
+        self.path = path or os.path.join(user_data_dir(appname="aiq"), "jobs.db")
+        self.namespace = namespace
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+
+        # A single connection used from worker threads, serialized by the lock
+        self._conn = sqlite3.connect(self.path, timeout=30.0, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+
+        with self._lock:
+            # WAL lets the workers of other processes read while one of them writes
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+
+    async def _run(self, fn, *args):
+        return await asyncio.to_thread(self._locked, fn, *args)
+
+    def _locked(self, fn, *args):
+        with self._lock:
+            return fn(*args)
+
+    def _row_to_job(self, row: sqlite3.Row) -> JobInfo:
+        return JobInfo(job_id=row["job_id"],
+                       status=row["status"],
+                       config_file=row["config_file"],
+                       error=row["error"],
+                       output_path=row["output_path"],
+                       created_at=datetime.fromtimestamp(row["created_at"], UTC),
+                       updated_at=datetime.fromtimestamp(row["updated_at"], UTC),
+                       expiry_seconds=row["expiry_seconds"])
+
+    def _query(self, sql: str, params: tuple) -> list[sqlite3.Row]:
+        return self._conn.execute(sql, params).fetchall()
+
+    async def _add_job(self, job: JobInfo):
+        await self._run(
+            self._conn.execute,
+            "INSERT OR REPLACE INTO jobs (namespace, job_id, status, config_file, error, output_path, created_at, "
+            "updated_at, expiry_seconds) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (self.namespace,
+             job.job_id,
+             JobStatus(job.status).value,
+             job.config_file,
+             job.error,
+             job.output_path,
+             job.created_at.timestamp(),
+             job.updated_at.timestamp(),
+             job.expiry_seconds))
+
+    async def _update_job(self,
+                          job_id: str,
+                          status: str,
+                          error: str | None,
+                          output_path: str | None,
+                          output: BaseModel | None):
+        output_data, output_ref = await self._dump_output(job_id, output)
+        status = JobStatus(status).value
+        now = datetime.now(UTC).timestamp()
+
+        # Only finished jobs get an expiry time, active jobs are exempt from expiry
+        cursor = await self._run(
+            self._conn.execute,
+            "UPDATE jobs SET status = ?, error = ?, output_path = ?, updated_at = ?, output = ?, output_ref = ?, "
+            "expires_at = CASE WHEN ? THEN NULL ELSE ? + expiry_seconds END WHERE namespace = ? AND job_id = ?",
+            (status,
+             error,
+             output_path,
+             now,
+             output_data,
+             output_ref,
+             status in self.ACTIVE_STATUS,
+             now,
+             self.namespace,
+             job_id))
+
+        if cursor.rowcount == 0:
+            raise ValueError(f"Job {job_id} not found")
+
+    async def get_job(self, job_id: str) -> JobInfo | None:
+        rows = await self._run(self._query,
+                               f"SELECT {_COLUMNS} FROM jobs WHERE namespace = ? AND job_id = ?",
+                               (self.namespace, job_id))
+        if not rows:
+            return None
+
+        job = self._row_to_job(rows[0])
+        job.output = await self._load_output(rows[0]["output"], rows[0]["output_ref"])
+        return job
+
+    async def get_last_job(self) -> JobInfo | None:
+        rows = await self._run(self._query,
+                               f"SELECT {_COLUMNS} FROM jobs WHERE namespace = ? ORDER BY created_at DESC LIMIT 1",
+                               (self.namespace, ))
+        if not rows:
+            logger.info("No jobs found in job store")
+            return None
+        return self._row_to_job(rows[0])
+
+    async def get_jobs_by_status(self, status: str) -> list[JobInfo]:
+        """Get all jobs with the specified status. The outputs of the jobs are not loaded."""
+        rows = await self._run(self._query,
+                               f"SELECT {_COLUMNS} FROM jobs WHERE namespace = ? AND status = ? ORDER BY updated_at",
+                               (self.namespace, JobStatus(status).value))
+        return [self._row_to_job(row) for row in rows]
+
+    async def get_all_jobs(self) -> list[JobInfo]:
+        """Get all jobs in the store. The outputs of the jobs are not loaded."""
+        rows = await self._run(self._query,
+                               f"SELECT {_COLUMNS} FROM jobs WHERE namespace = ? ORDER BY created_at",
+                               (self.namespace, ))
+        return [self._row_to_job(row) for row in rows]
+
+    def _delete_expired(self, now: float) -> list[sqlite3.Row]:
+        # Must be called with the lock held
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            most_recent = self._conn.execute(
+                "SELECT job_id FROM jobs WHERE namespace = ? AND expires_at IS NOT NULL "
+                "ORDER BY updated_at DESC LIMIT 1", (self.namespace, )).fetchone()
+            keep = most_recent["job_id"] if most_recent is not None else None
+
+            condition = "namespace = ? AND expires_at < ? AND job_id IS NOT ?"
+            params = (self.namespace, now, keep)
+            rows = self._conn.execute(f"SELECT {_COLUMNS} FROM jobs WHERE {condition}", params).fetchall()
+            self._conn.execute(f"DELETE FROM jobs WHERE {condition}", params)
+            self._conn.execute("COMMIT")
+            return rows
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+
+    async def _remove_expired_jobs(self, now: datetime) -> list[JobInfo]:
+        rows = await self._run(self._delete_expired, now.timestamp())
+        return [self._row_to_job(row) for row in rows]
+
+    async def aclose(self):
+        with self._lock:
+            self._conn.close()
@@ -15,18 +15,19 @@
 
 import html
 import logging
-from functools import reduce
 from textwrap import dedent
 
 from aiq.data_models.api_server import AIQResponseIntermediateStep
 from aiq.data_models.api_server import AIQResponseSerializable
 from aiq.data_models.intermediate_step import IntermediateStep
 from aiq.data_models.intermediate_step import IntermediateStepCategory
+from aiq.data_models.intermediate_step import IntermediateStepEvent
 from aiq.data_models.intermediate_step import IntermediateStepPayload
 from aiq.data_models.intermediate_step import IntermediateStepType
 from aiq.data_models.invocation_node import InvocationNode
 from aiq.data_models.step_adaptor import StepAdaptorConfig
 from aiq.data_models.step_adaptor import StepAdaptorMode
+from aiq.profiler.callbacks.token_stream import StreamedText
 from aiq.utils.type_utils import is_valid_json
 
 logger = logging.getLogger(__name__)
@@ -36,10 +37,12 @@ class StepAdaptor:
 
     def __init__(self, config: StepAdaptorConfig):
 
-        self._history: list[IntermediateStep] = []
+        self._history: list[IntermediateStep | IntermediateStepEvent] = []
+        # Text streamed so far by each LLM run, accumulated as the token steps arrive
+        self._llm_outputs = StreamedText()
         self.config = config
 
-    def _step_matches_filter(self, step: IntermediateStep, config: StepAdaptorConfig) -> bool:
+    def _step_matches_filter(self, step: IntermediateStep | IntermediateStepEvent, config: StepAdaptorConfig) -> bool:
         """
         Returns True if this intermediate step should be included (based on the config.mode).
         """
@@ -79,12 +82,7 @@ class StepAdaptor:
 
         if step.event_type == IntermediateStepType.LLM_NEW_TOKEN:
 
-            # Find all of the previous LLM chunks and concatenate them
-            output_str = reduce(
-                lambda x, y: x + y,
-                (str(x.data.chunk)
-                 for x in self._history if x.event_type == IntermediateStepType.LLM_NEW_TOKEN and x.UUID == step.UUID),
-                "")
+            output_str = self._llm_outputs.text(step.UUID)
 
         elif step.event_type == IntermediateStepType.LLM_END:
             output_str = str(step.data.output)
@@ -291,16 +289,23 @@ class StepAdaptor:
 
         return event
 
-    def process(self, step: IntermediateStep) -> AIQResponseSerializable | None:  # pylint: disable=R1710
+    def process(  # pylint: disable=R1710
+            self, step: IntermediateStep | IntermediateStepEvent) -> AIQResponseSerializable | None:
 
         # Track the chunk
         self._history.append(step)
-        payload = step.payload
-        ancestry = step.function_ancestry
+
+        if step.event_type == IntermediateStepType.LLM_NEW_TOKEN:
+            self._llm_outputs.add(step)
+        elif step.event_type == IntermediateStepType.LLM_END:
+            self._llm_outputs.pop(step.UUID)
 
         if not self._step_matches_filter(step, self.config):
             return None
 
+        payload = step.payload
+        ancestry = step.function_ancestry
+
         try:
 
             if step.event_category == IntermediateStepCategory.LLM:
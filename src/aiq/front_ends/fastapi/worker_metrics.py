@@ -0,0 +1,231 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import time
+from collections.abc import Awaitable
+from collections.abc import Callable
+
+from fastapi import Request
+from fastapi import Response
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+# Directory shared by the workers of one server, set by the front end before starting the workers
+METRICS_DIR_ENV = "AIQ_WORKER_METRICS_DIR"
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+class WorkerMetrics:
+    """
+    Request metrics of a single server worker process.
+
+    When the server runs several workers, every worker periodically writes its metrics to a directory shared by the
+    workers, so that the metrics endpoint can report all workers no matter which worker serves the request.
+
+    Args:
+        metrics_dir (str | None): Directory shared by the workers. `None` only reports the current worker.
+        flush_interval (float): Seconds between writes of the metrics to `metrics_dir`.
+    """
+
+    def __init__(self, metrics_dir: str | None = None, flush_interval: float = 5.0):
+        self.metrics_dir = metrics_dir
+        self.flush_interval = flush_interval
+        self._pid = os.getpid()
+        self._started_at = time.time()
+        self.in_flight = 0
+        self.requests_total: dict[str, int] = {}
+        self.request_seconds_sum = 0.0
+        self.request_seconds_max = 0.0
+        self._collectors: list[Callable[[], dict[str, float]]] = []
+
+    def _ensure_process(self) -> None:
+        """
+        Start the metrics over when running in a new process. The metrics can be created before the server forks its
+        workers (e.g. gunicorn with `--preload`), in which case each worker must report under its own pid.
+        """
+        pid = os.getpid()
+        if pid == self._pid:
+            return
+        self._pid = pid
+        self._started_at = time.time()
+        self.in_flight = 0
+        self.requests_total = {}
+        self.request_seconds_sum = 0.0
+        self.request_seconds_max = 0.0
+
+    @property
+    def pid(self) -> int:
+        self._ensure_process()
+        return self._pid
+
+    @property
+    def started_at(self) -> float:
+        self._ensure_process()
+        return self._started_at
+
+    def add_collector(self, collector: Callable[[], dict[str, float]]) -> None:
+        """
+        Report additional metrics of this worker, such as queue depths. The collector returns a mapping from metric
+        name (without the `aiq_worker_` prefix) to value and is called on every snapshot.
+        """
+        self._collectors.append(collector)
+
+    async def middleware(self, request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
+        self._ensure_process()
+        start = time.perf_counter()
+        status = "5xx"
+        self.in_flight += 1
+        try:
+            response = await call_next(request)
+            status = f"{response.status_code // 100}xx"
+            return response
+        finally:
+            self.in_flight -= 1
+            elapsed = time.perf_counter() - start
+            self.requests_total[status] = self.requests_total.get(status, 0) + 1
+            self.request_seconds_sum += elapsed
+            self.request_seconds_max = max(self.request_seconds_max, elapsed)
+
+    def snapshot(self) -> dict:
+        self._ensure_process()
+        extra: dict[str, float] = {}
+        for collector in self._collectors:
+            extra.update(collector())
+
+        # ru_maxrss is reported in kilobytes on Linux
+        max_rss_bytes = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024 if resource is not None else 0
+        return {
+            "pid": self.pid,
+            "uptime_seconds": time.time() - self.started_at,
+            "cpu_seconds": time.process_time(),
+            "max_rss_bytes": max_rss_bytes,
+            "in_flight": self.in_flight,
+            "requests_total": dict(self.requests_total),
+            "request_seconds_sum": self.request_seconds_sum,
+            "request_seconds_max": self.request_seconds_max,
+            "extra": extra,
+            "updated_at": time.time(),
+        }
+
+    def _path(self, pid: int) -> str:
+        return os.path.join(self.metrics_dir, f"{pid}.json")
+
+    def flush(self) -> None:
+        """
+        Write the metrics of this worker to the shared directory.
+        """
+        if self.metrics_dir is None:
+            return
+        try:
+            os.makedirs(self.metrics_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.metrics_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self.snapshot(), f)
+            os.replace(tmp_path, self._path(self.pid))
+        except OSError as e:
+            logger.warning("Unable to write worker metrics to %s: %s", self.metrics_dir, e)
+
+    async def run(self) -> None:
+        """
+        Periodically write the metrics of this worker until cancelled, then remove them.
+        """
+        try:
+            while True:
+                self.flush()
+                await asyncio.sleep(self.flush_interval)
+        finally:
+            if self.metrics_dir is not None:
+                try:
+                    os.remove(self._path(self.pid))
+                except OSError:
+                    pass
+
+    def collect(self) -> list[dict]:
+        """
+        Get the metrics of all live workers, with fresh metrics for the current worker.
+        """
+        snapshots = {self.pid: self.snapshot()}
+        if self.metrics_dir is None or not os.path.isdir(self.metrics_dir):
+            return list(snapshots.values())
+
+        for file_name in os.listdir(self.metrics_dir):
+            if not file_name.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(self.metrics_dir, file_name), encoding="utf-8") as f:
+                    snapshot = json.load(f)
+            except (OSError, ValueError):
+                continue
+            pid = snapshot.get("pid")
+            if pid not in snapshots and _pid_alive(pid):
+                snapshots[pid] = snapshot
+
+        return sorted(snapshots.values(), key=lambda snapshot: snapshot["pid"])
+
+    def render_prometheus(self) -> str:
+        """
+        Render the metrics of all workers in the Prometheus text format, labeled by worker pid.
+        """
+        gauges = {
+            "aiq_worker_uptime_seconds": ("uptime_seconds", "Seconds since the worker started"),
+            "aiq_worker_cpu_seconds_total": ("cpu_seconds", "CPU time used by the worker"),
+            "aiq_worker_max_rss_bytes": ("max_rss_bytes", "Peak resident memory of the worker"),
+            "aiq_worker_requests_in_flight": ("in_flight", "Requests being served by the worker"),
+            "aiq_worker_request_seconds_sum": ("request_seconds_sum", "Total time spent serving requests"),
+            "aiq_worker_request_seconds_max": ("request_seconds_max", "Longest request served by the worker"),
+        }
+        snapshots = self.collect()
+
+        lines = []
+        for name, (key, description) in gauges.items():
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} {'counter' if name.endswith(('_total', '_sum')) else 'gauge'}")
+            for snapshot in snapshots:
+                lines.append(f'{name}{{worker="{snapshot["pid"]}"}} {snapshot[key]}')
+
+        lines.append("# HELP aiq_worker_requests_total Requests served by the worker by status class")
+        lines.append("# TYPE aiq_worker_requests_total counter")
+        for snapshot in snapshots:
+            for status, count in sorted(snapshot["requests_total"].items()):
+                lines.append(f'aiq_worker_requests_total{{worker="{snapshot["pid"]}",status="{status}"}} {count}')
+
+        extra_names = sorted({key for snapshot in snapshots for key in snapshot.get("extra", {})})
+        for key in extra_names:
+            name = f"aiq_worker_{key}"
+            lines.append(f"# TYPE {name} {'counter' if name.endswith(('_total', '_sum')) else 'gauge'}")
+            for snapshot in snapshots:
+                if key in snapshot.get("extra", {}):
+                    lines.append(f'{name}{{worker="{snapshot["pid"]}"}} {snapshot["extra"][key]}')
+
+        return "\n".join(lines) + "\n"
@@ -15,8 +15,14 @@
 
 from abc import ABC
 from abc import abstractmethod
+from collections.abc import AsyncIterable
+from collections.abc import AsyncIterator
 
 from .models import ObjectStoreItem
+from .models import ObjectStoreItemInfo
+
+# Default size of the chunks yielded when streaming objects
+DEFAULT_CHUNK_SIZE = 1024 * 1024
 
 
 class ObjectStore(ABC):
@@ -25,6 +31,9 @@ class ObjectStore(ABC):
 
     Implementations may integrate with various object stores,
     such as S3, MySQL, etc.
+
+    The streaming methods have default implementations which buffer the whole object in memory. Implementations
+    should override them to keep memory usage bounded by the chunk size.
     """
 
     @abstractmethod
@@ -82,3 +91,91 @@ class ObjectStore(ABC):
             NoSuchKeyError: If the item does not exist.
         """
         pass
+
+    async def put_object_stream(self,
+                                key: str,
+                                chunks: AsyncIterable[bytes],
+                                content_type: str | None = None,
+                                metadata: dict[str, str] | None = None) -> int:
+        """
+        Save data streamed as chunks in the object store with the given key.
+        If the key already exists, raise an error.
+
+        Args:
+            key (str): The key to save the item under.
+            chunks (AsyncIterable[bytes]): The data of the item.
+            content_type (str | None): The content type of the data.
+            metadata (dict[str, str] | None): The metadata of the data.
+
+        Returns:
+            int: The number of bytes saved.
+
+        Raises:
+            KeyAlreadyExistsError: If the key already exists.
+        """
+        data = b"".join([chunk async for chunk in chunks])
+        await self.put_object(key, ObjectStoreItem(data=data, content_type=content_type, metadata=metadata))
+        return len(data)
+
+    async def upsert_object_stream(self,
+                                   key: str,
+                                   chunks: AsyncIterable[bytes],
+                                   content_type: str | None = None,
+                                   metadata: dict[str, str] | None = None) -> int:
+        """
+        Save data streamed as chunks in the object store with the given key.
+        If the key already exists, update the item.
+
+        Args:
+            key (str): The key to save the item under.
+            chunks (AsyncIterable[bytes]): The data of the item.
+            content_type (str | None): The content type of the data.
+            metadata (dict[str, str] | None): The metadata of the data.
+
+        Returns:
+            int: The number of bytes saved.
+        """
+        data = b"".join([chunk async for chunk in chunks])
+        await self.upsert_object(key, ObjectStoreItem(data=data, content_type=content_type, metadata=metadata))
+        return len(data)
+
+    async def get_object_info(self, key: str) -> ObjectStoreItemInfo:
+        """
+        Get the size, content type and metadata of an item without its data.
+
+        Args:
+            key (str): The key of the item.
+
+        Returns:
+            ObjectStoreItemInfo: The description of the item.
+
+        Raises:
+            NoSuchKeyError: If the item does not exist.
+        """
+        item = await self.get_object(key)
+        return ObjectStoreItemInfo(size=len(item.data), content_type=item.content_type, metadata=item.metadata)
+
+    async def get_object_stream(self,
+                                key: str,
+                                start: int = 0,
+                                end: int | None = None,
+                                chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[bytes]:
+        """
+        Stream the data of an item, or of the byte range `[start, end)` of the item, in chunks.
+
+        Args:
+            key (str): The key of the item.
+            start (int): Offset of the first byte to stream.
+            end (int | None): Offset after the last byte to stream. `None` streams to the end of the item.
+            chunk_size (int): Maximum size of the chunks.
+
+        Returns:
+            AsyncIterator[bytes]: The chunks of data.
+
+        Raises:
+            NoSuchKeyError: If the item does not exist.
+        """
+        item = await self.get_object(key)
+        data = memoryview(item.data)[start:end]
+        for offset in range(0, len(data), chunk_size):
+            yield bytes(data[offset:offset + chunk_size])
@@ -34,3 +34,22 @@ class ObjectStoreItem(BaseModel):
     data: bytes = Field(description="The data to store in the object store.")
     content_type: str | None = Field(description="The content type of the data.", default=None)
     metadata: dict[str, str] | None = Field(description="The metadata of the data.", default=None)
+
+
+class ObjectStoreItemInfo(BaseModel):
+    """
+    Describes an object store item without its data.
+
+    Attributes
+    ----------
+    size : int
+        The size of the data in bytes.
+    content_type : str | None
+        The content type of the data.
+    metadata : dict[str, str] | None
+        Metadata providing context and utility for management operations.
+    """
+
+    size: int = Field(description="The size of the data in bytes.")
+    content_type: str | None = Field(description="The content type of the data.", default=None)
+    metadata: dict[str, str] | None = Field(description="The metadata of the data.", default=None)
@@ -28,6 +28,7 @@ from typing import overload
 
 from aiq.builder.context import AIQContextState
 from aiq.data_models.intermediate_step import IntermediateStep
+from aiq.data_models.intermediate_step import IntermediateStepEvent
 from aiq.observability.exporter.exporter import Exporter
 from aiq.utils.reactive.subject import Subject
 from aiq.utils.type_utils import override
@@ -296,8 +297,8 @@ class BaseExporter(Exporter):
             logger.error("Event stream subject does not support subscription")
             return None
 
-        def on_next_wrapper(event: IntermediateStep) -> None:
-            self.export(event)
+        def on_next_wrapper(event: IntermediateStepEvent) -> None:
+            self.export(event.to_intermediate_step())
 
         self._subscription = subject.subscribe(
             on_next=on_next_wrapper,
@@ -313,6 +314,34 @@ class BaseExporter(Exporter):
         """Called before the exporter starts."""
         pass
 
+    @asynccontextmanager
+    async def start_shared(self) -> AsyncGenerator[None]:
+        """Start the exporter without subscribing to an event stream.
+
+        Used by the shared pipeline mode of the `ExporterManager`, where a single long-lived exporter receives the
+        events of every workflow run from the manager instead of subscribing to each run's event stream.
+        """
+        try:
+            await self._pre_start()
+
+            self._running = True
+            self._ready_event.set()
+
+            yield
+
+        finally:
+            await self.stop()
+
+    def release_steps(self, step_ids: set[str]) -> None:
+        """Release the state of steps which were started but never ended by a finished workflow run.
+
+        Only called in the shared pipeline mode of the `ExporterManager`, where the exporter outlives the runs.
+
+        Args:
+            step_ids (set[str]): The UUIDs of the steps.
+        """
+        pass
+
     @override
     @asynccontextmanager
     async def start(self) -> AsyncGenerator[None]:
@@ -20,6 +20,7 @@ from typing import TypeVar
 
 from aiq.data_models.intermediate_step import IntermediateStep
 from aiq.data_models.intermediate_step import IntermediateStepState
+from aiq.data_models.intermediate_step import IntermediateStepType
 from aiq.data_models.intermediate_step import TraceMetadata
 from aiq.data_models.span import MimeTypes
 from aiq.data_models.span import Span
@@ -31,6 +32,7 @@ from aiq.observability.exporter.processing_exporter import ProcessingExporter
 from aiq.observability.mixin.serialize_mixin import SerializeMixin
 from aiq.observability.utils.dict_utils import merge_dicts
 from aiq.observability.utils.time_utils import ns_timestamp
+from aiq.profiler.callbacks.token_stream import StreamedText
 from aiq.utils.type_utils import override
 
 logger = logging.getLogger(__name__)
@@ -75,6 +77,7 @@ class SpanExporter(ProcessingExporter[InputSpanT, OutputSpanT], SerializeMixin):
     _outstanding_spans: IsolatedAttribute[dict] = IsolatedAttribute(dict)
     _span_stack: IsolatedAttribute[dict] = IsolatedAttribute(dict)
     _metadata_stack: IsolatedAttribute[dict] = IsolatedAttribute(dict)
+    _streamed_text: IsolatedAttribute[StreamedText] = IsolatedAttribute(StreamedText)
 
     @abstractmethod
     async def export_processed(self, item: OutputSpanT) -> None:
@@ -99,6 +102,8 @@ class SpanExporter(ProcessingExporter[InputSpanT, OutputSpanT], SerializeMixin):
             self._process_start_event(event)
         elif (event.event_state == IntermediateStepState.END):
             self._process_end_event(event)
+        elif (event.event_type == IntermediateStepType.LLM_NEW_TOKEN and event.UUID in self._outstanding_spans):
+            self._streamed_text.add(event)  # type: ignore
 
     def _process_start_event(self, event: IntermediateStep):
         """Process the start event of an intermediate step.
@@ -215,11 +220,16 @@ class SpanExporter(ProcessingExporter[InputSpanT, OutputSpanT], SerializeMixin):
             sub_span.set_attribute(SpanAttributes.LLM_TOKEN_COUNT_TOTAL.value,
                                    usage_info.token_usage.total_tokens if usage_info.token_usage else 0)
 
+        # Fall back to the text streamed by an LLM when its end step doesn't carry the output
+        streamed_output = self._streamed_text.pop(event.UUID)  # type: ignore
         if event.payload.data and event.payload.data.output is not None:
             serialized_output, is_json = self._serialize_payload(event.payload.data.output)
             sub_span.set_attribute(SpanAttributes.OUTPUT_VALUE.value, serialized_output)
             sub_span.set_attribute(SpanAttributes.OUTPUT_MIME_TYPE.value,
                                    MimeTypes.JSON.value if is_json else MimeTypes.TEXT.value)
+        elif streamed_output:
+            sub_span.set_attribute(SpanAttributes.OUTPUT_VALUE.value, streamed_output)
+            sub_span.set_attribute(SpanAttributes.OUTPUT_MIME_TYPE.value, MimeTypes.TEXT.value)
 
         # Merge metadata from start event with end event metadata
         start_metadata = self._metadata_stack.pop(event.UUID)  # type: ignore
@@ -250,6 +260,25 @@ class SpanExporter(ProcessingExporter[InputSpanT, OutputSpanT], SerializeMixin):
         # Export the span with processing pipeline
         self._create_export_task(self._export_with_processing(sub_span))  # type: ignore
 
+    @override
+    def release_steps(self, step_ids: set[str]) -> None:
+        """End the spans of steps which were never ended by a finished workflow run.
+
+        Args:
+            step_ids (set[str]): The UUIDs of the steps.
+        """
+        for step_id in step_ids:
+            span = self._outstanding_spans.pop(step_id, None)  # type: ignore
+            streamed_output = self._streamed_text.pop(step_id)  # type: ignore
+            if span is not None:
+                logger.warning("Span for step %s was not closed by its workflow run", step_id)
+                if streamed_output:
+                    span.set_attribute(SpanAttributes.OUTPUT_VALUE.value, streamed_output)
+                    span.set_attribute(SpanAttributes.OUTPUT_MIME_TYPE.value, MimeTypes.TEXT.value)
+                span.end()
+            self._span_stack.pop(step_id, None)  # type: ignore
+            self._metadata_stack.pop(step_id, None)  # type: ignore
+
     @override
     async def _cleanup(self):
         """Clean up any remaining spans."""
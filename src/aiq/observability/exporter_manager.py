@@ -18,6 +18,8 @@ import logging
 from contextlib import asynccontextmanager
 
 from aiq.builder.context import AIQContextState
+from aiq.data_models.intermediate_step import IntermediateStepEvent
+from aiq.data_models.intermediate_step import IntermediateStepState
 from aiq.observability.exporter.base_exporter import BaseExporter
 
 logger = logging.getLogger(__name__)
@@ -38,12 +40,21 @@ class ExporterManager:
     Exporters added after `start()` is called will not be started automatically. They will only be
     started on the next lifecycle (i.e., after a stop and subsequent start).
 
+    In shared pipeline mode, a single ExporterManager serves every workflow execution instead. Its exporters are
+    started once, on the first execution after they are added, and stay running until `stop()` is called. The
+    `WorkflowBuilder` owns this manager and hands it to every workflow it builds. Each execution only subscribes
+    one router to its event stream, which hands the steps to the long-lived exporters. Steps the execution left
+    open are released from the exporters when it ends, which avoids copying, starting and stopping every exporter
+    for every request.
+
     Args:
         shutdown_timeout (int, optional): Maximum time in seconds to wait for exporters to shut down gracefully.
         Defaults to 120 seconds.
+        shared_pipeline (bool, optional): Share one long-lived pipeline per exporter between all workflow executions.
+        Defaults to False.
     """
 
-    def __init__(self, shutdown_timeout: int = 120):
+    def __init__(self, shutdown_timeout: int = 120, shared_pipeline: bool = False):
         """Initialize the ExporterManager."""
         self._tasks: dict[str, asyncio.Task] = {}
         self._running: bool = False
@@ -54,6 +65,8 @@ class ExporterManager:
         self._shutdown_timeout: int = shutdown_timeout
         # Track isolated exporters for proper cleanup
         self._active_isolated_exporters: dict[str, BaseExporter] = {}
+        self._shared_pipeline: bool = shared_pipeline
+        self._shared_exporters: list[BaseExporter] = []
 
     @classmethod
     def _create_with_shared_registry(cls, shutdown_timeout: int,
@@ -68,6 +81,8 @@ class ExporterManager:
         instance._shutdown_event = asyncio.Event()
         instance._shutdown_timeout = shutdown_timeout
         instance._active_isolated_exporters = {}
+        instance._shared_pipeline = False
+        instance._shared_exporters = []
         return instance
 
     def _ensure_registry_owned(self):
@@ -215,6 +230,11 @@ class ExporterManager:
         Raises:
             RuntimeError: If the manager is already running.
         """
+        if self._shared_pipeline:
+            async with self._start_shared(context_state):
+                yield self
+            return
+
         async with self._lock:
             if self._running:
                 raise RuntimeError("Exporter manager is already running")
@@ -256,16 +276,90 @@ class ExporterManager:
             # Then stop the manager tasks
             await self.stop()
 
-    async def _run_exporter(self, name: str, exporter: BaseExporter):
+    async def _ensure_shared_pipeline(self) -> list[BaseExporter]:
+        """
+        Start the long-lived exporters of the shared pipeline if they are not running yet.
+
+        Returns:
+            list[BaseExporter]: The running exporters.
+        """
+        async with self._lock:
+            if not self._running:
+                self._shutdown_event.clear()
+                self._running = True
+
+            # Exporters registered while the pipeline is running are started by the next workflow execution
+            exporters = [(name, exporter) for name, exporter in self._exporter_registry.items()
+                         if name not in self._tasks]
+            for name, exporter in exporters:
+                self._tasks[name] = asyncio.create_task(self._run_exporter(name, exporter, shared=True))
+
+            if exporters:
+                await asyncio.gather(*[exporter.wait_ready() for _, exporter in exporters])
+                self._shared_exporters = [self._exporter_registry[name] for name in self._tasks]
+
+            return self._shared_exporters
+
+    @asynccontextmanager
+    async def _start_shared(self, context_state: AIQContextState | None):
+        """
+        Route the steps of one workflow execution to the exporters of the shared pipeline.
+        """
+        exporters = await self._ensure_shared_pipeline()
+
+        if context_state is None:
+            context_state = AIQContextState.get()
+
+        subject = context_state.event_stream.get()
+        if subject is None or not exporters:
+            yield
+            return
+
+        # Steps of this execution which were started but not ended yet
+        open_steps: set[str] = set()
+
+        def on_next(event: IntermediateStepEvent) -> None:
+            if event.event_state == IntermediateStepState.START:
+                open_steps.add(event.UUID)
+            elif event.event_state == IntermediateStepState.END:
+                open_steps.discard(event.UUID)
+
+            step = event.to_intermediate_step()
+            for exporter in exporters:
+                try:
+                    exporter.export(step)
+                except Exception as e:
+                    logger.error("Exporter '%s' failed to export step %s: %s", exporter.name, event.UUID, e)
+
+        def on_error(exc: Exception) -> None:
+            for exporter in exporters:
+                exporter.on_error(exc)
+
+        subscription = subject.subscribe(on_next=on_next, on_error=on_error)
+        try:
+            yield
+        finally:
+            # Unsubscribing delivers the steps which are still buffered, so the open steps are final afterwards
+            subscription.unsubscribe()
+
+            if open_steps:
+                for exporter in exporters:
+                    try:
+                        exporter.release_steps(open_steps)
+                    except Exception as e:
+                        logger.error("Exporter '%s' failed to release open steps: %s", exporter.name, e)
+
+    async def _run_exporter(self, name: str, exporter: BaseExporter, shared: bool = False):
         """
         Run an exporter in its own task.
 
         Args:
             name (str): The name of the exporter.
             exporter (BaseExporter): The exporter instance to run.
+            shared (bool): Run the exporter as part of the shared pipeline, without subscribing it to an event stream.
         """
         try:
-            async with exporter.start():
+            async with (exporter.start_shared() if shared else exporter.start()):
                 logger.info("Started exporter '%s'", name)
                 # The context manager will keep the task alive until shutdown is signaled
                 await self._shutdown_event.wait()
@@ -313,11 +407,13 @@ class ExporterManager:
             logger.warning("Exporters did not shut down in time: %s", ", ".join(stuck_tasks))
 
     @staticmethod
-    def from_exporters(exporters: dict[str, BaseExporter], shutdown_timeout: int = 120) -> "ExporterManager":
+    def from_exporters(exporters: dict[str, BaseExporter],
+                       shutdown_timeout: int = 120,
+                       shared_pipeline: bool = False) -> "ExporterManager":
         """
         Create an ExporterManager from a dictionary of exporters.
         """
-        exporter_manager = ExporterManager(shutdown_timeout=shutdown_timeout)
+        exporter_manager = ExporterManager(shutdown_timeout=shutdown_timeout, shared_pipeline=shared_pipeline)
         for name, exporter in exporters.items():
             exporter_manager.add_exporter(name, exporter)
 
@@ -327,9 +423,12 @@ class ExporterManager:
         """
         Create a copy of this ExporterManager with the same configuration using copy-on-write.
 
-        This is the most efficient approach - shares the registry until modifications are needed.
+        This is the most efficient approach - shares the registry until modifications are needed. In shared pipeline
+        mode, the manager itself is returned, since every workflow execution uses the same running exporters.
 
         Returns:
             ExporterManager: A new ExporterManager instance with shared exporters (copy-on-write).
         """
+        if self._shared_pipeline:
+            return self
         return self._create_with_shared_registry(self._shutdown_timeout, self._exporter_registry)
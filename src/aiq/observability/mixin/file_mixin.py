@@ -15,15 +15,37 @@
 
 import asyncio
 import logging
+import shutil
+import time
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
 from typing import Any
+from typing import BinaryIO
 
+from aiq.observability.mixin.file_mode import FileCompression
+from aiq.observability.mixin.file_mode import FileFormat
 from aiq.observability.mixin.file_mode import FileMode
 from aiq.observability.mixin.resource_conflict_mixin import ResourceConflictMixin
 
 logger = logging.getLogger(__name__)
 
+_COMPRESSION_SUFFIXES = {FileCompression.GZIP: ".gz", FileCompression.ZSTD: ".zst"}
+
+
+class _OpenFile:
+    """State of the file being written, shared by an exporter and its isolated copies."""
+
+    __slots__ = ("handle", "buffer", "size", "opened_at", "first_write", "flush_task")
+
+    def __init__(self):
+        self.handle: BinaryIO | None = None
+        self.buffer = bytearray()
+        self.size = 0
+        self.opened_at = 0.0
+        self.first_write = True
+        self.flush_task: asyncio.Task | None = None
+
 
 class FileExportMixin(ResourceConflictMixin):
     """Mixin for file-based exporters.
@@ -31,6 +53,11 @@ class FileExportMixin(ResourceConflictMixin):
     This mixin provides file I/O functionality for exporters that need to write
     serialized data to local files, with support for file overwriting and rolling logs.
 
+    The output file is kept open and records are collected in a write buffer, which is written out when it is full,
+    `flush_interval` seconds after the first buffered record, on `flush()` and when the exporter stops. Records are
+    written either as JSON lines or as length-prefixed msgpack records. Rolled files can be compressed with gzip or
+    zstd.
+
     Automatically detects and prevents file path conflicts between multiple instances
     by raising ResourceConflictError during initialization.
     """
@@ -45,6 +72,11 @@ class FileExportMixin(ResourceConflictMixin):
             max_file_size: int = 10 * 1024 * 1024,  # 10MB default
             max_files: int = 5,
             cleanup_on_init: bool = False,
+            max_file_age: float | None = None,
+            compression: FileCompression = FileCompression.NONE,
+            file_format: FileFormat = FileFormat.JSONL,
+            buffer_size: int = 1024 * 1024,
+            flush_interval: float | None = 1.0,
             **kwargs):
         """Initialize the file exporter with the specified output_path and project.
 
@@ -56,6 +88,12 @@ class FileExportMixin(ResourceConflictMixin):
             max_file_size (int): Maximum file size in bytes before rolling. Defaults to 10MB.
             max_files (int): Maximum number of rolled files to keep. Defaults to 5.
             cleanup_on_init (bool): Clean up old files during initialization. Defaults to False.
+            max_file_age (float | None): Maximum number of seconds a file is written to before rolling. Defaults to
+                None (only roll on size).
+            compression (FileCompression): Compression of rolled files, "none", "gzip" or "zstd". Defaults to "none".
+            file_format (FileFormat): Record format, "jsonl" or "msgpack". Defaults to "jsonl".
+            buffer_size (int): Number of bytes buffered before they are written to the file. Defaults to 1MB.
+            flush_interval (float | None): Maximum number of seconds records stay buffered. Defaults to 1 second.
 
         Raises:
             ResourceConflictError: If another FileExportMixin instance is already using
@@ -68,8 +106,18 @@ class FileExportMixin(ResourceConflictMixin):
         self._max_file_size = max_file_size
         self._max_files = max_files
         self._cleanup_on_init = cleanup_on_init
+        self._max_file_age = max_file_age
+        self._compression = FileCompression(compression)
+        self._file_format = FileFormat(file_format)
+        self._buffer_size = buffer_size
+        self._flush_interval = flush_interval
         self._lock = asyncio.Lock()
-        self._first_write = True
+        self._file = _OpenFile()
+
+        # Fail early when the optional dependencies are missing
+        self._packb = self._get_packb() if self._file_format == FileFormat.MSGPACK else None
+        if self._compression == FileCompression.ZSTD:
+            self._import_zstandard()
 
         # Initialize file paths first, then check for conflicts via ResourceConflictMixin
         self._setup_file_paths()
@@ -115,7 +163,7 @@ class FileExportMixin(ResourceConflictMixin):
 
         # Add cleanup pattern for rolling files
         if self._enable_rolling:
-            cleanup_pattern = f"{self._base_filename}_*{self._file_extension}"
+            cleanup_pattern = self._rolled_file_pattern()
             pattern_key = f"{self._base_dir.resolve()}:{cleanup_pattern}"
             identifiers["cleanup_pattern"] = pattern_key
 
@@ -130,7 +178,7 @@ class FileExportMixin(ResourceConflictMixin):
                         f"Use different project names or output paths to avoid conflicts.")
             case "cleanup_pattern":
                 return (f"Rolling file cleanup conflict detected: Both instances would use pattern "
-                        f"'{self._base_filename}_*{self._file_extension}' in directory '{self._base_dir}', "
+                        f"'{self._rolled_file_pattern()}' in directory '{self._base_dir}', "
                         f"causing one to delete the other's files. "
                         f"Current instance (project: '{self._project}'), "
                         f"existing instance (project: '{existing_instance._project}'). "
@@ -138,11 +186,33 @@ class FileExportMixin(ResourceConflictMixin):
             case _:
                 return f"Unknown file resource conflict: {resource_type} = {identifier}"
 
+    def _rolled_file_pattern(self) -> str:
+        """Glob pattern of the rolled files, including compressed ones."""
+        return f"{self._base_filename}_*{self._file_extension}*"
+
+    @staticmethod
+    def _get_packb() -> Callable[[Any], bytes]:
+        try:
+            import msgpack
+        except ImportError as e:
+            raise ImportError("msgpack is required for the msgpack file format. "
+                              "Install it with `uv pip install msgpack`.") from e
+        return msgpack.Packer().pack
+
+    @staticmethod
+    def _import_zstandard():
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ImportError("zstandard is required for zstd compression. "
+                              "Install it with `uv pip install zstandard`.") from e
+        return zstandard
+
     def _cleanup_old_files_sync(self) -> None:
         """Synchronous version of cleanup for use during initialization."""
         try:
             # Find all rolled files matching our pattern
-            pattern = f"{self._base_filename}_*{self._file_extension}"
+            pattern = self._rolled_file_pattern()
             rolled_files = list(self._base_dir.glob(pattern))
 
             # Sort by modification time (newest first)
@@ -159,45 +229,105 @@ class FileExportMixin(ResourceConflictMixin):
         except Exception as e:
             logger.error("Error during initialization cleanup: %s", e)
 
-    async def _should_roll_file(self) -> bool:
-        """Check if the current file should be rolled based on size."""
-        if not self._enable_rolling:
+    def _should_roll_file(self) -> bool:
+        """Check if the current file should be rolled based on its size and age."""
+        if not self._enable_rolling or self._file.handle is None:
             return False
 
-        try:
-            if self._current_file_path.exists():
-                stat = self._current_file_path.stat()
-                return stat.st_size >= self._max_file_size
-        except OSError:
-            pass
-        return False
-
-    async def _roll_file(self) -> None:
-        """Roll the current file by renaming it with a timestamp and cleaning up old files."""
-        if not self._current_file_path.exists():
+        if self._file.size >= self._max_file_size:
+            return True
+
+        return self._max_file_age is not None and (time.time() - self._file.opened_at) >= self._max_file_age
+
+    def _open_file(self) -> None:
+        """Open the current file, truncating it on the first write in overwrite mode."""
+        state = self._file
+        file_mode = "wb" if state.first_write and self._mode == FileMode.OVERWRITE else "ab"
+        state.first_write = False
+
+        state.handle = open(self._current_file_path, file_mode)  # pylint: disable=consider-using-with
+        state.size = state.handle.tell()
+        state.opened_at = time.time()
+
+    def _write_out(self, handle: BinaryIO, data: bytes) -> None:
+        handle.write(data)
+        handle.flush()
+
+    async def _flush_buffer(self) -> None:
+        """Write the buffered records to the file. Must be called with the lock held."""
+        state = self._file
+        if not state.buffer or state.handle is None:
             return
 
+        data = bytes(state.buffer)
+        state.buffer.clear()
+        await asyncio.to_thread(self._write_out, state.handle, data)
+
+    async def _close_file(self) -> None:
+        """Write the buffered records and close the file. Must be called with the lock held."""
+        state = self._file
+        await self._flush_buffer()
+        if state.handle is not None:
+            handle, state.handle = state.handle, None
+            await asyncio.to_thread(handle.close)
+
+    async def _roll_file(self) -> Path | None:
+        """Close the current file and rename it with a timestamp. Must be called with the lock held.
+
+        Returns:
+            Path | None: The path of the rolled file, or None if the file could not be rolled.
+        """
+        await self._close_file()
+
+        if not self._current_file_path.exists():
+            return None
+
         # Generate timestamped filename with microsecond precision
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
         rolled_filename = f"{self._base_filename}_{timestamp}{self._file_extension}"
         rolled_path = self._base_dir / rolled_filename
 
         try:
-            # Rename current file
             self._current_file_path.rename(rolled_path)
             logger.info("Rolled log file to: %s", rolled_path)
-
-            # Clean up old files
-            await self._cleanup_old_files()
-
+            return rolled_path
         except OSError as e:
             logger.error("Error rolling file %s: %s", self._current_file_path, e)
+            return None
+
+    def _compress_file(self, path: Path) -> Path:
+        """Compress a rolled file next to it and remove the uncompressed file."""
+        target = path.with_name(path.name + _COMPRESSION_SUFFIXES[self._compression])
+
+        with open(path, "rb") as src:
+            if self._compression == FileCompression.GZIP:
+                import gzip
+                with gzip.open(target, "wb", compresslevel=6) as dst:
+                    shutil.copyfileobj(src, dst, length=self._buffer_size)
+            else:
+                zstandard = self._import_zstandard()
+                with open(target, "wb") as raw, zstandard.ZstdCompressor().stream_writer(raw) as dst:
+                    shutil.copyfileobj(src, dst, length=self._buffer_size)
+
+        path.unlink()
+        return target
+
+    async def _finish_roll(self, rolled_path: Path) -> None:
+        """Compress a rolled file if requested and clean up old files, without holding the lock."""
+        if self._compression != FileCompression.NONE:
+            try:
+                rolled_path = await asyncio.to_thread(self._compress_file, rolled_path)
+                logger.info("Compressed rolled log file to: %s", rolled_path)
+            except Exception as e:
+                logger.error("Error compressing rolled file %s: %s", rolled_path, e)
+
+        await self._cleanup_old_files()
 
     async def _cleanup_old_files(self) -> None:
         """Remove old rolled files beyond the maximum count."""
         try:
             # Find all rolled files matching our pattern
-            pattern = f"{self._base_filename}_*{self._file_extension}"
+            pattern = self._rolled_file_pattern()
             rolled_files = list(self._base_dir.glob(pattern))
 
             # Sort by modification time (newest first)
@@ -214,42 +344,81 @@ class FileExportMixin(ResourceConflictMixin):
         except Exception as e:
             logger.error("Error during cleanup: %s", e)
 
+    def _encode_records(self, records: list[str]) -> bytes:
+        if self._packb is not None:
+            # msgpack strings carry their length, so records can be read back without scanning for separators
+            return b"".join(self._packb(record) for record in records)
+        return ("\n".join(records) + "\n").encode("utf-8")
+
+    def _schedule_flush(self) -> None:
+        state = self._file
+        if self._flush_interval is None or not state.buffer:
+            return
+        if state.flush_task is None or state.flush_task.done():
+            state.flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self._flush_interval)
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error("Error flushing %s: %s", self._current_file_path, e, exc_info=True)
+
     async def export_processed(self, item: str | list[str]) -> None:
         """Export a processed string or list of strings.
 
         Args:
             item (str | list[str]): The string or list of strings to export.
         """
+        rolled_path = None
         try:
-            # Lazy import to avoid slow startup times
-            import aiofiles
+            data = self._encode_records(item if isinstance(item, list) else [item])
 
             async with self._lock:
+                state = self._file
+                if state.handle is None:
+                    self._open_file()
+
+                state.buffer += data
+                state.size += len(data)
+
+                if len(state.buffer) >= self._buffer_size:
+                    await self._flush_buffer()
+
                 # Check if we need to roll the file
-                if await self._should_roll_file():
-                    await self._roll_file()
-
-                # Determine file mode
-                if self._first_write and self._mode == FileMode.OVERWRITE:
-                    file_mode = "w"
-                    self._first_write = False
-                else:
-                    file_mode = "a"
-
-                async with aiofiles.open(self._current_file_path, mode=file_mode) as f:
-                    if isinstance(item, list):
-                        # Handle list of strings
-                        for single_item in item:
-                            await f.write(single_item)
-                            await f.write("\n")
-                    else:
-                        # Handle single string
-                        await f.write(item)
-                        await f.write("\n")
+                if self._should_roll_file():
+                    rolled_path = await self._roll_file()
+
+                self._schedule_flush()
+
+            if rolled_path is not None:
+                await self._finish_roll(rolled_path)
 
         except Exception as e:
             logger.error("Error exporting event: %s", e, exc_info=True)
 
+    async def flush(self) -> None:
+        """Write the buffered records to the file."""
+        async with self._lock:
+            await self._flush_buffer()
+
+    async def close(self) -> None:
+        """Write the buffered records and close the file. The file is reopened by the next export."""
+        async with self._lock:
+            await self._close_file()
+
+    async def _cleanup(self):
+        """Write out the buffered records when the exporter stops.
+
+        Isolated copies share the open file with the exporter they were created from, so they only flush it.
+        """
+        await super()._cleanup()
+
+        if getattr(self, "is_isolated_instance", False):
+            await self.flush()
+        else:
+            await self.close()
+
     def get_current_file_path(self) -> Path:
         """Get the current file path being written to.
 
@@ -270,6 +439,8 @@ class FileExportMixin(ResourceConflictMixin):
             "mode": self._mode,
             "rolling_enabled": self._enable_rolling,
             "cleanup_on_init": self._cleanup_on_init,
+            "file_format": self._file_format,
+            "buffer_size": self._buffer_size,
             "project": self._project,
             "effective_project": self._project,
         }
@@ -278,11 +449,15 @@ class FileExportMixin(ResourceConflictMixin):
             info.update({
                 "max_file_size": self._max_file_size,
                 "max_files": self._max_files,
+                "max_file_age": self._max_file_age,
+                "compression": self._compression,
                 "base_directory": str(self._base_dir),
             })
 
-            # Add current file size if it exists
-            if self._current_file_path.exists():
+            # Add current file size, including the buffered records
+            if self._file.handle is not None:
+                info["current_file_size"] = self._file.size
+            elif self._current_file_path.exists():
                 info["current_file_size"] = self._current_file_path.stat().st_size
 
         return info
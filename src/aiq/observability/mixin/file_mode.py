@@ -21,3 +21,18 @@ class FileMode(StrEnum):
 
     APPEND = "append"
     OVERWRITE = "overwrite"
+
+
+class FileFormat(StrEnum):
+    """Record formats for FileExportMixin."""
+
+    JSONL = "jsonl"
+    MSGPACK = "msgpack"
+
+
+class FileCompression(StrEnum):
+    """Compression applied by FileExportMixin to rolled files."""
+
+    NONE = "none"
+    GZIP = "gzip"
+    ZSTD = "zstd"
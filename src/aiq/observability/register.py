@@ -22,6 +22,8 @@ from aiq.cli.register_workflow import register_logging_method
 from aiq.cli.register_workflow import register_telemetry_exporter
 from aiq.data_models.logging import LoggingBaseConfig
 from aiq.data_models.telemetry_exporter import TelemetryExporterBaseConfig
+from aiq.observability.mixin.file_mode import FileCompression
+from aiq.observability.mixin.file_mode import FileFormat
 from aiq.observability.mixin.file_mode import FileMode
 
 logger = logging.getLogger(__name__)
@@ -42,6 +44,19 @@ class FileTelemetryExporterConfig(TelemetryExporterBaseConfig, name="file"):
         description="Maximum file size in bytes before rolling to a new file.")
     max_files: int = Field(default=5, description="Maximum number of rolled files to keep.")
     cleanup_on_init: bool = Field(default=False, description="Clean up old files during initialization.")
+    max_file_age: float | None = Field(
+        default=None, gt=0, description="Maximum age in seconds of a file before rolling to a new file, if rolling.")
+    compression: FileCompression = Field(
+        default=FileCompression.NONE,
+        description="Compression of rolled files: 'none', 'gzip' or 'zstd' (requires the zstandard package).")
+    file_format: FileFormat = Field(
+        default=FileFormat.JSONL,
+        description="Record format: 'jsonl' or length-prefixed 'msgpack' records (requires the msgpack package).")
+    buffer_size: int = Field(default=1024 * 1024,
+                             ge=0,
+                             description="Number of bytes buffered in memory before they are written to the file.")
+    flush_interval: float | None = Field(
+        default=1.0, gt=0, description="Maximum number of seconds records stay buffered before they are written.")
 
 
 @register_telemetry_exporter(config_type=FileTelemetryExporterConfig)
@@ -52,13 +67,23 @@ async def file_telemetry_exporter(config: FileTelemetryExporterConfig, builder:
 
     from aiq.observability.exporter.file_exporter import FileExporter
 
-    yield FileExporter(output_path=config.output_path,
-                       project=config.project,
-                       mode=config.mode,
-                       enable_rolling=config.enable_rolling,
-                       max_file_size=config.max_file_size,
-                       max_files=config.max_files,
-                       cleanup_on_init=config.cleanup_on_init)
+    exporter = FileExporter(output_path=config.output_path,
+                            project=config.project,
+                            mode=config.mode,
+                            enable_rolling=config.enable_rolling,
+                            max_file_size=config.max_file_size,
+                            max_files=config.max_files,
+                            cleanup_on_init=config.cleanup_on_init,
+                            max_file_age=config.max_file_age,
+                            compression=config.compression,
+                            file_format=config.file_format,
+                            buffer_size=config.buffer_size,
+                            flush_interval=config.flush_interval)
+    try:
+        yield exporter
+    finally:
+        # Isolated copies of the exporter only flush the shared file, close it once the workflow is done
+        await exporter.close()
 
 
 class ConsoleLoggingMethodConfig(LoggingBaseConfig, name="console"):
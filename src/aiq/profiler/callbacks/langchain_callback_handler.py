@@ -38,6 +38,8 @@ from aiq.data_models.intermediate_step import ToolSchema
 from aiq.data_models.intermediate_step import TraceMetadata
 from aiq.data_models.intermediate_step import UsageInfo
 from aiq.profiler.callbacks.base_callback_class import BaseProfilerCallback
+from aiq.profiler.callbacks.token_stream import TokenStreamBuffer
+from aiq.profiler.callbacks.token_stream import get_token_stream_config
 from aiq.profiler.callbacks.token_usage_base_model import TokenUsageBaseModel
 
 logger = logging.getLogger(__name__)
@@ -75,6 +77,7 @@ class LangchainProfilerHandler(AsyncCallbackHandler, BaseProfilerCallback):  # p
         self._run_id_to_llm_input = {}
         self._run_id_to_tool_input = {}
         self._run_id_to_start_time = {}
+        self._run_id_to_token_buffer: dict[str, TokenStreamBuffer] = {}
 
     def __repr__(self) -> str:
         return (f"Tokens Used: {self.total_tokens}\n"
@@ -181,18 +184,50 @@ class LangchainProfilerHandler(AsyncCallbackHandler, BaseProfilerCallback):  # p
         except Exception as e:
             logger.exception("Error getting usage metadata: %s", e, exc_info=True)
 
-        stats = IntermediateStepPayload(
-            event_type=IntermediateStepType.LLM_NEW_TOKEN,
-            framework=LLMFrameworkEnum.LANGCHAIN,
-            name=model_name,
-            UUID=str(kwargs.get("run_id", str(uuid4()))),
-            data=StreamEventData(input=self._run_id_to_llm_input.get(str(kwargs.get("run_id", "")), ""), chunk=token),
-            usage_info=UsageInfo(token_usage=self._extract_token_base_model(usage_metadata),
-                                 num_llm_calls=1,
-                                 seconds_between_calls=int(time.time() - self.last_call_ts)),
-            metadata=TraceMetadata(chat_responses=[kwargs.get("chunk")] if kwargs.get("chunk") else []))
+        run_id = str(kwargs.get("run_id", str(uuid4())))
+        token_usage = self._extract_token_base_model(usage_metadata)
 
-        self.step_manager.push_intermediate_step(stats)
+        config = get_token_stream_config()
+        if config.mode == "full":
+            # Tokens are the most frequent events, push them without building the payload models
+            self.step_manager.push_event(
+                IntermediateStepType.LLM_NEW_TOKEN,
+                framework=LLMFrameworkEnum.LANGCHAIN,
+                name=model_name,
+                UUID=run_id,
+                data={
+                    "input": self._run_id_to_llm_input.get(run_id, ""), "chunk": token
+                },
+                usage_info={
+                    "token_usage": token_usage,
+                    "num_llm_calls": 1,
+                    "seconds_between_calls": int(time.time() - self.last_call_ts)
+                },
+                metadata={"chat_responses": [kwargs.get("chunk")] if kwargs.get("chunk") else []})
+            return
+
+        # In delta mode the prompt is only reported by LLM_START, and tokens can be combined into fewer steps
+        buffer = self._run_id_to_token_buffer.get(run_id)
+        if buffer is None:
+            buffer = self._run_id_to_token_buffer[run_id] = TokenStreamBuffer()
+        buffer.add(token, token_usage)
+        if buffer.ready(config):
+            self._push_token_delta(run_id, model_name, buffer)
+
+    def _push_token_delta(self, run_id: str, model_name: str, buffer: TokenStreamBuffer) -> None:
+        chunk, offset, tokens, token_usage = buffer.drain()
+        self.step_manager.push_event(IntermediateStepType.LLM_NEW_TOKEN,
+                                     framework=LLMFrameworkEnum.LANGCHAIN,
+                                     name=model_name,
+                                     UUID=run_id,
+                                     data={
+                                         "chunk": chunk, "chunk_offset": offset, "chunk_tokens": tokens
+                                     },
+                                     usage_info={
+                                         "token_usage": token_usage,
+                                         "num_llm_calls": 1,
+                                         "seconds_between_calls": int(time.time() - self.last_call_ts)
+                                     })
 
     async def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
         """Collect token usage."""
@@ -225,6 +260,12 @@ class LangchainProfilerHandler(AsyncCallbackHandler, BaseProfilerCallback):  # p
 
         llm_text_output = generation.message.content if generation else ""
 
+        # Report the remaining coalesced tokens before the end of the run
+        run_id = str(kwargs.get("run_id", ""))
+        buffer = self._run_id_to_token_buffer.pop(run_id, None)
+        if buffer is not None and buffer.tokens:
+            self._push_token_delta(run_id, self._run_id_to_model_name.get(run_id, model_name), buffer)
+
         # update shared state behind lock
         with self._lock:
             usage_stat = IntermediateStepPayload(
@@ -242,6 +283,15 @@ class LangchainProfilerHandler(AsyncCallbackHandler, BaseProfilerCallback):  # p
 
         self._state = IntermediateStepType.LLM_END
 
+    async def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        """Forget the state of a failed LLM run, including its tokens which were not reported yet."""
+
+        run_id = str(run_id)
+        self._run_id_to_token_buffer.pop(run_id, None)
+        self._run_id_to_model_name.pop(run_id, None)
+        self._run_id_to_llm_input.pop(run_id, None)
+        self._run_id_to_start_time.pop(run_id, None)
+
     async def on_tool_start(
         self,
         serialized: dict[str, Any],
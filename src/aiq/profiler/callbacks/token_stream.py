@@ -0,0 +1,145 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+
+from aiq.data_models.config import TokenStreamConfig
+from aiq.data_models.intermediate_step import IntermediateStep
+from aiq.data_models.intermediate_step import IntermediateStepEvent
+from aiq.profiler.callbacks.token_usage_base_model import TokenUsageBaseModel
+
+_token_stream_config = TokenStreamConfig()
+
+
+def set_token_stream_config(config: TokenStreamConfig) -> None:
+    """
+    Set the process-wide configuration used by the profiler callbacks to report streamed LLM tokens.
+    """
+    global _token_stream_config  # pylint: disable=global-statement
+    _token_stream_config = config
+
+
+def get_token_stream_config() -> TokenStreamConfig:
+    return _token_stream_config
+
+
+class TokenStreamBuffer:
+    """
+    Tokens streamed by a single LLM run which have not been reported yet.
+
+    In `delta` mode each LLM_NEW_TOKEN step only carries the text generated since the previous step, together with
+    `chunk_offset`, the position of that text in the full output. The output of the run is therefore the
+    concatenation of the chunks in offset order, and the prompt only has to be read from the LLM_START step.
+    """
+
+    __slots__ = ("_chunks", "_started_at", "offset", "tokens", "prompt_tokens", "completion_tokens", "total_tokens")
+
+    def __init__(self):
+        self._chunks: list[str] = []
+        self._started_at = 0.0
+        self.offset = 0
+        self.tokens = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.total_tokens = 0
+
+    def add(self, token: str, token_usage: TokenUsageBaseModel) -> None:
+        if not self.tokens:
+            self._started_at = time.monotonic()
+        self._chunks.append(token)
+        self.tokens += 1
+        self.prompt_tokens += token_usage.prompt_tokens
+        self.completion_tokens += token_usage.completion_tokens
+        self.total_tokens += token_usage.total_tokens
+
+    def ready(self, config: TokenStreamConfig) -> bool:
+        """
+        Whether the buffered tokens should be reported, based on their count and the age of the oldest one.
+        """
+        if self.tokens >= config.coalesce_tokens:
+            return True
+        return (config.coalesce_interval_ms is not None and self.tokens > 0
+                and (time.monotonic() - self._started_at) * 1000 >= config.coalesce_interval_ms)
+
+    def drain(self) -> tuple[str, int, int, TokenUsageBaseModel]:
+        """
+        Take the buffered tokens.
+
+        Returns:
+            tuple[str, int, int, TokenUsageBaseModel]: The buffered text, its offset in the output, the number of
+            tokens and their combined token usage.
+        """
+        text = "".join(self._chunks)
+        result = (text,
+                  self.offset,
+                  self.tokens,
+                  TokenUsageBaseModel(prompt_tokens=self.prompt_tokens,
+                                      completion_tokens=self.completion_tokens,
+                                      total_tokens=self.total_tokens))
+        self._chunks.clear()
+        self.offset += len(text)
+        self.tokens = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.total_tokens = 0
+        return result
+
+
+class StreamedText:
+    """
+    Reassembles the streamed output of LLM runs from their LLM_NEW_TOKEN steps, in either token stream mode.
+
+    Chunks which carry a `chunk_offset` (`delta` mode) are placed at their offset, so the text is right even if the
+    steps of a run are delivered out of order. Chunks without an offset (`full` mode) are appended.
+    """
+
+    def __init__(self):
+        self._chunks: dict[str, dict[int, str]] = {}
+        self._ends: dict[str, int] = {}
+
+    def add(self, step: IntermediateStep | IntermediateStepEvent) -> None:
+        """
+        Add the chunk of an LLM_NEW_TOKEN step to the output of its run.
+        """
+        data = step.data
+        if data is None or data.chunk is None:
+            return
+
+        chunk = str(data.chunk)
+        end = self._ends.get(step.UUID, 0)
+        offset = getattr(data, "chunk_offset", None)
+        if offset is None:
+            offset = end
+
+        self._chunks.setdefault(step.UUID, {})[offset] = chunk
+        self._ends[step.UUID] = max(end, offset + len(chunk))
+
+    def text(self, run_id: str) -> str:
+        """
+        Get the output streamed so far by a run.
+        """
+        chunks = self._chunks.get(run_id)
+        if not chunks:
+            return ""
+        return "".join(chunks[offset] for offset in sorted(chunks))
+
+    def pop(self, run_id: str) -> str:
+        """
+        Get the output streamed by a run and forget the run.
+        """
+        text = self.text(run_id)
+        self._chunks.pop(run_id, None)
+        self._ends.pop(run_id, None)
+        return text
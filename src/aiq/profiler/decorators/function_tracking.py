@@ -22,9 +22,7 @@ from pydantic import BaseModel
 
 from aiq.builder.context import AIQContext
 from aiq.builder.intermediate_step_manager import IntermediateStepManager
-from aiq.data_models.intermediate_step import IntermediateStepPayload
 from aiq.data_models.intermediate_step import IntermediateStepType
-from aiq.data_models.intermediate_step import TraceMetadata
 
 
 # --- Helper function to recursively serialize any object into JSON-friendly data ---
@@ -63,16 +61,14 @@ def push_intermediate_step(step_manager: IntermediateStepManager,
                            metadata: dict[str, Any] | None = None) -> None:
     """Push an intermediate step to the AIQ Toolkit Event Stream."""
 
-    payload = IntermediateStepPayload(UUID=identifier,
-                                      event_type=event_type,
-                                      name=function_name,
-                                      metadata=TraceMetadata(
-                                          span_inputs=[args, kwargs],
-                                          span_outputs=output,
-                                          provided_metadata=metadata,
-                                      ))
-
-    step_manager.push_intermediate_step(payload)
+    step_manager.push_event(event_type,
+                            UUID=identifier,
+                            name=function_name,
+                            metadata={
+                                "span_inputs": [args, kwargs],
+                                "span_outputs": output,
+                                "provided_metadata": metadata,
+                            })
 
 
 def track_function(func: Any = None, *, metadata: dict[str, Any] | None = None):
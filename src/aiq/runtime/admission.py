@@ -0,0 +1,285 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import contextvars
+import logging
+import time
+from collections import OrderedDict
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from enum import IntEnum
+
+logger = logging.getLogger(__name__)
+
+
+class RequestPriority(IntEnum):
+    """
+    Priority classes of workflow runs. Lower values are admitted first.
+    """
+    INTERACTIVE = 0
+    SYNC = 1
+    ASYNC = 2
+    EVALUATION = 3
+
+
+class AdmissionRejectedError(RuntimeError):
+    """
+    Raised when a workflow run is not admitted, either because the queue of its priority class is full or because it
+    waited longer than the queue timeout.
+
+    Args:
+        message (str): Description of the rejection.
+        queue_full (bool): Whether the run was rejected immediately because the queue was full.
+        retry_after (float): Suggested number of seconds to wait before retrying.
+    """
+
+    def __init__(self, message: str, queue_full: bool, retry_after: float):
+        super().__init__(message)
+        self.queue_full = queue_full
+        self.retry_after = retry_after
+
+
+# Priority class and fair share key of the current request, set by the session manager
+request_priority: contextvars.ContextVar[RequestPriority | None] = contextvars.ContextVar("request_priority",
+                                                                                          default=None)
+fair_share_key: contextvars.ContextVar[str | None] = contextvars.ContextVar("fair_share_key", default=None)
+
+
+class _Waiter:
+
+    __slots__ = ("future", "priority", "key", "enqueued_at")
+
+    def __init__(self, future: asyncio.Future, priority: RequestPriority, key: str | None):
+        self.future = future
+        self.priority = priority
+        self.key = key
+        self.enqueued_at = time.monotonic()
+
+
+class AdmissionController:
+    """
+    Admission control for workflow runs.
+
+    Runs are admitted while fewer than the concurrency limit are in flight. Otherwise they wait in the queue of their
+    priority class, and higher priority classes are always admitted first. Within a class, the queue is shared fairly
+    by rotating between the waiting users (fair share keys), so a single user submitting many runs cannot starve the
+    others. Runs are rejected right away when their queue is full and after waiting longer than `queue_timeout`.
+
+    With `adaptive` enabled the concurrency limit follows the observed run latency using additive increase /
+    multiplicative decrease: the limit shrinks when runs become much slower than the baseline latency (the backend,
+    usually the LLM, is saturated) and grows back while runs are queued and latency is healthy.
+
+    Args:
+        max_concurrency (int): Maximum number of runs in flight. 0 or less disables the limit.
+        min_concurrency (int): Lower bound of the adaptive limit.
+        max_queue_size (int | None): Maximum number of queued runs per priority class. `None` is unbounded.
+        queue_timeout (float | None): Maximum number of seconds a run waits to be admitted. `None` waits forever.
+        adaptive (bool): Adapt the concurrency limit to the observed latency.
+        latency_tolerance (float): Runs slower than the baseline latency times this factor decrease the limit.
+        backoff_ratio (float): Factor applied to the limit on each decrease.
+    """
+
+    def __init__(self,
+                 max_concurrency: int = 8,
+                 min_concurrency: int = 1,
+                 max_queue_size: int | None = None,
+                 queue_timeout: float | None = None,
+                 adaptive: bool = False,
+                 latency_tolerance: float = 2.0,
+                 backoff_ratio: float = 0.9):
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = max(1, min(min_concurrency, max_concurrency)) if max_concurrency > 0 else 0
+        self.max_queue_size = max_queue_size
+        self.queue_timeout = queue_timeout
+        self.adaptive = adaptive
+        self.latency_tolerance = latency_tolerance
+        self.backoff_ratio = backoff_ratio
+
+        self._limit = float(max_concurrency)
+        self._in_flight = 0
+        # Per priority class: fair share key -> waiters of that key, rotated on every admission
+        self._queues: dict[RequestPriority, OrderedDict[str | None, deque[_Waiter]]] = {
+            priority: OrderedDict()
+            for priority in RequestPriority
+        }
+        self._queue_sizes: dict[RequestPriority, int] = {priority: 0 for priority in RequestPriority}
+
+        self._baseline_latency: float | None = None
+        self._latency_ewma: float | None = None
+        self._admitted = 0
+        self._rejected = 0
+        self._timed_out = 0
+        self._queue_wait_sum = 0.0
+
+    @property
+    def limited(self) -> bool:
+        return self.max_concurrency > 0
+
+    @property
+    def limit(self) -> int:
+        """The current concurrency limit."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        return sum(self._queue_sizes.values())
+
+    @asynccontextmanager
+    async def admit(self,
+                    priority: RequestPriority = RequestPriority.SYNC,
+                    key: str | None = None) -> AsyncIterator[None]:
+        """
+        Wait until a run is admitted and hold its slot for the duration of the context.
+
+        Args:
+            priority (RequestPriority): The priority class of the run.
+            key (str | None): Fair share key of the run, usually identifying the user.
+
+        Raises:
+            AdmissionRejectedError: If the queue is full or the queue timeout expired.
+        """
+        if not self.limited:
+            yield
+            return
+
+        await self._acquire(priority, key)
+
+        start = time.monotonic()
+        succeeded = False
+        try:
+            yield
+            succeeded = True
+        finally:
+            self._release(time.monotonic() - start if succeeded else None)
+
+    def _has_precedence(self, priority: RequestPriority) -> bool:
+        # Whether any run of the same or a higher priority class is already waiting
+        return any(self._queue_sizes[p] for p in RequestPriority if p <= priority)
+
+    async def _acquire(self, priority: RequestPriority, key: str | None) -> None:
+        if self._in_flight < self.limit and not self._has_precedence(priority):
+            self._in_flight += 1
+            self._admitted += 1
+            return
+
+        if self.max_queue_size is not None and self._queue_sizes[priority] >= self.max_queue_size:
+            self._rejected += 1
+            raise AdmissionRejectedError(f"Too many queued {priority.name.lower()} requests",
+                                         queue_full=True,
+                                         retry_after=self._retry_after())
+
+        waiter = _Waiter(asyncio.get_running_loop().create_future(), priority, key)
+        self._queues[priority].setdefault(key, deque()).append(waiter)
+        self._queue_sizes[priority] += 1
+
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.future), self.queue_timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if waiter.future.done():
+                # Admitted just before timing out or being cancelled, give the slot to the next run
+                self._release(None)
+            else:
+                waiter.future.cancel()
+                self._remove(waiter)
+
+            if isinstance(e, asyncio.TimeoutError):
+                self._timed_out += 1
+                raise AdmissionRejectedError(f"Timed out waiting {self.queue_timeout}s to be admitted",
+                                             queue_full=False,
+                                             retry_after=self._retry_after()) from None
+            raise
+
+        self._admitted += 1
+        self._queue_wait_sum += time.monotonic() - waiter.enqueued_at
+
+    def _remove(self, waiter: _Waiter) -> None:
+        queue = self._queues[waiter.priority]
+        waiters = queue.get(waiter.key)
+        if waiters is not None and waiter in waiters:
+            waiters.remove(waiter)
+            self._queue_sizes[waiter.priority] -= 1
+            if not waiters:
+                del queue[waiter.key]
+
+    def _pop_next(self) -> _Waiter | None:
+        for priority in RequestPriority:
+            queue = self._queues[priority]
+            if not queue:
+                continue
+
+            key, waiters = next(iter(queue.items()))
+            waiter = waiters.popleft()
+            self._queue_sizes[priority] -= 1
+            if waiters:
+                # Rotate so that the other keys of this class are served next
+                queue.move_to_end(key)
+            else:
+                del queue[key]
+            return waiter
+
+        return None
+
+    def _release(self, latency: float | None) -> None:
+        self._in_flight -= 1
+
+        if latency is not None and self.adaptive:
+            self._adapt(latency)
+
+        while self._in_flight < self.limit:
+            waiter = self._pop_next()
+            if waiter is None:
+                break
+            self._in_flight += 1
+            waiter.future.set_result(None)
+
+    def _adapt(self, latency: float) -> None:
+        self._latency_ewma = latency if self._latency_ewma is None else 0.9 * self._latency_ewma + 0.1 * latency
+
+        # The baseline follows the fastest runs and slowly drifts up, so that it recovers from a change of workload
+        if self._baseline_latency is None:
+            self._baseline_latency = latency
+        else:
+            self._baseline_latency = min(latency, self._baseline_latency * 1.01)
+
+        if latency > self._baseline_latency * self.latency_tolerance:
+            self._limit = max(float(self.min_concurrency), self._limit * self.backoff_ratio)
+        elif self.queued:
+            self._limit = min(float(self.max_concurrency), self._limit + 1.0 / self._limit)
+
+    def _retry_after(self) -> float:
+        latency = self._latency_ewma or 1.0
+        return max(1.0, latency * (self.queued + 1) / max(1, self.limit))
+
+    def stats(self) -> dict[str, float]:
+        """
+        Get the admission metrics: concurrency limit, runs in flight, queue depth per priority class and counters.
+        """
+        stats: dict[str, float] = {
+            "admission_limit": self.limit,
+            "admission_in_flight": self._in_flight,
+            "admission_admitted_total": self._admitted,
+            "admission_rejected_total": self._rejected,
+            "admission_timed_out_total": self._timed_out,
+            "admission_queue_wait_seconds_sum": self._queue_wait_sum,
+        }
+        for priority in RequestPriority:
+            stats[f"admission_queued_{priority.name.lower()}"] = self._queue_sizes[priority]
+        return stats
@@ -20,9 +20,9 @@ from enum import Enum
 from aiq.builder.context import AIQContext
 from aiq.builder.context import AIQContextState
 from aiq.builder.function import Function
+from aiq.builder.intermediate_step_manager import create_event_stream
 from aiq.data_models.invocation_node import InvocationNode
 from aiq.observability.exporter_manager import ExporterManager
-from aiq.utils.reactive.subject import Subject
 
 logger = logging.getLogger(__name__)
 
@@ -94,7 +94,7 @@ class AIQRunner:
         self._input_message_token = self._context_state.input_message.set(self._input_message)
 
         # Create reactive event stream
-        self._context_state.event_stream.set(Subject())
+        self._context_state.event_stream.set(create_event_stream())
         self._context_state.active_function.set(InvocationNode(
             function_name="root",
             function_id="root",
@@ -13,13 +13,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import asyncio
 import contextvars
 import typing
 from collections.abc import Awaitable
 from collections.abc import Callable
 from contextlib import asynccontextmanager
-from contextlib import nullcontext
 
 from starlette.requests import HTTPConnection
 
@@ -32,6 +30,10 @@ from aiq.data_models.authentication import AuthProviderBaseConfig
 from aiq.data_models.config import AIQConfig
 from aiq.data_models.interactive import HumanResponse
 from aiq.data_models.interactive import InteractionPrompt
+from aiq.runtime.admission import AdmissionController
+from aiq.runtime.admission import RequestPriority
+from aiq.runtime.admission import fair_share_key
+from aiq.runtime.admission import request_priority
 
 _T = typing.TypeVar("_T")
 
@@ -42,7 +44,10 @@ class UserManagerBase:
 
 class AIQSessionManager:
 
-    def __init__(self, workflow: Workflow, max_concurrency: int = 8):
+    def __init__(self,
+                 workflow: Workflow,
+                 max_concurrency: int = 8,
+                 admission_controller: AdmissionController | None = None):
         """
         The AIQSessionManager class is used to run and manage a user workflow session. It runs and manages the context,
         and configuration of a workflow with the specified concurrency.
@@ -53,6 +58,10 @@ class AIQSessionManager:
             The workflow to run
         max_concurrency : int, optional
             The maximum number of simultaneous workflow invocations, by default 8
+        admission_controller : AdmissionController, optional
+            Admission controller deciding when runs start, which can be shared by several session managers to enforce
+            a single limit with priorities and fair queuing. By default a controller limited to `max_concurrency` is
+            created for this session manager.
         """
 
         if (workflow is None):
@@ -68,11 +77,8 @@ class AIQSessionManager:
         # for each request, and we need to restore the context vars
         self._saved_context = contextvars.copy_context()
 
-        if (max_concurrency > 0):
-            self._semaphore = asyncio.Semaphore(max_concurrency)
-        else:
-            # If max_concurrency is 0, then we don't need to limit the concurrency but we still need a context
-            self._semaphore = nullcontext()
+        # If max_concurrency is 0, the controller admits every run immediately
+        self._admission = admission_controller or AdmissionController(max_concurrency=max_concurrency)
 
     @property
     def config(self) -> AIQConfig:
@@ -86,6 +92,10 @@ class AIQSessionManager:
     def context(self) -> AIQContext:
         return self._context
 
+    @property
+    def admission(self) -> AdmissionController:
+        return self._admission
+
     @asynccontextmanager
     async def session(self,
                       user_manager=None,
@@ -93,7 +103,8 @@ class AIQSessionManager:
                       conversation_id: str | None = None,
                       user_input_callback: Callable[[InteractionPrompt], Awaitable[HumanResponse]] = None,
                       user_authentication_callback: Callable[[AuthProviderBaseConfig, AuthFlowType],
-                                                             Awaitable[AuthenticatedContext | None]] = None):
+                                                             Awaitable[AuthenticatedContext | None]] = None,
+                      priority: RequestPriority | None = None):
 
         token_user_input = None
         if user_input_callback is not None:
@@ -112,6 +123,19 @@ class AIQSessionManager:
 
         self.set_metadata_from_http_request(request)
 
+        if priority is None and request is not None:
+            # Runs driven by a websocket have a user waiting on the other end
+            priority = RequestPriority.INTERACTIVE if request.scope["type"] == "websocket" else RequestPriority.SYNC
+        if priority is not None:
+            request_priority.set(priority)
+
+        if request is not None:
+            fair_share_key.set(
+                request.cookies.get("aiqtoolkit-session") or request.headers.get("conversation-id")
+                or (request.client.host if request.client is not None else None))
+        elif conversation_id is not None:
+            fair_share_key.set(conversation_id)
+
         try:
             yield self
         finally:
@@ -123,11 +147,19 @@ class AIQSessionManager:
                 self._context_state.user_auth_callback.reset(token_user_authentication)
 
     @asynccontextmanager
-    async def run(self, message):
+    async def run(self, message, priority: RequestPriority | None = None):
         """
-        Start a workflow run
+        Start a workflow run once it is admitted by the admission controller.
+
+        The priority defaults to the one of the current session, or `RequestPriority.SYNC` outside of a request.
+        Raises `AdmissionRejectedError` when the run is not admitted.
         """
-        async with self._semaphore:
+        if priority is None:
+            priority = request_priority.get()
+        if priority is None:
+            priority = RequestPriority.SYNC
+
+        async with self._admission.admit(priority, fair_share_key.get()):
             # Apply the saved context
             for k, v in self._saved_context.items():
                 k.set(v)
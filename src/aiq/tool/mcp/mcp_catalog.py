@@ -0,0 +1,188 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+import weakref
+from collections.abc import Awaitable
+from collections.abc import Callable
+
+from mcp.types import ListToolsResult
+from mcp.types import Tool
+from platformdirs import user_cache_dir
+
+logger = logging.getLogger(__name__)
+
+
+def schema_hash(value) -> str:
+    """
+    Stable hash of a JSON compatible value, independent of key order.
+    """
+    canonical = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class _CatalogEntry:
+
+    __slots__ = ("tools", "content_hash", "fetched_at")
+
+    def __init__(self, tools: list[Tool], content_hash: str, fetched_at: float):
+        self.tools = tools
+        self.content_hash = content_hash
+        self.fetched_at = fetched_at
+
+
+class MCPCatalog:
+    """
+    Process-wide catalog of the tools served by each MCP server.
+
+    Every server is listed at most once per TTL no matter how many tool wrappers use it. Concurrent lookups for the
+    same server wait for a single `list_tools` request. Listings are persisted to an on-disk cache, so a restarted
+    process can skip discovery entirely while the entry is fresh. Once an entry expires, the server is listed again
+    with a full `list_tools` request, since MCP has no conditional listing. If the content hash of the new listing
+    matches the cached one, the already parsed tools are kept.
+
+    Args:
+        cache_dir (str | None): Directory of the on-disk cache. Defaults to `AIQ_MCP_CACHE_DIR` or the user cache dir.
+            Set `persist` to False to keep the catalog in memory only.
+        ttl (float | None): Number of seconds a listing is considered fresh. `None` never expires.
+        persist (bool): Whether to read and write the on-disk cache.
+    """
+
+    def __init__(self, cache_dir: str | None = None, ttl: float | None = 3600.0, persist: bool = True):
+        self.cache_dir = cache_dir or os.getenv("AIQ_MCP_CACHE_DIR", os.path.join(user_cache_dir(appname="aiq"), "mcp"))
+        self.ttl = ttl
+        self.persist = persist
+        self._entries: dict[str, _CatalogEntry] = {}
+        # asyncio locks are bound to the loop they are first used on, so every loop gets its own set
+        self._locks: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Lock]] = \
+            weakref.WeakKeyDictionary()
+
+    def _is_fresh(self, entry: _CatalogEntry) -> bool:
+        return self.ttl is None or (time.time() - entry.fetched_at) < self.ttl
+
+    async def get_tools(self,
+                        url: str,
+                        fetch: Callable[[], Awaitable[ListToolsResult]],
+                        refresh: bool = False) -> list[Tool]:
+        """
+        Get the tools served by an MCP server, listing the server only when there is no fresh entry.
+
+        Args:
+            url (str): The url (or identifier) of the MCP server.
+            fetch (Callable): Coroutine function which lists the tools of the server.
+            refresh (bool): Ignore any cached entry and list the server again.
+
+        Returns:
+            list[Tool]: The tools served by the server.
+        """
+        loop_locks = self._locks.setdefault(asyncio.get_running_loop(), {})
+        lock = loop_locks.get(url)
+        if lock is None:
+            lock = loop_locks[url] = asyncio.Lock()
+
+        async with lock:
+            entry = self._entries.get(url)
+            if entry is None and self.persist:
+                entry = self._read(url)
+                if entry is not None:
+                    self._entries[url] = entry
+
+            if entry is not None and not refresh and self._is_fresh(entry):
+                return entry.tools
+
+            result = await fetch()
+            payload = [tool.model_dump(mode="json") for tool in result.tools]
+            content_hash = schema_hash(payload)
+
+            if entry is not None and entry.content_hash == content_hash:
+                # Unchanged since the last listing, keep the parsed tools and only renew the entry
+                entry.fetched_at = time.time()
+            else:
+                entry = _CatalogEntry(list(result.tools), content_hash, time.time())
+                self._entries[url] = entry
+
+            if self.persist:
+                self._write(url, entry, payload)
+
+            return entry.tools
+
+    def invalidate(self, url: str | None = None) -> None:
+        """
+        Drop the cached listing of a server, or of every server when `url` is not provided.
+        """
+        urls = [url] if url is not None else list(self._entries)
+        for key in urls:
+            self._entries.pop(key, None)
+            if self.persist:
+                try:
+                    os.remove(self._path(key))
+                except FileNotFoundError:
+                    pass
+
+    def _path(self, url: str) -> str:
+        return os.path.join(self.cache_dir, f"{schema_hash(url)}.json")
+
+    def _read(self, url: str) -> _CatalogEntry | None:
+        try:
+            with open(self._path(url), encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("url") != url:
+                return None
+            tools = [Tool.model_validate(tool) for tool in data["tools"]]
+            return _CatalogEntry(tools, data["content_hash"], data["fetched_at"])
+        except FileNotFoundError:
+            return None
+        except Exception as e:  # pylint: disable=broad-except
+            logger.debug("Ignoring unreadable MCP catalog cache for %s: %s", url, e)
+            return None
+
+    def _write(self, url: str, entry: _CatalogEntry, payload: list[dict]) -> None:
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "url": url,
+                        "content_hash": entry.content_hash,
+                        "fetched_at": entry.fetched_at,
+                        "tools": payload,
+                    },
+                    f)
+            os.replace(tmp_path, self._path(url))
+        except OSError as e:
+            logger.warning("Unable to write MCP catalog cache for %s: %s", url, e)
+
+
+_catalog: MCPCatalog | None = None
+
+
+def get_mcp_catalog() -> MCPCatalog:
+    """
+    Get the process-wide MCP catalog. The TTL can be configured with `AIQ_MCP_CATALOG_TTL` (seconds).
+    """
+    global _catalog  # pylint: disable=global-statement
+    if _catalog is None:
+        ttl = os.getenv("AIQ_MCP_CATALOG_TTL")
+        _catalog = MCPCatalog(ttl=float(ttl) if ttl else 3600.0)
+    return _catalog
@@ -15,28 +15,71 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import shlex
+from collections.abc import AsyncGenerator
+from collections.abc import Awaitable
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
 from contextlib import asynccontextmanager
+from contextlib import nullcontext
 from enum import Enum
 from typing import Any
+from typing import TypeVar
 
 from mcp import ClientSession
+from mcp import StdioServerParameters
 from mcp.client.sse import sse_client
+from mcp.client.stdio import stdio_client
+from mcp.client.streamable_http import streamablehttp_client
+from mcp.types import CallToolResult
 from mcp.types import TextContent
 from pydantic import BaseModel
 from pydantic import Field
 from pydantic import create_model
 
 from aiq.tool.mcp.exceptions import MCPToolNotFoundError
+from aiq.tool.mcp.mcp_catalog import MCPCatalog
+from aiq.tool.mcp.mcp_catalog import schema_hash
+from aiq.tool.mcp.mcp_session_pool import MCPSessionPool
 from aiq.utils.exception_handlers.mcp import mcp_exception_handler
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+class MCPBatchResult(BaseModel):
+    """
+    Result of one call in a batch of MCP tool calls. Exactly one of `output` and `error` is set.
+    """
+    index: int = Field(description="Position of the call's arguments in the batch")
+    output: str | None = Field(default=None, description="The tool output if the call succeeded")
+    error: str | None = Field(default=None, description="The error message if the call failed")
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+# Generated input models keyed by model name and schema hash
+_model_cache: dict[tuple[str, str], type[BaseModel]] = {}
+
 
 def model_from_mcp_schema(name: str, mcp_input_schema: dict) -> type[BaseModel]:
     """
-    Create a pydantic model from the input schema of the MCP tool
+    Create a pydantic model from the input schema of the MCP tool. Models are memoized by name and schema hash, so
+    tools sharing a schema (or re-created by other wrappers) reuse the same model.
     """
+    key = (name, schema_hash(mcp_input_schema))
+    model = _model_cache.get(key)
+    if model is None:
+        model = _model_cache[key] = _create_model_from_mcp_schema(name, mcp_input_schema)
+    return model
+
+
+def _create_model_from_mcp_schema(name: str, mcp_input_schema: dict) -> type[BaseModel]:
     _type_map = {
         "string": str,
         "number": float,
@@ -107,16 +150,55 @@ def model_from_mcp_schema(name: str, mcp_input_schema: dict) -> type[BaseModel]:
     return create_model(f"{_generate_valid_classname(name)}InputSchema", **schema_dict)
 
 
-class MCPSSEClient:
+class MCPBaseClient:
+    """
+    Base client for creating sessions with an MCP server over a specific transport
+
+    Args:
+      url (str): The url of the MCP server, or an identifier of the server for non-HTTP transports
+      session_pool (MCPSessionPool | None): Pool of long-lived sessions to use. If not provided, every request opens
+        and initializes a new session.
+    """
+
+    transport: str = ""
+
+    def __init__(self, url: str, session_pool: MCPSessionPool | None = None):
+        self.url = url
+        self._session_pool = session_pool
+
+    @property
+    def session_pool(self) -> MCPSessionPool | None:
+        return self._session_pool
+
+    def connect_to_server(self) -> AbstractAsyncContextManager[ClientSession]:
+        """
+        Establish an initialized session with the MCP server within an async context
+        """
+        raise NotImplementedError
+
+    async def _with_session(self, fn: Callable[[ClientSession], Awaitable[T]], idempotent: bool = True) -> T:
+        """
+        Run `fn` with a pooled session when a pool is configured, otherwise with a one-off session. Non-idempotent
+        requests are not retried by the pool once they were sent.
+        """
+        if self._session_pool is not None:
+            return await self._session_pool.run(fn, idempotent=idempotent)
+
+        async with self.connect_to_server() as session:
+            return await fn(session)
+
+
+class MCPSSEClient(MCPBaseClient):
     """
     Client for creating a session and connecting to an MCP server using SSE
 
     Args:
       url (str): The url of the MCP server
+      session_pool (MCPSessionPool | None): Pool of long-lived sessions to use. If not provided, every request opens
+        and initializes a new session.
     """
 
-    def __init__(self, url: str):
-        self.url = url
+    transport = "sse"
 
     @asynccontextmanager
     async def connect_to_sse_server(self):
@@ -128,36 +210,189 @@ class MCPSSEClient:
                 await session.initialize()
                 yield session
 
+    def connect_to_server(self) -> AbstractAsyncContextManager[ClientSession]:
+        return self.connect_to_sse_server()
+
+
+class MCPStreamableHTTPClient(MCPBaseClient):
+    """
+    Client for creating a session and connecting to an MCP server using the streamable HTTP transport
+
+    Args:
+      url (str): The url of the MCP server
+      session_pool (MCPSessionPool | None): Pool of long-lived sessions to use. If not provided, every request opens
+        and initializes a new session.
+    """
+
+    transport = "streamable-http"
+
+    @asynccontextmanager
+    async def connect_to_server(self):
+        async with streamablehttp_client(url=self.url) as (read, write, _):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                yield session
+
+
+class MCPStdioClient(MCPBaseClient):
+    """
+    Client for creating a session with an MCP server running as a subprocess and communicating over stdio.
+    Every session owns its own server process.
+
+    Args:
+      command (str): The executable used to start the server
+      args (list[str] | None): Arguments passed to the command
+      env (dict[str, str] | None): Environment variables for the server process
+      cwd (str | None): Working directory for the server process
+      session_pool (MCPSessionPool | None): Pool of long-lived sessions (warm server processes) to use. If not
+        provided, every request starts a new server process.
+    """
+
+    transport = "stdio"
+
+    def __init__(self,
+                 command: str,
+                 args: list[str] | None = None,
+                 env: dict[str, str] | None = None,
+                 cwd: str | None = None,
+                 session_pool: MCPSessionPool | None = None):
+        self.server_params = StdioServerParameters(command=command, args=args or [], env=env, cwd=cwd)
+        super().__init__(f"stdio:{shlex.join([command, *self.server_params.args])}", session_pool=session_pool)
+
+    @asynccontextmanager
+    async def connect_to_server(self):
+        async with stdio_client(self.server_params) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                yield session
+
 
-class MCPBuilder(MCPSSEClient):
+def create_mcp_client(transport: str = "sse",
+                      url: str | None = None,
+                      command: str | None = None,
+                      args: list[str] | None = None,
+                      env: dict[str, str] | None = None,
+                      cwd: str | None = None,
+                      session_pool: MCPSessionPool | None = None) -> MCPBaseClient:
+    """
+    Create a client for the given transport.
+
+    Args:
+        transport (str): One of "sse", "streamable-http" or "stdio"
+        url (str | None): The url of the MCP server, required by the HTTP transports
+        command (str | None): The executable used to start the server, required by the stdio transport
+        args (list[str] | None): Arguments passed to the command
+        env (dict[str, str] | None): Environment variables for the server process
+        cwd (str | None): Working directory for the server process
+        session_pool (MCPSessionPool | None): Pool of long-lived sessions to use
+
+    Returns:
+        MCPBaseClient: The transport specific client
+    """
+    if transport == "stdio":
+        if not command:
+            raise ValueError("The stdio transport requires a command")
+        return MCPStdioClient(command, args=args, env=env, cwd=cwd, session_pool=session_pool)
+
+    if not url:
+        raise ValueError(f"The {transport} transport requires a url")
+    if transport == "sse":
+        return MCPSSEClient(url, session_pool=session_pool)
+    if transport == "streamable-http":
+        return MCPStreamableHTTPClient(url, session_pool=session_pool)
+
+    raise ValueError(f"Unsupported MCP transport: {transport}")
+
+
+class MCPBuilder(MCPBaseClient):
     """
     Builder class used to connect to an MCP Server and generate ToolClients
 
+    When used as an async context manager without an explicit `session_pool`, the builder owns a pool of long-lived
+    sessions for its lifetime which is shared with all of the tool clients it creates. For the stdio transport the
+    pool keeps `min_sessions` warm server processes running.
+
     Args:
-        url (str): The url of the MCP server
+        url (str | None): The url of the MCP server. Not used by the stdio transport.
+        session_pool (MCPSessionPool | None): Pool of long-lived sessions shared with the created tool clients
+        transport (str): One of "sse", "streamable-http" or "stdio"
+        command (str | None): The executable used to start a stdio server
+        args (list[str] | None): Arguments passed to the stdio server command
+        env (dict[str, str] | None): Environment variables for the stdio server process
+        catalog (MCPCatalog | None): Catalog used to share and cache tool listings. If not provided, the server is
+            listed on every call to `get_tools`.
+        pool_kwargs: Arguments for the `MCPSessionPool` created when entering the builder's context
     """
 
-    def __init__(self, url):
-        super().__init__(url)
+    def __init__(self,
+                 url: str | None = None,
+                 session_pool: MCPSessionPool | None = None,
+                 transport: str = "sse",
+                 command: str | None = None,
+                 args: list[str] | None = None,
+                 env: dict[str, str] | None = None,
+                 catalog: MCPCatalog | None = None,
+                 **pool_kwargs):
+        self._client = create_mcp_client(transport, url=url, command=command, args=args, env=env)
+        super().__init__(self._client.url, session_pool=session_pool)
+        self.transport = transport
+        self._catalog = catalog
         self._tools = None
+        self._pool_kwargs = pool_kwargs
+        self._owns_pool = False
+
+    def connect_to_server(self) -> AbstractAsyncContextManager[ClientSession]:
+        return self._client.connect_to_server()
+
+    def connect_to_sse_server(self) -> AbstractAsyncContextManager[ClientSession]:
+        return self.connect_to_server()
+
+    async def __aenter__(self) -> MCPBuilder:
+        if self._session_pool is None:
+            self._session_pool = MCPSessionPool(self.url, self.connect_to_server, **self._pool_kwargs)
+            self._owns_pool = True
+            await self._session_pool.start()
+        return self
+
+    async def __aexit__(self, *exc_details) -> None:
+        if self._owns_pool:
+            await self._session_pool.aclose()
+            self._session_pool = None
+            self._owns_pool = False
+            self._tools = None
 
     @mcp_exception_handler
-    async def get_tools(self):
+    async def get_tools(self, refresh: bool = False):
         """
         Retrieve a dictionary of all tools served by the MCP server.
 
+        Args:
+            refresh (bool): Bypass the catalog and list the server again.
+
         Returns:
             Dict of tool name to MCPToolClient
 
         Raises:
             MCPError: If connection or tool retrieval fails
         """
-        async with self.connect_to_sse_server() as session:
-            response = await session.list_tools()
+
+        async def _list_tools():
+            return await self._with_session(lambda session: session.list_tools())
+
+        if self._catalog is not None:
+            tools = await self._catalog.get_tools(self.url, _list_tools, refresh=refresh)
+        else:
+            tools = (await _list_tools()).tools
 
         return {
-            tool.name: MCPToolClient(self.url, tool.name, tool.description, tool_input_schema=tool.inputSchema)
-            for tool in response.tools
+            tool.name:
+                MCPToolClient(self.url,
+                              tool.name,
+                              tool.description,
+                              tool_input_schema=tool.inputSchema,
+                              session_pool=self._session_pool,
+                              transport_client=self._client)
+            for tool in tools
         }
 
     @mcp_exception_handler
@@ -179,18 +414,20 @@ class MCPBuilder(MCPSSEClient):
             self._tools = await self.get_tools()
 
         tool = self._tools.get(tool_name)
+        if not tool and self._catalog is not None:
+            # The cached listing may predate the tool being added to the server
+            self._tools = await self.get_tools(refresh=True)
+            tool = self._tools.get(tool_name)
         if not tool:
             raise MCPToolNotFoundError(tool_name, self.url)
         return tool
 
     @mcp_exception_handler
     async def call_tool(self, tool_name: str, tool_args: dict | None):
-        async with self.connect_to_sse_server() as session:
-            result = await session.call_tool(tool_name, tool_args)
-            return result
+        return await self._with_session(lambda session: session.call_tool(tool_name, tool_args), idempotent=False)
 
 
-class MCPToolClient(MCPSSEClient):
+class MCPToolClient(MCPBaseClient):
     """
     Client wrapper used to call an MCP tool.
 
@@ -199,14 +436,27 @@ class MCPToolClient(MCPSSEClient):
         tool_name (str): The name of the tool to wrap
         tool_description (str): The description of the tool provided by the MCP server.
         tool_input_schema (dict): The input schema for the tool.
+        session_pool (MCPSessionPool | None): Pool of long-lived sessions to call the tool through.
+        transport_client (MCPBaseClient | None): Client used to open one-off sessions when no pool is provided.
+            Defaults to an SSE client for `url`.
     """
 
-    def __init__(self, url: str, tool_name: str, tool_description: str | None, tool_input_schema: dict | None = None):
-        super().__init__(url)
+    def __init__(self,
+                 url: str,
+                 tool_name: str,
+                 tool_description: str | None,
+                 tool_input_schema: dict | None = None,
+                 session_pool: MCPSessionPool | None = None,
+                 transport_client: MCPBaseClient | None = None):
+        super().__init__(url, session_pool=session_pool)
+        self._transport_client = transport_client or MCPSSEClient(url)
         self._tool_name = tool_name
         self._tool_description = tool_description
         self._input_schema = model_from_mcp_schema(self._tool_name, tool_input_schema) if tool_input_schema else None
 
+    def connect_to_server(self) -> AbstractAsyncContextManager[ClientSession]:
+        return self._transport_client.connect_to_server()
+
     @property
     def name(self):
         """Returns the name of the tool."""
@@ -234,7 +484,6 @@ class MCPToolClient(MCPSSEClient):
         """
         self._tool_description = description
 
-    @mcp_exception_handler
     async def acall(self, tool_args: dict) -> str:
         """
         Call the MCP tool with the provided arguments.
@@ -242,9 +491,65 @@ class MCPToolClient(MCPSSEClient):
         Args:
             tool_args (dict[str, Any]): A dictionary of key value pairs to serve as inputs for the MCP tool.
         """
-        async with self.connect_to_sse_server() as session:
-            result = await session.call_tool(self._tool_name, tool_args)
+        return self._result_to_text(await self._call_tool(tool_args))
+
+    @mcp_exception_handler
+    async def _call_tool(self, tool_args: dict) -> CallToolResult:
+        return await self._with_session(lambda session: session.call_tool(self._tool_name, tool_args), idempotent=False)
+
+    async def astream_batch(self,
+                            tool_args_list: list[dict],
+                            max_concurrency: int | None = None) -> AsyncGenerator[MCPBatchResult]:
+        """
+        Call the MCP tool once per argument dict concurrently, yielding results as they complete. Calls are spread
+        over the pooled sessions and are additionally bounded by the pool's per-server concurrency limit.
+
+        Args:
+            tool_args_list (list[dict[str, Any]]): Arguments for each call.
+            max_concurrency (int | None): Maximum number of calls of this batch in flight at once.
+
+        Yields:
+            MCPBatchResult for each call in completion order. Failed calls carry the error instead of raising.
+        """
+        limit = asyncio.Semaphore(max_concurrency) if max_concurrency else nullcontext()
+
+        async def _call(index: int, tool_args: dict) -> MCPBatchResult:
+            async with limit:
+                try:
+                    result = await self._call_tool(tool_args)
+                except Exception as e:
+                    logger.warning("Batch call %d of tool %s failed: %s", index, self.name, e)
+                    return MCPBatchResult(index=index, error=str(e))
+
+                # Errors raised by the tool itself are reported in the result rather than as a protocol error
+                if result.isError:
+                    return MCPBatchResult(index=index, error=self._result_to_text(result))
+                return MCPBatchResult(index=index, output=self._result_to_text(result))
+
+        tasks = [asyncio.create_task(_call(i, tool_args)) for i, tool_args in enumerate(tool_args_list)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Stop outstanding calls if the consumer stops early
+            for task in tasks:
+                task.cancel()
+
+    async def acall_batch(self, tool_args_list: list[dict], max_concurrency: int | None = None) -> list[MCPBatchResult]:
+        """
+        Call the MCP tool once per argument dict concurrently.
+
+        Args:
+            tool_args_list (list[dict[str, Any]]): Arguments for each call.
+            max_concurrency (int | None): Maximum number of calls of this batch in flight at once.
+
+        Returns:
+            list[MCPBatchResult] in the order of `tool_args_list`. Failed calls carry the error instead of raising.
+        """
+        results = [result async for result in self.astream_batch(tool_args_list, max_concurrency=max_concurrency)]
+        return sorted(results, key=lambda result: result.index)
 
+    def _result_to_text(self, result: CallToolResult) -> str:
         output = []
         for res in result.content:
             if isinstance(res, TextContent):
@@ -0,0 +1,417 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+from collections.abc import AsyncIterator
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Hashable
+from contextlib import AbstractAsyncContextManager
+from contextlib import asynccontextmanager
+from typing import TypeVar
+
+import anyio
+import httpx
+from mcp import ClientSession
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Pools shared by every function connecting to the same server with the same settings, with their reference counts
+_shared_pools: dict[tuple, tuple[MCPSessionPool, int]] = {}
+
+# Errors which indicate that the underlying transport is gone and the session should be replaced
+_CONNECTION_ERRORS = (
+    anyio.ClosedResourceError,
+    anyio.BrokenResourceError,
+    anyio.EndOfStream,
+    ConnectionError,
+    httpx.TransportError,
+)
+
+
+def _is_connection_error(error: BaseException) -> bool:
+    if isinstance(error, BaseExceptionGroup):  # noqa: F821
+        return any(_is_connection_error(e) for e in error.exceptions)
+    return isinstance(error, _CONNECTION_ERRORS)
+
+
+class _SessionUnavailableError(anyio.ClosedResourceError):
+    """
+    Raised when the selected session died before the request was handed to it, so the request was never sent.
+    """
+
+
+class _PooledSession:
+    """
+    A single long-lived MCP session.
+
+    The transport and `ClientSession` context managers are entered and exited inside a dedicated background task,
+    since anyio requires cancel scopes to be exited by the task which entered them.
+    """
+
+    def __init__(self, connect: Callable[[], AbstractAsyncContextManager[ClientSession]]):
+        self._connect = connect
+        self._ready = asyncio.Event()
+        self._stop = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._error: BaseException | None = None
+        self.session: ClientSession | None = None
+        self.in_flight = 0
+
+    @property
+    def starting(self) -> bool:
+        return not self._ready.is_set()
+
+    @property
+    def alive(self) -> bool:
+        return self.session is not None and self._task is not None and not self._task.done()
+
+    async def wait_ready(self) -> None:
+        await self._ready.wait()
+
+    async def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+        await self._ready.wait()
+        if self._error is not None:
+            raise self._error
+
+    async def _run(self) -> None:
+        try:
+            async with self._connect() as session:
+                self.session = session
+                self._ready.set()
+                await self._stop.wait()
+        except BaseException as e:  # pylint: disable=broad-except
+            # Surface connection failures to `start`. Errors after startup just mark the session as dead.
+            if not self._ready.is_set():
+                self._error = e
+            else:
+                logger.debug("MCP session closed with error: %s", e)
+        finally:
+            self.session = None
+            self._ready.set()
+
+    async def close(self) -> None:
+        self._stop.set()
+        if self._task is not None:
+            try:
+                await self._task
+            except BaseException:  # pylint: disable=broad-except
+                pass
+
+
+class MCPSessionPool:
+    """
+    Pool of long-lived, initialized MCP sessions to a single server.
+
+    MCP multiplexes concurrent requests over one session, so calls are routed to the least loaded session and a new
+    session is only opened when every existing one is busy and `max_sessions` has not been reached. Dead sessions are
+    detected by periodic pings and replaced on the next call, reconnecting with exponential backoff.
+
+    For stdio servers every session is a separate server subprocess, so the pool also acts as a supervisor: `start`
+    pre-spawns `min_sessions` warm processes, calls are balanced across them and the health checks restart crashed
+    processes to keep `min_sessions` running.
+
+    Args:
+        url (str): The url of the MCP server, used for logging.
+        connect (Callable): Factory returning an async context manager which yields an initialized `ClientSession`.
+        max_sessions (int): Maximum number of concurrent sessions to the server.
+        min_sessions (int): Number of sessions opened by `start` and kept open by the health checks.
+        max_concurrency (int | None): Maximum number of calls in flight to the server across all sessions.
+        health_check_interval (float | None): Seconds between pings of idle sessions. `None` disables health checks.
+        max_retries (int): Number of reconnect attempts when a call fails because the connection was lost.
+        backoff_base (float): Initial reconnect delay in seconds, doubled on every attempt.
+        backoff_max (float): Upper bound for the reconnect delay in seconds.
+    """
+
+    def __init__(self,
+                 url: str,
+                 connect: Callable[[], AbstractAsyncContextManager[ClientSession]],
+                 max_sessions: int = 1,
+                 min_sessions: int = 0,
+                 max_concurrency: int | None = None,
+                 health_check_interval: float | None = 30.0,
+                 max_retries: int = 3,
+                 backoff_base: float = 0.5,
+                 backoff_max: float = 10.0):
+        if max_sessions < 1:
+            raise ValueError("max_sessions must be at least 1")
+        if not 0 <= min_sessions <= max_sessions:
+            raise ValueError("min_sessions must be between 0 and max_sessions")
+
+        self.url = url
+        self._connect = connect
+        self.max_sessions = max_sessions
+        self.min_sessions = min_sessions
+        self.max_concurrency = max_concurrency
+        self._concurrency = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        self.health_check_interval = health_check_interval
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self._sessions: list[_PooledSession] = []
+        self._lock = asyncio.Lock()
+        self._health_task: asyncio.Task | None = None
+        self._closed = False
+
+    async def __aenter__(self) -> MCPSessionPool:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_details) -> None:
+        await self.aclose()
+
+    @property
+    def size(self) -> int:
+        return sum(1 for s in self._sessions if s.alive)
+
+    async def start(self) -> None:
+        """
+        Open the warm `min_sessions` sessions. Calling `start` is optional; sessions are otherwise opened on demand.
+        """
+        if self._closed:
+            raise RuntimeError(f"MCP session pool for {self.url} is closed")
+        await self._replenish()
+
+    def _prune(self) -> None:
+        # Must be called with the lock held. Sessions which are still connecting keep their reserved slot.
+        self._sessions = [s for s in self._sessions if s.alive or s.starting]
+
+    def _reserve(self) -> _PooledSession:
+        # Must be called with the lock held. The slot is reserved here and connected by `_open` outside the lock,
+        # so a slow server start-up does not block calls routed to the sessions which are already open.
+        pooled = _PooledSession(self._connect)
+        self._sessions.append(pooled)
+        return pooled
+
+    async def _open(self, pooled: _PooledSession) -> None:
+        try:
+            await pooled.start()
+        except BaseException:
+            async with self._lock:
+                if pooled in self._sessions:
+                    self._sessions.remove(pooled)
+            raise
+
+        logger.debug("Opened MCP session %d/%d to %s", len(self._sessions), self.max_sessions, self.url)
+
+        async with self._lock:
+            if self._closed:
+                closed = True
+            else:
+                closed = False
+                if self.health_check_interval and self._health_task is None:
+                    self._health_task = asyncio.create_task(self._health_check_loop())
+        if closed:
+            # The pool was closed while this session was connecting
+            await pooled.close()
+            raise RuntimeError(f"MCP session pool for {self.url} is closed")
+
+    async def _replenish(self) -> None:
+        async with self._lock:
+            if self._closed:
+                return
+            self._prune()
+            missing = self.min_sessions - len(self._sessions)
+            reserved = [self._reserve() for _ in range(missing)]
+
+        results = await asyncio.gather(*(self._open(pooled) for pooled in reserved), return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.warning("Failed to start MCP session to %s: %s", self.url, result)
+
+    async def _select(self) -> _PooledSession:
+        """
+        Pick the session for a call and count the call as in flight on it.
+        """
+        while True:
+            async with self._lock:
+                if self._closed:
+                    raise RuntimeError(f"MCP session pool for {self.url} is closed")
+
+                self._prune()
+
+                ready = [s for s in self._sessions if not s.starting]
+                idle = min(ready, key=lambda s: s.in_flight, default=None)
+                if idle is not None and (idle.in_flight == 0 or len(self._sessions) >= self.max_sessions):
+                    idle.in_flight += 1
+                    return idle
+
+                if len(self._sessions) < self.max_sessions:
+                    pooled = self._reserve()
+                    pooled.in_flight += 1
+                    opening = True
+                else:
+                    # Every slot is taken by sessions which are still connecting, share the least loaded one
+                    pooled = min(self._sessions, key=lambda s: s.in_flight)
+                    pooled.in_flight += 1
+                    opening = False
+
+            try:
+                if opening:
+                    await self._open(pooled)
+                else:
+                    await pooled.wait_ready()
+            except BaseException:
+                pooled.in_flight -= 1
+                raise
+
+            if pooled.alive:
+                return pooled
+            # The session we waited for failed to connect, pick again
+            pooled.in_flight -= 1
+
+    async def run(self, fn: Callable[[ClientSession], Awaitable[T]], idempotent: bool = True) -> T:
+        """
+        Run `fn` with a pooled session, replacing the session and retrying with backoff if the connection was lost.
+
+        Args:
+            fn (Callable): Coroutine function receiving an initialized `ClientSession`.
+            idempotent (bool): Whether `fn` may be repeated safely. Non-idempotent calls, like tool calls, are only
+                retried when the connection failed before the request was handed to a session, since a request which
+                was already sent may have been executed by the server.
+
+        Returns:
+            The result of `fn`.
+        """
+        if self._concurrency is None:
+            return await self._run(fn, idempotent)
+        async with self._concurrency:
+            return await self._run(fn, idempotent)
+
+    async def _run(self, fn: Callable[[ClientSession], Awaitable[T]], idempotent: bool) -> T:
+        attempt = 0
+        while True:
+            pooled: _PooledSession | None = None
+            sent = False
+            try:
+                pooled = await self._select()
+                try:
+                    session = pooled.session
+                    if session is None or not pooled.alive:
+                        raise _SessionUnavailableError()
+                    sent = True
+                    return await fn(session)
+                finally:
+                    pooled.in_flight -= 1
+            except Exception as e:
+                if not _is_connection_error(e):
+                    raise
+                if pooled is not None:
+                    await self._discard(pooled)
+                if attempt >= self.max_retries or (sent and not idempotent):
+                    raise
+                delay = min(self.backoff_max, self.backoff_base * (2**attempt)) * random.uniform(0.5, 1.0)
+                attempt += 1
+                logger.warning("MCP connection to %s failed (%s), reconnecting in %.2fs (attempt %d/%d)",
+                               self.url,
+                               e,
+                               delay,
+                               attempt,
+                               self.max_retries)
+                await asyncio.sleep(delay)
+
+    async def _discard(self, pooled: _PooledSession) -> None:
+        async with self._lock:
+            if pooled in self._sessions:
+                self._sessions.remove(pooled)
+        await pooled.close()
+
+    async def _health_check_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.health_check_interval)
+            for pooled in list(self._sessions):
+                if pooled.starting:
+                    continue
+                if pooled.in_flight:
+                    # Busy sessions are proven healthy by their in-flight requests
+                    continue
+                try:
+                    if not pooled.alive:
+                        raise anyio.ClosedResourceError()
+                    with anyio.fail_after(self.health_check_interval):
+                        await pooled.session.send_ping()
+                except Exception as e:  # pylint: disable=broad-except
+                    logger.info("Dropping unhealthy MCP session to %s: %s", self.url, e)
+                    await self._discard(pooled)
+
+            # Restart crashed sessions so that the warm sessions are available for the next calls
+            if self._closed:
+                return
+            await self._replenish()
+
+    async def aclose(self) -> None:
+        """
+        Close all sessions and stop the health checks.
+        """
+        async with self._lock:
+            self._closed = True
+            sessions, self._sessions = self._sessions, []
+            health_task, self._health_task = self._health_task, None
+
+        if health_task is not None:
+            health_task.cancel()
+            try:
+                await health_task
+            except asyncio.CancelledError:
+                pass
+
+        for pooled in sessions:
+            await pooled.close()
+
+
+@asynccontextmanager
+async def shared_session_pool(url: str,
+                              connect: Callable[[], AbstractAsyncContextManager[ClientSession]],
+                              connection_key: Hashable = None,
+                              **pool_kwargs) -> AsyncIterator[MCPSessionPool]:
+    """
+    Share one `MCPSessionPool` per server between all users inside the context. Users only share a pool when the url,
+    the `connection_key` and all `pool_kwargs` are equal, so a pool is never used with limits or a server
+    environment other than the ones it was configured with. The pool is created by the first user and closed when the
+    last user exits, so it can be tied to a builder's exit stack.
+
+    Args:
+        url (str): The url of the MCP server.
+        connect (Callable): Factory returning an async context manager which yields an initialized `ClientSession`.
+        connection_key (Hashable): Connection settings which are not part of the url, like the environment and
+            arguments of a stdio server.
+        pool_kwargs: Additional arguments for `MCPSessionPool`.
+    """
+    key = (url, connection_key, tuple(sorted(pool_kwargs.items())))
+
+    pool, refs = _shared_pools.get(key, (None, 0))
+    if pool is None:
+        pool = MCPSessionPool(url, connect, **pool_kwargs)
+    _shared_pools[key] = (pool, refs + 1)
+
+    try:
+        if refs == 0:
+            await pool.start()
+        yield pool
+    finally:
+        pool, refs = _shared_pools[key]
+        if refs > 1:
+            _shared_pools[key] = (pool, refs - 1)
+        else:
+            del _shared_pools[key]
+            await pool.aclose()
@@ -14,10 +14,14 @@
 # limitations under the License.
 
 import logging
+import typing
+from collections.abc import AsyncGenerator
 
 from pydantic import BaseModel
 from pydantic import Field
 from pydantic import HttpUrl
+from pydantic import create_model
+from pydantic import model_validator
 
 from aiq.builder.builder import Builder
 from aiq.builder.function_info import FunctionInfo
@@ -33,7 +37,14 @@ class MCPToolConfig(FunctionBaseConfig, name="mcp_tool_wrapper"):
     function.
     """
     # Add your custom configuration parameters here
-    url: HttpUrl = Field(description="The URL of the MCP server")
+    url: HttpUrl | None = Field(default=None, description="The URL of the MCP server. Required for HTTP transports.")
+    transport: typing.Literal["sse", "streamable-http",
+                              "stdio"] = Field(default="sse",
+                                               description="The transport used to communicate with the MCP server")
+    command: str | None = Field(default=None,
+                                description="The command used to start the MCP server. Required for stdio transport.")
+    args: list[str] = Field(default_factory=list, description="Arguments passed to the stdio server command")
+    env: dict[str, str] | None = Field(default=None, description="Environment variables for the stdio server process")
     mcp_tool_name: str = Field(description="The name of the tool served by the MCP Server that you want to use")
     description: str | None = Field(default=None,
                                     description="""
@@ -45,6 +56,45 @@ class MCPToolConfig(FunctionBaseConfig, name="mcp_tool_wrapper"):
         If true, the tool will return the exception message if the tool call fails.
         If false, raise the exception.
         """)
+    max_sessions: int = Field(default=1,
+                              ge=1,
+                              description="""
+        Maximum number of long-lived sessions kept open to the MCP server. Sessions are shared by all tools using the
+        same server and multiplex concurrent calls, so additional sessions are only opened under heavy load.
+        """)
+    health_check_interval: float | None = Field(default=30.0,
+                                                description="""
+        Seconds between pings of idle pooled sessions. Unhealthy sessions are dropped and reopened on the next call.
+        Set to null to disable health checks.
+        """)
+    min_sessions: int = Field(default=0,
+                              ge=0,
+                              description="""
+        Number of sessions opened when the workflow is built and kept open by the health checks. For the stdio
+        transport this is the number of warm server processes, which avoids paying the server start-up on first use.
+        """)
+    max_concurrency: int | None = Field(default=None,
+                                        ge=1,
+                                        description="""
+        Maximum number of calls in flight to the MCP server across all of its pooled sessions. The limit is shared by
+        all tools using the same server. Set to null for no limit.
+        """)
+    batch: bool = Field(default=False,
+                        description="""
+        If true, the function takes a list of tool inputs and calls the tool concurrently for each of them. Results
+        contain either the output or the error of each call, and the streaming variant yields them as they complete.
+        """)
+
+    @model_validator(mode="after")
+    def _validate_transport(self):
+        if self.transport == "stdio":
+            if not self.command:
+                raise ValueError("`command` is required for the stdio transport")
+        elif self.url is None:
+            raise ValueError(f"`url` is required for the {self.transport} transport")
+        if self.min_sessions > self.max_sessions:
+            raise ValueError("`min_sessions` cannot be larger than `max_sessions`")
+        return self
 
 
 @register_function(config_type=MCPToolConfig)
@@ -53,44 +103,107 @@ async def mcp_tool(config: MCPToolConfig, builder: Builder):  # pylint: disable=
     Generate an AIQ Toolkit Function that wraps a tool provided by the MCP server.
     """
 
+    from aiq.tool.mcp.mcp_catalog import get_mcp_catalog
+    from aiq.tool.mcp.mcp_client import MCPBatchResult
     from aiq.tool.mcp.mcp_client import MCPBuilder
     from aiq.tool.mcp.mcp_client import MCPToolClient
-
-    client = MCPBuilder(url=str(config.url))
-
-    tool: MCPToolClient = await client.get_tool(config.mcp_tool_name)
-    if config.description:
-        tool.set_description(description=config.description)
-
-    logger.info("Configured to use tool: %s from MCP server at %s", tool.name, str(config.url))
-
-    def _convert_from_str(input_str: str) -> tool.input_schema:
-        return tool.input_schema.model_validate_json(input_str)
-
-    async def _response_fn(tool_input: BaseModel | None = None, **kwargs) -> str:
-        # Run the tool, catching any errors and sending to agent for correction
-        try:
-            if tool_input:
-                args = tool_input.model_dump()
-                return await tool.acall(args)
-
-            _ = tool.input_schema.model_validate(kwargs)
-            filtered_kwargs = {k: v for k, v in kwargs.items() if v is not None}
-            return await tool.acall(filtered_kwargs)
-        except Exception as e:
-            if config.return_exception:
+    from aiq.tool.mcp.mcp_client import create_mcp_client
+    from aiq.tool.mcp.mcp_session_pool import shared_session_pool
+
+    server_url = str(config.url) if config.url else None
+    transport_client = create_mcp_client(config.transport,
+                                         url=server_url,
+                                         command=config.command,
+                                         args=config.args,
+                                         env=config.env)
+    url = transport_client.url
+
+    # The pool is shared with other tools on the same server and closed when the builder's exit stack unwinds
+    async with shared_session_pool(url,
+                                   transport_client.connect_to_server,
+                                   connection_key=(config.transport, tuple(sorted((config.env or {}).items()))),
+                                   max_sessions=config.max_sessions,
+                                   min_sessions=config.min_sessions,
+                                   max_concurrency=config.max_concurrency,
+                                   health_check_interval=config.health_check_interval) as session_pool:
+
+        client = MCPBuilder(url=server_url,
+                            session_pool=session_pool,
+                            transport=config.transport,
+                            command=config.command,
+                            args=config.args,
+                            env=config.env,
+                            catalog=get_mcp_catalog())
+
+        # Tool listings are shared by every wrapper of the same server through the process-wide catalog
+        tool: MCPToolClient = await client.get_tool(config.mcp_tool_name)
+        if config.description:
+            tool.set_description(description=config.description)
+
+        logger.info("Configured to use tool: %s from MCP server at %s", tool.name, url)
+
+        if config.batch:
+            batch_input_schema = create_model(
+                f"{tool.input_schema.__name__}Batch",
+                calls=(list[tool.input_schema], Field(description=f"Inputs of each call to the {tool.name} tool")),
+                max_concurrency=(int | None,
+                                 Field(default=None, ge=1, description="Maximum number of calls running at once")))
+
+            def _convert_batch_from_str(input_str: str) -> batch_input_schema:
+                return batch_input_schema.model_validate_json(input_str)
+
+            def _check_results(results: list[MCPBatchResult]) -> None:
+                failed = [result for result in results if not result.ok]
+                if failed and not config.return_exception:
+                    raise RuntimeError(f"{len(failed)} of {len(results)} calls to tool {tool.name} failed: "
+                                       f"{failed[0].error}")
+
+            async def _batch_fn(batch_input: batch_input_schema) -> list[MCPBatchResult]:
+                results = await tool.acall_batch([call.model_dump() for call in batch_input.calls],
+                                                 max_concurrency=batch_input.max_concurrency)
+                _check_results(results)
+                return results
+
+            async def _batch_stream_fn(batch_input: batch_input_schema) -> AsyncGenerator[MCPBatchResult]:
+                async for result in tool.astream_batch([call.model_dump() for call in batch_input.calls],
+                                                       max_concurrency=batch_input.max_concurrency):
+                    _check_results([result])
+                    yield result
+
+            yield FunctionInfo.create(single_fn=_batch_fn,
+                                      stream_fn=_batch_stream_fn,
+                                      description=tool.description,
+                                      input_schema=batch_input_schema,
+                                      converters=[_convert_batch_from_str])
+            return
+
+        def _convert_from_str(input_str: str) -> tool.input_schema:
+            return tool.input_schema.model_validate_json(input_str)
+
+        async def _response_fn(tool_input: BaseModel | None = None, **kwargs) -> str:
+            # Run the tool, catching any errors and sending to agent for correction
+            try:
                 if tool_input:
-                    logger.warning("Error calling tool %s with serialized input: %s",
-                                   tool.name,
-                                   tool_input.model_dump(),
-                                   exc_info=True)
-                else:
-                    logger.warning("Error calling tool %s with input: %s", tool.name, kwargs, exc_info=True)
-                return str(e)
-            # If the tool call fails, raise the exception.
-            raise
-
-    yield FunctionInfo.create(single_fn=_response_fn,
-                              description=tool.description,
-                              input_schema=tool.input_schema,
-                              converters=[_convert_from_str])
+                    args = tool_input.model_dump()
+                    return await tool.acall(args)
+
+                _ = tool.input_schema.model_validate(kwargs)
+                filtered_kwargs = {k: v for k, v in kwargs.items() if v is not None}
+                return await tool.acall(filtered_kwargs)
+            except Exception as e:
+                if config.return_exception:
+                    if tool_input:
+                        logger.warning("Error calling tool %s with serialized input: %s",
+                                       tool.name,
+                                       tool_input.model_dump(),
+                                       exc_info=True)
+                    else:
+                        logger.warning("Error calling tool %s with input: %s", tool.name, kwargs, exc_info=True)
+                    return str(e)
+                # If the tool call fails, raise the exception.
+                raise
+
+        yield FunctionInfo.create(single_fn=_response_fn,
+                                  description=tool.description,
+                                  input_schema=tool.input_schema,
+                                  converters=[_convert_from_str])
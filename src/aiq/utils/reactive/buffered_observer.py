@@ -0,0 +1,239 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import TypeVar
+
+from aiq.utils.reactive.base.observer_base import ObserverBase
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")  # pylint: disable=invalid-name
+
+# Markers queued behind the buffered values, so that observers see the end of the stream after its last value
+_COMPLETE = object()
+_ERROR = object()
+
+
+class OverflowPolicy(str, Enum):
+    """
+    What a `BufferedObserver` does with a new value when its buffer is full.
+    """
+    BLOCK = "block"
+    """Make the producer wait until there is room in the buffer. No values are lost."""
+    DROP_OLDEST = "drop_oldest"
+    """Drop the oldest buffered value."""
+    DROP_NEWEST = "drop_newest"
+    """Drop the new value."""
+
+
+class BufferedObserver(ObserverBase[_T]):
+    """
+    Observer which decouples a producer from a slow observer.
+
+    Values are appended to a bounded buffer on the producer's stack and handed to the wrapped observer in batches by
+    a callback scheduled on the event loop the observer was created on, so a producer only pays for the append.
+    Producers may run on the loop or on other threads. When there is no running event loop the values are delivered
+    synchronously.
+
+    With the `BLOCK` overflow policy a producer on the event loop thread cannot wait for the loop to drain the buffer,
+    so it delivers the oldest batch itself instead. Producers on other threads wait for room in the buffer.
+
+    Args:
+        observer (ObserverBase): The observer receiving the values.
+        max_buffer_size (int): Maximum number of values waiting for delivery.
+        batch_size (int): Maximum number of values delivered before yielding back to the event loop.
+        overflow_policy (OverflowPolicy): What to do with new values when the buffer is full.
+    """
+
+    def __init__(self,
+                 observer: ObserverBase[_T],
+                 max_buffer_size: int = 10_000,
+                 batch_size: int = 256,
+                 overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK):
+        if max_buffer_size < 1:
+            raise ValueError("max_buffer_size must be at least 1")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        self.observer = observer
+        self.max_buffer_size = max_buffer_size
+        self.batch_size = batch_size
+        self.overflow_policy = OverflowPolicy(overflow_policy)
+
+        try:
+            self._loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+        except RuntimeError:
+            self._loop = None
+
+        # Buffered (enqueue time, value) pairs, and the (marker, error) pair ending the stream once it was signaled
+        self._buffer: deque[tuple[float, object]] = deque()
+        self._terminal: tuple[object, Exception | None] | None = None
+        self._not_full = threading.Condition(threading.Lock())
+        self._scheduled = False
+        self._closed = False
+
+        self.delivered = 0
+        self.dropped = 0
+        self.max_lag = 0
+
+    def _on_loop_thread(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    def on_next(self, value: _T) -> None:
+        if self._loop is None or self._loop.is_closed():
+            self.observer.on_next(value)
+            return
+
+        with self._not_full:
+            if self._closed or self._terminal is not None:
+                return
+
+            while len(self._buffer) >= self.max_buffer_size:
+                if self.overflow_policy == OverflowPolicy.DROP_NEWEST:
+                    self._count_drop()
+                    return
+                if self.overflow_policy == OverflowPolicy.DROP_OLDEST:
+                    self._buffer.popleft()
+                    self._count_drop()
+                    break
+                if self._on_loop_thread():
+                    # The loop cannot drain while we hold it, deliver a batch on the producer's stack instead
+                    self._not_full.release()
+                    try:
+                        self._deliver_batch()
+                    finally:
+                        self._not_full.acquire()
+                else:
+                    self._not_full.wait()
+                    if self._closed:
+                        return
+
+            self._buffer.append((time.monotonic(), value))
+            self.max_lag = max(self.max_lag, len(self._buffer))
+            self._schedule()
+
+    def _count_drop(self) -> None:
+        # Must be called with the lock held
+        if not self.dropped:
+            logger.warning("Observer buffer is full (%d values), dropping values", self.max_buffer_size)
+        self.dropped += 1
+
+    def _schedule(self) -> None:
+        # Must be called with the lock held
+        if self._scheduled:
+            return
+        self._scheduled = True
+        if self._on_loop_thread():
+            self._loop.call_soon(self._drain)
+        else:
+            try:
+                self._loop.call_soon_threadsafe(self._drain)
+            except RuntimeError:
+                # The loop was closed in the meantime, there is nobody left to deliver the values
+                self._scheduled = False
+
+    def _drain(self) -> None:
+        self._deliver_batch()
+        with self._not_full:
+            if self._buffer or (self._terminal is not None and not self._closed):
+                self._loop.call_soon(self._drain)
+            else:
+                self._scheduled = False
+
+    def _deliver_batch(self) -> None:
+        with self._not_full:
+            count = min(self.batch_size, len(self._buffer))
+            batch = [self._buffer.popleft()[1] for _ in range(count)]
+            terminal = None
+            if not self._buffer and self._terminal is not None and not self._closed:
+                terminal = self._terminal
+                self._closed = True
+            self.delivered += count
+            self._not_full.notify_all()
+
+        for value in batch:
+            self.observer.on_next(value)
+
+        if terminal is not None:
+            marker, exc = terminal
+            if marker is _ERROR:
+                self.observer.on_error(exc)
+            else:
+                self.observer.on_complete()
+
+    def _end(self, marker: object, exc: Exception | None) -> None:
+        if self._loop is None or self._loop.is_closed():
+            self._closed = True
+            if marker is _ERROR:
+                self.observer.on_error(exc)
+            else:
+                self.observer.on_complete()
+            return
+
+        with self._not_full:
+            if self._closed or self._terminal is not None:
+                return
+            self._terminal = (marker, exc)
+            self._schedule()
+
+    def on_error(self, exc: Exception) -> None:
+        self._end(_ERROR, exc)
+
+    def on_complete(self) -> None:
+        self._end(_COMPLETE, None)
+
+    def flush(self) -> None:
+        """
+        Deliver every buffered value, and the end of the stream if it was signaled, on the caller's stack.
+        """
+        while True:
+            with self._not_full:
+                if not self._buffer and (self._terminal is None or self._closed):
+                    return
+            self._deliver_batch()
+
+    def close(self) -> None:
+        """
+        Deliver the buffered values and stop accepting new ones. Producers waiting for room are released.
+        """
+        self.flush()
+        with self._not_full:
+            self._closed = True
+            self._not_full.notify_all()
+
+    def stats(self) -> dict[str, int | float | str]:
+        """
+        Delivery metrics of the observer. `lag` is the number of values waiting for delivery, `lag_seconds` the age
+        of the oldest one and `max_lag` the largest number of values that were waiting at once.
+        """
+        with self._not_full:
+            lag_seconds = time.monotonic() - self._buffer[0][0] if self._buffer else 0.0
+            return {
+                "overflow_policy": self.overflow_policy.value,
+                "lag": len(self._buffer),
+                "lag_seconds": lag_seconds,
+                "max_lag": self.max_lag,
+                "delivered": self.delivered,
+                "dropped": self.dropped,
+            }
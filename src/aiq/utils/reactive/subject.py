@@ -18,6 +18,8 @@ from collections.abc import Callable
 from typing import TypeVar
 
 from aiq.utils.reactive.base.subject_base import SubjectBase
+from aiq.utils.reactive.buffered_observer import BufferedObserver
+from aiq.utils.reactive.buffered_observer import OverflowPolicy
 from aiq.utils.reactive.observable import Observable
 from aiq.utils.reactive.observer import Observer
 from aiq.utils.reactive.subscription import Subscription
@@ -33,19 +35,37 @@ class Subject(Observable[T], Observer[T], SubjectBase[T]):
     """
     A Subject is both an Observer (receives events) and an Observable (sends events).
     - Maintains a list of ObserverBase[T].
-    - No internal buffering or replay; events are only delivered to current subscribers.
+    - No replay; events are only delivered to current subscribers.
     - Thread-safe via a lock.
 
+    By default events are delivered synchronously on the producer's stack. A buffered Subject wraps every subscriber
+    in a `BufferedObserver`, so that slow subscribers are served from the event loop instead of delaying producers.
+    Events which are still buffered when a subscriber unsubscribes are delivered before it is removed.
+
     Once on_error or on_complete is called, the Subject is closed.
+
+    Args:
+        buffered (bool): Deliver events to every subscriber through its own bounded buffer.
+        max_buffer_size (int): Maximum number of events buffered per subscriber.
+        batch_size (int): Maximum number of events delivered to a subscriber before yielding to the event loop.
+        overflow_policy (OverflowPolicy): What to do with new events when a subscriber's buffer is full.
     """
 
-    def __init__(self) -> None:
+    def __init__(self,
+                 buffered: bool = False,
+                 max_buffer_size: int = 10_000,
+                 batch_size: int = 256,
+                 overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK) -> None:
         super().__init__()
         self._lock = threading.RLock()
         self._closed = False
         self._error: Exception | None = None
         self._observers: list[Observer[T]] = []
         self._disposed = False
+        self._buffered = buffered
+        self._max_buffer_size = max_buffer_size
+        self._batch_size = batch_size
+        self._overflow_policy = overflow_policy
 
     # ==========================================================================
     # Observable[T] - for consumers
@@ -60,6 +80,12 @@ class Subject(Observable[T], Observer[T], SubjectBase[T]):
                 # Already disposed => no subscription
                 return Subscription(self, None)
 
+            if self._buffered:
+                observer = BufferedObserver(observer,
+                                            max_buffer_size=self._max_buffer_size,
+                                            batch_size=self._batch_size,
+                                            overflow_policy=self._overflow_policy)
+
             self._observers.append(observer)
             return Subscription(self, observer)
 
@@ -115,6 +141,18 @@ class Subject(Observable[T], Observer[T], SubjectBase[T]):
             if not self._disposed and observer in self._observers:
                 self._observers.remove(observer)
 
+        if isinstance(observer, BufferedObserver):
+            observer.close()
+
+    def buffer_stats(self) -> list[dict[str, int | float | str]]:
+        """
+        Delivery metrics of the buffered subscribers, see `BufferedObserver.stats`.
+        """
+        with self._lock:
+            observers = list(self._observers)
+
+        return [obs.stats() for obs in observers if isinstance(obs, BufferedObserver)]
+
     # ==========================================================================
     # Disposal
     # ==========================================================================
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+聚合结果缓存 - 为图表数据准备提供预聚合与分组结果缓存
+加载数据时为低基数列预计算一维汇总（计数与数值列求和），数据集变化时整体失效
+"""
+
+import copy
+from collections import OrderedDict
+from typing import Any
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+import pandas as pd
+
+
+class AggregateCache:
+    """按数据集版本失效的聚合缓存"""
+
+    def __init__(self, max_entries: int = 256, max_rollup_dimensions: int = 20,
+                 max_rollup_cardinality: int = 1000):
+        """
+        Args:
+            max_entries: 缓存的图表结果数量上限
+            max_rollup_dimensions: 预计算汇总的维度列数量上限
+            max_rollup_cardinality: 维度列的最大唯一值数量
+        """
+        self.max_entries = max_entries
+        self.max_rollup_dimensions = max_rollup_dimensions
+        self.max_rollup_cardinality = max_rollup_cardinality
+        self.version = 0
+        self._entries: 'OrderedDict[Tuple, Dict[str, Any]]' = OrderedDict()
+        self._counts: Dict[str, pd.Series] = {}
+        self._sums: Dict[str, pd.DataFrame] = {}
+
+    def reset(self, df: Optional[pd.DataFrame]):
+        """
+        数据集变化时调用：升级版本、清空缓存并重新预计算汇总
+
+        Args:
+            df: 新的数据集
+        """
+        self.version += 1
+        self._entries.clear()
+        self._counts.clear()
+        self._sums.clear()
+
+        if df is not None:
+            self._build_rollups(df)
+
+    def _build_rollups(self, df: pd.DataFrame):
+        numeric_cols = [
+            col for col in df.select_dtypes(include='number').columns
+            if not pd.api.types.is_bool_dtype(df[col].dtype)
+        ]
+
+        dimensions = []
+        for col in df.columns:
+            if len(dimensions) >= self.max_rollup_dimensions:
+                break
+            dtype = df[col].dtype
+            if isinstance(dtype, pd.CategoricalDtype):
+                if len(dtype.categories) <= self.max_rollup_cardinality:
+                    dimensions.append(col)
+            elif pd.api.types.is_bool_dtype(dtype):
+                dimensions.append(col)
+
+        for dim in dimensions:
+            # 每个维度一次分组同时得到所有数值列的和
+            self._counts[dim] = df[dim].value_counts()
+            measures = [col for col in numeric_cols if col != dim]
+            if measures:
+                self._sums[dim] = _as_float64(df[measures]).groupby(df[dim], observed=True).sum()
+
+    def make_key(self, x_col: str, y_col: Optional[str], agg: str, chart_type: str, limit: int) -> Tuple:
+        return (self.version, x_col, y_col, agg, chart_type, limit)
+
+    def get(self, key: Tuple) -> Optional[Dict[str, Any]]:
+        """查找缓存的图表数据，返回副本以免调用方修改缓存内容"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return copy.deepcopy(entry)
+
+    def put(self, key: Tuple, value: Dict[str, Any]):
+        if key[0] != self.version:
+            return
+        self._entries[key] = copy.deepcopy(value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def value_counts(self, df: pd.DataFrame, x_col: str) -> pd.Series:
+        """按列计数，优先使用预计算汇总"""
+        counts = self._counts.get(x_col)
+        if counts is None:
+            counts = df[x_col].value_counts()
+        return counts
+
+    def group_sum(self, df: pd.DataFrame, x_col: str, y_col: str) -> pd.Series:
+        """按x_col分组对y_col求和，优先使用预计算汇总"""
+        sums = self._sums.get(x_col)
+        if sums is not None and y_col in sums.columns:
+            return sums[y_col]
+        return _as_float64(df[y_col]).groupby(df[x_col], observed=True).sum()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'version': self.version,
+            'entries': len(self._entries),
+            'rollup_dimensions': list(self._counts.keys())
+        }
+
+
+def _as_float64(data):
+    """浮点度量转换为float64后再求和，float32累加会丢失精度；整数求和本身以int64累加"""
+    if isinstance(data, pd.Series):
+        if pd.api.types.is_float_dtype(data.dtype) and data.dtype != 'float64':
+            return data.astype('float64')
+        return data
+    upcast = {
+        col: 'float64' for col, dtype in data.dtypes.items()
+        if pd.api.types.is_float_dtype(dtype) and dtype != 'float64'
+    }
+    return data.astype(upcast) if upcast else data
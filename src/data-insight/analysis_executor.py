@@ -0,0 +1,486 @@
+#!/usr/bin/env python3
+"""
+分析执行器 - 将CPU密集的分析调用放到独立的工作进程中执行，避免阻塞事件循环
+数据集通过共享内存目录中的Arrow IPC文件在进程间传递（子进程内存映射读取），不对DataFrame做pickle
+每个工作进程按共享键保留长期存活的分析器，数据集版本不变时复用其聚合缓存和SQL表注册
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import tempfile
+import threading
+import uuid
+from collections import OrderedDict
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+from typing import Callable
+from typing import Deque
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import pandas as pd
+
+try:
+    import pyarrow.feather as feather
+except ImportError:  # pyarrow为可选依赖
+    feather = None
+
+logger = logging.getLogger(__name__)
+
+_SHM_DIR = '/dev/shm'
+
+
+class SharedFrame:
+    """共享数据集句柄，可在进程间传递"""
+
+    __slots__ = ('path', 'version', 'nbytes')
+
+    def __init__(self, path: str, version: Any = None, nbytes: int = 0):
+        self.path = path
+        self.version = version
+        # 共享文件大小，/dev/shm中的文件占用的是内存
+        self.nbytes = nbytes
+
+    def __getstate__(self):
+        return self.path, self.version, self.nbytes
+
+    def __setstate__(self, state):
+        self.path, self.version, self.nbytes = state
+
+
+def default_shared_dir() -> str:
+    """优先使用内存文件系统/dev/shm，不可用时退回临时目录"""
+    if os.path.isdir(_SHM_DIR) and os.access(_SHM_DIR, os.W_OK):
+        return os.path.join(_SHM_DIR, 'dasight')
+    return os.path.join(tempfile.gettempdir(), 'dasight_shared')
+
+
+def default_start_method() -> str:
+    """工作进程启动方式：优先forkserver，不支持时使用spawn；不使用fork，避免子进程继承事件循环和锁的状态"""
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        return 'forkserver'
+    return 'spawn'
+
+
+def share_frame(df: pd.DataFrame, directory: str, version: Any = None) -> SharedFrame:
+    """
+    将数据集写为未压缩的Arrow IPC文件，供其他进程内存映射读取
+
+    混合类型的object列等无法转换为Arrow的数据（或pyarrow未安装时）退回pickle格式。
+    pickle文件无法内存映射，每个工作进程都会完整反序列化一份副本，只作为兼容兜底。
+
+    Args:
+        df: 数据集
+        directory: 共享目录
+        version: 数据集版本
+
+    Returns:
+        SharedFrame: 共享句柄
+    """
+    os.makedirs(directory, exist_ok=True)
+    base_path = os.path.join(directory, f"{os.getpid()}_{uuid.uuid4().hex}")
+
+    path = base_path + '.feather'
+    try:
+        if feather is None:
+            raise ImportError("pyarrow不可用")
+        feather.write_feather(df, path, compression='uncompressed')
+    except Exception as e:
+        if os.path.exists(path):
+            os.remove(path)
+        logger.warning("数据集无法写为Arrow文件，退回pickle共享（工作进程内不能内存映射）: %s", e)
+        path = base_path + '.pkl'
+        df.to_pickle(path)
+
+    return SharedFrame(path, version, os.path.getsize(path))
+
+
+def open_shared_frame(handle: SharedFrame) -> pd.DataFrame:
+    """内存映射读取共享数据集"""
+    if handle.path.endswith('.feather'):
+        return feather.read_feather(handle.path, memory_map=True)
+    return pd.read_pickle(handle.path)
+
+
+def release_shared_frame(handle: SharedFrame):
+    try:
+        os.remove(handle.path)
+    except FileNotFoundError:
+        pass
+
+
+# 以下为工作进程内的状态，由_init_worker初始化
+_worker_cache = None
+_worker_analyzer_slots = 4
+# 共享键 -> (共享句柄, 分析器)，按最近使用排序
+_worker_analyzers: 'OrderedDict[str, Tuple[SharedFrame, Any]]' = OrderedDict()
+
+
+def _init_worker(cache_dir: Optional[str], cache_max_bytes: int, analyzer_slots: int):
+    """子进程初始化：创建数据集缓存，分析器槽位数决定每个进程保留多少个会话的数据集"""
+    global _worker_cache, _worker_analyzer_slots
+    from dataset_cache import DatasetCache
+
+    _worker_cache = DatasetCache(cache_dir=cache_dir, max_bytes=cache_max_bytes)
+    _worker_analyzer_slots = analyzer_slots
+
+
+def _load_in_worker(file_path: str, shared_dir: str) -> Tuple[Optional[SharedFrame], Dict[str, Any], Dict[str, Any]]:
+    """子进程：解析文件并计算汇总统计，数据集以共享文件返回"""
+    from basic_analyzer import BasicDataAnalyzer
+
+    analyzer = BasicDataAnalyzer(cache=_worker_cache)
+    file_info = analyzer.load_file(file_path)
+    if file_info.get('error'):
+        return None, file_info, {}
+    return share_frame(analyzer.df, shared_dir), file_info, analyzer.get_summary_statistics()
+
+
+def _worker_analyzer(key: str, handle: SharedFrame):
+    """子进程：获取共享键对应的长期分析器，数据集版本变化或共享文件被释放时重建"""
+    from basic_analyzer import BasicDataAnalyzer
+
+    # 主进程已释放的共享文件（会话溢出、关闭或版本更新）不再保留映射
+    for stale_key, (stale_handle, stale_analyzer) in list(_worker_analyzers.items()):
+        if stale_key != key and not os.path.exists(stale_handle.path):
+            _worker_analyzers.pop(stale_key)
+            stale_analyzer.unload()
+
+    entry = _worker_analyzers.get(key)
+    if entry is not None and entry[0].path == handle.path:
+        _worker_analyzers.move_to_end(key)
+        return entry[1]
+
+    if entry is not None:
+        entry[1].unload()
+
+    analyzer = BasicDataAnalyzer(cache=_worker_cache)
+    analyzer.attach(open_shared_frame(handle), handle.path, {})
+    _worker_analyzers[key] = (handle, analyzer)
+    _worker_analyzers.move_to_end(key)
+
+    while len(_worker_analyzers) > _worker_analyzer_slots:
+        _, (_, evicted) = _worker_analyzers.popitem(last=False)
+        evicted.unload()
+
+    return analyzer
+
+
+def _call_in_worker(handle: SharedFrame, key: str, method: str, args: tuple, kwargs: Dict[str, Any]) -> Any:
+    """子进程：在共享键对应的长期分析器上调用BasicDataAnalyzer的方法"""
+    return getattr(_worker_analyzer(key, handle), method)(*args, **kwargs)
+
+
+def _call_once_in_worker(handle: SharedFrame, method: str, args: tuple, kwargs: Dict[str, Any]) -> Any:
+    """子进程：对一次性共享的数据集调用BasicDataAnalyzer的方法，调用后即释放"""
+    from basic_analyzer import BasicDataAnalyzer
+
+    analyzer = BasicDataAnalyzer(cache=_worker_cache)
+    analyzer.attach(open_shared_frame(handle), handle.path, {})
+    try:
+        return getattr(analyzer, method)(*args, **kwargs)
+    finally:
+        analyzer.unload()
+
+
+class _Worker:
+    """单进程执行器，任务超时时只回收这一个进程"""
+
+    __slots__ = ('pool', 'keys')
+
+    def __init__(self, pool: ProcessPoolExecutor):
+        self.pool = pool
+        # 该进程内保留了分析器的共享键，用于把同一会话的调用调度到同一进程
+        self.keys: 'OrderedDict[str, None]' = OrderedDict()
+
+    def remember(self, key: str, slots: int):
+        self.keys[key] = None
+        self.keys.move_to_end(key)
+        while len(self.keys) > slots:
+            self.keys.popitem(last=False)
+
+    def terminate(self):
+        # ProcessPoolExecutor没有公开的终止接口，直接终止其工作进程
+        processes = list((getattr(self.pool, '_processes', None) or {}).values())
+        self.pool.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+
+
+class AnalysisExecutor:
+    """基于独立工作进程的异步分析执行器"""
+
+    def __init__(self, max_workers: Optional[int] = None, timeout: Optional[float] = 60.0,
+                 shared_dir: Optional[str] = None, start_method: Optional[str] = None,
+                 cache_dir: Optional[str] = None, cache_max_bytes: int = 10 * 1024 ** 3,
+                 analyzers_per_worker: int = 4):
+        """
+        Args:
+            max_workers: 工作进程数，默认为CPU核数
+            timeout: 单次调用的默认超时时间（秒），None表示不限制
+            shared_dir: 共享数据集目录，默认使用/dev/shm
+            start_method: 工作进程启动方式（forkserver、spawn），默认优先forkserver
+            cache_dir: 工作进程加载文件时使用的数据集缓存目录
+            cache_max_bytes: 数据集缓存的磁盘预算（字节）
+            analyzers_per_worker: 每个工作进程保留的会话分析器数量
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.timeout = timeout
+        self.shared_dir = shared_dir or default_shared_dir()
+        self.start_method = start_method or default_start_method()
+        self.cache_dir = cache_dir
+        self.cache_max_bytes = cache_max_bytes
+        self.analyzers_per_worker = analyzers_per_worker
+        self._mp_context = multiprocessing.get_context(self.start_method)
+        self._lock = threading.Lock()
+        self._idle: List[_Worker] = []
+        self._busy: set = set()
+        self._waiters: Deque[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = deque()
+        self._closed = False
+        # 共享键 -> 当前版本的共享句柄，每个键只保留最新版本
+        self._shared: Dict[str, SharedFrame] = {}
+
+    def _new_worker(self) -> _Worker:
+        # 进程在首次提交任务时才启动
+        pool = ProcessPoolExecutor(max_workers=1,
+                                   mp_context=self._mp_context,
+                                   initializer=_init_worker,
+                                   initargs=(self.cache_dir, self.cache_max_bytes, self.analyzers_per_worker))
+        return _Worker(pool)
+
+    async def _acquire_worker(self, key: Optional[str]) -> _Worker:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("分析执行器已关闭")
+
+            worker = None
+            if self._idle:
+                # 优先选择已保留该会话分析器的进程，其次选择最近使用过的进程
+                worker = next((w for w in reversed(self._idle) if key is not None and key in w.keys), self._idle[-1])
+                self._idle.remove(worker)
+            elif len(self._busy) < self.max_workers:
+                worker = self._new_worker()
+
+            if worker is not None:
+                self._busy.add(worker)
+                return worker
+
+            waiter = loop.create_future()
+            self._waiters.append((loop, waiter))
+
+        try:
+            return await waiter
+        except asyncio.CancelledError:
+            with self._lock:
+                try:
+                    self._waiters.remove((loop, waiter))
+                    handed = False
+                except ValueError:
+                    handed = True
+            if handed and waiter.done() and not waiter.cancelled():
+                self._release_worker(waiter.result())
+            raise
+
+    def _hand_off(self, waiter: asyncio.Future, worker: _Worker):
+        if waiter.done():
+            # 等待方已取消，转交给下一个等待方
+            self._release_worker(worker)
+        else:
+            waiter.set_result(worker)
+
+    def _release_worker(self, worker: _Worker):
+        with self._lock:
+            if self._closed:
+                self._busy.discard(worker)
+                worker.pool.shutdown(wait=False, cancel_futures=True)
+                return
+
+            while self._waiters:
+                loop, waiter = self._waiters.popleft()
+                try:
+                    loop.call_soon_threadsafe(self._hand_off, waiter, worker)
+                    return
+                except RuntimeError:
+                    # 等待方的事件循环已关闭
+                    continue
+
+            self._busy.discard(worker)
+            self._idle.append(worker)
+
+    def _recycle(self, worker: _Worker):
+        """终止仍在执行已取消任务的工作进程，用新进程替换，其他进程不受影响"""
+        worker.terminate()
+        logger.warning("分析任务超时或被取消，已终止其工作进程")
+
+        replacement = self._new_worker()
+        with self._lock:
+            self._busy.discard(worker)
+            self._busy.add(replacement)
+        self._release_worker(replacement)
+
+    async def _run(self, fn: Callable, args: tuple, key: Optional[str]) -> Any:
+        worker = await self._acquire_worker(key)
+        try:
+            future = worker.pool.submit(fn, *args)
+        except BaseException:
+            self._recycle(worker)
+            raise
+
+        try:
+            result = await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # 未开始的任务直接取消；已在子进程中运行的任务只能终止该进程
+            if future.cancel() or future.done():
+                self._release_worker(worker)
+            else:
+                self._recycle(worker)
+            raise
+        except BrokenProcessPool:
+            self._recycle(worker)
+            raise
+        except BaseException:
+            self._release_worker(worker)
+            raise
+
+        if key is not None:
+            worker.remember(key, self.analyzers_per_worker)
+        self._release_worker(worker)
+        return result
+
+    async def run(self, fn: Callable, *args, key: Optional[str] = None, timeout: Optional[float] = None) -> Any:
+        """
+        在工作进程中执行可pickle的函数
+
+        Args:
+            fn: 模块级函数
+            *args: 参数
+            key: 共享键，同一键的调用优先调度到已保留其分析器的进程
+            timeout: 超时时间（秒），包含等待空闲进程的时间，默认使用执行器配置
+
+        Returns:
+            Any: 函数返回值
+        """
+        timeout = self.timeout if timeout is None else timeout
+        try:
+            return await asyncio.wait_for(self._run(fn, args, key), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"分析任务超过 {timeout} 秒未完成，已取消")
+
+    async def load_file(
+        self, file_path: str, timeout: Optional[float] = None
+    ) -> Tuple[Optional[pd.DataFrame], Dict[str, Any], Dict[str, Any]]:
+        """
+        在子进程中解析文件和计算汇总统计
+
+        Args:
+            file_path: 文件路径
+            timeout: 超时时间（秒）
+
+        Returns:
+            Tuple: (数据集, 文件信息, 汇总统计)，加载失败时数据集为None
+        """
+        handle, file_info, stats = await self.run(_load_in_worker, file_path, self.shared_dir, timeout=timeout)
+        if handle is None:
+            return None, file_info, stats
+
+        try:
+            # 复制到本进程内存后删除共享文件
+            df = open_shared_frame(handle).copy()
+        finally:
+            release_shared_frame(handle)
+        return df, file_info, stats
+
+    def share(self, df: pd.DataFrame, key: str, version: Any) -> SharedFrame:
+        """
+        获取数据集的共享句柄，同一键在版本未变化时复用
+
+        Args:
+            df: 数据集
+            key: 共享键（如会话ID）
+            version: 数据集版本
+
+        Returns:
+            SharedFrame: 共享句柄
+        """
+        with self._lock:
+            handle = self._shared.get(key)
+            if handle is not None and handle.version == version and os.path.exists(handle.path):
+                return handle
+
+        new_handle = share_frame(df, self.shared_dir, version)
+        with self._lock:
+            previous = self._shared.get(key)
+            self._shared[key] = new_handle
+        if previous is not None:
+            release_shared_frame(previous)
+        return new_handle
+
+    def shared_bytes(self, key: str) -> int:
+        """某个共享键当前占用的共享文件字节数"""
+        with self._lock:
+            handle = self._shared.get(key)
+            return handle.nbytes if handle is not None else 0
+
+    async def call(self, df: pd.DataFrame, method: str, *args, key: str = 'default', version: Any = None,
+                   timeout: Optional[float] = None, **kwargs) -> Any:
+        """
+        在子进程中对数据集调用BasicDataAnalyzer的方法
+
+        Args:
+            df: 数据集
+            method: 方法名，如query_data、prepare_chart_data
+            key: 共享键
+            version: 数据集版本，None表示每次重新共享（子进程不保留分析器）
+            timeout: 超时时间（秒）
+
+        Returns:
+            Any: 方法返回值
+        """
+        if version is None:
+            handle = await asyncio.to_thread(share_frame, df, self.shared_dir)
+            try:
+                return await self.run(_call_once_in_worker, handle, method, args, kwargs, timeout=timeout)
+            finally:
+                release_shared_frame(handle)
+
+        handle = await asyncio.to_thread(self.share, df, key, version)
+        return await self.run(_call_in_worker, handle, key, method, args, kwargs, key=key, timeout=timeout)
+
+    def release(self, key: str):
+        """释放某个共享键对应的共享文件，工作进程在下次调用时丢弃其分析器"""
+        with self._lock:
+            handle = self._shared.pop(key, None)
+            for worker in [*self._idle, *self._busy]:
+                worker.keys.pop(key, None)
+        if handle is not None:
+            release_shared_frame(handle)
+
+    def shutdown(self, wait: bool = True):
+        """关闭所有工作进程并删除所有共享文件"""
+        with self._lock:
+            self._closed = True
+            workers = [*self._idle, *self._busy]
+            self._idle.clear()
+            self._busy.clear()
+            waiters = list(self._waiters)
+            self._waiters.clear()
+            handles = list(self._shared.values())
+            self._shared.clear()
+
+        for loop, waiter in waiters:
+            try:
+                loop.call_soon_threadsafe(waiter.cancel)
+            except RuntimeError:
+                pass
+        for worker in workers:
+            worker.pool.shutdown(wait=wait, cancel_futures=True)
+        for handle in handles:
+            release_shared_frame(handle)
@@ -4,19 +4,36 @@
 为MCP服务集成做准备
 """
 
-import pandas as pd
-import numpy as np
-import json
 import os
-from typing import Dict, List, Any, Optional
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+import pandas as pd
+from aggregate_cache import AggregateCache
+from dataset_cache import DatasetCache
+from downsampling import downsample_line
+from downsampling import downsample_scatter
+from ingestion import IngestionEngine
+from profiler import DatasetProfiler
+from sql_engine import SQLQueryEngine
+from sql_engine import is_sql_query
+
 
 class BasicDataAnalyzer:
     """基础数据分析器"""
     
-    def __init__(self):
+    def __init__(self, ingestion: Optional[IngestionEngine] = None, cache: Optional[DatasetCache] = None):
         self.df: Optional[pd.DataFrame] = None
         self.file_path: Optional[str] = None
         self.file_info: Dict = {}
+        self.ingestion = ingestion or IngestionEngine()
+        self.load_options: Dict[str, Any] = {}
+        self.cache = cache
+        self._summary: Optional[Dict[str, Any]] = None
+        self.aggregates = AggregateCache()
+        self._sql_engine: Optional[SQLQueryEngine] = None
     
     def load_file(self, file_path: str) -> Dict[str, Any]:
         """
@@ -31,43 +48,25 @@ class BasicDataAnalyzer:
         self.file_path = file_path
         
         try:
-            # 检查文件是否存在
-            if not os.path.exists(file_path):
-                raise FileNotFoundError(f"文件不存在: {file_path}")
+            cached = None
+            if self.cache is not None:
+                cache_key = self.cache.make_key(file_path, self.ingestion.cache_options)
+                cached = self.cache.get(cache_key)
             
-            # 根据文件扩展名加载
-            if file_path.lower().endswith('.csv'):
-                # 尝试不同编码
-                encodings = ['utf-8', 'gbk', 'gb2312', 'latin1']
-                for encoding in encodings:
-                    try:
-                        self.df = pd.read_csv(file_path, encoding=encoding)
-                        break
-                    except UnicodeDecodeError:
-                        continue
-                else:
-                    raise ValueError("无法识别CSV文件编码")
-                    
-            elif file_path.lower().endswith(('.xlsx', '.xls')):
-                # Excel文件处理，尝试多种引擎
-                engines = ['openpyxl', 'xlrd', None]  # None表示自动选择
-                last_error = None
-                
-                for engine in engines:
-                    try:
-                        if engine is None:
-                            self.df = pd.read_excel(file_path)
-                        else:
-                            self.df = pd.read_excel(file_path, engine=engine)
-                        break  # 成功读取，跳出循环
-                    except Exception as e:
-                        last_error = e
-                        continue
-                else:
-                    # 所有引擎都失败了
-                    raise ValueError(f"无法读取Excel文件，尝试的引擎都失败了。最后的错误: {str(last_error)}")
+            if cached is not None:
+                # 命中缓存：直接内存映射读取列式文件
+                self.df, self.load_options = cached
+                self.load_options['cache'] = 'hit'
             else:
-                raise ValueError("不支持的文件格式，仅支持CSV和Excel文件")
+                # 单遍分块加载，自动嗅探编码/分隔符并压缩数据类型
+                self.df, self.load_options = self.ingestion.load(file_path)
+                if self.cache is not None:
+                    self.cache.put(cache_key, self.df, self.load_options)
+                    self.load_options['cache'] = 'miss'
+            
+            self._summary = None
+            # 数据集变化：失效聚合缓存并为低基数列预计算汇总
+            self.aggregates.reset(self.df)
             
             # 获取文件基本信息
             self.file_info = self._get_file_info()
@@ -81,6 +80,44 @@ class BasicDataAnalyzer:
             }
             return error_info
     
+    def attach(self, df: pd.DataFrame, file_path: str, file_info: Dict[str, Any],
+               summary: Optional[Dict[str, Any]] = None):
+        """
+        挂载在其他进程中已加载的数据集
+
+        Args:
+            df: 数据集
+            file_path: 文件路径
+            file_info: load_file返回的文件信息
+            summary: 已计算的汇总统计
+        """
+        self.df = df
+        self.file_path = file_path
+        self.file_info = file_info
+        self.load_options = file_info.get('load_options', {})
+        self._summary = summary or None
+        self.aggregates.reset(df)
+
+    def restore(self, df: pd.DataFrame):
+        """
+        重新挂载unload前的数据集（如从溢出文件重新加载），重建聚合汇总，文件信息和汇总统计沿用
+
+        Args:
+            df: 数据集
+        """
+        self.df = df
+        self.aggregates.reset(df)
+
+    def unload(self):
+        """
+        卸载数据集：注销SQL引擎中的表并清空聚合缓存，文件信息和汇总统计保留
+        """
+        self.df = None
+        self.aggregates.reset(None)
+        if self._sql_engine is not None:
+            self._sql_engine.close()
+            self._sql_engine = None
+
     def _get_file_info(self) -> Dict[str, Any]:
         """获取文件基本信息"""
         if self.df is None:
@@ -99,64 +136,59 @@ class BasicDataAnalyzer:
             },
             'columns': list(self.df.columns),
             'dtypes': {col: str(dtype) for col, dtype in self.df.dtypes.items()},
-            'memory_usage': f"{self.df.memory_usage(deep=True).sum() / 1024 / 1024:.2f} MB"
+            'memory_usage': f"{self.df.memory_usage(deep=True).sum() / 1024 / 1024:.2f} MB",
+            'load_options': self.load_options
         }
         
         # 数据预览
         basic_info['preview'] = {
-            'head': self.df.head(5).fillna('NULL').to_dict(orient='records'),
-            'tail': self.df.tail(5).fillna('NULL').to_dict(orient='records')
+            'head': self._to_records(self.df.head(5)),
+            'tail': self._to_records(self.df.tail(5))
         }
         
         return basic_info
     
+    @staticmethod
+    def _to_records(frame: pd.DataFrame) -> List[Dict[str, Any]]:
+        """将预览数据转换为记录列表，缺失值显示为NULL（兼容category列）"""
+        return frame.astype(object).where(frame.notna(), 'NULL').to_dict(orient='records')
+    
     def get_summary_statistics(self) -> Dict[str, Any]:
         """获取汇总统计信息"""
         if self.df is None:
             return {'error': True, 'message': '没有加载数据'}
         
         try:
-            # 数值型列统计
-            numeric_cols = self.df.select_dtypes(include=[np.number]).columns
-            numeric_stats = {}
-            
-            if len(numeric_cols) > 0:
-                desc = self.df[numeric_cols].describe()
-                numeric_stats = desc.fillna(0).to_dict()
+            # 单遍流式画像，结果在数据集变化前复用
+            if self._summary is None:
+                self._summary = DatasetProfiler.from_frame(self.df).summary()
+            return self._summary
             
-            # 文本型列统计
-            text_cols = self.df.select_dtypes(include=['object']).columns
-            text_stats = {}
-            
-            for col in text_cols:
-                text_stats[col] = {
-                    'unique_count': int(self.df[col].nunique()),
-                    'most_frequent': str(self.df[col].mode().iloc[0]) if not self.df[col].mode().empty else 'N/A',
-                    'null_count': int(self.df[col].isnull().sum())
-                }
-            
-            # 缺失值统计
-            missing_stats = {
-                col: {
-                    'count': int(self.df[col].isnull().sum()),
-                    'percentage': round(self.df[col].isnull().sum() / len(self.df) * 100, 2)
-                }
-                for col in self.df.columns
-            }
+        except Exception as e:
+            return {'error': True, 'message': f"统计计算失败: {str(e)}"}
+    
+    def profile_file(self, file_path: str) -> Dict[str, Any]:
+        """
+        不加载整个文件，逐块计算汇总统计（适用于超出内存的文件）
+        
+        Args:
+            file_path: 文件路径
             
-            return {
-                'numeric_statistics': numeric_stats,
-                'text_statistics': text_stats,
-                'missing_values': missing_stats,
-                'total_rows': int(len(self.df)),
-                'total_columns': int(len(self.df.columns))
-            }
+        Returns:
+            Dict: 与get_summary_statistics格式一致的统计信息
+        """
+        try:
+            profiler = DatasetProfiler()
+            for chunk in self.ingestion.iter_chunks(file_path):
+                profiler.update(chunk)
+            return profiler.summary()
             
         except Exception as e:
             return {'error': True, 'message': f"统计计算失败: {str(e)}"}
     
     def prepare_chart_data(self, x_col: str, y_col: str = None, chart_type: str = 'bar', 
-                          limit: int = 20) -> Dict[str, Any]:
+                           limit: int = 20, max_points: int = 2000,
+                           downsample: str = 'lttb') -> Dict[str, Any]:
         """
         准备图表数据
         
@@ -164,7 +196,9 @@ class BasicDataAnalyzer:
             x_col: X轴列名
             y_col: Y轴列名（可选）
             chart_type: 图表类型 ('bar', 'line', 'pie', 'scatter')
-            limit: 数据点限制
+            limit: 柱状图/饼图的类别数限制
+            max_points: 折线图/散点图降采样后的点数上限
+            downsample: 折线图降采样方法 ('lttb', 'minmax')
             
         Returns:
             Dict: 图表数据
@@ -175,16 +209,35 @@ class BasicDataAnalyzer:
         if x_col not in self.df.columns:
             return {'error': True, 'message': f'列 {x_col} 不存在'}
         
+        # 相同数据集版本下的重复图表请求直接命中缓存
+        if chart_type in ('line', 'scatter'):
+            agg = downsample if chart_type == 'line' else 'grid'
+            cache_key = self.aggregates.make_key(x_col, y_col, agg, chart_type, max_points)
+        else:
+            agg = {'bar': 'sum' if y_col else 'count', 'pie': 'count'}.get(chart_type, 'raw')
+            cache_key = self.aggregates.make_key(x_col, y_col, agg, chart_type, limit)
+        cached = self.aggregates.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        result = self._build_chart_data(x_col, y_col, chart_type, limit, max_points, downsample)
+        if not result.get('error'):
+            self.aggregates.put(cache_key, result)
+        return result
+    
+    def _build_chart_data(self, x_col: str, y_col: Optional[str], chart_type: str,
+                          limit: int, max_points: int, downsample: str) -> Dict[str, Any]:
+        """计算图表数据"""
         try:
             if chart_type == 'bar':
                 # 柱状图：分组统计
                 if y_col and y_col in self.df.columns:
                     # 有Y轴：按X分组求Y的和
-                    data = self.df.groupby(x_col)[y_col].sum().reset_index()
+                    data = self.aggregates.group_sum(self.df, x_col, y_col).reset_index()
                     data = data.head(limit)
                 else:
                     # 无Y轴：按X分组计数
-                    data = self.df[x_col].value_counts().head(limit).reset_index()
+                    data = self.aggregates.value_counts(self.df, x_col).head(limit).reset_index()
                     data.columns = [x_col, 'count']
                     y_col = 'count'
                 
@@ -201,9 +254,9 @@ class BasicDataAnalyzer:
                 }
             
             elif chart_type == 'line':
-                # 折线图：需要数值型数据
+                # 折线图：需要数值型数据，超长序列降采样到固定点数
                 if y_col and y_col in self.df.columns:
-                    data = self.df[[x_col, y_col]].head(limit)
+                    data = downsample_line(self.df, x_col, y_col, max_points, downsample)
                     return {
                         'type': 'line',
                         'data': {
@@ -220,7 +273,7 @@ class BasicDataAnalyzer:
             
             elif chart_type == 'pie':
                 # 饼图：按类别分组
-                data = self.df[x_col].value_counts().head(limit)
+                data = self.aggregates.value_counts(self.df, x_col).head(limit)
                 return {
                     'type': 'pie',
                     'data': {
@@ -235,16 +288,14 @@ class BasicDataAnalyzer:
             elif chart_type == 'scatter':
                 # 散点图：需要两个数值列
                 if y_col and y_col in self.df.columns:
-                    data = self.df[[x_col, y_col]].head(limit)
+                    # 点数超过上限时按网格分箱
+                    points = downsample_scatter(self.df, x_col, y_col, max_points)
                     return {
                         'type': 'scatter',
                         'data': {
                             'datasets': [{
                                 'label': f'{x_col} vs {y_col}',
-                                'data': [
-                                    {'x': row[x_col], 'y': row[y_col]} 
-                                    for _, row in data.iterrows()
-                                ]
+                                'data': points
                             }]
                         },
                         'title': f'{x_col} vs {y_col}'
@@ -263,7 +314,7 @@ class BasicDataAnalyzer:
         简单的数据查询
         
         Args:
-            query: 查询字符串（简化版SQL-like语法）
+            query: 查询字符串（简化版SQL-like语法，或以SELECT/WITH开头的SQL，表名为data）
             
         Returns:
             Dict: 查询结果
@@ -271,6 +322,9 @@ class BasicDataAnalyzer:
         if self.df is None:
             return {'error': True, 'message': '没有加载数据'}
         
+        if is_sql_query(query):
+            return self.query_sql(query)
+        
         try:
             # 简单的查询解析
             query = query.lower().strip()
@@ -290,7 +344,7 @@ class BasicDataAnalyzer:
             elif 'head' in query or '前几行' in query:
                 return {
                     'type': 'table',
-                    'result': self.df.head().fillna('NULL').to_dict(orient='records')
+                    'result': self._to_records(self.df.head())
                 }
             
             elif 'describe' in query or '统计' in query:
@@ -303,11 +357,48 @@ class BasicDataAnalyzer:
             else:
                 return {
                     'type': 'info', 
-                    'result': '支持的查询: shape, columns, head, describe'
+                    'result': '支持的查询: shape, columns, head, describe，或对表data执行SELECT语句'
                 }
                 
         except Exception as e:
             return {'error': True, 'message': f'查询失败: {str(e)}'}
+    
+    def query_sql(self, sql: str, page: int = 1, page_size: int = 100,
+                  timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        使用嵌入式SQL引擎查询当前数据集
+        
+        Args:
+            sql: SELECT/WITH查询语句，数据集表名为data
+            page: 页码，从1开始
+            page_size: 每页行数
+            timeout: 超时时间（秒）
+            
+        Returns:
+            Dict: 分页查询结果
+        """
+        if self.df is None:
+            return {'error': True, 'message': '没有加载数据'}
+        
+        try:
+            if self._sql_engine is None:
+                self._sql_engine = SQLQueryEngine()
+            # 数据集版本未变化时复用已注册的表
+            self._sql_engine.register(self.df, version=(self.aggregates.version, id(self.df)))
+            result = self._sql_engine.execute(sql, page=page, page_size=page_size, timeout=timeout)
+            return {
+                'type': 'table',
+                'sql': sql,
+                'result': result['rows'],
+                'columns': result['columns'],
+                'page': result['page'],
+                'page_size': result['page_size'],
+                'has_more': result['has_more'],
+                'elapsed_ms': result['elapsed_ms']
+            }
+            
+        except Exception as e:
+            return {'error': True, 'message': f'SQL查询失败: {str(e)}'}
 
 # 使用示例
 if __name__ == "__main__":
@@ -319,4 +410,5 @@ if __name__ == "__main__":
     print("1. load_file(file_path) - 加载数据文件")
     print("2. get_summary_statistics() - 获取统计信息")
     print("3. prepare_chart_data(x_col, y_col, chart_type) - 准备图表数据")
-    print("4. query_data(query) - 简单数据查询")
\ No newline at end of file
+    print("4. query_data(query) - 简单数据查询")
+    print("5. query_sql(sql, page, page_size) - SQL分析查询（表名为data）")
\ No newline at end of file
@@ -1,55 +1,97 @@
 #!/usr/bin/env python3
 """
 AntV 图表连接器 - 连接@antv/mcp-server-chart服务
+支持批量渲染：按内容哈希去重，在内存中生成配置和HTML，产物写入对象存储并通过/static提供访问
 """
 
+import asyncio
+import hashlib
 import json
-import subprocess
-import tempfile
 import os
-from typing import Dict, Any, Optional
+import tempfile
+from collections import OrderedDict
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+
+def chart_content_hash(content: Any) -> str:
+    """
+    计算稳定的内容哈希（与进程、字典顺序无关）
+
+    Args:
+        content: 可JSON序列化的图表数据或配置
+
+    Returns:
+        str: 十六进制哈希
+    """
+    canonical = json.dumps(content, sort_keys=True, ensure_ascii=False, default=str, separators=(',', ':'))
+    return hashlib.blake2b(canonical.encode('utf-8'), digest_size=16).hexdigest()
+
 
 class AntVChartConnector:
     """AntV MCP图表服务连接器"""
     
-    def __init__(self):
+    def __init__(self, object_store=None, charts_dir: str = "charts", key_prefix: str = "charts",
+                 static_url: str = "/static", max_rendered: int = 512):
+        """
+        Args:
+            object_store: aiq ObjectStore实例，配置后渲染产物写入对象存储而不是本地文件
+            charts_dir: 未配置对象存储时的本地输出目录
+            key_prefix: 对象存储中的键前缀
+            static_url: 对象存储静态文件路由的URL前缀
+            max_rendered: 进程内保留的已渲染结果数量
+        """
         self.server_cmd = ["npx", "@antv/mcp-server-chart"]
-        self.charts_dir = "charts"
-        self._ensure_charts_dir()
+        self.object_store = object_store
+        self.charts_dir = charts_dir
+        self.key_prefix = key_prefix
+        self.static_url = static_url.rstrip('/')
+        self.max_rendered = max_rendered
+        # 内容哈希 -> 渲染结果，同一图表重复渲染时直接复用
+        self._rendered: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._connection_status: Optional[Dict[str, Any]] = None
     
     def _ensure_charts_dir(self):
         """确保图表目录存在"""
         if not os.path.exists(self.charts_dir):
             os.makedirs(self.charts_dir)
     
-    def test_connection(self) -> Dict[str, Any]:
-        """测试MCP服务连接"""
+    async def atest_connection(self) -> Dict[str, Any]:
+        """测试MCP服务连接（完成MCP握手并列出工具），成功结果在连接器生命周期内复用"""
+        if self._connection_status is not None:
+            return self._connection_status
+        
         try:
-            result = subprocess.run(
-                self.server_cmd + ["--help"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            from aiq.tool.mcp.mcp_client import MCPBuilder
             
-            if result.returncode == 0:
-                return {
-                    'status': 'success',
-                    'message': 'AntV MCP服务连接正常',
-                    'help_output': result.stdout
-                }
-            else:
-                return {
-                    'status': 'error',
-                    'message': 'AntV MCP服务连接失败',
-                    'error': result.stderr
-                }
+            builder = MCPBuilder(transport='stdio', command=self.server_cmd[0], args=self.server_cmd[1:])
+            tools = await builder.get_tools()
+            
+            self._connection_status = {
+                'status': 'success',
+                'message': 'AntV MCP服务连接正常',
+                'tools': sorted(tools)
+            }
+            return self._connection_status
         except Exception as e:
             return {
                 'status': 'error',
                 'message': f'连接测试失败: {str(e)}'
             }
     
+    def test_connection(self) -> Dict[str, Any]:
+        """atest_connection的同步版本，仅用于没有运行中事件循环的脚本；事件循环中请 await atest_connection()"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.atest_connection())
+        return {
+            'status': 'error',
+            'message': '事件循环中请使用 await atest_connection()'
+        }
+    
     def generate_chart_json(self, chart_data: Dict[str, Any], 
                            output_file: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -64,8 +106,9 @@ class AntVChartConnector:
         """
         try:
             if output_file is None:
-                output_file = f"chart_{hash(str(chart_data)) % 10000}.json"
+                output_file = f"chart_{chart_content_hash(chart_data)}.json"
             
+            self._ensure_charts_dir()
             output_path = os.path.join(self.charts_dir, output_file)
             
             # 转换为AntV G2格式
@@ -88,6 +131,124 @@ class AntVChartConnector:
                 'message': f'图表配置生成失败: {str(e)}'
             }
     
+    async def arender_charts(self, chart_specs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        批量渲染图表：相同内容只渲染一次，配置和HTML在内存中生成后一次性写出
+        
+        Args:
+            chart_specs: 图表数据列表（prepare_chart_data的返回格式）
+            
+        Returns:
+            List[Dict]: 与输入顺序一致的渲染结果
+        """
+        chart_ids = [chart_content_hash(spec) for spec in chart_specs]
+        
+        # 已渲染的产物可能已被删除（对象存储清理、本地目录被清空），复用前先确认仍然存在
+        remembered = [chart_id for chart_id in dict.fromkeys(chart_ids) if chart_id in self._rendered]
+        for chart_id in await self._missing_artifacts(remembered):
+            self._rendered.pop(chart_id, None)
+        
+        pending: Dict[str, Dict[str, Any]] = {}
+        for chart_id, spec in zip(chart_ids, chart_specs):
+            if chart_id not in self._rendered and chart_id not in pending:
+                pending[chart_id] = spec
+        
+        if pending:
+            rendered = {chart_id: self._render(chart_id, spec) for chart_id, spec in pending.items()}
+            await self._store_artifacts(rendered)
+            for chart_id, (result, _) in rendered.items():
+                self._remember(chart_id, result)
+        
+        results = []
+        for chart_id in chart_ids:
+            self._rendered.move_to_end(chart_id)
+            results.append(dict(self._rendered[chart_id]))
+        return results
+    
+    def _render(self, chart_id: str, chart_data: Dict[str, Any]):
+        """在内存中生成配置和HTML，返回(结果, 待写出的产物)"""
+        config = self._convert_to_antv_format(chart_data)
+        config_bytes = json.dumps(config, ensure_ascii=False).encode('utf-8')
+        html_bytes = self._generate_html_template(config).encode('utf-8')
+        
+        config_key = f"{self.key_prefix}/{chart_id}.json"
+        html_key = f"{self.key_prefix}/{chart_id}.html"
+        if self.object_store is not None:
+            url = f"{self.static_url}/{html_key}"
+        else:
+            url = f"file://{os.path.abspath(os.path.join(self.charts_dir, chart_id + '.html'))}"
+        
+        result = {
+            'status': 'success',
+            'chart_id': chart_id,
+            'config': config,
+            'config_key': config_key,
+            'html_key': html_key,
+            'url': url
+        }
+        artifacts = [
+            (config_key, config_bytes, 'application/json'),
+            (html_key, html_bytes, 'text/html; charset=utf-8')
+        ]
+        return result, artifacts
+    
+    async def _store_artifacts(self, rendered: Dict[str, Any]):
+        artifacts = [artifact for _, items in rendered.values() for artifact in items]
+        
+        if self.object_store is None:
+            # 未配置对象存储时写入本地目录；文件名即内容哈希，已存在的文件无需重写
+            self._ensure_charts_dir()
+            for key, data, _ in artifacts:
+                path = os.path.join(self.charts_dir, os.path.basename(key))
+                if not os.path.exists(path):
+                    with open(path, 'wb') as f:
+                        f.write(data)
+            return
+        
+        await asyncio.gather(*(self._put_artifact(key, data, content_type) for key, data, content_type in artifacts))
+    
+    async def _missing_artifacts(self, chart_ids: List[str]) -> List[str]:
+        """返回产物已不存在的图表ID"""
+        if not chart_ids:
+            return []
+        
+        keys = {chart_id: (self._rendered[chart_id]['config_key'], self._rendered[chart_id]['html_key'])
+                for chart_id in chart_ids}
+        
+        if self.object_store is None:
+            return [
+                chart_id for chart_id, chart_keys in keys.items()
+                if not all(os.path.exists(os.path.join(self.charts_dir, os.path.basename(key))) for key in chart_keys)
+            ]
+        
+        exists = await asyncio.gather(*(self._artifact_exists(chart_keys) for chart_keys in keys.values()))
+        return [chart_id for chart_id, found in zip(keys, exists) if not found]
+    
+    async def _artifact_exists(self, keys) -> bool:
+        from aiq.data_models.object_store import NoSuchKeyError
+        
+        try:
+            await asyncio.gather(*(self.object_store.get_object_info(key) for key in keys))
+            return True
+        except NoSuchKeyError:
+            return False
+    
+    async def _put_artifact(self, key: str, data: bytes, content_type: str):
+        from aiq.data_models.object_store import KeyAlreadyExistsError
+        from aiq.object_store.models import ObjectStoreItem
+        
+        try:
+            await self.object_store.put_object(key, ObjectStoreItem(data=data, content_type=content_type))
+        except KeyAlreadyExistsError:
+            # 键由内容哈希决定，已存在即内容相同
+            pass
+    
+    def _remember(self, chart_id: str, result: Dict[str, Any]):
+        self._rendered[chart_id] = result
+        self._rendered.move_to_end(chart_id)
+        while len(self._rendered) > self.max_rendered:
+            self._rendered.popitem(last=False)
+    
     def _convert_to_antv_format(self, chart_data: Dict[str, Any]) -> Dict[str, Any]:
         """将通用图表数据转换为AntV G2格式"""
         
@@ -235,8 +396,9 @@ class AntVChartConnector:
         """
         try:
             if output_file is None:
-                output_file = f"chart_{hash(str(chart_config)) % 10000}.html"
+                output_file = f"chart_{chart_content_hash(chart_config)}.html"
             
+            self._ensure_charts_dir()
             output_path = os.path.join(self.charts_dir, output_file)
             
             # 生成HTML模板
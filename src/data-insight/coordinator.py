@@ -4,20 +4,124 @@
 整合basic_analyzer和chart_connector
 """
 
-import os
+import asyncio
 import json
-from typing import Dict, Any, Optional, List
+import logging
+import os
+import threading
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+
 from basic_analyzer import BasicDataAnalyzer
 from chart_connector import AntVChartConnector
+from dataset_cache import DatasetCache
+from history_store import AnalysisHistory
+from session_registry import AnalysisSession
+from session_registry import AnalyzerRegistry
+
+logger = logging.getLogger(__name__)
+
+# 准备图表数据的协程函数：(x_col, y_col, chart_type) -> 图表数据，未加载数据时返回None
+PrepareChart = Callable[[str, Optional[str], str], Awaitable[Optional[Dict[str, Any]]]]
 
 class DataInsightCoordinator:
     """数据洞察协调器"""
     
-    def __init__(self):
-        self.analyzer = BasicDataAnalyzer()
-        self.chart_connector = AntVChartConnector()
-        self.current_file = None
-        self.analysis_history = []
+    def __init__(self, cache_dir: Optional[str] = None, cache_max_bytes: int = 10 * 1024 ** 3,
+                 memory_budget_bytes: int = 4 * 1024 ** 3, spill_dir: Optional[str] = None,
+                 history_depth: int = 100, object_store=None, idle_ttl: Optional[float] = None,
+                 sweep_interval: float = 60.0):
+        """
+        Args:
+            cache_dir: 数据集缓存目录
+            cache_max_bytes: 数据集缓存的磁盘预算（字节）
+            memory_budget_bytes: 所有会话数据集的全局内存预算（字节）
+            spill_dir: 空闲会话数据集的溢出目录
+            history_depth: 每个会话保留的分析历史条数
+            object_store: aiq ObjectStore，用于转存大体积分析结果和存放渲染后的图表
+            idle_ttl: 会话空闲超过该秒数后被移除，None表示不过期
+            sweep_interval: 后台清理过期会话的间隔（秒）
+        """
+        self.dataset_cache = DatasetCache(cache_dir=cache_dir, max_bytes=cache_max_bytes)
+        self.object_store = object_store
+        # 对象存储客户端绑定创建协调器时的事件循环，分析历史的转存操作都调度到该循环
+        self._loop = _running_loop()
+        self.sessions = AnalyzerRegistry(
+            memory_budget_bytes=memory_budget_bytes,
+            spill_dir=spill_dir,
+            cache=self.dataset_cache,
+            idle_ttl=idle_ttl,
+            history_factory=lambda session_id: AnalysisHistory(max_depth=history_depth,
+                                                               object_store=self.object_store,
+                                                               key_prefix=f"analysis_history/{session_id}",
+                                                               loop=self._loop))
+        self.chart_connector = AntVChartConnector(object_store=object_store)
+        
+        # 过期会话由后台线程定期清理，不依赖新的请求触发
+        self._stop_sweeper = threading.Event()
+        self._sweeper: Optional[threading.Thread] = None
+        if idle_ttl is not None:
+            self._sweeper = threading.Thread(target=self._sweep_idle_sessions,
+                                             args=(min(sweep_interval, idle_ttl),),
+                                             name='dasight-session-sweeper',
+                                             daemon=True)
+            self._sweeper.start()
+    
+    def _sweep_idle_sessions(self, interval: float):
+        while not self._stop_sweeper.wait(interval):
+            try:
+                expired = self.sessions.expire_idle()
+                if expired:
+                    logger.info("已移除 %d 个空闲会话", expired)
+            except Exception as e:
+                logger.warning("清理空闲会话失败: %s", e)
+    
+    def set_object_store(self, object_store):
+        """
+        设置对象存储：之后的图表渲染产物写入该存储，之后创建的会话历史转存到该存储
+
+        Args:
+            object_store: aiq ObjectStore实例
+        """
+        self.object_store = object_store
+        self.chart_connector.object_store = object_store
+        if self._loop is None:
+            self._loop = _running_loop()
+    
+    def close(self):
+        """停止后台清理线程"""
+        self._stop_sweeper.set()
+        if self._sweeper is not None:
+            self._sweeper.join()
+            self._sweeper = None
+    
+    @property
+    def session(self) -> AnalysisSession:
+        """
+        当前会话（按conversation-id隔离）。每次访问都重新查找且不固定会话，
+        需要在多次访问之间保持数据集时使用sessions.acquire()/release()
+        """
+        return self.sessions.get()
+    
+    @property
+    def analyzer(self) -> BasicDataAnalyzer:
+        return self.session.analyzer
+    
+    @property
+    def current_file(self) -> Optional[str]:
+        return self.session.current_file
+    
+    @current_file.setter
+    def current_file(self, file_path: Optional[str]):
+        self.session.current_file = file_path
+    
+    @property
+    def analysis_history(self) -> AnalysisHistory:
+        return self.session.history
     
     def process_file_upload(self, file_path: str) -> Dict[str, Any]:
         """
@@ -29,17 +133,22 @@ class DataInsightCoordinator:
         Returns:
             Dict: 处理结果
         """
+        # 调用期间固定会话，避免其他线程的预算检查溢出数据集
+        session = self.sessions.acquire()
         try:
+            analyzer = session.analyzer
             # 加载文件
-            file_info = self.analyzer.load_file(file_path)
+            file_info = analyzer.load_file(file_path)
             
             if file_info.get('error'):
                 return file_info
             
-            self.current_file = file_path
+            session.current_file = file_path
+            # 统计数据集内存占用，超出预算时溢出其他空闲会话
+            self.sessions.account(session.session_id)
             
             # 获取统计信息
-            stats = self.analyzer.get_summary_statistics()
+            stats = analyzer.get_summary_statistics()
             
             # 合并结果
             result = {
@@ -51,12 +160,8 @@ class DataInsightCoordinator:
             }
             
             # 记录分析历史
-            self.analysis_history.append({
-                'action': 'file_upload',
-                'file_path': file_path,
-                'timestamp': self._get_timestamp(),
-                'result': result
-            })
+            session.history.record('file_upload', {'file_path': file_path}, result,
+                                   timestamp=self._get_timestamp())
             
             return result
             
@@ -66,6 +171,8 @@ class DataInsightCoordinator:
                 'message': f'文件处理失败: {str(e)}'
             }
             return error_result
+        finally:
+            self.sessions.release(session)
     
     def analyze_data(self, query: str) -> Dict[str, Any]:
         """
@@ -77,23 +184,20 @@ class DataInsightCoordinator:
         Returns:
             Dict: 分析结果
         """
-        if not self.current_file:
-            return {
-                'status': 'error',
-                'message': '请先上传数据文件'
-            }
-        
+        session = self.sessions.acquire()
         try:
+            if not session.current_file:
+                return {
+                    'status': 'error',
+                    'message': '请先上传数据文件'
+                }
+            
             # 执行查询
-            query_result = self.analyzer.query_data(query)
+            query_result = session.analyzer.query_data(query)
             
             # 记录分析历史
-            self.analysis_history.append({
-                'action': 'data_analysis',
-                'query': query,
-                'timestamp': self._get_timestamp(),
-                'result': query_result
-            })
+            session.history.record('data_analysis', {'query': query}, query_result,
+                                   timestamp=self._get_timestamp())
             
             return {
                 'status': 'success',
@@ -107,9 +211,22 @@ class DataInsightCoordinator:
                 'status': 'error',
                 'message': f'数据分析失败: {str(e)}'
             }
+        finally:
+            self.sessions.release(session)
     
-    def generate_chart(self, x_col: str, y_col: str = None, 
-                      chart_type: str = 'bar', title: str = None) -> Dict[str, Any]:
+    async def _prepare_chart(self, session: AnalysisSession, prepare_chart: Optional[PrepareChart],
+                             x_col: str, y_col: Optional[str], chart_type: str) -> Dict[str, Any]:
+        if prepare_chart is None:
+            # 分组/降采样在线程中计算，不阻塞事件循环
+            return await asyncio.to_thread(session.analyzer.prepare_chart_data, x_col, y_col, chart_type)
+        chart_data = await prepare_chart(x_col, y_col, chart_type)
+        if chart_data is None:
+            return {'error': True, 'message': '没有加载数据'}
+        return chart_data
+    
+    async def generate_chart(self, x_col: str, y_col: str = None, 
+                             chart_type: str = 'bar', title: str = None,
+                             prepare_chart: Optional[PrepareChart] = None) -> Dict[str, Any]:
         """
         生成图表
         
@@ -118,19 +235,22 @@ class DataInsightCoordinator:
             y_col: Y轴列名
             chart_type: 图表类型
             title: 图表标题
+            prepare_chart: 准备图表数据的协程函数(x_col, y_col, chart_type)，如在分析进程池中执行；
+                默认在线程中调用当前会话的prepare_chart_data
             
         Returns:
             Dict: 图表生成结果
         """
-        if not self.current_file:
-            return {
-                'status': 'error',
-                'message': '请先上传数据文件'
-            }
-        
+        session = await asyncio.to_thread(self.sessions.acquire)
         try:
+            if not session.current_file:
+                return {
+                    'status': 'error',
+                    'message': '请先上传数据文件'
+                }
+            
             # 准备图表数据
-            chart_data = self.analyzer.prepare_chart_data(x_col, y_col, chart_type)
+            chart_data = await self._prepare_chart(session, prepare_chart, x_col, y_col, chart_type)
             
             if chart_data.get('error'):
                 return chart_data
@@ -139,39 +259,26 @@ class DataInsightCoordinator:
             if title:
                 chart_data['title'] = title
             
-            # 生成图表配置
-            config_result = self.chart_connector.generate_chart_json(chart_data)
-            
-            if config_result['status'] != 'success':
-                return config_result
-            
-            # 生成HTML文件
-            html_result = self.chart_connector.generate_chart_html(
-                config_result['config']
-            )
+            # 在内存中生成配置和HTML并写出
+            rendered = (await self.chart_connector.arender_charts([chart_data]))[0]
             
             # 合并结果
             result = {
                 'status': 'success',
                 'message': '图表生成成功',
                 'chart_data': chart_data,
-                'config_file': config_result['config_file'],
-                'html_file': html_result['html_file'],
-                'chart_url': html_result['url']
+                'config_file': rendered['config_key'],
+                'html_file': rendered['html_key'],
+                'chart_url': rendered['url']
             }
             
             # 记录分析历史
-            self.analysis_history.append({
-                'action': 'chart_generation',
-                'params': {
-                    'x_col': x_col,
-                    'y_col': y_col,
-                    'chart_type': chart_type,
-                    'title': title
-                },
-                'timestamp': self._get_timestamp(),
-                'result': result
-            })
+            session.history.record('chart_generation', {
+                'x_col': x_col,
+                'y_col': y_col,
+                'chart_type': chart_type,
+                'title': title
+            }, result, timestamp=self._get_timestamp())
             
             return result
             
@@ -180,19 +287,91 @@ class DataInsightCoordinator:
                 'status': 'error',
                 'message': f'图表生成失败: {str(e)}'
             }
+        finally:
+            await asyncio.to_thread(self.sessions.release, session)
     
-    def get_smart_recommendations(self) -> Dict[str, Any]:
-        """获取智能推荐"""
-        if not self.current_file:
+    async def generate_charts(self, chart_requests: List[Dict[str, Any]],
+                              prepare_chart: Optional[PrepareChart] = None) -> Dict[str, Any]:
+        """
+        批量生成图表（如仪表盘），相同图表只渲染一次
+        
+        Args:
+            chart_requests: 图表参数列表，每项包含x_col、y_col、chart_type（或type）、title，
+                可直接传入智能推荐的charts
+            prepare_chart: 准备图表数据的协程函数，同generate_chart
+            
+        Returns:
+            Dict: 批量生成结果，charts与输入顺序一致
+        """
+        session = await asyncio.to_thread(self.sessions.acquire)
+        try:
+            if not session.current_file:
+                return {
+                    'status': 'error',
+                    'message': '请先上传数据文件'
+                }
+            
+            charts = []
+            specs = []
+            for request in chart_requests:
+                chart_type = request.get('chart_type') or request.get('type', 'bar')
+                chart_data = await self._prepare_chart(session, prepare_chart, request['x_col'],
+                                                       request.get('y_col'), chart_type)
+                if not chart_data.get('error') and request.get('title'):
+                    chart_data['title'] = request['title']
+                charts.append(chart_data)
+                if not chart_data.get('error'):
+                    specs.append(chart_data)
+            
+            rendered = iter(await self.chart_connector.arender_charts(specs))
+            results = []
+            for chart_data in charts:
+                if chart_data.get('error'):
+                    results.append({'status': 'error', 'message': chart_data.get('message')})
+                    continue
+                item = next(rendered)
+                results.append({
+                    'status': 'success',
+                    'chart_id': item['chart_id'],
+                    'title': chart_data.get('title'),
+                    'config_file': item['config_key'],
+                    'html_file': item['html_key'],
+                    'chart_url': item['url']
+                })
+            
+            result = {
+                'status': 'success',
+                'message': f'已生成 {len(specs)} 个图表',
+                'charts': results
+            }
+            
+            # 记录分析历史
+            session.history.record('chart_batch', {'charts': chart_requests}, result,
+                                   timestamp=self._get_timestamp())
+            
+            return result
+            
+        except Exception as e:
             return {
                 'status': 'error',
-                'message': '请先上传数据文件'
+                'message': f'图表生成失败: {str(e)}'
             }
-        
+        finally:
+            await asyncio.to_thread(self.sessions.release, session)
+    
+    def get_smart_recommendations(self) -> Dict[str, Any]:
+        """获取智能推荐"""
+        session = self.sessions.acquire()
         try:
+            if not session.current_file:
+                return {
+                    'status': 'error',
+                    'message': '请先上传数据文件'
+                }
+            
             # 获取数据信息
-            file_info = self.analyzer.file_info
-            stats = self.analyzer.get_summary_statistics()
+            file_info = session.analyzer.file_info
+            stats = session.analyzer.get_summary_statistics()
             
             recommendations = {
                 'charts': self._recommend_charts(file_info, stats),
@@ -210,6 +389,8 @@ class DataInsightCoordinator:
                 'status': 'error',
                 'message': f'推荐生成失败: {str(e)}'
             }
+        finally:
+            self.sessions.release(session)
     
     def _generate_recommendations(self, file_info: Dict, stats: Dict) -> List[str]:
         """生成分析建议"""
@@ -333,14 +514,30 @@ class DataInsightCoordinator:
         import datetime
         return datetime.datetime.now().isoformat()
     
-    def get_analysis_history(self) -> List[Dict]:
-        """获取分析历史"""
-        return self.analysis_history
+    def get_analysis_history(self, page: int = 1, page_size: int = 20) -> Dict[str, Any]:
+        """
+        分页获取分析历史摘要
+        
+        Args:
+            page: 页码，从1开始
+            page_size: 每页条数
+            
+        Returns:
+            Dict: 分页摘要，最新记录在前
+        """
+        return self.analysis_history.page(page, page_size)
     
     def clear_history(self):
         """清空分析历史"""
-        self.analysis_history = []
-        self.current_file = None
+        session = self.session
+        session.history.clear()
+        session.current_file = None
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
 
 # 使用示例
 if __name__ == "__main__":
@@ -349,5 +546,5 @@ if __name__ == "__main__":
     print("支持的功能:")
     print("1. process_file_upload(file_path) - 处理文件上传")
     print("2. analyze_data(query) - 分析数据")
-    print("3. generate_chart(x_col, y_col, chart_type) - 生成图表")
+    print("3. await generate_chart(x_col, y_col, chart_type) - 生成图表")
     print("4. get_smart_recommendations() - 获取智能推荐")
\ No newline at end of file
@@ -4,14 +4,112 @@
 基于NVIDIA NeMo Agent Toolkit框架开发
 """
 
-import pandas as pd
+import asyncio
+import json
+import logging
+import os
+import threading
+from typing import Any
+from typing import Dict
+from typing import Optional
+
 import numpy as np
-from typing import Dict, Any, Optional
+import pandas as pd
+from analysis_executor import AnalysisExecutor
+from coordinator import DataInsightCoordinator
 from pydantic import Field
 
 from aiq.builder.function_info import FunctionInfo
-from aiq.data_models.function import FunctionBaseConfig
 from aiq.cli.register_workflow import register_function
+from aiq.data_models.component_ref import ObjectStoreRef
+from aiq.data_models.function import FunctionBaseConfig
+
+logger = logging.getLogger(__name__)
+
+# 三个工具共享会话状态和同一个分析进程池
+_coordinator: Optional[DataInsightCoordinator] = None
+_executor: Optional[AnalysisExecutor] = None
+_executor_refs = 0
+_state_lock = threading.Lock()
+
+
+def get_coordinator(object_store=None) -> DataInsightCoordinator:
+    """
+    获取共享的协调器
+
+    Args:
+        object_store: aiq ObjectStore实例，协调器尚未配置对象存储时使用
+    """
+    global _coordinator
+    with _state_lock:
+        if _coordinator is None:
+            _coordinator = DataInsightCoordinator(object_store=object_store)
+        elif object_store is not None and _coordinator.object_store is None:
+            _coordinator.set_object_store(object_store)
+        elif object_store is not None and _coordinator.object_store is not object_store:
+            logger.warning("数据洞察工具配置了不同的对象存储，继续使用最先配置的对象存储")
+        return _coordinator
+
+
+async def _configure_coordinator(config, builder) -> DataInsightCoordinator:
+    """按工具配置解析对象存储并配置共享的协调器"""
+    object_store = None
+    if config.object_store is not None:
+        object_store = await builder.get_object_store_client(config.object_store)
+    return get_coordinator(object_store)
+
+
+def _acquire_executor(max_workers: Optional[int], timeout: Optional[float]) -> AnalysisExecutor:
+    global _executor, _executor_refs
+    coordinator = get_coordinator()
+    with _state_lock:
+        if _executor is None:
+            # 工作进程使用协调器的数据集缓存；会话溢出或关闭时释放其共享副本
+            _executor = AnalysisExecutor(max_workers=max_workers,
+                                         timeout=timeout,
+                                         cache_dir=coordinator.dataset_cache.cache_dir,
+                                         cache_max_bytes=coordinator.dataset_cache.max_bytes)
+            coordinator.sessions.add_release_hook(_executor.release)
+        _executor_refs += 1
+        return _executor
+
+
+def _release_executor():
+    global _executor, _executor_refs
+    with _state_lock:
+        _executor_refs -= 1
+        if _executor_refs > 0 or _executor is None:
+            return
+        executor, _executor = _executor, None
+    get_coordinator().sessions.remove_release_hook(executor.release)
+    executor.shutdown(wait=False)
+
+
+async def _call_analyzer(executor: AnalysisExecutor, method: str, *args,
+                         timeout: Optional[float] = None, **kwargs) -> Optional[Dict[str, Any]]:
+    """在进程池中对当前会话的数据集调用分析方法，未加载数据时返回None"""
+    coordinator = get_coordinator()
+    # 调用期间固定会话，避免其数据集和共享副本被溢出释放
+    session = await asyncio.to_thread(coordinator.sessions.acquire)
+    try:
+        df = session.analyzer.df
+        if df is None:
+            return None
+        result = await executor.call(df, method, *args,
+                                     key=session.session_id,
+                                     version=session.analyzer.aggregates.version,
+                                     timeout=timeout, **kwargs)
+        # 共享副本位于/dev/shm，计入会话内存预算
+        shared_bytes = executor.shared_bytes(session.session_id)
+        if shared_bytes != session.shared_bytes:
+            await asyncio.to_thread(coordinator.sessions.account_shared, session.session_id, shared_bytes)
+        return result
+    finally:
+        await asyncio.to_thread(coordinator.sessions.release, session)
+
+
+def _to_text(result: Dict[str, Any]) -> str:
+    return json.dumps(result, ensure_ascii=False, default=str, indent=2)
 
 
 class DataAnalysisConfig(FunctionBaseConfig, name="data_analysis"):
@@ -20,6 +118,18 @@ class DataAnalysisConfig(FunctionBaseConfig, name="data_analysis"):
         default="分析CSV/Excel文件数据，提供统计信息和洞察",
         description="工具描述"
     )
+    max_workers: Optional[int] = Field(
+        default=None,
+        description="分析进程池的工作进程数，默认为CPU核数"
+    )
+    timeout: float = Field(
+        default=60.0,
+        description="单次分析调用的超时时间（秒）"
+    )
+    object_store: Optional[ObjectStoreRef] = Field(
+        default=None,
+        description="对象存储，用于转存大体积分析历史和存放渲染后的图表（可通过/static访问）"
+    )
 
 
 class ChartGenerationConfig(FunctionBaseConfig, name="chart_generation"):
@@ -28,6 +138,18 @@ class ChartGenerationConfig(FunctionBaseConfig, name="chart_generation"):
         default="根据数据生成各种类型的图表(柱状图、折线图、饼图等)",
         description="工具描述"
     )
+    max_workers: Optional[int] = Field(
+        default=None,
+        description="分析进程池的工作进程数，默认为CPU核数"
+    )
+    timeout: float = Field(
+        default=60.0,
+        description="单次分析调用的超时时间（秒）"
+    )
+    object_store: Optional[ObjectStoreRef] = Field(
+        default=None,
+        description="对象存储，用于转存大体积分析历史和存放渲染后的图表（可通过/static访问）"
+    )
 
 
 class FileProcessorConfig(FunctionBaseConfig, name="file_processor"):
@@ -36,6 +158,18 @@ class FileProcessorConfig(FunctionBaseConfig, name="file_processor"):
         default="处理上传的CSV/Excel文件，解析数据结构",
         description="工具描述"
     )
+    max_workers: Optional[int] = Field(
+        default=None,
+        description="分析进程池的工作进程数，默认为CPU核数"
+    )
+    timeout: float = Field(
+        default=60.0,
+        description="单次分析调用的超时时间（秒）"
+    )
+    object_store: Optional[ObjectStoreRef] = Field(
+        default=None,
+        description="对象存储，用于转存大体积分析历史和存放渲染后的图表（可通过/static访问）"
+    )
 
 
 @register_function(config_type=DataAnalysisConfig)
@@ -49,6 +183,8 @@ async def data_analysis_tool(config: DataAnalysisConfig, builder):
     - 异常值检测
     - 相关性分析
     """
+    await _configure_coordinator(config, builder)
+    executor = _acquire_executor(config.max_workers, config.timeout)
     
     async def analyze_data(query: str) -> str:
         """
@@ -61,12 +197,10 @@ async def data_analysis_tool(config: DataAnalysisConfig, builder):
             分析结果的文本描述
         """
         try:
-            # 这里是数据分析的核心逻辑
-            # 实际实现中需要：
-            # 1. 解析用户查询意图
-            # 2. 从当前加载的数据中提取相关信息
-            # 3. 执行相应的统计分析
-            # 4. 返回友好的文本结果
+            # 已加载数据时在进程池中执行查询，事件循环不被pandas计算阻塞
+            result = await _call_analyzer(executor, 'query_data', query, timeout=config.timeout)
+            if result is not None:
+                return _to_text(result)
             
             # 示例响应
             if "行" in query or "列" in query:
@@ -89,7 +223,9 @@ async def data_analysis_tool(config: DataAnalysisConfig, builder):
     try:
         yield FunctionInfo.from_fn(analyze_data, description=config.description)
     except GeneratorExit:
-        print("数据分析工具退出")
+        logger.info("数据分析工具退出")
+    finally:
+        _release_executor()
 
 
 @register_function(config_type=ChartGenerationConfig)
@@ -102,18 +238,44 @@ async def chart_generation_tool(config: ChartGenerationConfig, builder):
     - 生成各种统计图表
     - 图表自定义配置
     """
+    await _configure_coordinator(config, builder)
+    executor = _acquire_executor(config.max_workers, config.timeout)
+    
+    async def prepare_chart(x_col: str, y_col: Optional[str], chart_type: str) -> Optional[Dict[str, Any]]:
+        return await _call_analyzer(executor, 'prepare_chart_data', x_col, y_col, chart_type,
+                                    timeout=config.timeout)
     
     async def generate_chart(request: str) -> str:
         """
         根据请求生成图表
         
         Args:
-            request: 图表生成请求
+            request: 图表生成请求，或JSON格式的图表参数，如 {"x_col": "地区", "y_col": "销售额", "chart_type": "bar"}；
+                传入参数列表（或 {"charts": [...]}）时批量生成
             
         Returns:
             图表生成结果的描述
         """
         try:
+            try:
+                params = json.loads(request)
+            except ValueError:
+                params = None
+            
+            if isinstance(params, dict) and isinstance(params.get('charts'), list):
+                params = params['charts']
+            
+            # 图表数据的分组/降采样在进程池中计算，渲染产物写入对象存储（或本地目录）
+            if isinstance(params, dict) and params.get('x_col'):
+                result = await get_coordinator().generate_chart(params['x_col'], params.get('y_col'),
+                                                                params.get('chart_type', 'bar'),
+                                                                params.get('title'),
+                                                                prepare_chart=prepare_chart)
+                return _to_text(result)
+            if isinstance(params, list) and params:
+                result = await get_coordinator().generate_charts(params, prepare_chart=prepare_chart)
+                return _to_text(result)
+            
             # 这里是图表生成的核心逻辑
             # 实际实现中需要：
             # 1. 解析图表类型和数据需求
@@ -150,7 +312,9 @@ async def chart_generation_tool(config: ChartGenerationConfig, builder):
     try:
         yield FunctionInfo.from_fn(generate_chart, description=config.description)
     except GeneratorExit:
-        print("图表生成工具退出")
+        logger.info("图表生成工具退出")
+    finally:
+        _release_executor()
 
 
 @register_function(config_type=FileProcessorConfig)
@@ -163,24 +327,36 @@ async def file_processor_tool(config: FileProcessorConfig, builder):
     - 数据格式验证
     - 数据预览生成
     """
+    await _configure_coordinator(config, builder)
+    executor = _acquire_executor(config.max_workers, config.timeout)
     
     async def process_file(file_info: str) -> str:
         """
         处理上传的文件
         
         Args:
-            file_info: 文件信息
+            file_info: 文件信息或文件路径
             
         Returns:
             文件处理结果
         """
         try:
-            # 这里是文件处理的核心逻辑
-            # 实际实现中需要：
-            # 1. 读取文件内容
-            # 2. 检测文件格式和编码
-            # 3. 解析数据结构
-            # 4. 生成数据预览
+            file_path = file_info.strip()
+            if os.path.isfile(file_path):
+                # 文件解析和统计在子进程中完成，本进程只挂载结果
+                df, info, stats = await executor.load_file(file_path, timeout=config.timeout)
+                if df is None:
+                    return _to_text(info)
+                
+                coordinator = get_coordinator()
+                session = await asyncio.to_thread(coordinator.sessions.acquire)
+                try:
+                    await asyncio.to_thread(session.analyzer.attach, df, file_path, info, stats)
+                    session.current_file = file_path
+                    await asyncio.to_thread(coordinator.sessions.account, session.session_id)
+                finally:
+                    await asyncio.to_thread(coordinator.sessions.release, session)
+                return _to_text({'status': 'success', 'file_info': info, 'statistics': stats})
             
             return """✅ 文件处理完成：
 📄 文件信息：
@@ -214,7 +390,9 @@ async def file_processor_tool(config: FileProcessorConfig, builder):
     try:
         yield FunctionInfo.from_fn(process_file, description=config.description)
     except GeneratorExit:
-        print("文件处理工具退出")
+        logger.info("文件处理工具退出")
+    finally:
+        _release_executor()
 
 
 if __name__ == "__main__":
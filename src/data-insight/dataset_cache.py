@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+数据集缓存 - 将解析后的数据以Arrow/Feather列式文件持久化
+按文件内容哈希+解析参数建立索引，重新加载时内存映射读取，超出磁盘预算时按LRU淘汰
+内容哈希按(路径, 大小, 修改时间)记录在索引中，只有文件元数据变化时才重新读取全文计算
+"""
+
+import hashlib
+import json
+import logging
+import os
+from typing import Any
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:  # pyarrow为可选依赖
+    pa = None
+    feather = None
+
+logger = logging.getLogger(__name__)
+
+# 解析参数写入Arrow schema元数据的键名
+_OPTIONS_METADATA_KEY = b'dasight.load_options'
+_CACHE_SUFFIX = '.feather'
+# (路径, 大小, 修改时间) -> 内容哈希的索引目录
+_INDEX_DIR = 'index'
+
+
+class DatasetCache:
+    """基于内容哈希的列式数据集缓存"""
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: int = 10 * 1024 ** 3,
+                 hash_block_size: int = 4 * 1024 * 1024):
+        """
+        Args:
+            cache_dir: 缓存目录，默认读取环境变量DASIGHT_CACHE_DIR
+            max_bytes: 缓存占用的磁盘预算（字节）
+            hash_block_size: 计算内容哈希时每次读取的字节数
+        """
+        self.cache_dir = cache_dir or os.environ.get(
+            'DASIGHT_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'dasight', 'datasets'))
+        self.max_bytes = max_bytes
+        self.hash_block_size = hash_block_size
+        # (真实路径, 大小, 修改时间) -> 内容哈希，避免同一进程内重复读取索引
+        self._digest_memo: Dict[Tuple[str, int, int], str] = {}
+        os.makedirs(os.path.join(self.cache_dir, _INDEX_DIR), exist_ok=True)
+
+    @property
+    def available(self) -> bool:
+        """pyarrow不可用时缓存自动失效"""
+        return feather is not None
+
+    def make_key(self, file_path: str, options: Dict[str, Any]) -> str:
+        """
+        生成缓存键
+
+        Args:
+            file_path: 源文件路径
+            options: 影响解析结果的参数
+
+        Returns:
+            str: 内容哈希与解析参数组合后的缓存键
+        """
+        options_digest = hashlib.blake2b(json.dumps(options, sort_keys=True, default=str).encode('utf-8'),
+                                         digest_size=8).hexdigest()
+        return f"{self._content_digest(file_path)}-{options_digest}"
+
+    def _content_digest(self, file_path: str) -> str:
+        real_path = os.path.realpath(file_path)
+        stat = os.stat(real_path)
+        memo_key = (real_path, stat.st_size, stat.st_mtime_ns)
+        if memo_key in self._digest_memo:
+            return self._digest_memo[memo_key]
+
+        # 索引由所有进程共享，大小和修改时间一致时直接复用记录的内容哈希
+        index_path = self._index_path_for(real_path)
+        entry = self._read_index(index_path)
+        if entry is not None and entry.get('size') == stat.st_size and entry.get('mtime_ns') == stat.st_mtime_ns:
+            digest = entry['digest']
+        else:
+            # 新文件或元数据已变化：读取全文计算内容哈希，内容未变的文件仍命中原缓存
+            digest = self._hash_file(real_path)
+            self._write_index(index_path, {'path': real_path, 'size': stat.st_size,
+                                           'mtime_ns': stat.st_mtime_ns, 'digest': digest})
+
+        self._digest_memo[memo_key] = digest
+        return digest
+
+    def _hash_file(self, file_path: str) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        with open(file_path, 'rb') as f:
+            while True:
+                block = f.read(self.hash_block_size)
+                if not block:
+                    break
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _index_path_for(self, real_path: str) -> str:
+        name = hashlib.blake2b(real_path.encode('utf-8'), digest_size=16).hexdigest()
+        return os.path.join(self.cache_dir, _INDEX_DIR, name + '.json')
+
+    @staticmethod
+    def _read_index(index_path: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_index(self, index_path: str, entry: Dict[str, Any]):
+        tmp_path = f"{index_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, index_path)
+        except OSError as e:
+            logger.warning("写入数据集缓存索引失败: %s", e)
+            self._remove(tmp_path)
+
+    def _path_for(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + _CACHE_SUFFIX)
+
+    def get(self, key: str) -> Optional[Tuple[pd.DataFrame, Dict[str, Any]]]:
+        """
+        读取缓存的数据集
+
+        Args:
+            key: 缓存键
+
+        Returns:
+            Optional[Tuple]: (DataFrame, 解析参数)，未命中时返回None
+        """
+        if not self.available:
+            return None
+
+        path = self._path_for(key)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            # 未压缩的Arrow IPC文件可直接内存映射，避免整体读入；按列拆分转换时，
+            # 无缺失值的数值列直接引用映射内存（只读），文本等其他列逐列转换并释放Arrow缓冲区
+            table = feather.read_table(path, memory_map=True)
+            metadata = table.schema.metadata or {}
+            options = json.loads(metadata.get(_OPTIONS_METADATA_KEY, b'{}'))
+            df = table.to_pandas(split_blocks=True, self_destruct=True)
+            del table
+        except Exception as e:
+            logger.warning("读取数据集缓存失败，将重新解析: %s", e)
+            self._remove(path)
+            return None
+
+        # 更新访问时间，用于LRU淘汰
+        os.utime(path, None)
+        return df, options
+
+    def put(self, key: str, df: pd.DataFrame, options: Dict[str, Any]) -> bool:
+        """
+        写入数据集缓存
+
+        Args:
+            key: 缓存键
+            df: 解析后的数据
+            options: 解析参数
+
+        Returns:
+            bool: 是否写入成功
+        """
+        if not self.available:
+            return False
+
+        path = self._path_for(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            metadata = dict(table.schema.metadata or {})
+            metadata[_OPTIONS_METADATA_KEY] = json.dumps(options, default=str).encode('utf-8')
+            table = table.replace_schema_metadata(metadata)
+
+            # 每列只写一个数据块，读取时才能零拷贝地映射为pandas列
+            feather.write_feather(table, tmp_path, compression='uncompressed', chunksize=max(table.num_rows, 1))
+            os.replace(tmp_path, path)
+        except Exception as e:
+            # 混合类型的object列等无法转换为Arrow时跳过缓存
+            logger.warning("写入数据集缓存失败: %s", e)
+            self._remove(tmp_path)
+            return False
+
+        self.evict()
+        return True
+
+    def evict(self) -> int:
+        """
+        按最近访问时间淘汰缓存，直到总大小不超过磁盘预算
+
+        Returns:
+            int: 被淘汰的文件数
+        """
+        entries = []
+        total = 0
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(_CACHE_SUFFIX):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        evicted = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+            evicted += 1
+
+        return evicted
+
+    def clear(self):
+        """清空缓存目录和内容哈希索引"""
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(_CACHE_SUFFIX):
+                self._remove(os.path.join(self.cache_dir, name))
+        index_dir = os.path.join(self.cache_dir, _INDEX_DIR)
+        for name in os.listdir(index_dir):
+            self._remove(os.path.join(index_dir, name))
+        self._digest_memo.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """获取缓存占用信息"""
+        sizes = [
+            os.path.getsize(os.path.join(self.cache_dir, name))
+            for name in os.listdir(self.cache_dir)
+            if name.endswith(_CACHE_SUFFIX)
+        ]
+        return {
+            'cache_dir': self.cache_dir,
+            'entries': len(sizes),
+            'total_bytes': sum(sizes),
+            'max_bytes': self.max_bytes
+        }
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
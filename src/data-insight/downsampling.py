@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+图表降采样引擎 - 将任意长度的序列压缩为固定点数且保持视觉形态
+折线图：Largest-Triangle-Three-Buckets (LTTB) 与 每桶最小/最大值
+散点图：二维网格分箱
+"""
+
+from typing import Any
+from typing import Dict
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+LINE_METHODS = ('lttb', 'minmax')
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets降采样
+
+    Args:
+        x: 单调递增的横坐标
+        y: 纵坐标
+        threshold: 输出点数
+
+    Returns:
+        np.ndarray: 选中点的下标
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    # 首尾点固定，中间n-2个点均分为threshold-2个桶
+    edges = (np.arange(threshold - 1) * (n - 2) / (threshold - 2)).astype(np.int64) + 1
+    edges[-1] = n - 1
+    # 预先计算每个桶的均值，作为下一个桶的参考点
+    sums_x = np.add.reduceat(x[1:n - 1], edges[:-1] - 1)
+    sums_y = np.add.reduceat(y[1:n - 1], edges[:-1] - 1)
+    counts = np.diff(edges)
+    avg_x = np.append(sums_x / counts, x[-1])
+    avg_y = np.append(sums_y / counts, y[-1])
+
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    prev = 0
+    for bucket in range(threshold - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        next_x, next_y = avg_x[bucket + 1], avg_y[bucket + 1]
+        # 桶内所有点与前一选中点、下一桶均值构成的三角形面积（向量化）
+        area = np.abs((x[prev] - next_x) * (y[start:end] - y[prev]) -
+                      (x[prev] - x[start:end]) * (next_y - y[prev]))
+        prev = start + int(np.argmax(area))
+        selected[bucket + 1] = prev
+
+    return selected
+
+
+def minmax_indices(y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    每个桶保留最小值和最大值点，适合保留尖峰
+
+    Args:
+        y: 纵坐标
+        threshold: 输出点数上限
+
+    Returns:
+        np.ndarray: 选中点的下标（按原始顺序）
+    """
+    n = len(y)
+    buckets = threshold // 2
+    if threshold >= n or buckets < 1:
+        return np.arange(n)
+
+    size = int(np.ceil(n / buckets))
+    padded = np.full(buckets * size, np.nan)
+    padded[:n] = y
+    grid = padded.reshape(buckets, size)
+
+    valid = ~np.all(np.isnan(grid), axis=1)
+    offsets = np.arange(buckets)[valid] * size
+    grid = grid[valid]
+    indices = np.concatenate([offsets + np.nanargmin(grid, axis=1), offsets + np.nanargmax(grid, axis=1)])
+    return np.unique(indices)
+
+
+def grid_bins(x: np.ndarray, y: np.ndarray, max_points: int) -> List[Dict[str, Any]]:
+    """
+    二维网格分箱：每个非空格子输出一个中心点及其点数
+
+    Args:
+        x: 横坐标
+        y: 纵坐标
+        max_points: 输出点数上限
+
+    Returns:
+        List[Dict]: [{'x': ..., 'y': ..., 'count': ...}]
+    """
+    bins = max(int(np.sqrt(max_points)), 1)
+    counts, x_edges, y_edges = np.histogram2d(x, y, bins=bins)
+    x_centers = (x_edges[:-1] + x_edges[1:]) / 2
+    y_centers = (y_edges[:-1] + y_edges[1:]) / 2
+    xi, yi = np.nonzero(counts)
+    return [
+        {'x': float(cx), 'y': float(cy), 'count': int(c)}
+        for cx, cy, c in zip(x_centers[xi], y_centers[yi], counts[xi, yi])
+    ]
+
+
+def _as_coordinates(series: pd.Series) -> np.ndarray:
+    """将横坐标转换为可计算的数值；非数值或非单调时使用行位置"""
+    if pd.api.types.is_datetime64_any_dtype(series.dtype):
+        values = series.astype('int64').to_numpy(dtype=np.float64)
+    elif pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype):
+        values = series.to_numpy(dtype=np.float64)
+    else:
+        return np.arange(len(series), dtype=np.float64)
+
+    if len(values) > 1 and not np.all(np.diff(values) >= 0):
+        return np.arange(len(series), dtype=np.float64)
+    return values
+
+
+def downsample_line(df: pd.DataFrame, x_col: str, y_col: str, max_points: int = 2000,
+                    method: str = 'lttb') -> pd.DataFrame:
+    """
+    折线图降采样
+
+    Args:
+        df: 数据
+        x_col: X轴列名
+        y_col: Y轴列名（数值列）
+        max_points: 输出点数上限
+        method: 'lttb' 或 'minmax'
+
+    Returns:
+        pd.DataFrame: 降采样后的[x_col, y_col]
+    """
+    if method not in LINE_METHODS:
+        raise ValueError(f"不支持的降采样方法: {method}")
+
+    data = df[[x_col, y_col]].dropna(subset=[y_col])
+    if len(data) <= max_points:
+        return data
+
+    y = data[y_col].to_numpy(dtype=np.float64)
+    if method == 'lttb':
+        indices = lttb_indices(_as_coordinates(data[x_col]), y, max_points)
+    else:
+        indices = minmax_indices(y, max_points)
+    return data.iloc[indices]
+
+
+def downsample_scatter(df: pd.DataFrame, x_col: str, y_col: str, max_points: int = 2000) -> List[Dict[str, Any]]:
+    """
+    散点图降采样：点数不超过上限时原样输出，否则按网格分箱
+
+    Args:
+        df: 数据
+        x_col: X轴列名（数值列）
+        y_col: Y轴列名（数值列）
+        max_points: 输出点数上限
+
+    Returns:
+        List[Dict]: 散点数据
+    """
+    data = df[[x_col, y_col]].dropna()
+    if len(data) <= max_points:
+        xs = data[x_col].tolist()
+        ys = data[y_col].tolist()
+        return [{'x': x, 'y': y} for x, y in zip(xs, ys)]
+
+    return grid_bins(data[x_col].to_numpy(dtype=np.float64), data[y_col].to_numpy(dtype=np.float64), max_points)
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+分析历史存储 - 固定深度的环形缓冲区
+元数据使用__slots__紧凑记录，较大的结果体按引用转存到对象存储，历史按页返回摘要
+"""
+
+import asyncio
+import datetime
+import json
+import logging
+import uuid
+from collections import deque
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Dict
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class HistoryRecord:
+    """单条分析历史记录"""
+
+    __slots__ = ('seq', 'action', 'timestamp', 'params', 'status', 'message', 'result_size', 'result_ref', 'result')
+
+    def __init__(self, seq: int, action: str, timestamp: str, params: Dict[str, Any], status: Optional[str],
+                 message: Optional[str], result_size: int, result_ref: Optional[str] = None,
+                 result: Optional[bytes] = None):
+        self.seq = seq
+        self.action = action
+        self.timestamp = timestamp
+        self.params = params
+        self.status = status
+        self.message = message
+        self.result_size = result_size
+        self.result_ref = result_ref
+        # 仅保存小结果的序列化字节，大结果以result_ref引用对象存储
+        self.result = result
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            'seq': self.seq,
+            'action': self.action,
+            'timestamp': self.timestamp,
+            'params': self.params,
+            'status': self.status,
+            'message': self.message,
+            'result_size': self.result_size,
+            'result_ref': self.result_ref
+        }
+
+
+class AnalysisHistory:
+    """有界分析历史"""
+
+    def __init__(self, max_depth: int = 100, inline_result_bytes: int = 16 * 1024,
+                 object_store=None, key_prefix: Optional[str] = None,
+                 loop: Optional[asyncio.AbstractEventLoop] = None):
+        """
+        Args:
+            max_depth: 保留的历史条数
+            inline_result_bytes: 不超过该大小的结果直接保存在内存中
+            object_store: aiq ObjectStore实例，用于转存大结果；为None时大结果只保留摘要
+            key_prefix: 对象存储键前缀
+            loop: 对象存储客户端所属的事件循环，转存操作都在该循环上执行；
+                默认使用第一次在事件循环中记录历史时的循环
+        """
+        self.max_depth = max_depth
+        self.inline_result_bytes = inline_result_bytes
+        self.object_store = object_store
+        self.key_prefix = key_prefix or f"analysis_history/{uuid.uuid4().hex}"
+        self._records: deque = deque()
+        self._seq = 0
+        self._loop = loop
+        # 待执行的对象存储操作，按提交顺序串行执行
+        self._operations: deque = deque()
+        self._drain_task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def record(self, action: str, params: Dict[str, Any], result: Dict[str, Any],
+               timestamp: Optional[str] = None) -> HistoryRecord:
+        """
+        追加一条历史记录，超出深度时淘汰最旧记录
+
+        Args:
+            action: 操作类型
+            params: 操作参数
+            result: 操作结果
+            timestamp: 时间戳，默认为当前时间
+
+        Returns:
+            HistoryRecord: 新记录
+        """
+        self._seq += 1
+        body = json.dumps(result, ensure_ascii=False, default=str).encode('utf-8')
+
+        record = HistoryRecord(seq=self._seq,
+                               action=action,
+                               timestamp=timestamp or datetime.datetime.now().isoformat(),
+                               params=params,
+                               status=result.get('status'),
+                               message=result.get('message'),
+                               result_size=len(body))
+
+        if len(body) <= self.inline_result_bytes:
+            record.result = body
+        elif self.object_store is not None:
+            result_ref = f"{self.key_prefix}/{self._seq}"
+            if self._offload(result_ref, body):
+                record.result_ref = result_ref
+
+        self._records.append(record)
+        while len(self._records) > self.max_depth:
+            self._evict(self._records.popleft())
+
+        return record
+
+    def page(self, page: int = 1, page_size: int = 20) -> Dict[str, Any]:
+        """
+        按页返回历史摘要，最新的记录在前
+
+        Args:
+            page: 页码，从1开始
+            page_size: 每页条数
+
+        Returns:
+            Dict: 分页摘要
+        """
+        page = max(int(page), 1)
+        page_size = max(int(page_size), 1)
+        start = (page - 1) * page_size
+        newest_first = list(reversed(self._records))[start:start + page_size]
+
+        return {
+            'total': len(self._records),
+            'page': page,
+            'page_size': page_size,
+            'items': [record.summary() for record in newest_first]
+        }
+
+    async def aget_result(self, seq: int) -> Optional[Dict[str, Any]]:
+        """
+        获取某条记录的完整结果（内联或从对象存储读取）
+
+        Args:
+            seq: 记录序号
+
+        Returns:
+            Optional[Dict]: 完整结果，已淘汰或未保存时返回None
+        """
+        record = next((r for r in self._records if r.seq == seq), None)
+        if record is None:
+            return None
+        if record.result is not None:
+            return json.loads(record.result)
+        if record.result_ref is not None and self.object_store is not None:
+            # 转存可能仍在队列中
+            await self.flush()
+            item = await self.object_store.get_object(record.result_ref)
+            return json.loads(item.data)
+        return None
+
+    def clear(self):
+        """清空历史并删除已转存的结果"""
+        while self._records:
+            self._evict(self._records.popleft())
+
+    async def flush(self):
+        """等待已排队的对象存储操作全部完成"""
+        task = self._drain_task
+        if task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop():
+            await asyncio.shield(task)
+
+    def _offload(self, key: str, body: bytes) -> bool:
+        from aiq.object_store.models import ObjectStoreItem
+
+        item = ObjectStoreItem(data=body, content_type='application/json', metadata={'source': 'analysis_history'})
+        return self._submit(lambda: self.object_store.upsert_object(key, item))
+
+    def _evict(self, record: HistoryRecord):
+        if record.result_ref is not None and self.object_store is not None:
+            key = record.result_ref
+            self._submit(lambda: self.object_store.delete_object(key))
+
+    def _owning_loop(self) -> Optional[asyncio.AbstractEventLoop]:
+        if self._loop is None:
+            # 未显式指定时绑定到第一次在事件循环中调用时的循环
+            try:
+                self._loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return None
+        if self._loop.is_closed():
+            return None
+        return self._loop
+
+    def _submit(self, operation: Callable[[], Awaitable[Any]]) -> bool:
+        """
+        将对象存储操作排入队列，由所属事件循环上的单个任务按提交顺序执行，
+        保证同一个键的写入先于删除完成；可以在其他线程中调用
+
+        Args:
+            operation: 创建对象存储协程的函数
+
+        Returns:
+            bool: 是否已排队，没有可用的事件循环时返回False
+        """
+        loop = self._owning_loop()
+        if loop is None:
+            logger.warning("分析历史没有可用的事件循环，跳过对象存储操作")
+            return False
+
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        if running is loop:
+            self._enqueue(operation)
+        else:
+            try:
+                loop.call_soon_threadsafe(self._enqueue, operation)
+            except RuntimeError:
+                logger.warning("分析历史所属的事件循环已关闭，跳过对象存储操作")
+                return False
+        return True
+
+    def _enqueue(self, operation: Callable[[], Awaitable[Any]]):
+        self._operations.append(operation)
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.get_running_loop().create_task(self._drain())
+
+    async def _drain(self):
+        while self._operations:
+            operation = self._operations.popleft()
+            try:
+                await operation()
+            except Exception as e:
+                logger.warning("分析历史对象存储操作失败: %s", e)
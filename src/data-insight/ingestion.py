@@ -0,0 +1,440 @@
+#!/usr/bin/env python3
+"""
+数据接入引擎 - 分块、列式的CSV/Excel加载
+基于有限字节样本嗅探编码和分隔符，按样本推断的类型表流式解析，并按完整数据压缩数据类型
+"""
+
+import csv
+import os
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+except ImportError:  # pyarrow为可选依赖
+    pa = None
+    pc = None
+    pa_csv = None
+
+# 候选编码，按优先级排列
+CANDIDATE_ENCODINGS = ['utf-8', 'gbk', 'gb2312', 'latin1']
+# 候选分隔符
+CANDIDATE_DELIMITERS = ',\t;|'
+
+
+class IngestionEngine:
+    """分块数据接入引擎"""
+
+    def __init__(self, sample_bytes: int = 1024 * 1024, chunksize: int = 200_000,
+                 engine: str = 'auto', category_ratio: float = 0.5,
+                 category_max_unique: int = 10_000, sample_rows: int = 10_000):
+        """
+        Args:
+            sample_bytes: 嗅探编码/分隔符时读取的最大字节数
+            chunksize: 每个数据块的行数
+            sample_rows: C引擎推断列类型表时读取的样本行数
+            engine: CSV解析引擎 ('auto', 'pyarrow', 'c')
+            category_ratio: 文本列唯一值占比不超过该值时转换为category
+            category_max_unique: 转换为category的最大唯一值数量
+        """
+        self.sample_bytes = sample_bytes
+        self.chunksize = chunksize
+        self.engine = engine
+        self.category_ratio = category_ratio
+        self.category_max_unique = category_max_unique
+        self.sample_rows = sample_rows
+
+    @property
+    def cache_options(self) -> Dict[str, Any]:
+        """影响解析结果的参数，用于数据集缓存键"""
+        return {
+            'engine': self.engine,
+            'category_ratio': self.category_ratio,
+            'category_max_unique': self.category_max_unique,
+            'chunksize': self.chunksize,
+            'sample_bytes': self.sample_bytes,
+            'sample_rows': self.sample_rows
+        }
+
+    def load(self, file_path: str) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """
+        加载CSV/Excel文件
+
+        Args:
+            file_path: 文件路径
+
+        Returns:
+            Tuple: (DataFrame, 解析参数信息)
+        """
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"文件不存在: {file_path}")
+
+        lower_path = file_path.lower()
+        if lower_path.endswith('.csv'):
+            return self.load_csv(file_path)
+        if lower_path.endswith(('.xlsx', '.xls')):
+            return self.load_excel(file_path)
+        raise ValueError("不支持的文件格式，仅支持CSV和Excel文件")
+
+    def sniff(self, file_path: str) -> Dict[str, str]:
+        """
+        从文件头部的有限字节样本中嗅探编码和分隔符
+
+        Args:
+            file_path: 文件路径
+
+        Returns:
+            Dict: {'encoding': ..., 'delimiter': ...}
+        """
+        with open(file_path, 'rb') as f:
+            sample = f.read(self.sample_bytes)
+            truncated = bool(f.read(1))
+
+        # 样本被截断时丢弃最后一个不完整的行，避免切断多字节字符
+        if truncated and b'\n' in sample:
+            sample = sample[:sample.rindex(b'\n') + 1]
+
+        encoding = self._detect_encoding(sample)
+        text = sample.decode(encoding, errors='replace')
+
+        try:
+            delimiter = csv.Sniffer().sniff(text[:64 * 1024], delimiters=CANDIDATE_DELIMITERS).delimiter
+        except csv.Error:
+            delimiter = ','
+
+        return {'encoding': encoding, 'delimiter': delimiter}
+
+    def _detect_encoding(self, sample: bytes) -> str:
+        """检测样本编码"""
+        if sample.startswith(b'\xef\xbb\xbf'):
+            return 'utf-8-sig'
+
+        for encoding in CANDIDATE_ENCODINGS:
+            try:
+                sample.decode(encoding)
+                return encoding
+            except UnicodeDecodeError:
+                continue
+
+        raise ValueError("无法识别CSV文件编码")
+
+    def load_csv(self, file_path: str) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """单遍分块加载CSV文件"""
+        options = self.sniff(file_path)
+        engine = self._resolve_engine()
+
+        # 样本判定的编码在文件后部解码失败时，依次尝试后续候选编码
+        base_encoding = options['encoding'].replace('-sig', '')
+        encodings = [options['encoding']] + CANDIDATE_ENCODINGS[CANDIDATE_ENCODINGS.index(base_encoding) + 1:]
+
+        last_error = None
+        for encoding in encodings:
+            options['encoding'] = encoding
+            try:
+                if engine == 'pyarrow':
+                    try:
+                        df, num_chunks = self._load_pyarrow(file_path, options)
+                    except UnicodeDecodeError:
+                        raise
+                    except Exception:
+                        # pyarrow按首块推断的类型与后续块不一致时回退到C引擎（按类型表解析并调和冲突）
+                        engine = 'c'
+                        df, num_chunks = self._combine_chunks(self._iter_pandas_chunks(file_path, options))
+                else:
+                    df, num_chunks = self._combine_chunks(self._iter_pandas_chunks(file_path, options))
+
+                options.update({'engine': engine, 'chunks': num_chunks})
+                return df, options
+            except UnicodeDecodeError as e:
+                last_error = e
+                continue
+
+        raise ValueError(f"无法识别CSV文件编码: {last_error}")
+
+    def iter_chunks(self, file_path: str) -> Iterator[pd.DataFrame]:
+        """
+        逐块产出压缩后的数据，不在内存中合并，适用于超出内存的文件
+
+        Args:
+            file_path: 文件路径
+
+        Yields:
+            pd.DataFrame: 压缩数据类型后的数据块
+        """
+        if file_path.lower().endswith('.csv'):
+            options = self.sniff(file_path)
+            chunks = self._iter_pandas_chunks(file_path, options)
+        elif file_path.lower().endswith('.xlsx'):
+            chunks = self._iter_xlsx_chunks(file_path)
+        else:
+            raise ValueError("流式读取仅支持CSV和xlsx文件")
+
+        # 流式读取无法预知完整数据的基数，category列只能按首块判定
+        category_columns = None
+        for chunk in chunks:
+            if category_columns is None:
+                category_columns = self.infer_category_columns(chunk)
+            yield compact_dtypes(chunk, category_columns)
+
+    def _resolve_engine(self) -> str:
+        if self.engine == 'auto':
+            return 'pyarrow' if pa_csv is not None else 'c'
+        if self.engine == 'pyarrow' and pa_csv is None:
+            raise ValueError("pyarrow未安装，无法使用pyarrow解析引擎")
+        return self.engine
+
+    def _iter_pandas_chunks(self, file_path: str, options: Dict[str, str]) -> Iterator[pd.DataFrame]:
+        """
+        按样本推断的类型表（dtype=）解析所有数据块，后续块不再各自推断类型；
+        某块与类型表冲突时（如浮点列出现文本）从该块起撤销数值类型声明重新打开读取器，冲突在合并时调和
+        """
+        dtypes = self.infer_dtype_map(self._read_sample(file_path, options))
+        rows_read = 0
+
+        while True:
+            reader = pd.read_csv(file_path,
+                                 encoding=options['encoding'],
+                                 sep=options['delimiter'],
+                                 chunksize=self.chunksize,
+                                 dtype=dtypes or None,
+                                 skiprows=range(1, rows_read + 1) if rows_read else None,
+                                 low_memory=False)
+            try:
+                with reader:
+                    for chunk in reader:
+                        rows_read += len(chunk)
+                        yield chunk
+                return
+            except (ValueError, TypeError):
+                relaxed = {col: dtype for col, dtype in dtypes.items() if dtype == 'category'}
+                if relaxed == dtypes:
+                    raise
+                dtypes = relaxed
+
+    def _read_sample(self, file_path: str, options: Dict[str, str]) -> pd.DataFrame:
+        return pd.read_csv(file_path,
+                           encoding=options['encoding'],
+                           sep=options['delimiter'],
+                           nrows=self.sample_rows,
+                           low_memory=False)
+
+    def infer_dtype_map(self, sample: pd.DataFrame) -> Dict[str, Any]:
+        """
+        根据样本推断解析类型表：浮点列声明为float64，低基数文本列直接解析为category；
+        整数列不声明，后续块出现缺失值时由pandas推断为浮点并在合并时调和
+
+        Args:
+            sample: 样本数据
+
+        Returns:
+            Dict: 列名 -> read_csv的dtype
+        """
+        category_columns = self.infer_category_columns(sample)
+        dtypes: Dict[str, Any] = {}
+        for col in sample.columns:
+            if col in category_columns:
+                dtypes[col] = 'category'
+            elif pd.api.types.is_float_dtype(sample[col].dtype):
+                dtypes[col] = 'float64'
+        return dtypes
+
+    def _iter_pyarrow_batches(self, file_path: str, options: Dict[str, str]) -> Iterator[Any]:
+        encoding = options['encoding'].replace('-sig', '')
+        read_options = pa_csv.ReadOptions(encoding=encoding, block_size=16 * 1024 * 1024)
+        parse_options = pa_csv.ParseOptions(delimiter=options['delimiter'])
+
+        # 流式读取器按首块推断列类型并用于后续所有块，冲突时抛出异常
+        with pa_csv.open_csv(file_path, read_options=read_options, parse_options=parse_options) as reader:
+            yield from reader
+
+    def _load_pyarrow(self, file_path: str, options: Dict[str, str]) -> Tuple[pd.DataFrame, int]:
+        """在Arrow中合并数据块并整表判定category列，逐列转换为pandas时释放Arrow内存，避免合并时内存翻倍"""
+        batches = list(self._iter_pyarrow_batches(file_path, options))
+        if not batches:
+            return pd.DataFrame(), 0
+        num_chunks = len(batches)
+
+        table = pa.Table.from_batches(batches)
+        del batches
+
+        for index, field in enumerate(table.schema):
+            if not (pa.types.is_string(field.type) or pa.types.is_large_string(field.type)):
+                continue
+            column = table.column(index)
+            # 先在开头的一段数据上计数，唯一值已超过上限的列无需整列去重
+            head = column.slice(0, 2 * self.category_max_unique)
+            if pc.count_distinct(head).as_py() > self.category_max_unique:
+                continue
+            if self._is_low_cardinality(pc.count_distinct(column).as_py(), table.num_rows):
+                table = table.set_column(index, field.name, pc.dictionary_encode(column))
+            del column
+
+        df = table.to_pandas(split_blocks=True, self_destruct=True)
+        del table
+        return compact_dtypes(df), num_chunks
+
+    def _combine_chunks(self, chunks: Iterator[pd.DataFrame]) -> Tuple[pd.DataFrame, int]:
+        """逐块压缩数据类型并合并，合并后按完整数据重新判定category列"""
+        compacted: List[pd.DataFrame] = []
+        category_columns: Optional[set] = None
+
+        for chunk in chunks:
+            if category_columns is None:
+                # 首块的判定只用于降低解析期间的内存，最终以完整数据为准
+                category_columns = self.infer_category_columns(chunk)
+            compacted.append(compact_dtypes(chunk, category_columns))
+
+        if not compacted:
+            return pd.DataFrame(), 0
+
+        num_chunks = len(compacted)
+        df = concat_compact(compacted)
+        return self._reconcile_categories(df), num_chunks
+
+    def _reconcile_categories(self, df: pd.DataFrame) -> pd.DataFrame:
+        """按完整数据判定category列：基数过高的退回object，首块之后才满足条件的文本列转换为category"""
+        category_columns = self.infer_category_columns(df)
+        for col in df.columns:
+            is_category = isinstance(df[col].dtype, pd.CategoricalDtype)
+            if is_category and col not in category_columns:
+                df[col] = df[col].astype(object)
+            elif not is_category and col in category_columns:
+                df[col] = df[col].astype('category')
+        return df
+
+    def _is_low_cardinality(self, unique_count: int, row_count: int) -> bool:
+        return row_count > 0 and unique_count <= self.category_max_unique \
+            and unique_count / row_count <= self.category_ratio
+
+    def infer_category_columns(self, df: pd.DataFrame) -> set:
+        """推断低基数文本列"""
+        columns = set()
+        if len(df) == 0:
+            return columns
+
+        for col in df.select_dtypes(include=['object', 'string', 'category']).columns:
+            if self._is_low_cardinality(df[col].nunique(dropna=True), len(df)):
+                columns.add(col)
+        return columns
+
+    def load_excel(self, file_path: str) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """加载Excel文件，xlsx使用只读流式读取"""
+        if file_path.lower().endswith('.xlsx'):
+            try:
+                df, num_chunks = self._combine_chunks(self._iter_xlsx_chunks(file_path))
+                return df, {'engine': 'openpyxl-readonly', 'chunks': num_chunks}
+            except Exception:
+                # 只读模式无法处理时回退到常规引擎
+                pass
+
+        # Excel文件处理，尝试多种引擎
+        engines = ['openpyxl', 'xlrd', None]  # None表示自动选择
+        last_error = None
+
+        for engine in engines:
+            try:
+                if engine is None:
+                    df = pd.read_excel(file_path)
+                else:
+                    df = pd.read_excel(file_path, engine=engine)
+                return compact_dtypes(df, self.infer_category_columns(df)), {'engine': engine or 'auto', 'chunks': 1}
+            except Exception as e:
+                last_error = e
+                continue
+
+        # 所有引擎都失败了
+        raise ValueError(f"无法读取Excel文件，尝试的引擎都失败了。最后的错误: {str(last_error)}")
+
+    def _iter_xlsx_chunks(self, file_path: str) -> Iterator[pd.DataFrame]:
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            rows = workbook.active.iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                return
+            columns = [str(col) if col is not None else f'Unnamed: {i}' for i, col in enumerate(header)]
+
+            buffer = []
+            for row in rows:
+                buffer.append(row)
+                if len(buffer) >= self.chunksize:
+                    yield pd.DataFrame.from_records(buffer, columns=columns).infer_objects()
+                    buffer = []
+            if buffer:
+                yield pd.DataFrame.from_records(buffer, columns=columns).infer_objects()
+        finally:
+            workbook.close()
+
+
+def compact_dtypes(df: pd.DataFrame, category_columns: Optional[set] = None) -> pd.DataFrame:
+    """
+    压缩DataFrame的数据类型：整数无损向下转换，低基数文本列转换为category
+
+    浮点列保持float64：即使每个值都能无损转换为float32，求和等聚合也会以float32累加而丢失精度
+
+    Args:
+        df: 待压缩的DataFrame
+        category_columns: 需要转换为category的列
+
+    Returns:
+        pd.DataFrame: 压缩后的DataFrame
+    """
+    category_columns = category_columns or set()
+
+    for col in df.columns:
+        series = df[col]
+        if pd.api.types.is_bool_dtype(series.dtype):
+            continue
+        if pd.api.types.is_integer_dtype(series.dtype):
+            df[col] = pd.to_numeric(series, downcast='integer')
+        elif col in category_columns and not isinstance(series.dtype, pd.CategoricalDtype):
+            df[col] = series.astype('category')
+
+    return df
+
+
+def concat_compact(chunks: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    合并压缩后的数据块，category列合并类别而不退化为object，类型不一致的列按公共类型合并
+
+    逐列合并并立即释放该列在各数据块中的引用，峰值内存约为结果大小加一列，而不是结果大小的两倍。
+    传入的列表会被清空。
+    """
+    if len(chunks) == 1:
+        return chunks.pop()
+
+    columns = chunks[0].columns
+    pieces = [{col: chunk[col] for col in columns} for chunk in chunks]
+    chunks.clear()
+
+    merged = {}
+    for col in columns:
+        parts = [piece.pop(col) for piece in pieces]
+        merged[col] = _concat_column(parts)
+        del parts
+
+    return pd.DataFrame(merged, columns=columns, copy=False)
+
+
+def _concat_column(parts: List[pd.Series]) -> pd.Series:
+    if all(isinstance(part.dtype, pd.CategoricalDtype) for part in parts):
+        try:
+            return pd.Series(union_categoricals(parts), name=parts[0].name)
+        except TypeError:
+            # 各块的类别值类型不同（如数字与文本）
+            parts = [part.astype(object) for part in parts]
+    elif any(isinstance(part.dtype, pd.CategoricalDtype) for part in parts):
+        parts = [part.astype(object) if isinstance(part.dtype, pd.CategoricalDtype) else part for part in parts]
+    # 整数块与含缺失值的浮点块合并为浮点，数值与文本合并为object
+    return pd.concat(parts, ignore_index=True)
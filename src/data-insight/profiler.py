@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+"""
+流式数据画像 - 单遍、可分块、可合并的列统计
+数值列：计数/缺失/最值/均值方差(Welford并行合并)/近似分位数(KLL，线性插值)
+文本列：计数/缺失/近似去重计数(HyperLogLog)/高频值(Space-Saving)
+布尔、日期时间等其他列：只计入缺失值统计（与原get_summary_statistics一致）
+"""
+
+import copy
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class QuantileSketch:
+    """KLL分位数草图，支持批量更新与合并"""
+
+    def __init__(self, k: int = 400, seed: int = 0):
+        self.k = k
+        self.levels: List[np.ndarray] = [np.empty(0, dtype=np.float64)]
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(int(self.k * (2 / 3) ** depth), 8)
+
+    def update(self, values: np.ndarray):
+        """批量加入数值"""
+        if len(values) == 0:
+            return
+        self.levels[0] = np.concatenate([self.levels[0], values.astype(np.float64, copy=False)])
+        self._compress()
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0, dtype=np.float64))
+                items = np.sort(items)
+                # 奇数个元素时保留一个在本层
+                keep = items[:1] if len(items) % 2 else items[:0]
+                items = items[len(keep):]
+                promoted = items[self._rng.integers(2)::2]
+                self.levels[level] = keep
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+
+    def merge(self, other: 'QuantileSketch'):
+        """合并另一个草图"""
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0, dtype=np.float64))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self._compress()
+
+    def quantiles(self, qs: Iterable[float]) -> List[Optional[float]]:
+        """查询近似分位数，与pandas一致采用相邻秩线性插值"""
+        items = np.concatenate(self.levels)
+        if len(items) == 0:
+            return [None for _ in qs]
+        weights = np.concatenate([np.full(len(level), 2 ** i, dtype=np.float64) for i, level in enumerate(self.levels)])
+        order = np.argsort(items, kind='stable')
+        items, cumulative = items[order], np.cumsum(weights[order])
+        total = cumulative[-1]
+        result = []
+        for q in qs:
+            # 每个元素按权重展开为连续的秩，目标秩h = q * (n - 1)
+            rank = q * (total - 1)
+            lower = int(np.floor(rank))
+            lo = min(int(np.searchsorted(cumulative, lower, side='right')), len(items) - 1)
+            hi = min(int(np.searchsorted(cumulative, lower + 1, side='right')), len(items) - 1)
+            result.append(float(items[lo] + (rank - lower) * (items[hi] - items[lo])))
+        return result
+
+    def weighted_items(self) -> List[Tuple[float, int]]:
+        """草图中保留的(值, 代表次数)，按次数降序"""
+        counts: Dict[float, int] = {}
+        for level, items in enumerate(self.levels):
+            for value in items.tolist():
+                counts[value] = counts.get(value, 0) + 2 ** level
+        return sorted(counts.items(), key=lambda x: -x[1])
+
+
+class HyperLogLog:
+    """HyperLogLog基数估计，基于64位哈希的向量化实现"""
+
+    def __init__(self, precision: int = 14):
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def update_hashes(self, hashes: np.ndarray):
+        """加入一批64位哈希值"""
+        if len(hashes) == 0:
+            return
+        p = self.precision
+        index = (hashes >> np.uint64(64 - p)).astype(np.intp)
+        remainder = hashes & np.uint64((1 << (64 - p)) - 1)
+        # rank为剩余位中首个1出现的位置
+        bit_length = np.zeros(len(remainder), dtype=np.int64)
+        nonzero = remainder > 0
+        bit_length[nonzero] = np.floor(np.log2(remainder[nonzero].astype(np.float64))).astype(np.int64) + 1
+        rank = (64 - p - bit_length + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def merge(self, other: 'HyperLogLog'):
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def count(self) -> int:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.power(2.0, -self.registers.astype(np.float64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        # 小基数时使用线性计数修正
+        if estimate <= 2.5 * m and zeros > 0:
+            estimate = m * np.log(m / zeros)
+        return int(round(estimate))
+
+
+class SpaceSaving:
+    """Space-Saving高频值统计"""
+
+    def __init__(self, capacity: int = 100):
+        self.capacity = capacity
+        self.counters: Dict[Any, List[int]] = {}  # value -> [count, error]
+
+    def update_counts(self, counts: Iterable[Tuple[Any, int]]):
+        """按降序的(值, 次数)批量更新"""
+        for value, count in counts:
+            counter = self.counters.get(value)
+            if counter is not None:
+                counter[0] += count
+            elif len(self.counters) < self.capacity:
+                self.counters[value] = [count, 0]
+            else:
+                # 替换计数最小的计数器，继承其计数作为误差上界
+                min_value = min(self.counters, key=lambda v: self.counters[v][0])
+                min_count = self.counters.pop(min_value)[0]
+                self.counters[value] = [min_count + count, min_count]
+
+    def merge(self, other: 'SpaceSaving'):
+        self.update_counts(sorted(((v, c[0]) for v, c in other.counters.items()), key=lambda x: -x[1]))
+
+    def top(self, k: int = 5) -> List[Tuple[Any, int]]:
+        items = sorted(self.counters.items(), key=lambda x: -x[1][0])[:k]
+        return [(value, counter[0]) for value, counter in items]
+
+
+def column_kind(dtype) -> str:
+    """
+    判定列的统计类别，与原get_summary_statistics的划分一致：
+    数值列（不含布尔）为numeric；object/字符串/分类列为text；
+    布尔、日期时间等其他类型为other，只计入缺失值统计
+    """
+    if pd.api.types.is_bool_dtype(dtype):
+        return 'other'
+    if pd.api.types.is_numeric_dtype(dtype):
+        return 'numeric'
+    if (pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype)
+            or isinstance(dtype, pd.CategoricalDtype)):
+        return 'text'
+    return 'other'
+
+
+class ColumnProfile:
+    """单列画像"""
+
+    def __init__(self, name: str, kind: str):
+        self.name = name
+        self.kind = kind
+        self.count = 0
+        self.nulls = 0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.quantiles = QuantileSketch() if kind == 'numeric' else None
+        self.distinct = HyperLogLog()
+        self.heavy_hitters = None if kind == 'numeric' else SpaceSaving()
+
+    @property
+    def numeric(self) -> bool:
+        return self.kind == 'numeric'
+
+    def _adopt(self, kind: str):
+        """
+        切换统计类别。尚无非空值时直接按新类别重建；
+        否则不一致的类别统一降级为text（与object列的处理一致）
+        """
+        if kind == self.kind:
+            return
+        if self.count == 0:
+            nulls = self.nulls
+            self.__init__(self.name, kind)
+            self.nulls = nulls
+            return
+        if self.numeric:
+            # 数值值哈希与text路径对数值块的哈希一致，去重计数可直接沿用；
+            # 高频值由分位数草图保留的加权样本近似
+            self.heavy_hitters = SpaceSaving()
+            self.heavy_hitters.update_counts(self.quantiles.weighted_items())
+            self.quantiles = None
+            self.min = self.max = None
+            self.mean = self.m2 = 0.0
+        self.kind = 'text'
+
+    def update(self, series: pd.Series):
+        """加入一个数据块中的该列"""
+        mask = series.notna().to_numpy()
+        self.nulls += int(len(mask) - mask.sum())
+        values = series[mask]
+        if len(values) == 0:
+            return
+        self._adopt(column_kind(series.dtype))
+
+        if self.numeric:
+            array = values.to_numpy(dtype=np.float64)
+            self._update_moments(array)
+            self.quantiles.update(array)
+            self.distinct.update_hashes(pd.util.hash_array(array))
+        else:
+            self.count += len(values)
+            if pd.api.types.is_numeric_dtype(values.dtype) and not pd.api.types.is_bool_dtype(values.dtype):
+                hashes = pd.util.hash_array(values.to_numpy(dtype=np.float64))
+            else:
+                hashes = pd.util.hash_pandas_object(values, index=False).to_numpy()
+            self.distinct.update_hashes(hashes)
+            counts = values.value_counts(sort=True)
+            counts = counts[counts > 0].head(self.heavy_hitters.capacity)
+            self.heavy_hitters.update_counts(zip(counts.index, counts.to_numpy().tolist()))
+
+    def _update_moments(self, array: np.ndarray):
+        # Chan等人的并行Welford合并：块内统计量一次向量化计算
+        n_b = len(array)
+        mean_b = float(array.mean())
+        m2_b = float(((array - mean_b) ** 2).sum())
+        self._merge_moments(n_b, mean_b, m2_b, float(array.min()), float(array.max()))
+
+    def _merge_moments(self, n_b: int, mean_b: float, m2_b: float, min_b: float, max_b: float):
+        n_a = self.count
+        n = n_a + n_b
+        delta = mean_b - self.mean
+        self.mean += delta * n_b / n
+        self.m2 += m2_b + delta * delta * n_a * n_b / n
+        self.count = n
+        self.min = min_b if self.min is None else min(self.min, min_b)
+        self.max = max_b if self.max is None else max(self.max, max_b)
+
+    def merge(self, other: 'ColumnProfile'):
+        """合并另一个分块/进程的同列画像，类别不一致时先统一类别"""
+        if other.count == 0:
+            self.nulls += other.nulls
+            return
+        if self.kind != other.kind and self.count:
+            if other.numeric:
+                # 复制后降级，避免修改被合并的画像
+                other = copy.deepcopy(other)
+                other._adopt('text')
+            self._adopt('text')
+        else:
+            self._adopt(other.kind)
+
+        self.nulls += other.nulls
+        self.distinct.merge(other.distinct)
+        if self.numeric:
+            self._merge_moments(other.count, other.mean, other.m2, other.min, other.max)
+            self.quantiles.merge(other.quantiles)
+        else:
+            self.count += other.count
+            self.heavy_hitters.merge(other.heavy_hitters)
+
+    @property
+    def variance(self) -> Optional[float]:
+        return self.m2 / (self.count - 1) if self.count > 1 else None
+
+
+class DatasetProfiler:
+    """数据集画像，逐块消费DataFrame并输出汇总统计"""
+
+    def __init__(self):
+        self.columns: Dict[str, ColumnProfile] = {}
+        self.total_rows = 0
+
+    def update(self, chunk: pd.DataFrame) -> 'DatasetProfiler':
+        """消费一个数据块"""
+        for col in chunk.columns:
+            if col not in self.columns:
+                self.columns[col] = ColumnProfile(col, column_kind(chunk[col].dtype))
+                # 后加入的列在之前的数据块中视为缺失
+                self.columns[col].nulls = self.total_rows
+            self.columns[col].update(chunk[col])
+        # 本块中缺少的已知列同样视为缺失
+        for col, profile in self.columns.items():
+            if col not in chunk.columns:
+                profile.nulls += len(chunk)
+        self.total_rows += len(chunk)
+        return self
+
+    def merge(self, other: 'DatasetProfiler') -> 'DatasetProfiler':
+        """合并另一个画像（来自其他分块或工作进程），不修改other"""
+        for col, profile in self.columns.items():
+            if col not in other.columns:
+                profile.nulls += other.total_rows
+        for col, profile in other.columns.items():
+            if col in self.columns:
+                self.columns[col].merge(profile)
+            else:
+                merged = ColumnProfile(col, profile.kind)
+                merged.nulls = self.total_rows
+                merged.merge(profile)
+                self.columns[col] = merged
+        self.total_rows += other.total_rows
+        return self
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, chunk_rows: int = 500_000) -> 'DatasetProfiler':
+        """按行切片画像已加载的DataFrame"""
+        profiler = cls()
+        for start in range(0, max(len(df), 1), chunk_rows):
+            profiler.update(df.iloc[start:start + chunk_rows])
+        return profiler
+
+    def summary(self) -> Dict[str, Any]:
+        """输出与get_summary_statistics兼容的汇总统计"""
+        numeric_stats = {}
+        text_stats = {}
+
+        for col, profile in self.columns.items():
+            if profile.kind == 'numeric':
+                q25, q50, q75 = profile.quantiles.quantiles([0.25, 0.5, 0.75])
+                variance = profile.variance
+                numeric_stats[col] = {
+                    'count': float(profile.count),
+                    'mean': profile.mean if profile.count else 0,
+                    'std': float(np.sqrt(variance)) if variance is not None else 0,
+                    'min': profile.min if profile.min is not None else 0,
+                    '25%': q25 if q25 is not None else 0,
+                    '50%': q50 if q50 is not None else 0,
+                    '75%': q75 if q75 is not None else 0,
+                    'max': profile.max if profile.max is not None else 0,
+                    'approx_unique': profile.distinct.count()
+                }
+            elif profile.kind == 'text':
+                top_values = profile.heavy_hitters.top(5)
+                text_stats[col] = {
+                    'unique_count': profile.distinct.count(),
+                    'most_frequent': str(top_values[0][0]) if top_values else 'N/A',
+                    'null_count': profile.nulls,
+                    'top_values': [{'value': str(value), 'count': count} for value, count in top_values]
+                }
+
+        missing_stats = {
+            col: {
+                'count': profile.nulls,
+                'percentage': round(profile.nulls / self.total_rows * 100, 2) if self.total_rows else 0
+            }
+            for col, profile in self.columns.items()
+        }
+
+        return {
+            'numeric_statistics': numeric_stats,
+            'text_statistics': text_stats,
+            'missing_values': missing_stats,
+            'total_rows': int(self.total_rows),
+            'total_columns': len(self.columns)
+        }
@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+多会话分析器注册表 - 按会话隔离BasicDataAnalyzer
+统计每个数据集的内存占用，超出全局内存预算时将最久未使用的空闲数据集溢出到磁盘，访问时透明重新加载
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+
+import pandas as pd
+from basic_analyzer import BasicDataAnalyzer
+from dataset_cache import DatasetCache
+from history_store import AnalysisHistory
+
+try:
+    import pyarrow.feather as feather
+except ImportError:  # pyarrow为可选依赖
+    feather = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SESSION_ID = 'default'
+
+
+def resolve_session_id(session_id: Optional[str] = None) -> str:
+    """
+    解析会话ID：优先使用显式传入的ID，其次使用AIQ上下文中的conversation-id
+
+    Args:
+        session_id: 显式指定的会话ID
+
+    Returns:
+        str: 会话ID
+    """
+    if session_id:
+        return session_id
+
+    try:
+        from aiq.builder.context import AIQContext
+        conversation_id = AIQContext.get().conversation_id
+    except Exception:
+        conversation_id = None
+
+    return conversation_id or DEFAULT_SESSION_ID
+
+
+class AnalysisSession:
+    """单个会话的分析状态"""
+
+    def __init__(self, session_id: str, analyzer: BasicDataAnalyzer, history: AnalysisHistory):
+        self.session_id = session_id
+        self.analyzer = analyzer
+        self.current_file: Optional[str] = None
+        self.history = history
+        self.memory_bytes = 0
+        # 分析进程池为该会话共享的数据集副本（/dev/shm中的文件）占用的字节数
+        self.shared_bytes = 0
+        self.spill_path: Optional[str] = None
+        self.last_access = time.time()
+        # 正在使用该会话数据集的调用数，大于0时不会被溢出或过期移除
+        self.pins = 0
+
+    @property
+    def spilled(self) -> bool:
+        return self.spill_path is not None
+
+    @property
+    def pinned(self) -> bool:
+        return self.pins > 0
+
+    @property
+    def resident_bytes(self) -> int:
+        return self.memory_bytes + self.shared_bytes
+
+
+class AnalyzerRegistry:
+    """会话级分析器注册表，带全局内存预算和LRU溢出"""
+
+    def __init__(self, memory_budget_bytes: int = 4 * 1024 ** 3, spill_dir: Optional[str] = None,
+                 cache: Optional[DatasetCache] = None, idle_ttl: Optional[float] = None,
+                 history_factory: Optional[Callable[[str], AnalysisHistory]] = None):
+        """
+        Args:
+            memory_budget_bytes: 所有会话数据集的全局内存预算（字节）
+            spill_dir: 溢出文件目录
+            cache: 新建分析器共享的数据集缓存
+            idle_ttl: 会话空闲超过该秒数后被移除，None表示不过期
+            history_factory: 按会话ID创建分析历史存储的工厂函数
+        """
+        self.memory_budget_bytes = memory_budget_bytes
+        self.spill_dir = spill_dir or os.path.join(tempfile.gettempdir(), 'dasight_spill')
+        self.cache = cache
+        self.idle_ttl = idle_ttl
+        self.history_factory = history_factory or (lambda session_id: AnalysisHistory())
+        # 按最近访问顺序排列，末尾为最近使用
+        self._sessions: 'OrderedDict[str, AnalysisSession]' = OrderedDict()
+        # 会话数据集被溢出或移除时调用，用于释放其他组件持有的数据集副本
+        self._release_hooks: List[Callable[[str], None]] = []
+        self._lock = threading.RLock()
+        os.makedirs(self.spill_dir, exist_ok=True)
+
+    def get(self, session_id: Optional[str] = None) -> AnalysisSession:
+        """
+        获取会话，不存在时创建；已溢出的数据集会被透明重新加载
+
+        Args:
+            session_id: 会话ID，默认取当前conversation-id
+
+        Returns:
+            AnalysisSession: 会话状态
+        """
+        session_id = resolve_session_id(session_id)
+
+        with self._lock:
+            self._expire_idle()
+            return self._get(session_id)
+
+    def _get(self, session_id: str) -> AnalysisSession:
+        session = self._sessions.get(session_id)
+        if session is None:
+            session = AnalysisSession(session_id,
+                                      BasicDataAnalyzer(cache=self.cache),
+                                      self.history_factory(session_id))
+            self._sessions[session_id] = session
+
+        self._sessions.move_to_end(session_id)
+        session.last_access = time.time()
+
+        if session.spilled:
+            self._reload(session)
+            self._enforce_budget(exclude=session_id)
+
+        return session
+
+    def acquire(self, session_id: Optional[str] = None) -> AnalysisSession:
+        """
+        获取会话并增加引用计数，在release之前该会话的数据集不会被溢出或过期移除
+
+        Args:
+            session_id: 会话ID，默认取当前conversation-id
+
+        Returns:
+            AnalysisSession: 会话状态
+        """
+        session_id = resolve_session_id(session_id)
+
+        with self._lock:
+            self._expire_idle()
+            session = self._get(session_id)
+            session.pins += 1
+            return session
+
+    def release(self, session: AnalysisSession):
+        """
+        释放acquire获取的会话引用
+
+        Args:
+            session: acquire返回的会话
+        """
+        with self._lock:
+            session.pins = max(session.pins - 1, 0)
+            session.last_access = time.time()
+            if self._sessions.get(session.session_id) is session:
+                self._sessions.move_to_end(session.session_id)
+            if not session.pinned:
+                # 期间因固定而无法溢出的数据集可能仍超出预算
+                self._enforce_budget()
+
+    def account(self, session_id: Optional[str] = None) -> int:
+        """
+        重新统计会话数据集的内存占用，并在超出预算时溢出其他空闲会话
+
+        Args:
+            session_id: 会话ID
+
+        Returns:
+            int: 该会话数据集占用的字节数
+        """
+        session = self.get(session_id)
+
+        with self._lock:
+            df = session.analyzer.df
+            session.memory_bytes = int(df.memory_usage(deep=True).sum()) if df is not None else 0
+            self._enforce_budget(exclude=session.session_id)
+            return session.memory_bytes
+
+    def account_shared(self, session_id: str, nbytes: int):
+        """
+        记录其他组件为会话共享的数据集副本大小，计入全局内存预算
+
+        Args:
+            session_id: 会话ID
+            nbytes: 共享副本占用的字节数
+        """
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None or session.shared_bytes == nbytes:
+                return
+            session.shared_bytes = nbytes
+            self._enforce_budget(exclude=session_id)
+
+    def add_release_hook(self, hook: Callable[[str], None]):
+        """
+        注册释放回调：会话数据集被溢出、关闭或过期时以会话ID调用
+
+        Args:
+            hook: 回调函数
+        """
+        with self._lock:
+            self._release_hooks.append(hook)
+
+    def remove_release_hook(self, hook: Callable[[str], None]):
+        with self._lock:
+            if hook in self._release_hooks:
+                self._release_hooks.remove(hook)
+
+    def close(self, session_id: Optional[str] = None):
+        """移除会话并释放其数据"""
+        session_id = resolve_session_id(session_id)
+
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+            if session is not None:
+                self._release_shared(session)
+                self._discard_spill(session)
+                session.history.clear()
+
+    @property
+    def total_memory_bytes(self) -> int:
+        with self._lock:
+            return sum(session.resident_bytes for session in self._sessions.values() if not session.spilled)
+
+    def stats(self) -> Dict[str, Any]:
+        """获取注册表的内存统计"""
+        with self._lock:
+            return {
+                'sessions': len(self._sessions),
+                'resident_sessions': sum(1 for session in self._sessions.values() if not session.spilled),
+                'spilled_sessions': sum(1 for session in self._sessions.values() if session.spilled),
+                'pinned_sessions': sum(1 for session in self._sessions.values() if session.pinned),
+                'memory_bytes': self.total_memory_bytes,
+                'memory_budget_bytes': self.memory_budget_bytes
+            }
+
+    def _enforce_budget(self, exclude: Optional[str] = None):
+        total = self.total_memory_bytes
+        for session_id, session in list(self._sessions.items()):
+            if total <= self.memory_budget_bytes:
+                break
+            if session_id == exclude or session.pinned or session.spilled or session.analyzer.df is None:
+                continue
+            total -= session.resident_bytes
+            self._spill(session)
+
+        if total > self.memory_budget_bytes:
+            logger.warning("会话数据集内存占用 %d 字节仍超出预算 %d 字节", total, self.memory_budget_bytes)
+
+    def _spill(self, session: AnalysisSession):
+        """将空闲会话的数据集写入磁盘并释放内存"""
+        df = session.analyzer.df
+        session_digest = hashlib.blake2b(session.session_id.encode('utf-8'), digest_size=8).hexdigest()
+        base_path = os.path.join(self.spill_dir, f"{os.getpid()}_{session_digest}")
+
+        spill_path = base_path + '.feather'
+        try:
+            if feather is None:
+                raise ImportError("pyarrow不可用")
+            feather.write_feather(df, spill_path, compression='uncompressed')
+        except Exception:
+            # 无法转换为Arrow的数据退回pickle格式
+            if os.path.exists(spill_path):
+                os.remove(spill_path)
+            spill_path = base_path + '.pkl'
+            df.to_pickle(spill_path)
+
+        session.spill_path = spill_path
+        # 同时注销SQL引擎中的表并清空聚合缓存，否则其引用会让数据集继续驻留内存
+        session.analyzer.unload()
+        self._release_shared(session)
+        logger.info("会话 %s 的数据集已溢出到磁盘 (%d 字节)", session.session_id, session.memory_bytes)
+
+    def _reload(self, session: AnalysisSession):
+        """从溢出文件重新加载数据集"""
+        if session.spill_path.endswith('.feather'):
+            df = feather.read_feather(session.spill_path, memory_map=True)
+        else:
+            df = pd.read_pickle(session.spill_path)
+
+        session.analyzer.restore(df)
+        self._discard_spill(session)
+        session.memory_bytes = int(df.memory_usage(deep=True).sum())
+
+    def _release_shared(self, session: AnalysisSession):
+        for hook in list(self._release_hooks):
+            try:
+                hook(session.session_id)
+            except Exception as e:
+                logger.warning("释放会话 %s 的共享数据集失败: %s", session.session_id, e)
+        session.shared_bytes = 0
+
+    def _discard_spill(self, session: AnalysisSession):
+        if session.spill_path is not None:
+            try:
+                os.remove(session.spill_path)
+            except FileNotFoundError:
+                pass
+            session.spill_path = None
+
+    def expire_idle(self) -> int:
+        """
+        移除空闲超过idle_ttl的会话，由协调器定期调用
+
+        Returns:
+            int: 被移除的会话数
+        """
+        with self._lock:
+            return self._expire_idle()
+
+    def _expire_idle(self) -> int:
+        if self.idle_ttl is None:
+            return 0
+        deadline = time.time() - self.idle_ttl
+        expired = 0
+        for session_id, session in list(self._sessions.items()):
+            if session.last_access >= deadline:
+                # 有序字典按访问时间排列，后续会话均未过期
+                break
+            if session.pinned:
+                continue
+            self._sessions.pop(session_id)
+            self._release_shared(session)
+            self._discard_spill(session)
+            session.history.clear()
+            expired += 1
+        return expired
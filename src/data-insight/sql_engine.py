@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+嵌入式SQL查询引擎 - 基于DuckDB在进程内执行列式、多线程的分析查询
+已加载的数据集以零拷贝方式注册为表，查询带行数限制、超时和分页
+"""
+
+import re
+import threading
+import time
+from typing import Any
+from typing import Dict
+from typing import Optional
+
+import pandas as pd
+
+try:
+    import duckdb
+except ImportError:  # duckdb为可选依赖
+    duckdb = None
+
+# 数据集在SQL中的表名
+TABLE_NAME = 'data'
+
+_READ_ONLY_PATTERN = re.compile(r'^\s*(select|with)\b', re.IGNORECASE)
+
+
+def is_sql_query(query: str) -> bool:
+    """判断查询是否为SQL语句"""
+    return bool(_READ_ONLY_PATTERN.match(query))
+
+
+class SQLQueryEngine:
+    """DuckDB查询引擎"""
+
+    def __init__(self, max_rows: int = 10_000, timeout: float = 30.0, threads: Optional[int] = None):
+        """
+        Args:
+            max_rows: 单页返回的最大行数
+            timeout: 查询超时时间（秒）
+            threads: DuckDB工作线程数，默认使用全部CPU
+        """
+        if duckdb is None:
+            raise ImportError("duckdb未安装，无法执行SQL查询。请运行: pip install duckdb")
+
+        self.max_rows = max_rows
+        self.timeout = timeout
+        self._conn = duckdb.connect(database=':memory:')
+        if threads:
+            self._conn.execute(f"SET threads TO {int(threads)}")
+        # 查询只能访问已注册的数据集：禁止读写文件、ATTACH和网络访问，禁止自动安装/加载扩展，
+        # 最后锁定配置，查询语句无法再用SET放开这些限制（已锁定后仍可重新注册数据集）
+        self._conn.execute("SET autoinstall_known_extensions = false")
+        self._conn.execute("SET autoload_known_extensions = false")
+        self._conn.execute("SET enable_external_access = false")
+        self._conn.execute("SET lock_configuration = true")
+        self._lock = threading.Lock()
+        self._registered_version = None
+
+    def register(self, df: pd.DataFrame, version: Any = None):
+        """
+        注册数据集为SQL表（DuckDB直接扫描DataFrame内存，不复制数据）
+
+        Args:
+            df: 数据集
+            version: 数据集版本，版本未变化时跳过重新注册
+        """
+        with self._lock:
+            if version is not None and version == self._registered_version:
+                return
+            self._conn.register(TABLE_NAME, df)
+            self._registered_version = version
+
+    def execute(self, sql: str, page: int = 1, page_size: int = 100,
+                timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        执行只读SQL查询并返回一页结果
+
+        Args:
+            sql: SELECT/WITH查询语句，表名为data
+            page: 页码，从1开始
+            page_size: 每页行数，不超过max_rows
+            timeout: 超时时间（秒），默认使用引擎配置
+
+        Returns:
+            Dict: 查询结果
+        """
+        sql = sql.strip()
+        if not is_sql_query(sql):
+            raise ValueError("仅支持单条SELECT/WITH查询语句")
+        # 由DuckDB解析器拆分语句，字符串和注释中的分号不会被误判
+        statements = duckdb.extract_statements(sql)
+        if len(statements) != 1 or statements[0].type != duckdb.StatementType.SELECT:
+            raise ValueError("仅支持单条SELECT/WITH查询语句")
+
+        page = max(int(page), 1)
+        page_size = min(max(int(page_size), 1), self.max_rows)
+        offset = (page - 1) * page_size
+
+        timeout = self.timeout if timeout is None else timeout
+        timed_out = threading.Event()
+
+        def _interrupt():
+            timed_out.set()
+            self._conn.interrupt()
+
+        with self._lock:
+            timer = threading.Timer(timeout, _interrupt)
+            start = time.perf_counter()
+            timer.start()
+            try:
+                # 多取一行用于判断是否还有下一页
+                result = self._conn.sql(sql).limit(page_size + 1, offset).fetchdf()
+            except Exception as e:
+                if timed_out.is_set():
+                    raise TimeoutError(f"查询超过 {timeout} 秒未完成，已取消") from e
+                raise
+            finally:
+                timer.cancel()
+            elapsed = time.perf_counter() - start
+
+        has_more = len(result) > page_size
+        result = result.head(page_size)
+
+        return {
+            'columns': list(result.columns),
+            'rows': result.astype(object).where(result.notna(), None).to_dict(orient='records'),
+            'page': page,
+            'page_size': page_size,
+            'has_more': has_more,
+            'elapsed_ms': round(elapsed * 1000, 2)
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
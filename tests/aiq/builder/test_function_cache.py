@@ -0,0 +1,176 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+
+import pytest
+
+from aiq.builder.function_cache import CACHE_MISS
+from aiq.builder.function_cache import FunctionResultCache
+from aiq.builder.function_cache import InMemoryFunctionCache
+from aiq.data_models.function import FunctionBaseConfig
+from aiq.data_models.function_cache import FunctionCacheConfig
+
+
+class CachedFunctionConfig(FunctionBaseConfig, name="test_cached_function"):
+    a: int = 1
+
+
+def _make_cache(**config_kwargs) -> FunctionResultCache:
+    config = FunctionCacheConfig(**config_kwargs)
+    return FunctionResultCache(config, "fn", InMemoryFunctionCache(max_entries=config.max_entries))
+
+
+async def test_memory_cache_lru_eviction():
+    cache = InMemoryFunctionCache(max_entries=2)
+
+    await cache.set("a", 1, ttl=None)
+    await cache.set("b", 2, ttl=None)
+    assert await cache.get("a") == 1  # "b" is now the least recently used entry
+    await cache.set("c", 3, ttl=None)
+
+    assert await cache.get("a") == 1
+    assert await cache.get("b") is CACHE_MISS
+    assert await cache.get("c") == 3
+
+
+async def test_memory_cache_ttl(monkeypatch: pytest.MonkeyPatch):
+    now = 100.0
+    monkeypatch.setattr("aiq.builder.function_cache.time.monotonic", lambda: now)
+    cache = InMemoryFunctionCache()
+
+    await cache.set("a", 1, ttl=5)
+    await cache.set("b", 2, ttl=None)
+
+    now = 104.9
+    assert await cache.get("a") == 1
+
+    now = 105.0
+    assert await cache.get("a") is CACHE_MISS
+    assert await cache.get("b") == 2
+
+
+async def test_memory_cache_returns_copies():
+    cache = InMemoryFunctionCache()
+    value = {"items": [1, 2]}
+
+    await cache.set("a", value, ttl=None)
+    value["items"].append(3)
+    cached = await cache.get("a")
+    cached["items"].append(4)
+
+    assert await cache.get("a") == {"items": [1, 2]}
+
+
+async def test_get_or_call_caches_result():
+    cache = _make_cache()
+    calls = 0
+
+    async def fn():
+        nonlocal calls
+        calls += 1
+        return {"answer": 42}
+
+    assert await cache.get_or_call({"q": "x"}, fn) == {"answer": 42}
+    assert await cache.get_or_call({"q": "x"}, fn) == {"answer": 42}
+    assert await cache.get_or_call({"q": "y"}, fn) == {"answer": 42}
+    assert calls == 2
+
+
+async def test_key_fields():
+    cache = _make_cache(key_fields=["q"])
+
+    assert cache.make_key({"q": "x", "request_id": 1}) == cache.make_key({"q": "x", "request_id": 2})
+    assert cache.make_key({"q": "x"}) != cache.make_key({"q": "y"})
+
+
+async def test_single_flight():
+    cache = _make_cache()
+    calls = 0
+    release = asyncio.Event()
+
+    async def fn():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return {"answer": 42}
+
+    tasks = [asyncio.create_task(cache.get_or_call("x", fn)) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert calls == 1
+    assert results == [{"answer": 42}] * 5
+    # Waiting callers do not share the result object
+    assert len({id(result) for result in results}) == 5
+
+
+async def test_single_flight_shares_errors_without_caching_them():
+    cache = _make_cache()
+    calls = 0
+    release = asyncio.Event()
+
+    async def failing():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        raise ValueError("boom")
+
+    tasks = [asyncio.create_task(cache.get_or_call("x", failing)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert calls == 1
+    assert all(isinstance(result, ValueError) for result in results)
+
+    async def succeeding():
+        return "ok"
+
+    assert await cache.get_or_call("x", succeeding) == "ok"
+
+
+async def test_cancelled_leader_lets_waiter_run():
+    cache = _make_cache()
+    started = asyncio.Event()
+
+    async def slow():
+        started.set()
+        await asyncio.sleep(10)
+
+    async def fast():
+        return "ok"
+
+    leader = asyncio.create_task(cache.get_or_call("x", slow))
+    await started.wait()
+    waiter = asyncio.create_task(cache.get_or_call("x", fast))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await waiter == "ok"
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+
+def test_cache_config_round_trip():
+    # The FastAPI front end writes the configuration for its workers with this dump, caching must survive it
+    config = CachedFunctionConfig(a=2, cache=FunctionCacheConfig(ttl=10, key_fields=["q"]))
+
+    dumped = config.model_dump(mode="json", by_alias=True, round_trip=True)
+    assert dumped["cache"]["ttl"] == 10
+
+    restored = CachedFunctionConfig.model_validate(dumped)
+    assert restored.cache == config.cache
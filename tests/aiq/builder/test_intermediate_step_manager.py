@@ -0,0 +1,70 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from aiq.builder.context import AIQContextState
+from aiq.builder.intermediate_step_manager import IntermediateStepManager
+from aiq.data_models.intermediate_step import IntermediateStep
+from aiq.data_models.intermediate_step import IntermediateStepEvent
+from aiq.data_models.intermediate_step import IntermediateStepPayload
+from aiq.data_models.intermediate_step import IntermediateStepType
+from aiq.utils.reactive.subject import Subject
+
+
+@pytest.fixture(name="step_manager")
+def step_manager_fixture():
+    context_state = AIQContextState.get()
+    stream_token = context_state.event_stream.set(Subject())
+    stack_token = context_state.active_span_id_stack.set(["root"])
+    yield IntermediateStepManager(context_state)
+    context_state.active_span_id_stack.reset(stack_token)
+    context_state.event_stream.reset(stream_token)
+
+
+def test_subscribe_and_subscribe_events(step_manager: IntermediateStepManager):
+    steps: list[IntermediateStep] = []
+    events: list[IntermediateStepEvent] = []
+    step_manager.subscribe(on_next=steps.append)
+    step_manager.subscribe_events(on_next=events.append)
+
+    payload = IntermediateStepPayload(event_type=IntermediateStepType.LLM_START, name="llm")
+    step_manager.push_intermediate_step(payload)
+    step_manager.push_event(IntermediateStepType.LLM_NEW_TOKEN, UUID=payload.UUID, name="llm", data={"chunk": "a"})
+    step_manager.push_event(IntermediateStepType.LLM_END, UUID=payload.UUID, name="llm", data={"output": "a"})
+
+    assert [type(event) for event in events] == [IntermediateStepEvent] * 3
+    assert [type(step) for step in steps] == [IntermediateStep] * 3
+
+    # Both kinds of subscribers see the same steps, and share the models built from the events
+    assert [step.event_type for step in steps] == [event.event_type for event in events]
+    assert all(step is event.to_intermediate_step() for step, event in zip(steps, events))
+    assert steps[0].payload is payload
+    assert [step.parent_id for step in steps] == ["root"] * 3
+
+
+def test_push_event_drops_unmatched_steps(step_manager: IntermediateStepManager):
+    events: list[IntermediateStepEvent] = []
+    step_manager.subscribe_events(on_next=events.append)
+
+    step_manager.push_event(IntermediateStepType.LLM_NEW_TOKEN, UUID="unknown", data={"chunk": "a"})
+    step_manager.push_event(IntermediateStepType.LLM_END, UUID="unknown")
+
+    assert not events
+
+
+def test_push_event_rejects_span_timestamp_on_start(step_manager: IntermediateStepManager):
+    with pytest.raises(ValueError):
+        step_manager.push_event(IntermediateStepType.LLM_START, span_event_timestamp=1.0)
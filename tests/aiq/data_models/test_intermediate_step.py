@@ -0,0 +1,99 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from aiq.data_models.intermediate_step import IntermediateStep
+from aiq.data_models.intermediate_step import IntermediateStepEvent
+from aiq.data_models.intermediate_step import IntermediateStepPayload
+from aiq.data_models.intermediate_step import IntermediateStepType
+from aiq.data_models.intermediate_step import StreamEventData
+from aiq.data_models.intermediate_step import TraceMetadata
+from aiq.data_models.intermediate_step import UsageInfo
+from aiq.data_models.invocation_node import InvocationNode
+
+_ANCESTRY = InvocationNode(function_id="fn-1", function_name="fn")
+
+
+def _event(**kwargs) -> IntermediateStepEvent:
+    return IntermediateStepEvent(parent_id="root",
+                                 function_ancestry=_ANCESTRY,
+                                 event_type=IntermediateStepType.LLM_NEW_TOKEN,
+                                 UUID="step-1",
+                                 **kwargs)
+
+
+def test_models_built_lazily_from_dict_fields():
+    event = _event(data={
+        "chunk": "hel", "chunk_offset": 0
+    },
+                   metadata={"chat_responses": []},
+                   usage_info={"num_llm_calls": 1})
+
+    # Nothing is validated until a field is read
+    assert isinstance(event._data, dict)
+    assert isinstance(event._metadata, dict)
+    assert isinstance(event._usage_info, dict)
+    assert event._payload is None
+
+    data = event.data
+    assert isinstance(data, StreamEventData)
+    assert data.chunk == "hel"
+    assert data.chunk_offset == 0
+    assert event.data is data
+    assert isinstance(event._metadata, dict)
+
+    assert isinstance(event.metadata, TraceMetadata)
+    assert isinstance(event.usage_info, UsageInfo)
+    assert event.usage_info.num_llm_calls == 1
+
+
+def test_models_passed_through():
+    data = StreamEventData(input="prompt")
+    usage_info = UsageInfo(num_llm_calls=1)
+    event = _event(data=data, usage_info=usage_info)
+
+    assert event.data is data
+    assert event.usage_info is usage_info
+    assert event.metadata is None
+
+
+def test_from_payload_reuses_validated_payload():
+    payload = IntermediateStepPayload(event_type=IntermediateStepType.LLM_START,
+                                      name="llm",
+                                      data=StreamEventData(input="prompt"),
+                                      metadata={"custom": "value"})
+
+    event = IntermediateStepEvent.from_payload("root", _ANCESTRY, payload)
+
+    assert event.payload is payload
+    assert event.UUID == payload.UUID
+    assert event.event_timestamp == payload.event_timestamp
+    assert event.data is payload.data
+    # Metadata stays as validated by the payload
+    assert event.metadata == {"custom": "value"}
+    assert event.to_intermediate_step().payload is payload
+
+
+def test_to_intermediate_step_built_once():
+    event = _event(data={"chunk": "hel"}, event_timestamp=123.0)
+
+    step = event.to_intermediate_step()
+    assert isinstance(step, IntermediateStep)
+    assert event.to_intermediate_step() is step
+    assert step.parent_id == "root"
+    assert step.function_ancestry == _ANCESTRY
+    assert step.UUID == "step-1"
+    assert step.event_timestamp == 123.0
+    assert step.data.chunk == "hel"
+    assert step.payload is event.payload
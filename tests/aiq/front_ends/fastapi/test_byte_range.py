@@ -0,0 +1,95 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+from fastapi import HTTPException
+
+from aiq.front_ends.fastapi.fastapi_front_end_plugin_worker import _parse_byte_range
+
+
+@pytest.mark.parametrize("range_header, size, expected",
+                         [
+                             ("bytes=0-99", 1000, (0, 100)),
+                             ("bytes=100-199", 1000, (100, 200)),
+                             ("bytes=999-999", 1000, (999, 1000)),
+                             ("bytes=-100", 1000, (900, 1000)),
+                             ("bytes=-5000", 1000, (0, 1000)),
+                             ("bytes=500-", 1000, (500, 1000)),
+                             ("bytes=900-5000", 1000, (900, 1000)),
+                             ("Bytes = 0-9", 1000, (0, 10)),
+                         ],
+                         ids=[
+                             "first_bytes",
+                             "middle",
+                             "last_byte",
+                             "suffix",
+                             "suffix_longer_than_object",
+                             "open_ended",
+                             "end_past_size",
+                             "case_and_spaces",
+                         ])
+def test_satisfiable_range(range_header: str, size: int, expected: tuple[int, int]):
+    assert _parse_byte_range(range_header, size) == expected
+
+
+@pytest.mark.parametrize("range_header",
+                         [
+                             None,
+                             "",
+                             "bytes=0-9,20-29",
+                             "bytes=-5,0-1",
+                             "items=0-9",
+                             "bytes=",
+                             "bytes=-",
+                             "bytes=abc-def",
+                             "bytes=10",
+                             "bytes=20-10",
+                             "bytes=--5",
+                         ],
+                         ids=[
+                             "no_header",
+                             "empty_header",
+                             "multiple_ranges",
+                             "multiple_ranges_with_suffix",
+                             "other_unit",
+                             "no_range",
+                             "dash_only",
+                             "not_numbers",
+                             "no_dash",
+                             "end_before_start",
+                             "negative",
+                         ])
+def test_whole_object_sent(range_header: str | None):
+    # Multiple and malformed ranges fall back to a 200 response with the whole object
+    assert _parse_byte_range(range_header, 1000) is None
+
+
+@pytest.mark.parametrize("range_header", ["bytes=1000-", "bytes=1000-1999", "bytes=5000-6000", "bytes=-0"])
+def test_unsatisfiable_range(range_header: str):
+    with pytest.raises(HTTPException) as exc_info:
+        _parse_byte_range(range_header, 1000)
+
+    assert exc_info.value.status_code == 416
+    assert exc_info.value.headers == {"Content-Range": "bytes */1000"}
+
+
+def test_empty_object():
+    assert _parse_byte_range(None, 0) is None
+
+    for range_header in ("bytes=0-", "bytes=0-0", "bytes=-10"):
+        with pytest.raises(HTTPException) as exc_info:
+            _parse_byte_range(range_header, 0)
+        assert exc_info.value.status_code == 416
+        assert exc_info.value.headers == {"Content-Range": "bytes */0"}
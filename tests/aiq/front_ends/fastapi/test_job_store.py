@@ -0,0 +1,176 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from datetime import UTC
+from datetime import datetime
+from datetime import timedelta
+
+import pytest
+from pydantic import BaseModel
+
+from aiq.front_ends.fastapi import job_store as job_store_module
+from aiq.front_ends.fastapi.job_store import JobStatus
+from aiq.front_ends.fastapi.job_store import JobStore
+from aiq.front_ends.fastapi.job_store import JobStoreBase
+from aiq.front_ends.fastapi.sqlite_job_store import SQLiteJobStore
+
+
+class _Output(BaseModel):
+    value: str
+
+
+@pytest.fixture(name="job_store", params=["memory", "sqlite"])
+async def job_store_fixture(request, tmp_path):
+    if request.param == "memory":
+        store = JobStore()
+    else:
+        store = SQLiteJobStore(str(tmp_path / "jobs.db"), poll_interval=0.05)
+    yield store
+    await store.aclose()
+
+
+async def test_create_and_get(job_store: JobStoreBase):
+    job_id = await job_store.create_job(config_file="config.yml", expiry_seconds=1)
+
+    job = await job_store.get_job(job_id)
+    assert job.status == JobStatus.SUBMITTED
+    assert job.config_file == "config.yml"
+    assert job.expiry_seconds == job_store.MIN_EXPIRY
+    assert await job_store.get_status(job_id) == job
+    assert await job_store.get_job("missing") is None
+
+
+async def test_update_status(job_store: JobStoreBase):
+    job_id = await job_store.create_job()
+
+    await job_store.update_status(job_id, "success", output_path="/tmp/out", output=_Output(value="done"))
+
+    job = await job_store.get_job(job_id)
+    assert job.status == JobStatus.SUCCESS
+    assert job.output_path == "/tmp/out"
+    output = job.output if isinstance(job.output, dict) else job.output.model_dump()
+    assert output == {"value": "done"}
+
+    with pytest.raises(ValueError):
+        await job_store.update_status("missing", "success")
+
+
+async def test_queries(job_store: JobStoreBase):
+    first = await job_store.create_job()
+    second = await job_store.create_job()
+    await job_store.update_status(first, "running")
+
+    assert [job.job_id for job in await job_store.get_all_jobs()] == [first, second]
+    assert (await job_store.get_last_job()).job_id == second
+    assert [job.job_id for job in await job_store.get_jobs_by_status("running")] == [first]
+    assert [job.job_id for job in await job_store.get_jobs_by_status("submitted")] == [second]
+
+
+async def test_wait_for_job(job_store: JobStoreBase):
+    job_id = await job_store.create_job()
+
+    waiter = asyncio.create_task(job_store.wait_for_job(job_id))
+    await asyncio.sleep(0.01)
+    assert not waiter.done()
+
+    await job_store.update_status(job_id, "running")
+    await asyncio.sleep(0.01)
+    assert not waiter.done()
+
+    await job_store.update_status(job_id, "failure", error="boom")
+    job = await asyncio.wait_for(waiter, timeout=1)
+    assert job.status == JobStatus.FAILURE
+    assert job.error == "boom"
+    assert not job_store._waiters
+
+
+async def test_wait_for_job_timeout(job_store: JobStoreBase):
+    job_id = await job_store.create_job()
+
+    job = await job_store.wait_for_job(job_id, timeout=0.1)
+
+    assert job.status == JobStatus.SUBMITTED
+    assert await job_store.wait_for_job("missing") is None
+    assert not job_store._waiters
+
+
+async def test_cleanup_expired_jobs(job_store: JobStoreBase, tmp_path, monkeypatch):
+    old_jobs = []
+    for name in ("old", "older"):
+        output_path = tmp_path / name
+        output_path.mkdir()
+        job_id = await job_store.create_job()
+        await job_store.update_status(job_id, "success", output_path=str(output_path))
+        old_jobs.append((job_id, output_path))
+    recent = await job_store.create_job()
+    await job_store.update_status(recent, "success")
+    active = await job_store.create_job()
+
+    later = datetime.now(UTC) + timedelta(seconds=job_store.DEFAULT_EXPIRY + 1)
+
+    class _Later(datetime):
+
+        @classmethod
+        def now(cls, tz=None):
+            return later
+
+    monkeypatch.setattr(job_store_module, "datetime", _Later)
+    await job_store.cleanup_expired_jobs()
+
+    # The most recently finished job is kept, active jobs never expire
+    assert {job.job_id for job in await job_store.get_all_jobs()} == {recent, active}
+    for _, output_path in old_jobs:
+        assert not output_path.exists()
+
+
+async def test_sqlite_shared_between_instances(tmp_path):
+    path = str(tmp_path / "jobs.db")
+    worker = SQLiteJobStore(path, namespace="generate")
+    other_worker = SQLiteJobStore(path, namespace="generate", poll_interval=0.05)
+    other_route = SQLiteJobStore(path, namespace="evaluate")
+    try:
+        job_id = await worker.create_job()
+        assert (await other_worker.get_job(job_id)).status == JobStatus.SUBMITTED
+        assert await other_route.get_job(job_id) is None
+
+        # Waiters of other instances notice the update by polling
+        waiter = asyncio.create_task(other_worker.wait_for_job(job_id, timeout=5))
+        await asyncio.sleep(0.1)
+        await worker.update_status(job_id, "success", output={"value": "done"})
+
+        job = await asyncio.wait_for(waiter, timeout=1)
+        assert job.status == JobStatus.SUCCESS
+        assert job.output == {"value": "done"}
+    finally:
+        for store in (worker, other_worker, other_route):
+            await store.aclose()
+
+
+async def test_sqlite_survives_restart(tmp_path):
+    path = str(tmp_path / "jobs.db")
+    store = SQLiteJobStore(path)
+    job_id = await store.create_job(config_file="config.yml")
+    await store.update_status(job_id, "interrupted")
+    await store.aclose()
+
+    store = SQLiteJobStore(path)
+    try:
+        job = await store.get_job(job_id)
+        assert job.status == JobStatus.INTERRUPTED
+        assert job.config_file == "config.yml"
+        assert (await store.get_last_job()).job_id == job_id
+    finally:
+        await store.aclose()
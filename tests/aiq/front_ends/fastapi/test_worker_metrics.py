@@ -0,0 +1,84 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import multiprocessing
+import os
+
+from fastapi import Request
+from fastapi import Response
+
+from aiq.front_ends.fastapi.worker_metrics import WorkerMetrics
+
+
+async def _ok(request: Request) -> Response:
+    return Response(status_code=200)
+
+
+def _serve(metrics: WorkerMetrics, ready, done) -> None:
+    asyncio.run(metrics.middleware(None, _ok))
+    metrics.flush()
+    ready.put(os.getpid())
+    done.wait(timeout=30)
+
+
+def test_forked_workers_report_their_own_pid(tmp_path):
+    # Created before forking, as with gunicorn --preload
+    metrics = WorkerMetrics(metrics_dir=str(tmp_path))
+
+    context = multiprocessing.get_context("fork")
+    ready = context.Queue()
+    done = context.Event()
+    workers = [context.Process(target=_serve, args=(metrics, ready, done)) for _ in range(2)]
+    for worker in workers:
+        worker.start()
+    try:
+        worker_pids = {ready.get(timeout=30) for _ in workers}
+        assert worker_pids == {worker.pid for worker in workers}
+        assert sorted(os.listdir(tmp_path)) == sorted(f"{pid}.json" for pid in worker_pids)
+
+        output = metrics.render_prometheus()
+        for pid in worker_pids:
+            assert f'aiq_worker_uptime_seconds{{worker="{pid}"}}' in output
+            assert f'aiq_worker_requests_total{{worker="{pid}",status="2xx"}} 1' in output
+        assert f'aiq_worker_uptime_seconds{{worker="{os.getpid()}"}}' in output
+    finally:
+        done.set()
+        for worker in workers:
+            worker.join(timeout=30)
+
+
+def test_forked_worker_starts_over():
+    metrics = WorkerMetrics()
+    metrics.requests_total["2xx"] = 3
+    metrics.request_seconds_sum = 1.5
+
+    context = multiprocessing.get_context("fork")
+    results = context.Queue()
+
+    def child():
+        snapshot = metrics.snapshot()
+        results.put((snapshot["pid"], snapshot["requests_total"], snapshot["request_seconds_sum"]))
+
+    worker = context.Process(target=child)
+    worker.start()
+    pid, requests_total, request_seconds_sum = results.get(timeout=30)
+    worker.join(timeout=30)
+
+    assert pid == worker.pid
+    assert requests_total == {}
+    assert request_seconds_sum == 0.0
+    assert metrics.pid == os.getpid()
+    assert metrics.requests_total == {"2xx": 3}
@@ -0,0 +1,191 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import uuid
+from contextlib import asynccontextmanager
+
+from aiq.builder.builder import Builder
+from aiq.builder.context import AIQContextState
+from aiq.builder.intermediate_step_manager import IntermediateStepManager
+from aiq.builder.workflow_builder import WorkflowBuilder
+from aiq.cli.register_workflow import register_telemetry_exporter
+from aiq.data_models.config import GeneralConfig
+from aiq.data_models.config import TelemetryConfig
+from aiq.data_models.intermediate_step import IntermediateStepType
+from aiq.data_models.span import Span
+from aiq.data_models.telemetry_exporter import TelemetryExporterBaseConfig
+from aiq.observability.exporter.span_exporter import SpanExporter
+from aiq.observability.exporter_manager import ExporterManager
+from aiq.tool.datetime_tools import CurrentTimeToolConfig
+from aiq.utils.reactive.subject import Subject
+
+
+class _RecordingSpanExporter(SpanExporter[Span, Span]):
+
+    def __init__(self):
+        super().__init__()
+        self.spans: list[Span] = []
+        self.starts = 0
+        self.stops = 0
+
+    async def export_processed(self, item: Span) -> None:
+        self.spans.append(item)
+
+    @asynccontextmanager
+    async def start_shared(self):
+        self.starts += 1
+        try:
+            async with super().start_shared():
+                yield
+        finally:
+            self.stops += 1
+
+
+class _RecordingSpanExporterConfig(TelemetryExporterBaseConfig, name="test_shared_pipeline_recorder"):
+    pass
+
+
+@register_telemetry_exporter(config_type=_RecordingSpanExporterConfig)
+async def _recording_span_exporter(config: _RecordingSpanExporterConfig, builder: Builder):
+    yield _RecordingSpanExporter()
+
+
+async def _run(manager: ExporterManager,
+               name: str,
+               child_started: asyncio.Event,
+               release: asyncio.Event,
+               end_root: bool = True) -> tuple[str, str]:
+    """Run a workflow with a root step and a child step, pausing while both are open."""
+    context_state = AIQContextState.get()
+    context_state.event_stream.set(Subject())
+    context_state.active_span_id_stack.set(["root"])
+    step_manager = IntermediateStepManager(context_state)
+
+    root_id = str(uuid.uuid4())
+    child_id = str(uuid.uuid4())
+
+    async with manager.start(context_state=context_state):
+        step_manager.push_event(IntermediateStepType.WORKFLOW_START, UUID=root_id, name=name)
+        step_manager.push_event(IntermediateStepType.TOOL_START, UUID=child_id, name=f"{name}_tool")
+        child_started.set()
+        await release.wait()
+        step_manager.push_event(IntermediateStepType.TOOL_END, UUID=child_id, name=f"{name}_tool")
+        if end_root:
+            step_manager.push_event(IntermediateStepType.WORKFLOW_END, UUID=root_id, name=name)
+
+    return root_id, child_id
+
+
+async def test_concurrent_runs_keep_separate_span_trees():
+    exporter = _RecordingSpanExporter()
+    manager = ExporterManager.from_exporters({"recorder": exporter}, shared_pipeline=True)
+
+    started_a = asyncio.Event()
+    started_b = asyncio.Event()
+    release = asyncio.Event()
+    try:
+        run_a = asyncio.create_task(_run(manager, "run_a", started_a, release))
+        run_b = asyncio.create_task(_run(manager, "run_b", started_b, release))
+
+        # Both runs have their root and child spans open on the same exporter at the same time
+        await started_a.wait()
+        await started_b.wait()
+        assert len(exporter._outstanding_spans) == 4
+        release.set()
+        await asyncio.gather(run_a, run_b)
+    finally:
+        await manager.stop()
+
+    assert exporter.starts == 1
+    assert exporter.stops == 1
+
+    spans = {span.name: span for span in exporter.spans}
+    assert set(spans) == {"run_a", "run_a_tool", "run_b", "run_b_tool"}
+
+    for name in ("run_a", "run_b"):
+        root = spans[name]
+        child = spans[f"{name}_tool"]
+        assert root.parent is None
+        assert child.parent is not None and child.parent.name == name
+        assert child.context.trace_id == root.context.trace_id
+
+    assert spans["run_a"].context.trace_id != spans["run_b"].context.trace_id
+    assert not exporter._outstanding_spans
+    assert not exporter._span_stack
+
+
+async def test_release_steps_ends_spans_left_open():
+    exporter = _RecordingSpanExporter()
+    manager = ExporterManager.from_exporters({"recorder": exporter}, shared_pipeline=True)
+
+    started_a = asyncio.Event()
+    started_b = asyncio.Event()
+    release_a = asyncio.Event()
+    release_b = asyncio.Event()
+    try:
+        # Run a never ends its root step, run b is still in flight when run a finishes
+        run_a = asyncio.create_task(_run(manager, "run_a", started_a, release_a, end_root=False))
+        run_b = asyncio.create_task(_run(manager, "run_b", started_b, release_b))
+        await started_a.wait()
+        await started_b.wait()
+
+        open_spans = {span.name: span for span in exporter._outstanding_spans.values()}
+
+        release_a.set()
+        root_a, _ = await run_a
+
+        assert open_spans["run_a"].end_time is not None
+        assert root_a not in exporter._outstanding_spans
+        assert root_a not in exporter._span_stack
+        assert root_a not in exporter._metadata_stack
+
+        # The steps of the other run are untouched
+        assert open_spans["run_b"].end_time is None
+        assert open_spans["run_b_tool"].end_time is None
+        assert len(exporter._outstanding_spans) == 2
+
+        release_b.set()
+        await run_b
+    finally:
+        await manager.stop()
+
+    assert not exporter._outstanding_spans
+    assert {span.name for span in exporter.spans} == {"run_a_tool", "run_b", "run_b_tool"}
+
+
+async def test_builder_shares_one_pipeline_between_workflows():
+    general_config = GeneralConfig(
+        telemetry=TelemetryConfig(tracing={"recorder": _RecordingSpanExporterConfig()}, shared_exporter_pipeline=True))
+
+    async with WorkflowBuilder(general_config=general_config) as builder:
+        await builder.set_workflow(CurrentTimeToolConfig())
+
+        first = builder.build()
+        second = builder.build()
+        assert first.exporter_manager is second.exporter_manager
+
+        async def run(workflow):
+            async with workflow.run("now") as runner:
+                return await runner.result(to_type=str)
+
+        await asyncio.gather(run(first), run(second), run(first))
+
+        exporter = first.exporter_manager.get_exporter("recorder")
+        assert exporter.starts == 1
+        assert exporter.stops == 0
+
+    assert exporter.starts == 1
+    assert exporter.stops == 1
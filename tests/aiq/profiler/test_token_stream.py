@@ -0,0 +1,156 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import uuid
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration
+from langchain_core.outputs import LLMResult
+
+from aiq.builder.context import AIQContext
+from aiq.builder.context import AIQContextState
+from aiq.data_models.config import TokenStreamConfig
+from aiq.data_models.intermediate_step import IntermediateStep
+from aiq.data_models.intermediate_step import IntermediateStepType
+from aiq.profiler.callbacks.langchain_callback_handler import LangchainProfilerHandler
+from aiq.profiler.callbacks.token_stream import StreamedText
+from aiq.profiler.callbacks.token_stream import set_token_stream_config
+from aiq.utils.reactive.subject import Subject
+
+
+@pytest.fixture(name="steps")
+def steps_fixture():
+    context_state = AIQContextState.get()
+    token = context_state.event_stream.set(Subject())
+    steps: list[IntermediateStep] = []
+    subscription = AIQContext.get().intermediate_step_manager.subscribe(on_next=steps.append)
+    yield steps
+    subscription.unsubscribe()
+    context_state.event_stream.reset(token)
+    set_token_stream_config(TokenStreamConfig())
+
+
+@pytest.fixture(name="clock")
+def clock_fixture(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+    return clock
+
+
+async def _start(handler: LangchainProfilerHandler) -> uuid.UUID:
+    run_id = uuid.uuid4()
+    await handler.on_llm_start({}, ["What is the answer?"], run_id=run_id, metadata={"ls_model_name": "test-model"})
+    return run_id
+
+
+async def _end(handler: LangchainProfilerHandler, run_id: uuid.UUID, output: str) -> None:
+    result = LLMResult(generations=[[ChatGeneration(message=AIMessage(content=output))]])
+    await handler.on_llm_end(result, run_id=run_id)
+
+
+def _tokens(steps: list[IntermediateStep]) -> list[IntermediateStep]:
+    return [step for step in steps if step.event_type == IntermediateStepType.LLM_NEW_TOKEN]
+
+
+def test_full_mode_is_default():
+    assert TokenStreamConfig().mode == "full"
+
+
+async def test_coalesce_by_token_count(steps):
+    set_token_stream_config(TokenStreamConfig(mode="delta", coalesce_tokens=2))
+    handler = LangchainProfilerHandler()
+    run_id = await _start(handler)
+
+    for token in ("The ", "answer ", "is ", "42"):
+        await handler.on_llm_new_token(token, run_id=run_id)
+
+    tokens = _tokens(steps)
+    assert [step.data.chunk for step in tokens] == ["The answer ", "is 42"]
+    assert [step.data.chunk_offset for step in tokens] == [0, 11]
+    assert [step.data.chunk_tokens for step in tokens] == [2, 2]
+    assert all(step.data.input is None for step in tokens)
+
+
+async def test_coalesce_by_interval(steps, clock):
+    set_token_stream_config(TokenStreamConfig(mode="delta", coalesce_tokens=100, coalesce_interval_ms=50))
+    handler = LangchainProfilerHandler()
+    run_id = await _start(handler)
+
+    await handler.on_llm_new_token("a", run_id=run_id)
+    clock[0] += 0.02
+    await handler.on_llm_new_token("b", run_id=run_id)
+    assert not _tokens(steps)
+
+    # The age of the oldest buffered token is checked when the next token arrives
+    clock[0] += 0.04
+    await handler.on_llm_new_token("c", run_id=run_id)
+    await handler.on_llm_new_token("d", run_id=run_id)
+
+    tokens = _tokens(steps)
+    assert [(step.data.chunk, step.data.chunk_offset) for step in tokens] == [("abc", 0)]
+
+
+async def test_remaining_tokens_flushed_before_llm_end(steps):
+    set_token_stream_config(TokenStreamConfig(mode="delta", coalesce_tokens=3))
+    handler = LangchainProfilerHandler()
+    run_id = await _start(handler)
+
+    for token in ("a", "b", "c", "d", "e"):
+        await handler.on_llm_new_token(token, run_id=run_id)
+    await _end(handler, run_id, "abcde")
+
+    assert [step.event_type for step in steps] == [
+        IntermediateStepType.LLM_START,
+        IntermediateStepType.LLM_NEW_TOKEN,
+        IntermediateStepType.LLM_NEW_TOKEN,
+        IntermediateStepType.LLM_END,
+    ]
+    assert [(step.data.chunk, step.data.chunk_offset) for step in _tokens(steps)] == [("abc", 0), ("de", 3)]
+    assert not handler._run_id_to_token_buffer
+
+
+async def test_llm_error_drops_buffered_tokens(steps):
+    set_token_stream_config(TokenStreamConfig(mode="delta", coalesce_tokens=10))
+    handler = LangchainProfilerHandler()
+    run_id = await _start(handler)
+
+    await handler.on_llm_new_token("a", run_id=run_id)
+    assert str(run_id) in handler._run_id_to_token_buffer
+
+    await handler.on_llm_error(RuntimeError("boom"), run_id=run_id)
+    assert not handler._run_id_to_token_buffer
+    assert str(run_id) not in handler._run_id_to_llm_input
+
+
+@pytest.mark.parametrize("mode", ["full", "delta"])
+async def test_streamed_text_reassembles_output(steps, mode):
+    set_token_stream_config(TokenStreamConfig(mode=mode, coalesce_tokens=2))
+    handler = LangchainProfilerHandler()
+    run_id = await _start(handler)
+
+    for token in ("The ", "answer ", "is ", "42", "!"):
+        await handler.on_llm_new_token(token, run_id=run_id)
+    await _end(handler, run_id, "The answer is 42!")
+
+    streamed_text = StreamedText()
+    # Chunks with an offset are placed correctly even when delivered out of order
+    for step in reversed(_tokens(steps)) if mode == "delta" else _tokens(steps):
+        streamed_text.add(step)
+
+    assert streamed_text.text(str(run_id)) == "The answer is 42!"
+    assert streamed_text.pop(str(run_id)) == "The answer is 42!"
+    assert streamed_text.text(str(run_id)) == ""
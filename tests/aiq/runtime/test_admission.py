@@ -0,0 +1,240 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+
+import pytest
+
+from aiq.runtime.admission import AdmissionController
+from aiq.runtime.admission import AdmissionRejectedError
+from aiq.runtime.admission import RequestPriority
+
+
+async def _hold(controller: AdmissionController,
+                order: list[str],
+                name: str,
+                release: asyncio.Event,
+                priority: RequestPriority = RequestPriority.SYNC,
+                key: str | None = None):
+    async with controller.admit(priority, key):
+        order.append(name)
+        await release.wait()
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def test_priority_order():
+    controller = AdmissionController(max_concurrency=1)
+    order: list[str] = []
+    release = asyncio.Event()
+
+    blocker_release = asyncio.Event()
+    blocker = asyncio.create_task(_hold(controller, order, "blocker", blocker_release))
+    await _settle()
+
+    tasks = [
+        asyncio.create_task(_hold(controller, order, "evaluation", release, RequestPriority.EVALUATION)),
+        asyncio.create_task(_hold(controller, order, "async", release, RequestPriority.ASYNC)),
+        asyncio.create_task(_hold(controller, order, "interactive", release, RequestPriority.INTERACTIVE)),
+    ]
+    await _settle()
+    assert controller.queued == 3
+
+    release.set()
+    blocker_release.set()
+    await asyncio.gather(blocker, *tasks)
+
+    assert order == ["blocker", "interactive", "async", "evaluation"]
+    assert controller.in_flight == 0
+
+
+async def test_fair_share_rotates_between_keys():
+    controller = AdmissionController(max_concurrency=1)
+    order: list[str] = []
+    release = asyncio.Event()
+
+    blocker_release = asyncio.Event()
+    blocker = asyncio.create_task(_hold(controller, order, "blocker", blocker_release))
+    await _settle()
+
+    # User "a" queues three runs before user "b" queues any
+    tasks = [asyncio.create_task(_hold(controller, order, f"a{i}", release, key="a")) for i in range(3)]
+    await _settle()
+    tasks += [asyncio.create_task(_hold(controller, order, f"b{i}", release, key="b")) for i in range(2)]
+    await _settle()
+
+    release.set()
+    blocker_release.set()
+    await asyncio.gather(blocker, *tasks)
+
+    assert order == ["blocker", "a0", "b0", "a1", "b1", "a2"]
+
+
+async def test_queue_full_rejects_immediately():
+    controller = AdmissionController(max_concurrency=1, max_queue_size=1)
+    order: list[str] = []
+    release = asyncio.Event()
+
+    running = asyncio.create_task(_hold(controller, order, "running", release))
+    queued = asyncio.create_task(_hold(controller, order, "queued", release))
+    await _settle()
+
+    with pytest.raises(AdmissionRejectedError) as exc_info:
+        async with controller.admit():
+            pass
+    assert exc_info.value.queue_full
+    assert exc_info.value.retry_after >= 1.0
+
+    # Other priority classes have their own queue
+    interactive = asyncio.create_task(_hold(controller, order, "interactive", release, RequestPriority.INTERACTIVE))
+    await _settle()
+
+    release.set()
+    await asyncio.gather(running, queued, interactive)
+    assert controller.stats()["admission_rejected_total"] == 1
+
+
+async def test_queue_timeout_rejects():
+    controller = AdmissionController(max_concurrency=1, queue_timeout=0.01)
+    order: list[str] = []
+    release = asyncio.Event()
+
+    running = asyncio.create_task(_hold(controller, order, "running", release))
+    await _settle()
+
+    with pytest.raises(AdmissionRejectedError) as exc_info:
+        async with controller.admit():
+            pass
+    assert not exc_info.value.queue_full
+    assert controller.queued == 0
+
+    release.set()
+    await running
+    assert controller.in_flight == 0
+    assert controller.stats()["admission_timed_out_total"] == 1
+
+
+async def test_cancelled_waiter_leaves_the_queue():
+    controller = AdmissionController(max_concurrency=1)
+    order: list[str] = []
+    release = asyncio.Event()
+
+    running = asyncio.create_task(_hold(controller, order, "running", release))
+    await _settle()
+    cancelled = asyncio.create_task(_hold(controller, order, "cancelled", release))
+    await _settle()
+    assert controller.queued == 1
+
+    cancelled.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+    assert controller.queued == 0
+
+    release.set()
+    await running
+    assert order == ["running"]
+    assert controller.in_flight == 0
+
+
+async def test_cancelled_after_admission_releases_the_slot():
+    controller = AdmissionController(max_concurrency=1)
+    order: list[str] = []
+    release = asyncio.Event()
+    next_release = asyncio.Event()
+
+    running = asyncio.create_task(_hold(controller, order, "running", release))
+    await _settle()
+    admitted = asyncio.create_task(_hold(controller, order, "admitted", next_release))
+    following = asyncio.create_task(_hold(controller, order, "following", next_release))
+    await _settle()
+
+    # The first waiter is admitted by the release but cancelled before it gets to run
+    release.set()
+    await running
+    admitted.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await admitted
+
+    next_release.set()
+    await following
+    assert order == ["running", "following"]
+    assert controller.in_flight == 0
+
+
+async def test_cancelled_run_releases_the_slot():
+    controller = AdmissionController(max_concurrency=1)
+    order: list[str] = []
+    release = asyncio.Event()
+
+    running = asyncio.create_task(_hold(controller, order, "running", asyncio.Event()))
+    await _settle()
+    running.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await running
+    assert controller.in_flight == 0
+
+    release.set()
+    await _hold(controller, order, "next", release)
+    assert order == ["running", "next"]
+
+
+def test_adaptive_limit_shrinks_on_slow_runs():
+    controller = AdmissionController(max_concurrency=10, min_concurrency=2, adaptive=True, backoff_ratio=0.5)
+
+    controller._adapt(1.0)  # establishes the baseline latency
+    assert controller.limit == 10
+
+    controller._adapt(5.0)
+    assert controller.limit == 5
+
+    for _ in range(10):
+        controller._adapt(5.0)
+    assert controller.limit == 2
+
+
+async def test_adaptive_limit_grows_back_while_runs_are_queued():
+    controller = AdmissionController(max_concurrency=4, min_concurrency=1, adaptive=True, backoff_ratio=0.25)
+    controller._adapt(1.0)
+    controller._adapt(10.0)
+    assert controller.limit == 1
+
+    # Healthy latency without a queue keeps the limit
+    controller._adapt(1.0)
+    assert controller.limit == 1
+
+    order: list[str] = []
+    release = asyncio.Event()
+    running = asyncio.create_task(_hold(controller, order, "running", release))
+    queued = asyncio.create_task(_hold(controller, order, "queued", release))
+    await _settle()
+    assert controller.queued == 1
+
+    for _ in range(20):
+        controller._adapt(1.0)
+    assert controller.limit == 4
+
+    release.set()
+    await asyncio.gather(running, queued)
+
+
+async def test_unlimited_controller_admits_everything():
+    controller = AdmissionController(max_concurrency=0)
+
+    async with controller.admit():
+        async with controller.admit():
+            assert controller.in_flight == 0
@@ -0,0 +1,190 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import anyio
+import pytest
+
+from aiq.tool.mcp import mcp_session_pool
+from aiq.tool.mcp.mcp_session_pool import MCPSessionPool
+from aiq.tool.mcp.mcp_session_pool import shared_session_pool
+
+
+class _FakeSession:
+
+    def __init__(self, index: int):
+        self.index = index
+        self.closed = False
+        self.broken = False
+        self.calls = 0
+
+    async def call(self, release: asyncio.Event | None = None) -> int:
+        self.calls += 1
+        if release is not None:
+            await release.wait()
+        if self.broken:
+            raise anyio.ClosedResourceError()
+        return self.index
+
+
+class _FakeConnector:
+    """Connect factory handing out fake sessions, recording how many were opened and closed."""
+
+    def __init__(self):
+        self.sessions: list[_FakeSession] = []
+
+    @asynccontextmanager
+    async def __call__(self):
+        session = _FakeSession(len(self.sessions))
+        self.sessions.append(session)
+        try:
+            yield session
+        finally:
+            session.closed = True
+
+
+def _pool(connector: _FakeConnector, **kwargs) -> MCPSessionPool:
+    kwargs.setdefault("health_check_interval", None)
+    kwargs.setdefault("backoff_base", 0.0)
+    return MCPSessionPool("http://fake", connector, **kwargs)
+
+
+def _kill(pool: MCPSessionPool) -> None:
+    """Make the transport of every open session die, as if the server went away."""
+    for pooled in pool._sessions:
+        pooled._task.cancel()
+
+
+async def test_sessions_reused():
+    connector = _FakeConnector()
+    async with _pool(connector) as pool:
+        assert await pool.run(lambda session: session.call()) == 0
+        assert await pool.run(lambda session: session.call()) == 0
+
+    assert len(connector.sessions) == 1
+    assert connector.sessions[0].closed
+
+
+async def test_reconnect_after_dead_session():
+    connector = _FakeConnector()
+    async with _pool(connector) as pool:
+        assert await pool.run(lambda session: session.call()) == 0
+
+        _kill(pool)
+        await asyncio.sleep(0)
+        assert pool.size == 0
+
+        assert await pool.run(lambda session: session.call(), idempotent=False) == 1
+        assert connector.sessions[0].closed
+        assert pool.size == 1
+
+
+async def test_idempotent_call_retried_on_new_session():
+    connector = _FakeConnector()
+    async with _pool(connector, max_retries=2) as pool:
+        await pool.run(lambda session: session.call())
+        connector.sessions[0].broken = True
+
+        assert await pool.run(lambda session: session.call()) == 1
+        assert connector.sessions[0].calls == 2
+        assert connector.sessions[0].closed
+
+
+async def test_sent_tool_call_not_retried():
+    connector = _FakeConnector()
+    async with _pool(connector, max_retries=2) as pool:
+        await pool.run(lambda session: session.call())
+        connector.sessions[0].broken = True
+
+        with pytest.raises(anyio.ClosedResourceError):
+            await pool.run(lambda session: session.call(), idempotent=False)
+
+        # The request reached the server once and was not repeated, the broken session was dropped
+        assert connector.sessions[0].calls == 2
+        assert len(connector.sessions) == 1
+        assert connector.sessions[0].closed
+
+        assert await pool.run(lambda session: session.call(), idempotent=False) == 1
+
+
+async def test_retries_give_up():
+    connector = _FakeConnector()
+
+    @asynccontextmanager
+    async def refuse():
+        raise ConnectionRefusedError()
+        yield  # pylint: disable=unreachable
+
+    async with _pool(connector, max_retries=2) as pool:
+        pool._connect = refuse
+        with pytest.raises(ConnectionRefusedError):
+            await pool.run(lambda session: session.call())
+        assert pool.size == 0
+
+
+async def test_max_sessions_cap():
+    connector = _FakeConnector()
+    release = asyncio.Event()
+    async with _pool(connector, max_sessions=2) as pool:
+        calls = [asyncio.create_task(pool.run(lambda session: session.call(release))) for _ in range(6)]
+        await asyncio.sleep(0.01)
+
+        assert len(connector.sessions) == 2
+        assert sorted(session.calls for session in connector.sessions) == [3, 3]
+
+        release.set()
+        assert sorted(await asyncio.gather(*calls)) == [0, 0, 0, 1, 1, 1]
+
+    assert all(session.closed for session in connector.sessions)
+
+
+async def test_min_sessions_started_warm():
+    connector = _FakeConnector()
+    async with _pool(connector, max_sessions=3, min_sessions=2) as pool:
+        assert pool.size == 2
+        assert len(connector.sessions) == 2
+
+
+async def test_closed_pool_rejects_calls():
+    connector = _FakeConnector()
+    pool = _pool(connector)
+    await pool.aclose()
+
+    with pytest.raises(RuntimeError):
+        await pool.run(lambda session: session.call())
+    assert not connector.sessions
+
+
+async def test_shared_pool_closed_by_last_user():
+    connector = _FakeConnector()
+
+    async with shared_session_pool("http://fake", connector, health_check_interval=None) as first:
+        async with shared_session_pool("http://fake", connector, health_check_interval=None) as second:
+            assert first is second
+            await second.run(lambda session: session.call())
+
+        # Still used by the outer user
+        assert not connector.sessions[0].closed
+        assert await first.run(lambda session: session.call()) == 0
+
+        async with shared_session_pool("http://fake", connector, health_check_interval=None, max_sessions=2) as other:
+            # Pools configured differently are not shared
+            assert other is not first
+
+    assert connector.sessions[0].closed
+    assert first._closed
+    assert not mcp_session_pool._shared_pools
@@ -0,0 +1,222 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import threading
+
+import pytest
+
+from aiq.utils.reactive.base.observer_base import ObserverBase
+from aiq.utils.reactive.buffered_observer import BufferedObserver
+from aiq.utils.reactive.buffered_observer import OverflowPolicy
+from aiq.utils.reactive.subject import Subject
+
+
+class _Recorder(ObserverBase[int]):
+
+    def __init__(self):
+        self.values: list[int] = []
+        self.events: list[object] = []
+        self.threads: set[int] = set()
+        self.done = threading.Event()
+
+    def on_next(self, value: int) -> None:
+        self.values.append(value)
+        self.events.append(value)
+        self.threads.add(threading.get_ident())
+
+    def on_error(self, exc: Exception) -> None:
+        self.events.append(exc)
+        self.done.set()
+
+    def on_complete(self) -> None:
+        self.events.append("complete")
+        self.done.set()
+
+
+async def _run_loop():
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+
+def test_no_loop_delivers_synchronously():
+    recorder = _Recorder()
+    observer = BufferedObserver(recorder)
+
+    observer.on_next(1)
+    observer.on_complete()
+
+    assert recorder.events == [1, "complete"]
+
+
+async def test_delivered_from_the_loop():
+    recorder = _Recorder()
+    observer = BufferedObserver(recorder, batch_size=2)
+
+    for value in range(5):
+        observer.on_next(value)
+    assert not recorder.values
+
+    await _run_loop()
+    assert recorder.values == [0, 1, 2, 3, 4]
+    assert recorder.threads == {threading.get_ident()}
+
+
+async def test_block_on_loop_thread_delivers_on_producer_stack():
+    recorder = _Recorder()
+    observer = BufferedObserver(recorder, max_buffer_size=2, batch_size=1, overflow_policy=OverflowPolicy.BLOCK)
+
+    for value in range(6):
+        observer.on_next(value)
+        assert len(observer._buffer) <= 2
+
+    # The producer delivered the oldest values itself to make room
+    assert recorder.values == [0, 1, 2, 3]
+
+    await _run_loop()
+    assert recorder.values == list(range(6))
+    assert observer.dropped == 0
+
+
+async def test_drop_oldest():
+    recorder = _Recorder()
+    observer = BufferedObserver(recorder, max_buffer_size=3, overflow_policy=OverflowPolicy.DROP_OLDEST)
+
+    for value in range(6):
+        observer.on_next(value)
+
+    await _run_loop()
+    assert recorder.values == [3, 4, 5]
+    assert observer.dropped == 3
+
+
+async def test_drop_newest():
+    recorder = _Recorder()
+    observer = BufferedObserver(recorder, max_buffer_size=3, overflow_policy=OverflowPolicy.DROP_NEWEST)
+
+    for value in range(6):
+        observer.on_next(value)
+
+    await _run_loop()
+    assert recorder.values == [0, 1, 2]
+    assert observer.dropped == 3
+
+
+@pytest.mark.parametrize("overflow_policy", list(OverflowPolicy))
+async def test_order_kept_with_producer_on_other_thread(overflow_policy: OverflowPolicy):
+    recorder = _Recorder()
+    observer = BufferedObserver(recorder, max_buffer_size=8, batch_size=3, overflow_policy=overflow_policy)
+    count = 2000
+
+    def produce():
+        for value in range(count):
+            observer.on_next(value)
+        observer.on_complete()
+
+    await asyncio.to_thread(produce)
+    while not recorder.done.is_set():
+        await asyncio.sleep(0.001)
+
+    assert recorder.events[-1] == "complete"
+    # Values are delivered on the loop thread, in order, whatever was dropped
+    assert recorder.values == sorted(recorder.values)
+    assert recorder.threads == {threading.get_ident()}
+    assert observer.delivered + observer.dropped == count
+    assert len(recorder.values) == observer.delivered
+    if overflow_policy == OverflowPolicy.BLOCK:
+        assert recorder.values == list(range(count))
+        assert observer.dropped == 0
+
+
+async def test_completion_after_last_value():
+    recorder = _Recorder()
+    observer = BufferedObserver(recorder, batch_size=2)
+
+    for value in range(5):
+        observer.on_next(value)
+    observer.on_complete()
+    observer.on_next(5)
+    assert not recorder.events
+
+    await _run_loop()
+    assert recorder.events == [0, 1, 2, 3, 4, "complete"]
+
+
+async def test_error_after_last_value():
+    recorder = _Recorder()
+    observer = BufferedObserver(recorder, batch_size=2)
+    error = RuntimeError("boom")
+
+    for value in range(3):
+        observer.on_next(value)
+    observer.on_error(error)
+
+    await _run_loop()
+    assert recorder.events == [0, 1, 2, error]
+
+
+async def test_close_flushes_and_stops():
+    recorder = _Recorder()
+    observer = BufferedObserver(recorder)
+
+    for value in range(3):
+        observer.on_next(value)
+    observer.close()
+    assert recorder.values == [0, 1, 2]
+
+    observer.on_next(3)
+    await _run_loop()
+    assert recorder.values == [0, 1, 2]
+
+
+async def test_unsubscribe_flushes_before_removing_subscriber():
+    recorder = _Recorder()
+    subject = Subject(buffered=True)
+    subscription = subject.subscribe(recorder)
+
+    for value in range(3):
+        subject.on_next(value)
+    assert not recorder.values
+
+    subscription.unsubscribe()
+    assert recorder.values == [0, 1, 2]
+
+    subject.on_next(3)
+    await _run_loop()
+    assert recorder.values == [0, 1, 2]
+
+
+async def test_stats():
+    recorder = _Recorder()
+    observer = BufferedObserver(recorder, max_buffer_size=4, overflow_policy=OverflowPolicy.DROP_NEWEST)
+
+    for value in range(6):
+        observer.on_next(value)
+
+    stats = observer.stats()
+    assert stats["overflow_policy"] == "drop_newest"
+    assert stats["lag"] == 4
+    assert stats["lag_seconds"] >= 0.0
+    assert stats["max_lag"] == 4
+    assert stats["delivered"] == 0
+    assert stats["dropped"] == 2
+
+    await _run_loop()
+    stats = observer.stats()
+    assert stats["lag"] == 0
+    assert stats["lag_seconds"] == 0.0
+    assert stats["max_lag"] == 4
+    assert stats["delivered"] == 4
+    assert stats["dropped"] == 2
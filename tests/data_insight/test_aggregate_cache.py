@@ -0,0 +1,67 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# data-insight is a flat module directory rather than an installed package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, "src", "data-insight"))
+
+from aggregate_cache import AggregateCache  # noqa: E402  # pylint: disable=wrong-import-position
+
+
+@pytest.fixture(name="frame")
+def frame_fixture() -> pd.DataFrame:
+    rng = np.random.default_rng(3)
+    n = 1_000_000
+    # Integers below 2**24 are exact in float32, only their float32 sum loses precision
+    return pd.DataFrame({
+        "region": pd.Categorical(rng.choice(["north", "south"], n)),
+        "amount": rng.integers(1_000_000, 16_000_000, n).astype(np.float32),
+        "units": rng.integers(0, 100, n).astype(np.int8),
+    })
+
+
+def _exact_sums(frame: pd.DataFrame, col: str) -> dict:
+    return {
+        region: sum(int(value) for value in group[col].to_numpy())
+        for region, group in frame.groupby("region", observed=True)
+    }
+
+
+def test_rollup_sums_are_exact(frame: pd.DataFrame):
+    cache = AggregateCache()
+    cache.reset(frame)
+
+    assert "region" in cache.stats()["rollup_dimensions"]
+    for col in ("amount", "units"):
+        sums = cache.group_sum(frame, "region", col)
+        assert sums.to_dict() == _exact_sums(frame, col)
+
+    assert cache.group_sum(frame, "region", "amount").dtype == np.float64
+
+
+def test_uncached_sums_are_exact(frame: pd.DataFrame):
+    cache = AggregateCache(max_rollup_dimensions=0)
+    cache.reset(frame)
+
+    sums = cache.group_sum(frame, "region", "amount")
+
+    assert cache.stats()["rollup_dimensions"] == []
+    assert sums.to_dict() == _exact_sums(frame, "amount")
@@ -0,0 +1,93 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from aiq.data_models.object_store import NoSuchKeyError
+from aiq.object_store.in_memory_object_store import InMemoryObjectStore
+
+# data-insight is a flat module directory rather than an installed package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, "src", "data-insight"))
+
+from coordinator import DataInsightCoordinator  # noqa: E402  # pylint: disable=wrong-import-position
+from history_store import AnalysisHistory  # noqa: E402  # pylint: disable=wrong-import-position
+
+
+@pytest.fixture(name="object_store")
+def object_store_fixture() -> InMemoryObjectStore:
+    return InMemoryObjectStore()
+
+
+async def test_large_results_are_offloaded(object_store: InMemoryObjectStore):
+    history = AnalysisHistory(max_depth=2, inline_result_bytes=64, object_store=object_store, key_prefix="pytest")
+
+    small = history.record("data_analysis", {}, {"status": "success"})
+    large_result = {"status": "success", "rows": list(range(100))}
+    large = history.record("data_analysis", {}, large_result)
+
+    assert small.result is not None and small.result_ref is None
+    assert large.result is None and large.result_ref == "pytest/2"
+    assert await history.aget_result(large.seq) == large_result
+    assert (await object_store.get_object("pytest/2")).content_type == "application/json"
+
+    # Evicting the record deletes the offloaded result after it was written
+    history.record("data_analysis", {}, {"status": "success"})
+    history.record("data_analysis", {}, {"status": "success"})
+    await history.flush()
+    with pytest.raises(NoSuchKeyError):
+        await object_store.get_object("pytest/2")
+
+
+async def test_large_results_are_summarized_without_object_store():
+    history = AnalysisHistory(inline_result_bytes=64)
+
+    record = history.record("data_analysis", {}, {"status": "success", "rows": list(range(100))})
+
+    assert record.result is None and record.result_ref is None
+    assert history.page()["items"][0]["result_size"] == record.result_size
+    assert await history.aget_result(record.seq) is None
+
+
+async def test_coordinator_offloads_history(object_store: InMemoryObjectStore, tmp_path):
+    rng = np.random.default_rng(5)
+    # Statistics of many columns make the upload result larger than the inline limit
+    frame = pd.DataFrame({f"value_{i}": rng.random(200) for i in range(150)})
+    file_path = str(tmp_path / "wide.csv")
+    frame.to_csv(file_path, index=False)
+
+    coordinator = DataInsightCoordinator(cache_dir=str(tmp_path / "cache"),
+                                         spill_dir=str(tmp_path / "spill"),
+                                         object_store=object_store)
+    try:
+        # Recorded from a worker thread, as the tools do, the upload is offloaded on the coordinator's loop
+        result = await asyncio.to_thread(coordinator.process_file_upload, file_path)
+        assert result["status"] == "success"
+
+        history = coordinator.session.history
+        item = history.page()["items"][0]
+        assert item["result_ref"] is not None
+        assert item["result_size"] > history.inline_result_bytes
+
+        stored = await history.aget_result(item["seq"])
+        assert stored["file_info"]["shape"] == result["file_info"]["shape"]
+        await object_store.get_object(item["result_ref"])
+    finally:
+        coordinator.close()
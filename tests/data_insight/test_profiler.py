@@ -0,0 +1,137 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# data-insight is a flat module directory rather than an installed package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, "src", "data-insight"))
+
+from profiler import DatasetProfiler  # noqa: E402  # pylint: disable=wrong-import-position
+
+
+@pytest.fixture(name="frame")
+def frame_fixture() -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    n = 300
+    amount = rng.normal(100, 15, n)
+    amount[::17] = np.nan
+    city = rng.choice(["north", "south", "east", "west"], n).astype(object)
+    city[::23] = None
+    return pd.DataFrame({
+        "amount": amount,
+        "units": rng.integers(0, 50, n),
+        "city": city,
+        "active": rng.integers(0, 2, n).astype(bool),
+        "created": pd.date_range("2024-01-01", periods=n, freq="h"),
+    })
+
+
+def _assert_summary_equal(actual: dict, expected: dict):
+    assert actual["total_rows"] == expected["total_rows"]
+    assert actual["total_columns"] == expected["total_columns"]
+    assert actual["missing_values"] == expected["missing_values"]
+    assert actual["text_statistics"] == expected["text_statistics"]
+    assert actual["numeric_statistics"].keys() == expected["numeric_statistics"].keys()
+    for col, stats in expected["numeric_statistics"].items():
+        assert actual["numeric_statistics"][col] == pytest.approx(stats)
+
+
+def test_matches_describe_semantics(frame: pd.DataFrame):
+    summary = DatasetProfiler.from_frame(frame).summary()
+
+    assert set(summary["numeric_statistics"]) == {"amount", "units"}
+    assert set(summary["text_statistics"]) == {"city"}
+    assert set(summary["missing_values"]) == set(frame.columns)
+
+    described = frame[["amount", "units"]].describe().fillna(0).to_dict()
+    for col, stats in described.items():
+        profiled = summary["numeric_statistics"][col]
+        assert {key: profiled[key] for key in stats} == pytest.approx(stats)
+
+
+@pytest.mark.parametrize("chunk_rows", [1, 7, 64, 299])
+def test_update_matches_single_pass(frame: pd.DataFrame, chunk_rows: int):
+    single = DatasetProfiler().update(frame).summary()
+    chunked = DatasetProfiler.from_frame(frame, chunk_rows=chunk_rows).summary()
+
+    _assert_summary_equal(chunked, single)
+
+
+def test_merge_matches_single_pass(frame: pd.DataFrame):
+    single = DatasetProfiler().update(frame).summary()
+    parts = [DatasetProfiler.from_frame(frame.iloc[start:start + 80], chunk_rows=30) for start in range(0, 300, 80)]
+
+    merged = DatasetProfiler()
+    for part in parts:
+        merged.merge(part)
+
+    _assert_summary_equal(merged.summary(), single)
+
+
+def test_merge_does_not_modify_other(frame: pd.DataFrame):
+    other = DatasetProfiler().update(frame.iloc[100:])
+    before = other.summary()
+
+    DatasetProfiler().update(frame.iloc[:100]).merge(other)
+
+    assert other.summary() == before
+
+
+def test_missing_columns_count_as_nulls():
+    first = pd.DataFrame({"a": [1.0, 2.0], "b": ["x", "y"]})
+    second = pd.DataFrame({"a": [3.0, 4.0, 5.0]})
+    third = pd.DataFrame({"b": ["z"]})
+
+    updated = DatasetProfiler().update(first).update(second).update(third).summary()
+    merged = DatasetProfiler().update(first).merge(DatasetProfiler().update(second)).merge(
+        DatasetProfiler().update(third)).summary()
+
+    expected = {"a": {"count": 1, "percentage": 16.67}, "b": {"count": 3, "percentage": 50.0}}
+    assert updated["missing_values"] == expected
+    assert merged["missing_values"] == expected
+    assert updated["numeric_statistics"]["a"]["count"] == 5.0
+    assert merged["text_statistics"]["b"]["null_count"] == 3
+
+
+def test_type_conflict_demotes_to_text():
+    numeric = pd.DataFrame({"code": [1.0, 2.0, 2.0]})
+    text = pd.DataFrame({"code": ["A1", "A1", "B2"]})
+
+    updated = DatasetProfiler().update(numeric).update(text).summary()
+    merged = DatasetProfiler().update(numeric).merge(DatasetProfiler().update(text)).summary()
+    reverse = DatasetProfiler().update(text).merge(DatasetProfiler().update(numeric)).summary()
+
+    for summary in (updated, merged, reverse):
+        assert "code" not in summary["numeric_statistics"]
+        stats = summary["text_statistics"]["code"]
+        assert stats["unique_count"] == 4
+        assert {item["value"]: item["count"] for item in stats["top_values"]} == {"2.0": 2, "A1": 2, "1.0": 1, "B2": 1}
+
+
+def test_all_null_chunk_takes_later_type():
+    empty = pd.DataFrame({"value": pd.Series([None, None], dtype=object)})
+    numbers = pd.DataFrame({"value": [1.5, 2.5]})
+
+    updated = DatasetProfiler().update(empty).update(numbers).summary()
+    merged = DatasetProfiler().update(empty).merge(DatasetProfiler().update(numbers)).summary()
+
+    for summary in (updated, merged):
+        assert summary["numeric_statistics"]["value"]["mean"] == pytest.approx(2.0)
+        assert summary["missing_values"]["value"]["count"] == 2